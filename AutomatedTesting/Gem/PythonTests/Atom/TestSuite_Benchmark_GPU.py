@@ -40,6 +40,24 @@ def filebeat_service_running():
     return result
 
 
+def check_benchmark_regressions(request, workspace, rhi):
+    """
+    Compares the benchmark results of an RHI with the baselines in --benchmark-baseline-path, or replaces the baselines
+    with them when --update-benchmark-baseline is set.
+    :param request: The pytest request object
+    :param workspace: The LyTestTools Workspace object
+    :param rhi: The RHI the benchmarks were run on
+    :return: None
+    """
+    baseline_path = request.config.getoption("--benchmark-baseline-path")
+    if not baseline_path:
+        pytest.skip("--benchmark-baseline-path not set")
+    aggregator = BenchmarkDataAggregator(workspace, logger, 'main_gpu')
+    aggregator.check_regressions(rhi, baseline_path,
+                                 update_baseline=request.config.getoption("--update-benchmark-baseline"),
+                                 threshold=request.config.getoption("--benchmark-regression-threshold"))
+
+
 @pytest.mark.parametrize("project", ["AutomatedTesting"])
 @pytest.mark.parametrize("launcher_platform", ["windows_editor"])
 @pytest.mark.parametrize("level", ["AtomFeatureIntegrationBenchmark"])
@@ -88,6 +106,13 @@ class TestPerformanceBenchmarkSuite(object):
         aggregator = BenchmarkDataAggregator(workspace, logger, 'main_gpu')
         aggregator.upload_metrics('dx12')
 
+    def test_AtomFeatureIntegrationBenchmarkTest_CheckBenchmarkRegressions_DX12(
+            self, request, editor, workspace, project, launcher_platform, level):
+        """
+        Fails when the DX12 benchmark metrics regressed compared to the baselines in --benchmark-baseline-path.
+        """
+        check_benchmark_regressions(request, workspace, 'dx12')
+
     @pytest.mark.parametrize('rhi', ['-rhi=Vulkan'])
     def test_AtomFeatureIntegrationBenchmarkTest_GatherBenchmarkMetrics_Vulkan(
             self, request, editor, workspace, rhi, project, launcher_platform, level):
@@ -130,3 +155,10 @@ class TestPerformanceBenchmarkSuite(object):
         """
         aggregator = BenchmarkDataAggregator(workspace, logger, 'main_gpu')
         aggregator.upload_metrics('Vulkan')
+
+    def test_AtomFeatureIntegrationBenchmarkTest_CheckBenchmarkRegressions_Vulkan(
+            self, request, editor, workspace, project, launcher_platform, level):
+        """
+        Fails when the Vulkan benchmark metrics regressed compared to the baselines in --benchmark-baseline-path.
+        """
+        check_benchmark_regressions(request, workspace, 'Vulkan')
@@ -35,6 +35,7 @@ def asset_processor(request: pytest.fixture, workspace: pytest.fixture) -> asset
     def teardown():
         logger.info("Running asset_processor_fixture teardown to stop the AP")
         ap.stop()
+        ap.release_temp_asset_root()
 
     request.addfinalizer(teardown)
     for n in ly_test_tools.o3de.asset_processor_utils.processList:
@@ -391,6 +391,26 @@ namespace O3DE::ProjectManager
         return ExecuteWithLockErrorHandling(executionCallback).IsSuccess();
     }
 
+    AZ::Outcome<void, AZStd::string> PythonBindings::ExecuteWithLockInManifestSession(AZStd::function<void()> executionCallback) const
+    {
+        return ExecuteWithLockErrorHandling([&]
+        {
+            // The o3de manifest and the json files of the registered objects are loaded once for all the queries of the callback
+            pybind11::object manifestSession = m_manifest.attr("ManifestSession")();
+            manifestSession.attr("__enter__")();
+            try
+            {
+                executionCallback();
+            }
+            catch (...)
+            {
+                manifestSession.attr("__exit__")(pybind11::none(), pybind11::none(), pybind11::none());
+                throw;
+            }
+            manifestSession.attr("__exit__")(pybind11::none(), pybind11::none(), pybind11::none());
+        });
+    }
+
     EngineInfo PythonBindings::EngineInfoFromPath(pybind11::handle enginePath)
     {
         EngineInfo engineInfo;
@@ -469,7 +489,7 @@ namespace O3DE::ProjectManager
     {
         QVector<EngineInfo> engines;
 
-        auto result = ExecuteWithLockErrorHandling([&]
+        auto result = ExecuteWithLockInManifestSession([&]
         {
             for (auto path : m_manifest.attr("get_manifest_engines")())
             {
@@ -646,7 +666,7 @@ namespace O3DE::ProjectManager
     {
         QVector<GemInfo> gems;
 
-        auto result = ExecuteWithLockErrorHandling([&]
+        auto result = ExecuteWithLockInManifestSession([&]
         {
             for (auto path : m_manifest.attr("get_engine_gems")())
             {
@@ -666,7 +686,7 @@ namespace O3DE::ProjectManager
     {
         QVector<GemInfo> gems;
 
-        auto result = ExecuteWithLockErrorHandling([&]
+        auto result = ExecuteWithLockInManifestSession([&]
         {
             auto pyProjectPath = QString_To_Py_Path(projectPath);
             for (auto path : m_manifest.attr("get_all_gems")(pyProjectPath))
@@ -1109,7 +1129,7 @@ namespace O3DE::ProjectManager
     {
         QVector<ProjectInfo> projects;
 
-        bool result = ExecuteWithLock([&] {
+        bool result = ExecuteWithLockInManifestSession([&] {
             // external projects
             for (auto path : m_manifest.attr("get_manifest_projects")())
             {
@@ -1121,7 +1141,7 @@ namespace O3DE::ProjectManager
             {
                 projects.push_back(ProjectInfoFromPath(path));
             }
-        });
+        }).IsSuccess();
 
         if (!result)
         {
@@ -1137,7 +1157,7 @@ namespace O3DE::ProjectManager
     {
         QVector<ProjectInfo> projects;
 
-        AZ::Outcome<void, AZStd::string> result = ExecuteWithLockErrorHandling(
+        AZ::Outcome<void, AZStd::string> result = ExecuteWithLockInManifestSession(
             [&]
             {
                 auto pyUri = QString_To_Py_String(repoUri);
@@ -1165,7 +1185,7 @@ namespace O3DE::ProjectManager
     AZ::Outcome<QVector<ProjectInfo>, AZStd::string> PythonBindings::GetProjectsForAllRepos()
     {
         QVector<ProjectInfo> projectInfos;
-        AZ::Outcome<void, AZStd::string> result = ExecuteWithLockErrorHandling(
+        AZ::Outcome<void, AZStd::string> result = ExecuteWithLockInManifestSession(
             [&]
             {
                 auto projectPaths = m_repo.attr("get_project_json_paths_from_all_cached_repos")();
@@ -1343,12 +1363,12 @@ namespace O3DE::ProjectManager
     {
         QVector<ProjectTemplateInfo> templates;
 
-        bool result = ExecuteWithLock([&] {
+        bool result = ExecuteWithLockInManifestSession([&] {
             for (auto path : m_manifest.attr("get_templates_for_project_creation")())
             {
                 templates.push_back(ProjectTemplateInfoFromPath(path));
             }
-        });
+        }).IsSuccess();
 
         if (!result)
         {
@@ -1364,14 +1384,14 @@ namespace O3DE::ProjectManager
     {
         QVector<TemplateInfo> templates;
 
-        bool result = ExecuteWithLock(
+        bool result = ExecuteWithLockInManifestSession(
             [&]
             {
                 for (auto path : m_manifest.attr("get_templates_for_gem_creation")())
                 {
                     templates.push_back(TemplateInfoFromPath(path));
                 }
-            });
+            }).IsSuccess();
 
         if (!result)
         {
@@ -1387,7 +1407,7 @@ namespace O3DE::ProjectManager
     {
         QVector<ProjectTemplateInfo> templates;
 
-        bool result = ExecuteWithLock(
+        bool result = ExecuteWithLockInManifestSession(
             [&]
             {
                 using namespace pybind11::literals;
@@ -1405,7 +1425,7 @@ namespace O3DE::ProjectManager
                         templates.push_back(remoteTemplate);
                     }
                 }
-            });
+            }).IsSuccess();
 
         if (!result)
         {
@@ -1421,7 +1441,7 @@ namespace O3DE::ProjectManager
     {
         QVector<ProjectTemplateInfo> templates;
 
-        bool result = ExecuteWithLock(
+        bool result = ExecuteWithLockInManifestSession(
             [&]
             {
                 auto templatePaths = m_repo.attr("get_template_json_paths_from_all_cached_repos")();
@@ -1435,7 +1455,7 @@ namespace O3DE::ProjectManager
                         templates.push_back(remoteTemplate);
                     }
                 }
-            });
+            }).IsSuccess();
 
         if (!result)
         {
@@ -1599,7 +1619,7 @@ namespace O3DE::ProjectManager
     {
         QVector<GemRepoInfo> gemRepos;
 
-        auto result = ExecuteWithLockErrorHandling(
+        auto result = ExecuteWithLockInManifestSession(
             [&]
             {
                 for (auto repoUri : m_manifest.attr("get_manifest_repos")())
@@ -1619,7 +1639,7 @@ namespace O3DE::ProjectManager
     AZ::Outcome<QVector<GemInfo>, AZStd::string> PythonBindings::GetGemInfosForRepo(const QString& repoUri)
     {
         QVector<GemInfo> gemInfos;
-        AZ::Outcome<void, AZStd::string> result = ExecuteWithLockErrorHandling(
+        AZ::Outcome<void, AZStd::string> result = ExecuteWithLockInManifestSession(
             [&]
             {
                 auto pyUri = QString_To_Py_String(repoUri);
@@ -1647,7 +1667,7 @@ namespace O3DE::ProjectManager
     AZ::Outcome<QVector<GemInfo>, AZStd::string> PythonBindings::GetGemInfosForAllRepos()
     {
         QVector<GemInfo> gemInfos;
-        AZ::Outcome<void, AZStd::string> result = ExecuteWithLockErrorHandling(
+        AZ::Outcome<void, AZStd::string> result = ExecuteWithLockInManifestSession(
             [&]
             {
                 auto gemPaths = m_repo.attr("get_gem_json_paths_from_all_cached_repos")();
@@ -100,6 +100,7 @@ namespace O3DE::ProjectManager
 
         AZ::Outcome<void, AZStd::string> ExecuteWithLockErrorHandling(AZStd::function<void()> executionCallback) const;
         bool ExecuteWithLock(AZStd::function<void()> executionCallback) const;
+        AZ::Outcome<void, AZStd::string> ExecuteWithLockInManifestSession(AZStd::function<void()> executionCallback) const;
         EngineInfo EngineInfoFromPath(pybind11::handle enginePath);
         GemInfo GemInfoFromPath(pybind11::handle path, pybind11::handle pyProjectPath);
         GemRepoInfo GetGemRepoInfo(pybind11::handle repoUri);
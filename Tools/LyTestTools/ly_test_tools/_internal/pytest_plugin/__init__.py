@@ -9,3 +9,4 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 # these values should only be modified during initialization, or patched during unit tests
 build_directory = None
 output_path = None
+duration_store = None
@@ -29,6 +29,8 @@ def pytest_addoption(parser: argparse.ArgumentParser) -> None:
     parser.addoption("--parallel-executables", type=int, action="store",
                      help="Override the number of program executables to run at the same time. Default value is: "
                      f"{ly_test_tools.o3de.multi_test_framework.MultiTestSuite.get_number_parallel_executables()}")
+    parser.addoption("--warm-editor-pool", action="store_true",
+                     help="Run the single tests of every EditorTestSuite in warm Editors kept open between tests")
 
 
 def pytest_pycollect_makeitem(collector: _pytest.python.Module, name: str, obj: object) -> _pytest.python.Module:
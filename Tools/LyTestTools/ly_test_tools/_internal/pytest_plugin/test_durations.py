@@ -0,0 +1,129 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Records the duration and outcome of every test into a persistent DurationStore across runs, and uses it to split the
+collected tests into balanced shards for distributed CI nodes and to report tests whose duration regressed.
+"""
+
+from __future__ import annotations
+
+__test__ = False  # Avoid pytest collection & warnings since this module is for test functions, but not a test itself.
+
+import ly_test_tools._internal.pytest_plugin
+from ly_test_tools.report.duration_store import DurationStore
+
+import pytest
+
+# Name of the user property a test can set to override the duration pytest measured for it, i.e. for the result
+# functions of shared tests that only report the result of a test which ran in a batch before
+DURATION_USER_PROPERTY = "test_duration"
+
+
+def pytest_addoption(parser: argparse.ArgumentParser) -> None:
+    """
+    Options for recording test durations and sharding tests.
+    :param parser: The ArgumentParser object
+    :return: None
+    """
+    parser.addoption("--test-durations-path", action="store", default=None,
+                     help="JSON-lines file where the durations of tests are stored across runs. Tests are ordered and "
+                          "sharded by these durations, and nothing is recorded when this is not set")
+    parser.addoption("--test-shard-count", type=int, action="store", default=1,
+                     help="Split the tests into this many shards of balanced duration. Default value is: 1")
+    parser.addoption("--test-shard-index", type=int, action="store", default=0,
+                     help="Zero-based index of the shard of tests to run when --test-shard-count is set")
+    parser.addoption("--test-duration-regression-threshold", type=float, action="store", default=2.0,
+                     help="Report tests whose duration is this many times longer than the median of their previous "
+                          "runs. Default value is: 2.0")
+
+
+def pytest_configure(config: _pytest.config.Config) -> None:
+    """
+    Validates the sharding options and loads the durations store, so it is available to the tests without fixtures.
+    :param config: The Pytest Config object
+    :return: None
+    """
+    shard_count = config.getoption("--test-shard-count")
+    shard_index = config.getoption("--test-shard-index")
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise pytest.UsageError(f"--test-shard-index must be between 0 and --test-shard-count - 1, "
+                                f"found index {shard_index} for {shard_count} shards")
+
+    durations_path = config.getoption("--test-durations-path")
+    ly_test_tools._internal.pytest_plugin.duration_store = DurationStore(durations_path) if durations_path else None
+
+
+def pytest_collection_modifyitems(session: _pytest.main.Session, config: _pytest.config.Config,
+                                  items: list[_pytest.nodes.Item]) -> None:
+    """
+    Deselects the tests which are not part of the shard to run. Shards are balanced with the recorded durations, or by
+    number of tests when there are none.
+    :param session: The Pytest Session
+    :param config: The Pytest Config object
+    :param items: The test case functions
+    :return: None
+    """
+    shard_count = config.getoption("--test-shard-count")
+    if shard_count <= 1:
+        return
+
+    duration_store = ly_test_tools._internal.pytest_plugin.duration_store or DurationStore(None)
+    shards = duration_store.split_into_shards([item.nodeid for item in items], shard_count)
+    selected_ids = set(shards[config.getoption("--test-shard-index")])
+    selected_items = [item for item in items if item.nodeid in selected_ids]
+    deselected_items = [item for item in items if item.nodeid not in selected_ids]
+    if deselected_items:
+        config.hook.pytest_deselected(items=deselected_items)
+        items[:] = selected_items
+
+
+def pytest_runtest_logreport(report: _pytest.reports.TestReport) -> None:
+    """
+    Records the duration and outcome of the call of each test.
+    :param report: The Pytest TestReport of one phase of a test
+    :return: None
+    """
+    duration_store = ly_test_tools._internal.pytest_plugin.duration_store
+    if duration_store is None or report.when != "call":
+        return
+
+    duration = dict(report.user_properties).get(DURATION_USER_PROPERTY, report.duration)
+    duration_store.add(report.nodeid, duration, report.outcome)
+
+
+def pytest_sessionfinish(session: _pytest.main.Session, exitstatus: int) -> None:
+    """
+    Saves the durations recorded during the session.
+    :param session: The Pytest Session
+    :param exitstatus: The exit status of the session
+    :return: None
+    """
+    duration_store = ly_test_tools._internal.pytest_plugin.duration_store
+    if duration_store is not None:
+        duration_store.save()
+
+
+def pytest_terminal_summary(terminalreporter: _pytest.terminal.TerminalReporter, exitstatus: int,
+                            config: _pytest.config.Config) -> None:
+    """
+    Adds a section listing the tests of this session whose duration regressed.
+    :param terminalreporter: Pytest's TerminalReporter object
+    :param exitstatus: The exit status of the session
+    :param config: The Pytest Config object
+    :return: None
+    """
+    duration_store = ly_test_tools._internal.pytest_plugin.duration_store
+    if duration_store is None:
+        return
+
+    session_test_ids = {report.nodeid for reports in terminalreporter.stats.values() for report in reports
+                        if getattr(report, "when", None) == "call"}
+    regressions = duration_store.find_regressions(
+        sorted(session_test_ids), threshold=config.getoption("--test-duration-regression-threshold"))
+    if regressions:
+        terminalreporter.section("Test duration regressions")
+        for test_id, baseline, latest in regressions:
+            terminalreporter.write_line(f"{test_id}: {latest:.2f}s, previously {baseline:.2f}s")
@@ -44,6 +44,15 @@ def pytest_addoption(parser):
     parser.addoption("--build-directory", nargs='?', default='',
                      help="An existing CMake binary output directory which contains the lumberyard executables,"
                           "such as: D:/ly/dev/windows_vs2017/bin/profile/")
+    parser.addoption("--benchmark-baseline-path", default=None,
+                     help="A folder of baseline benchmark results which the Atom benchmark suites compare their results "
+                          "to, failing on a performance regression. Benchmarks are not compared when this is not set")
+    parser.addoption("--update-benchmark-baseline", action="store_true", default=False,
+                     help="Replace the baselines in --benchmark-baseline-path with the benchmark results of this run "
+                          "instead of comparing them")
+    parser.addoption("--benchmark-regression-threshold", type=float, default=0.05,
+                     help="Relative growth of the median frame or pass time considered a performance regression. "
+                          "Default value is: 0.05")
 
 
 def pytest_configure(config):
@@ -383,7 +392,9 @@ def _crash_log_watchdog(request, workspace, raise_on_crash):
     """Separate implementation to call directly during unit tests"""
     error_log = workspace.paths.crash_log()
     crash_log_watchdog = ly_test_tools.environment.watchdog.CrashLogWatchdog(
-        error_log, raise_on_condition=raise_on_crash)
+        error_log, raise_on_condition=raise_on_crash,
+        interval=ly_test_tools.environment.watchdog.MONITOR_CHECK_INTERVAL,
+        monitor=ly_test_tools.environment.watchdog.get_shared_monitor())
 
     def teardown():
         # stop() will either raise an exception or log an error if watchdog has found an error log
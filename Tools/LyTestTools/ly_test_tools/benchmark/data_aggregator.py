@@ -6,14 +6,25 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 """
 
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
 import json
 from pathlib import Path
 import time
 import subprocess
 import os
+import sys
+
+import numpy as np
 
 from ly_test_tools.mars.filebeat_client import FilebeatClient
 
+# Percentiles reported for frame and pass times
+PERCENTILES = (50, 90, 99)
+# Number of buckets of the frame time histograms
+HISTOGRAM_BIN_COUNT = 20
+# Capture files are parsed in parallel processes when a benchmark has at least this many of them
+PARALLEL_PARSE_MIN_FILES = 64
+
 class BenchmarkPathException(Exception):
     """Custom Exception class for invalid benchmark file paths."""
     pass
@@ -60,6 +71,166 @@ class RunningStatistics(object):
     def getCount(self):
         return self.count
 
+class ColumnarStatistics(object):
+    def __init__(self, values):
+        '''
+        Initializes a helper class for calculating statistics over all the values of a series at once.
+
+        :param values: Sequence or NumPy array with the values of the series.
+        '''
+        self.values = np.asarray(values, dtype=np.float64)
+
+    def getAvg(self):
+        '''
+        Returns the average of the values.
+        '''
+        return float(self.values.mean())
+
+    def getMax(self):
+        '''
+        Returns the maximum of the values.
+        '''
+        return float(self.values.max())
+
+    def getMin(self):
+        '''
+        Returns the minimum of the values.
+        '''
+        return float(self.values.min())
+
+    def getCount(self):
+        return int(self.values.size)
+
+    def getStdDev(self):
+        '''
+        Returns the population standard deviation of the values.
+        '''
+        return float(self.values.std())
+
+    def getPercentiles(self, percentiles=PERCENTILES):
+        '''
+        Returns the percentiles of the values, interpolated linearly between the closest values.
+
+        :param percentiles: Sequence of percentiles between 0 and 100
+        :return: Dict of percentile to value
+        '''
+        return dict(zip(percentiles, np.percentile(self.values, percentiles).tolist()))
+
+    def getHistogram(self, bin_count=HISTOGRAM_BIN_COUNT):
+        '''
+        Returns a histogram of the values with equally sized bins between the minimum and the maximum.
+
+        :param bin_count: Number of bins
+        :return: Tuple with two indexes:
+            [0]: List with the bin_count + 1 edges of the bins
+            [1]: List with the number of values in each bin
+        '''
+        counts, edges = np.histogram(self.values, bins=bin_count)
+        return edges.tolist(), counts.tolist()
+
+def _parse_timestamp_file(file):
+    '''
+    Parses a frame*_timestamps.json capture file. Module level so it can run in a worker process.
+
+    :param file: Path of the capture file
+    :return: Tuple with two indexes:
+        [0]: List of the pass names of the timestamp entries
+        [1]: List of the times (in nanoseconds) of the timestamp entries
+    '''
+    entries = json.loads(Path(file).read_text())['ClassData']['timestampEntries']
+    return [entry['passName'] for entry in entries], [entry['timestampResultInNanoseconds'] for entry in entries]
+
+def _parse_frame_time_file(file):
+    '''
+    Parses a cpu_frame*_time.json capture file. Module level so it can run in a worker process.
+
+    :param file: Path of the capture file
+    :return: The frame time recorded in the file
+    '''
+    return json.loads(Path(file).read_text())['ClassData']['frameTime']
+
+def _parse_files(parse_function, files, max_workers=None):
+    '''
+    Parses capture files in parallel processes when there are enough of them to make up for starting the processes.
+
+    :param parse_function: Module level function parsing a single file
+    :param files: List of paths of the files
+    :param max_workers: Maximum number of worker processes, defaults to the number of CPUs
+    :return: List with the result of each file, in the order of files
+    '''
+    if len(files) < PARALLEL_PARSE_MIN_FILES or max_workers == 1:
+        return [parse_function(file) for file in files]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse_function, files, chunksize=max(len(files) // (4 * (os.cpu_count() or 1)), 1)))
+
+def load_benchmark_statistics(benchmark_dir, max_workers=None):
+    '''
+    Loads the times of all the captures of a benchmark into arrays and computes their statistics.
+
+    :param benchmark_dir: Path of directory containing the benchmark results
+    :param max_workers: Maximum number of processes parsing the capture files, defaults to the number of CPUs
+    :return: Tuple with three indexes:
+        [0]: ColumnarStatistics for GPU frame times, None if there are no GPU captures
+        [1]: Dict of ColumnarStatistics of GPU pass times (key: pass name)
+        [2]: ColumnarStatistics for CPU frame times, None if there are no CPU captures
+    '''
+    # this allows us to add additional data if necessary, e.g. frame_test_timestamps.json
+    is_timestamp_file = lambda file: file.name.startswith('frame') and file.name.endswith('_timestamps.json')
+    is_frame_time_file = lambda file: file.name.startswith('cpu_frame') and file.name.endswith('_time.json')
+
+    files = sorted(file for file in Path(benchmark_dir).iterdir() if not file.is_dir())
+    timestamp_files = [file for file in files if is_timestamp_file(file)]
+    frame_time_files = [file for file in files if is_frame_time_file(file)]
+
+    gpu_frame_stats = None
+    gpu_pass_stats = {}
+    if timestamp_files:
+        parsed_files = _parse_files(_parse_timestamp_file, timestamp_files, max_workers)
+        pass_indexes = {}
+        pass_codes = np.fromiter(
+            (pass_indexes.setdefault(name, len(pass_indexes)) for names, _ in parsed_files for name in names),
+            dtype=np.int64)
+        times = np.fromiter((time_ns for _, frame_times in parsed_files for time_ns in frame_times), dtype=np.int64)
+        entry_counts = np.fromiter((len(names) for names, _ in parsed_files), dtype=np.int64,
+                                   count=len(parsed_files))
+
+        # the GPU frame time is the sum of the times of its passes
+        frame_codes = np.repeat(np.arange(len(parsed_files)), entry_counts)
+        gpu_frame_stats = ColumnarStatistics(np.bincount(frame_codes, weights=times, minlength=len(parsed_files)))
+
+        # group the times by pass, keeping the order the passes were first seen in
+        order = np.argsort(pass_codes, kind='stable')
+        pass_times = np.split(times[order], np.cumsum(np.bincount(pass_codes, minlength=len(pass_indexes)))[:-1])
+        gpu_pass_stats = {name: ColumnarStatistics(pass_times[index]) for name, index in pass_indexes.items()}
+
+    cpu_frame_stats = None
+    if frame_time_files:
+        cpu_frame_stats = ColumnarStatistics(_parse_files(_parse_frame_time_file, frame_time_files, max_workers))
+
+    return gpu_frame_stats, gpu_pass_stats, cpu_frame_stats
+
+def _distribution_payload(stats, scale=lambda value: value, histogram=False):
+    '''
+    Generates the payload of the distribution of a series.
+
+    :param stats: ColumnarStatistics of the series
+    :param scale: Function converting the values to the unit of the payload
+    :param histogram: Whether to include the histogram of the values
+    :return: Payload dict
+    '''
+    payload = {
+        'avg': scale(stats.getAvg()),
+        'max': scale(stats.getMax()),
+        'min': scale(stats.getMin()),
+        'stddev': scale(stats.getStdDev()),
+        'count': stats.getCount()
+    }
+    payload.update({f'p{percentile}': scale(value) for percentile, value in stats.getPercentiles().items()})
+    if histogram:
+        edges, counts = stats.getHistogram()
+        payload['histogram'] = {'edges': [scale(edge) for edge in edges], 'counts': counts}
+    return payload
+
 class BenchmarkDataAggregator(object):
     def __init__(self, workspace, logger, test_suite):
         '''
@@ -72,22 +243,9 @@ class BenchmarkDataAggregator(object):
         self.build_dir = workspace.paths.build_directory()
         self.results_dir = Path(workspace.paths.project(), 'user/Scripts/PerformanceBenchmarks')
         self.test_suite = test_suite if os.environ.get('BUILD_NUMBER') else 'local'
-        self.filebeat_client = FilebeatClient(logger)
-
-    def _update_pass(self, gpu_pass_stats, entry):
-        '''
-        Modifies gpu_pass_stats dict keyed by pass name with the time recorded in a pass timestamp entry.
-
-        :param gpu_pass_stats: dict aggregating statistics from each pass (key: pass name, value: dict with stats)
-        :param entry: dict representing the timestamp entry of a pass
-        :return: Time (in nanoseconds) recorded by this pass
-        '''
-        name = entry['passName']
-        time_ns = entry['timestampResultInNanoseconds']
-        pass_entry = gpu_pass_stats.get(name, RunningStatistics())
-        pass_entry.update(time_ns)
-        gpu_pass_stats[name] = pass_entry
-        return time_ns
+        self.logger = logger
+        # connected on the first upload, so aggregating or gating results doesn't need a running Filebeat
+        self.filebeat_client = None
 
     def _process_benchmark(self, benchmark_dir, benchmark_metadata):
         '''
@@ -95,9 +253,10 @@ class BenchmarkDataAggregator(object):
 
         :param benchmark_dir: Path of directory containing the benchmark results
         :param benchmark_metadata: Dict with benchmark metadata mutated with additional info from metadata file
-        :return: Tuple with two indexes:
-            [0]: RunningStatistics for GPU frame times
-            [1]: Dict aggregating statistics from GPU pass times (key: pass name, value: RunningStatistics)
+        :return: Tuple with three indexes:
+            [0]: ColumnarStatistics for GPU frame times, None if there are no GPU captures
+            [1]: Dict aggregating statistics from GPU pass times (key: pass name, value: ColumnarStatistics)
+            [2]: ColumnarStatistics for CPU frame times, None if there are no CPU captures
         '''
         # Parse benchmark metadata
         metadata_file = benchmark_dir / 'benchmark_metadata.json'
@@ -107,33 +266,8 @@ class BenchmarkDataAggregator(object):
         else:
             raise BenchmarkPathException(f'Metadata file could not be found at {metadata_file}')
 
-        # data structures aggregating statistics from timestamp logs
-        gpu_frame_stats = RunningStatistics()
-        cpu_frame_stats = RunningStatistics()
-        gpu_pass_stats = {}  # key: pass name, value: RunningStatistics
-
-        # this allows us to add additional data if necessary, e.g. frame_test_timestamps.json
-        is_timestamp_file = lambda file: file.name.startswith('frame') and file.name.endswith('_timestamps.json')
-        is_frame_time_file = lambda file: file.name.startswith('cpu_frame') and file.name.endswith('_time.json')
-
-        # parse benchmark files
-        for file in benchmark_dir.iterdir():
-            if file.is_dir():
-                continue
-
-            if is_timestamp_file(file):
-                data = json.loads(file.read_text())
-                entries = data['ClassData']['timestampEntries']
-
-                frame_time = sum(self._update_pass(gpu_pass_stats, entry) for entry in entries)
-                gpu_frame_stats.update(frame_time)
-
-            if is_frame_time_file(file):
-                data = json.loads(file.read_text())
-                frame_time = data['ClassData']['frameTime']
-                cpu_frame_stats.update(frame_time)
-
-        if gpu_frame_stats.getCount() < 1 and cpu_frame_stats.getCount() < 1:
+        gpu_frame_stats, gpu_pass_stats, cpu_frame_stats = load_benchmark_statistics(benchmark_dir)
+        if gpu_frame_stats is None and cpu_frame_stats is None:
             raise BenchmarkPathException(f'No benchmark logs were found in {benchmark_dir}')
 
         return gpu_frame_stats, gpu_pass_stats, cpu_frame_stats
@@ -143,9 +277,9 @@ class BenchmarkDataAggregator(object):
         Generates payloads to send to Filebeat based on aggregated stats and metadata.
 
         :param benchmark_metadata: Dict of benchmark metadata
-        :param gpu_frame_stats: RunningStatistics for GPU frame data
-        :param gpu_pass_stats: Dict of aggregated pass RunningStatistics
-        :param cpu_frame_stats: RunningStatistics for CPU frame data
+        :param gpu_frame_stats: ColumnarStatistics for GPU frame data, or None
+        :param gpu_pass_stats: Dict of aggregated pass ColumnarStatistics
+        :param cpu_frame_stats: ColumnarStatistics for CPU frame data, or None
         :return payloads: List of tuples, each with two indexes:
             [0]: Elasticsearch index suffix associated with the payload
             [1]: Payload dict to deliver to Filebeat
@@ -153,17 +287,13 @@ class BenchmarkDataAggregator(object):
         ns_to_ms = lambda ns: ns / 1e6
         payloads = []
 
-        # add benchmark metadata to payload
-        if (gpu_frame_stats.getCount() > 0):
+        if gpu_frame_stats is not None and gpu_frame_stats.getCount() > 0:
             # calculate statistics based on aggregated frame data
             gpu_frame_payload = {
-                'frameTime': {
-                    'avg': ns_to_ms(gpu_frame_stats.getAvg()),
-                    'max': ns_to_ms(gpu_frame_stats.getMax()),
-                    'min': ns_to_ms(gpu_frame_stats.getMin())
-                }
+                'frameTime': _distribution_payload(gpu_frame_stats, ns_to_ms, histogram=True)
             }
 
+            # add benchmark metadata to payload
             gpu_frame_payload.update(benchmark_metadata)
             payloads.append(('gpu.frame_data', gpu_frame_payload))
 
@@ -171,23 +301,16 @@ class BenchmarkDataAggregator(object):
             for name, stat in gpu_pass_stats.items():
                 gpu_pass_payload = {
                     'passName': name,
-                    'passTime': {
-                        'avg': ns_to_ms(stat.getAvg()),
-                        'max': ns_to_ms(stat.getMax())
-                    }
+                    'passTime': _distribution_payload(stat, ns_to_ms)
                 }
                 # add benchmark metadata to payload
                 gpu_pass_payload.update(benchmark_metadata)
                 payloads.append(('gpu.pass_data', gpu_pass_payload))
 
-        if (cpu_frame_stats.getCount() > 0):
+        if cpu_frame_stats is not None and cpu_frame_stats.getCount() > 0:
             # calculate statistics based on aggregated frame data
             cpu_frame_payload = {
-                'frameTime': {
-                    'avg': cpu_frame_stats.getAvg(),
-                    'max': cpu_frame_stats.getMax(),
-                    'min': cpu_frame_stats.getMin()
-                }
+                'frameTime': _distribution_payload(cpu_frame_stats, histogram=True)
             }
 
             cpu_frame_payload.update(benchmark_metadata)
@@ -202,6 +325,8 @@ class BenchmarkDataAggregator(object):
         :param rhi: The RHI the benchmarks were run on
         '''
         start_timestamp = time.time()
+        if self.filebeat_client is None:
+            self.filebeat_client = FilebeatClient(self.logger)
 
         git_commit_data = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=self.build_dir)
         git_commit_hash = git_commit_data.decode('ascii').strip()
@@ -224,3 +349,114 @@ class BenchmarkDataAggregator(object):
                     f'ly_atom.performance_metrics.{self.test_suite}.{index_suffix}',
                     start_timestamp
                 )
+
+        # Events are sent in batches from a background thread, wait for the last ones to be delivered
+        self.filebeat_client.flush()
+
+    def check_regressions(self, rhi, baseline_dir, update_baseline=False, **gate_options):
+        '''
+        Compares the results of all the benchmarks run in a test suite with their baselines, failing on a regression.
+        Baselines are keyed by the same test suite name as the uploaded metrics, so local runs are only compared with
+        baselines recorded locally and CI runs with baselines recorded in CI.
+
+        :param rhi: The RHI the benchmarks were run on
+        :param baseline_dir: Path of the directory of the BaselineStore
+        :param update_baseline: Whether to replace the baselines with these results instead of comparing them
+        :param gate_options: Keyword arguments of PerformanceRegressionGate, i.e. threshold, alpha or method
+        :return: List of SeriesComparison, empty when the baselines were updated
+        :raises PerformanceRegressionError: When a series regressed beyond the threshold
+        '''
+        # imported here since the regression gate depends on this module
+        from ly_test_tools.benchmark.regression_gate import BaselineStore, PerformanceRegressionGate
+
+        gate = PerformanceRegressionGate(BaselineStore(baseline_dir), self.test_suite, rhi, **gate_options)
+        if update_baseline:
+            gate.update_baseline(self.results_dir)
+            return []
+        return gate.check(self.results_dir)
+
+def _compare_stats(baseline_stats, current_stats, scale=lambda value: value):
+    '''
+    Compares the distributions of a series in two benchmark runs.
+
+    :param baseline_stats: ColumnarStatistics of the baseline run
+    :param current_stats: ColumnarStatistics of the current run
+    :param scale: Function converting the values to the unit of the comparison
+    :return: Dict of statistic name to tuple of (baseline value, current value, relative change)
+    '''
+    comparison = {}
+    baseline_payload = _distribution_payload(baseline_stats, scale)
+    current_payload = _distribution_payload(current_stats, scale)
+    for key in ['avg', 'stddev'] + [f'p{percentile}' for percentile in PERCENTILES] + ['max']:
+        baseline_value = baseline_payload[key]
+        current_value = current_payload[key]
+        change = (current_value - baseline_value) / baseline_value if baseline_value else 0.0
+        comparison[key] = (baseline_value, current_value, change)
+    return comparison
+
+def compare_results(baseline_dir, current_dir, include_passes=False, max_workers=None):
+    '''
+    Compares the benchmarks found in both of two result directories, i.e. two copies of user/Scripts/PerformanceBenchmarks.
+
+    :param baseline_dir: Path of the directory with the baseline benchmark results
+    :param current_dir: Path of the directory with the current benchmark results
+    :param include_passes: Whether to also compare the time of each GPU pass
+    :param max_workers: Maximum number of processes parsing the capture files, defaults to the number of CPUs
+    :return: List of tuples, each with three indexes:
+        [0]: Benchmark name
+        [1]: Series name, i.e. 'gpu.frameTime' or 'gpu.pass.<pass name>'
+        [2]: Comparison dict returned by _compare_stats, in milliseconds for GPU times
+    '''
+    ns_to_ms = lambda ns: ns / 1e6
+    baseline_dir = Path(baseline_dir)
+    current_dir = Path(current_dir)
+    benchmark_names = sorted(benchmark_dir.name for benchmark_dir in baseline_dir.iterdir()
+                             if benchmark_dir.is_dir() and (current_dir / benchmark_dir.name).is_dir())
+    rows = []
+    for name in benchmark_names:
+        baseline_gpu, baseline_passes, baseline_cpu = load_benchmark_statistics(baseline_dir / name, max_workers)
+        current_gpu, current_passes, current_cpu = load_benchmark_statistics(current_dir / name, max_workers)
+        if baseline_gpu is not None and current_gpu is not None:
+            rows.append((name, 'gpu.frameTime', _compare_stats(baseline_gpu, current_gpu, ns_to_ms)))
+        if include_passes:
+            for pass_name, baseline_pass in baseline_passes.items():
+                if pass_name in current_passes:
+                    rows.append((name, f'gpu.pass.{pass_name}',
+                                 _compare_stats(baseline_pass, current_passes[pass_name], ns_to_ms)))
+        if baseline_cpu is not None and current_cpu is not None:
+            rows.append((name, 'cpu.frameTime', _compare_stats(baseline_cpu, current_cpu)))
+    return rows
+
+def main(argv=None):
+    '''
+    Offline comparison of two benchmark result directories, printing the change of each statistic, i.e.:
+        python -m ly_test_tools.benchmark.data_aggregator baseline/PerformanceBenchmarks current/PerformanceBenchmarks
+
+    :param argv: Command line arguments, defaults to sys.argv
+    :return: Exit code, 1 if a percentile regressed more than the threshold, 0 otherwise
+    '''
+    parser = ArgumentParser(description='Compares the frame time distributions of two benchmark result directories.')
+    parser.add_argument('baseline_dir', help='Directory with the baseline benchmark results')
+    parser.add_argument('current_dir', help='Directory with the current benchmark results')
+    parser.add_argument('--passes', action='store_true', help='Also compare the time of each GPU pass')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help='Relative change of a percentile considered a regression, i.e. 0.1 for 10%%')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Maximum number of processes parsing capture files, defaults to the number of CPUs')
+    args = parser.parse_args(argv)
+
+    regressed = False
+    percentile_keys = [f'p{percentile}' for percentile in PERCENTILES]
+    for benchmark_name, series, comparison in compare_results(args.baseline_dir, args.current_dir, args.passes,
+                                                              args.workers):
+        print(f'{benchmark_name} {series}')
+        for key, (baseline_value, current_value, change) in comparison.items():
+            marker = ''
+            if args.threshold is not None and key in percentile_keys and change > args.threshold:
+                marker = '  REGRESSION'
+                regressed = True
+            print(f'    {key:>6}: {baseline_value:12.4f} -> {current_value:12.4f} ({change:+.1%}){marker}')
+    return 1 if regressed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
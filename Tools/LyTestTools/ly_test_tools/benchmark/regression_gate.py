@@ -0,0 +1,317 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Performance regression gate for the Atom benchmark results aggregated by BenchmarkDataAggregator.
+
+The per-frame GPU frame times, GPU pass times and CPU frame times of a passing run are kept in a BaselineStore, keyed
+by test suite, RHI and benchmark name. Later runs are compared to them series by series with a statistical test, so a
+pass is only reported as regressed when its times are both significantly and meaningfully slower than the baseline:
+    - 'mann-whitney': one-sided Mann-Whitney U test, regressed when the p-value is below alpha and the median grew more
+      than the threshold
+    - 'bootstrap': bootstrap confidence interval of the relative change of the median, regressed when the whole
+      interval is above the threshold
+"""
+
+import logging
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+from ly_test_tools.benchmark.data_aggregator import load_benchmark_statistics
+
+logger = logging.getLogger(__name__)
+
+MANN_WHITNEY = 'mann-whitney'
+BOOTSTRAP = 'bootstrap'
+# Relative growth of the median time considered a regression, i.e. 0.05 for 5%
+DEFAULT_THRESHOLD = 0.05
+# Significance level of the Mann-Whitney U test, and 1 - confidence of the bootstrap interval
+DEFAULT_ALPHA = 0.01
+# Number of resamples of the bootstrap confidence interval
+BOOTSTRAP_RESAMPLES = 2000
+# Series with fewer frames than this in the baseline or in the current run are not compared
+MIN_SAMPLE_COUNT = 8
+GPU_FRAME_SERIES = 'gpu.frameTime'
+CPU_FRAME_SERIES = 'cpu.frameTime'
+GPU_PASS_SERIES_PREFIX = 'gpu.pass.'
+
+class PerformanceRegressionError(AssertionError):
+    """Raised by PerformanceRegressionGate.check() when a series regressed, failing the test that runs the check."""
+    pass
+
+def load_benchmark_samples(benchmark_dir, include_passes=True, max_workers=None):
+    '''
+    Loads the per-frame times of a benchmark by series name.
+
+    :param benchmark_dir: Path of directory containing the benchmark results
+    :param include_passes: Whether to load the time of each GPU pass
+    :param max_workers: Maximum number of processes parsing the capture files, defaults to the number of CPUs
+    :return: Dict of series name (i.e. 'gpu.frameTime' or 'gpu.pass.<pass name>') to NumPy array of times
+    '''
+    gpu_frame_stats, gpu_pass_stats, cpu_frame_stats = load_benchmark_statistics(benchmark_dir, max_workers)
+    samples = {}
+    if gpu_frame_stats is not None:
+        samples[GPU_FRAME_SERIES] = gpu_frame_stats.values
+    if include_passes:
+        for pass_name, pass_stats in gpu_pass_stats.items():
+            samples[f'{GPU_PASS_SERIES_PREFIX}{pass_name}'] = pass_stats.values
+    if cpu_frame_stats is not None:
+        samples[CPU_FRAME_SERIES] = cpu_frame_stats.values
+    return samples
+
+class BaselineStore(object):
+    def __init__(self, store_dir):
+        '''
+        Initializes a store of baseline benchmark samples, with one .npz file per test suite, RHI and benchmark:
+            <store_dir>/<test suite>/<rhi>/<benchmark name>.npz
+
+        :param store_dir: Path of the directory holding the baselines, created when a baseline is saved
+        '''
+        self.store_dir = Path(store_dir)
+
+    def _baseline_path(self, test_suite, rhi, benchmark_name):
+        return self.store_dir / test_suite / rhi.lower() / f'{benchmark_name}.npz'
+
+    def load(self, test_suite, rhi, benchmark_name):
+        '''
+        Loads the baseline samples of a benchmark.
+
+        :param test_suite: Name of the test suite the benchmark was run in
+        :param rhi: The RHI the benchmark was run on
+        :param benchmark_name: Name of the benchmark, the name of its results directory
+        :return: Dict of series name to NumPy array of times, empty when there is no baseline
+        '''
+        baseline_path = self._baseline_path(test_suite, rhi, benchmark_name)
+        if not baseline_path.exists():
+            return {}
+        with np.load(baseline_path) as baseline:
+            return {series: baseline[series] for series in baseline.files}
+
+    def save(self, test_suite, rhi, benchmark_name, samples):
+        '''
+        Replaces the baseline samples of a benchmark. The file is written next to the baseline and moved over it, so
+        a run reading the baseline never sees a partial file.
+
+        :param test_suite: Name of the test suite the benchmark was run in
+        :param rhi: The RHI the benchmark was run on
+        :param benchmark_name: Name of the benchmark, the name of its results directory
+        :param samples: Dict of series name to sequence of times
+        '''
+        baseline_path = self._baseline_path(test_suite, rhi, benchmark_name)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = baseline_path.with_name(f'{baseline_path.name}.{os.getpid()}.tmp')
+        with open(temp_path, 'wb') as temp_file:
+            np.savez(temp_file, **{series: np.asarray(values, dtype=np.float64) for series, values in samples.items()})
+        os.replace(temp_path, baseline_path)
+
+def _average_ranks(values):
+    '''
+    Ranks values from 1, giving tied values the average of their ranks.
+
+    :param values: NumPy array of values
+    :return: Tuple with two indexes:
+        [0]: NumPy array with the rank of each value
+        [1]: NumPy array with the size of each group of tied values
+    '''
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    average_ranks = np.cumsum(counts) - (counts - 1) / 2.0
+    return average_ranks[inverse], counts
+
+def mann_whitney_u(baseline, current):
+    '''
+    One-sided Mann-Whitney U test of the current values being larger than the baseline values, using the normal
+    approximation with tie and continuity corrections, which is accurate for the hundreds of frames of a benchmark.
+
+    :param baseline: Sequence of baseline values
+    :param current: Sequence of current values
+    :return: Tuple with two indexes:
+        [0]: The U statistic of the current values
+        [1]: The p-value, 1.0 when all the values are equal
+    '''
+    baseline = np.asarray(baseline, dtype=np.float64)
+    current = np.asarray(current, dtype=np.float64)
+    baseline_count = baseline.size
+    current_count = current.size
+    total_count = baseline_count + current_count
+
+    ranks, tie_counts = _average_ranks(np.concatenate((baseline, current)))
+    u_statistic = float(ranks[baseline_count:].sum()) - current_count * (current_count + 1) / 2.0
+    tie_correction = float((tie_counts ** 3 - tie_counts).sum()) / (total_count * (total_count - 1))
+    variance = baseline_count * current_count / 12.0 * ((total_count + 1) - tie_correction)
+    if variance <= 0:
+        return u_statistic, 1.0
+
+    z_score = (u_statistic - baseline_count * current_count / 2.0 - 0.5) / math.sqrt(variance)
+    return u_statistic, 0.5 * math.erfc(z_score / math.sqrt(2))
+
+def bootstrap_median_change(baseline, current, confidence=1 - DEFAULT_ALPHA, resamples=BOOTSTRAP_RESAMPLES, seed=0):
+    '''
+    Bootstrap percentile confidence interval of the relative change of the median from the baseline to the current
+    values. The resampling is seeded, so the same samples always give the same interval.
+
+    :param baseline: Sequence of baseline values
+    :param current: Sequence of current values
+    :param confidence: Confidence level of the interval, i.e. 0.99
+    :param resamples: Number of resamples
+    :param seed: Seed of the resampling
+    :return: Tuple of the (lower, upper) bounds of the relative change, i.e. 0.1 for 10% slower
+    '''
+    baseline = np.asarray(baseline, dtype=np.float64)
+    current = np.asarray(current, dtype=np.float64)
+    generator = np.random.default_rng(seed)
+    baseline_medians = np.median(generator.choice(baseline, size=(resamples, baseline.size)), axis=1)
+    current_medians = np.median(generator.choice(current, size=(resamples, current.size)), axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        changes = np.where(baseline_medians > 0, current_medians / baseline_medians - 1.0, 0.0)
+    tail = (1.0 - confidence) / 2.0 * 100
+    lower, upper = np.percentile(changes, (tail, 100 - tail))
+    return float(lower), float(upper)
+
+class SeriesComparison(object):
+    def __init__(self, benchmark_name, series, baseline_median, current_median, change, regressed, p_value=None,
+                 interval=None):
+        '''
+        Result of the comparison of a series of a benchmark with its baseline.
+
+        :param benchmark_name: Name of the benchmark
+        :param series: Name of the series, i.e. 'gpu.frameTime' or 'gpu.pass.<pass name>'
+        :param baseline_median: Median of the baseline times
+        :param current_median: Median of the current times
+        :param change: Relative change of the median, i.e. 0.1 for 10% slower
+        :param regressed: Whether the series regressed beyond the threshold
+        :param p_value: p-value of the Mann-Whitney U test, None with the bootstrap method
+        :param interval: (lower, upper) bootstrap interval of the change, None with the Mann-Whitney method
+        '''
+        self.benchmark_name = benchmark_name
+        self.series = series
+        self.baseline_median = baseline_median
+        self.current_median = current_median
+        self.change = change
+        self.regressed = regressed
+        self.p_value = p_value
+        self.interval = interval
+
+    def __str__(self):
+        if self.p_value is not None:
+            evidence = f'p={self.p_value:.2g}'
+        else:
+            evidence = f'CI=[{self.interval[0]:+.1%}, {self.interval[1]:+.1%}]'
+        return (f'{self.benchmark_name} {self.series}: median {self.baseline_median:.6g} -> '
+                f'{self.current_median:.6g} ({self.change:+.1%}, {evidence})')
+
+class PerformanceRegressionGate(object):
+    def __init__(self, baseline_store, test_suite, rhi, threshold=DEFAULT_THRESHOLD, alpha=DEFAULT_ALPHA,
+                 method=MANN_WHITNEY, include_passes=True, max_workers=None):
+        '''
+        Initializes a gate comparing the benchmark results of a test suite with their baselines.
+
+        :param baseline_store: BaselineStore holding the baselines
+        :param test_suite: Name of the test suite the benchmarks were run in
+        :param rhi: The RHI the benchmarks were run on
+        :param threshold: Relative growth of the median time considered a regression, i.e. 0.05 for 5%
+        :param alpha: Significance level of the Mann-Whitney U test, or 1 - confidence of the bootstrap interval
+        :param method: 'mann-whitney' or 'bootstrap'
+        :param include_passes: Whether to compare the time of each GPU pass, besides the frame times
+        :param max_workers: Maximum number of processes parsing the capture files, defaults to the number of CPUs
+        '''
+        if method not in (MANN_WHITNEY, BOOTSTRAP):
+            raise ValueError(f'Unknown regression test method "{method}", expected "{MANN_WHITNEY}" or "{BOOTSTRAP}"')
+        self.baseline_store = baseline_store
+        self.test_suite = test_suite
+        self.rhi = rhi
+        self.threshold = threshold
+        self.alpha = alpha
+        self.method = method
+        self.include_passes = include_passes
+        self.max_workers = max_workers
+
+    def compare_series(self, benchmark_name, series, baseline, current):
+        '''
+        Compares the times of a series with its baseline.
+
+        :param benchmark_name: Name of the benchmark
+        :param series: Name of the series
+        :param baseline: NumPy array of baseline times
+        :param current: NumPy array of current times
+        :return: SeriesComparison, None when either run has fewer than MIN_SAMPLE_COUNT frames
+        '''
+        if baseline.size < MIN_SAMPLE_COUNT or current.size < MIN_SAMPLE_COUNT:
+            logger.info(f'Not comparing {benchmark_name} {series}, it needs at least {MIN_SAMPLE_COUNT} frames '
+                        f'but found {baseline.size} in the baseline and {current.size} in the current run')
+            return None
+
+        baseline_median = float(np.median(baseline))
+        current_median = float(np.median(current))
+        change = current_median / baseline_median - 1.0 if baseline_median > 0 else 0.0
+        if self.method == MANN_WHITNEY:
+            _, p_value = mann_whitney_u(baseline, current)
+            return SeriesComparison(benchmark_name, series, baseline_median, current_median, change,
+                                    p_value < self.alpha and change > self.threshold, p_value=p_value)
+
+        interval = bootstrap_median_change(baseline, current, confidence=1 - self.alpha)
+        return SeriesComparison(benchmark_name, series, baseline_median, current_median, change,
+                                interval[0] > self.threshold, interval=interval)
+
+    def compare(self, results_dir):
+        '''
+        Compares every benchmark of a results directory with its baseline. Benchmarks and series without a baseline
+        are skipped.
+
+        :param results_dir: Path of the directory containing one subdirectory of results per benchmark
+        :return: List of SeriesComparison
+        '''
+        comparisons = []
+        for benchmark_dir in sorted(Path(results_dir).iterdir()):
+            if not benchmark_dir.is_dir():
+                continue
+            baseline_samples = self.baseline_store.load(self.test_suite, self.rhi, benchmark_dir.name)
+            if not baseline_samples:
+                logger.warning(f'No baseline found for benchmark {benchmark_dir.name} of {self.test_suite} on '
+                               f'{self.rhi}, it is not compared')
+                continue
+            current_samples = load_benchmark_samples(benchmark_dir, self.include_passes, self.max_workers)
+            for series, current in current_samples.items():
+                baseline = baseline_samples.get(series)
+                if baseline is None:
+                    logger.info(f'No baseline found for {benchmark_dir.name} {series}, it is not compared')
+                    continue
+                comparison = self.compare_series(benchmark_dir.name, series, baseline, current)
+                if comparison is not None:
+                    comparisons.append(comparison)
+        return comparisons
+
+    def check(self, results_dir):
+        '''
+        Compares every benchmark of a results directory with its baseline, failing when any series regressed.
+
+        :param results_dir: Path of the directory containing one subdirectory of results per benchmark
+        :return: List of SeriesComparison, when none of them regressed
+        :raises PerformanceRegressionError: When a series regressed beyond the threshold
+        '''
+        comparisons = self.compare(results_dir)
+        regressions = [comparison for comparison in comparisons if comparison.regressed]
+        for comparison in comparisons:
+            logger.info(str(comparison))
+        if regressions:
+            details = '\n'.join(f'    {comparison}' for comparison in regressions)
+            raise PerformanceRegressionError(
+                f'{len(regressions)} benchmark series of {self.test_suite} on {self.rhi} regressed more than '
+                f'{self.threshold:.1%} ({self.method}, alpha={self.alpha}):\n{details}')
+        return comparisons
+
+    def update_baseline(self, results_dir):
+        '''
+        Replaces the baselines with the results of every benchmark of a results directory.
+
+        :param results_dir: Path of the directory containing one subdirectory of results per benchmark
+        '''
+        for benchmark_dir in Path(results_dir).iterdir():
+            if benchmark_dir.is_dir():
+                samples = load_benchmark_samples(benchmark_dir, self.include_passes, self.max_workers)
+                self.baseline_store.save(self.test_suite, self.rhi, benchmark_dir.name, samples)
+                logger.info(f'Saved the baseline of benchmark {benchmark_dir.name} of {self.test_suite} on {self.rhi}')
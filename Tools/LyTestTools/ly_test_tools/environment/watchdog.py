@@ -6,12 +6,20 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 
 The Watchdog parent class that spawns a separate thread to wait for a specific condition. If that condition is
 fulfilled, then it can raise an exception or log an error.
+
+Watchdogs given a WatchdogMonitor don't spawn a thread, the monitor's single thread runs the checks of all of them
+instead. It waits for the exit of watched processes on pidfds where the OS supports them, so their exit is seen as soon
+as it happens without polling.
 """
+import heapq
+import itertools
 import threading
 import logging
 import os
 import re
 import psutil
+import selectors
+import socket
 import time
 
 import ly_test_tools
@@ -20,19 +28,345 @@ import ly_test_tools.environment.process_utils as process_utils
 logger = logging.getLogger(__name__)
 
 
+# Seconds between the checks of watched processes on platforms without pidfds
+PROCESS_POLL_INTERVAL = 0.25
+# Seconds between the checks of watchdogs run by a WatchdogMonitor, which are cheap enough to run sub-second
+MONITOR_CHECK_INTERVAL = 0.25
+
+
 class WatchdogError(Exception):
     """ Indicates that a Watchdog met its exception condition """
 
 
+class WatchdogMonitor(object):
+    DEFAULT_JOIN_TIMEOUT = 10  # seconds
+
+    def __init__(self, name='ly_test_watchdog_monitor'):
+        # type: (str) -> WatchdogMonitor
+        """
+        Runs the checks of many watchdogs and waits for the exit of many processes on a single thread, which is only
+        started once something is registered and sleeps until the next check is due or a watched process exits.
+        The thread stops once nothing is registered anymore, and is started again by the next registration.
+        Callbacks are called on the monitor's thread, so they must be quick and must not block.
+
+        :param name: The name of the monitor thread.
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._handles = itertools.count(1)
+        # handle: [check_fn, callback, interval]
+        self._checks = {}
+        # heap of (due time, handle), entries of removed checks are skipped when they are due
+        self._schedule = []
+        # handle: [psutil.Process or None when it already exited, pidfd or None, callback, pid]
+        self._processes = {}
+        self._registered_fds = {}
+        self._exited_handles = []
+        self._selector = None
+        self._wakeup_reader = None
+        self._wakeup_writer = None
+        self._thread = None
+
+    def add_check(self, check_fn, callback, interval=MONITOR_CHECK_INTERVAL):
+        # type: (function, function, float) -> int
+        """
+        Calls check_fn every interval seconds until it returns True, then calls callback() once and stops checking.
+
+        :param check_fn: A function that must return a boolean, called on the monitor thread
+        :param callback: A function without arguments called on the monitor thread when check_fn returns True
+        :param interval: The interval (in seconds) for how frequently check_fn is called
+        :return: The handle of the check, for remove()
+        """
+        with self._lock:
+            handle = next(self._handles)
+            self._checks[handle] = [check_fn, callback, interval]
+            heapq.heappush(self._schedule, (time.monotonic() + interval, handle))
+        self._wake_up()
+        return handle
+
+    def add_process(self, pid, callback):
+        # type: (int, function) -> int
+        """
+        Calls callback(pid) once when the process exits, right away if it already exited.
+
+        :param pid: The process id to watch
+        :param callback: A function taking the pid, called on the monitor thread
+        :return: The handle of the watch, for remove()
+        """
+        try:
+            process = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            process = None
+        pidfd = None
+        if process is not None and hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(pid)
+            except OSError:
+                # i.e. the process just exited, or the kernel doesn't support pidfds
+                logger.debug(f"Could not open a pidfd for process {pid}, polling it instead", exc_info=True)
+            # the pid could have been reused by a new process before the pidfd was opened
+            if pidfd is not None and not process.is_running():
+                os.close(pidfd)
+                pidfd = None
+
+        with self._lock:
+            handle = next(self._handles)
+            self._processes[handle] = [process, pidfd, callback, pid]
+            if process is None:
+                self._exited_handles.append(handle)
+        self._wake_up()
+        return handle
+
+    def remove(self, handle):
+        # type: (int) -> bool
+        """
+        Stops a check or a process watch, its callback is not called anymore.
+
+        :param handle: The handle returned by add_check() or add_process()
+        :return: True if the handle was still registered, False if its callback was already called or it was removed
+        """
+        with self._lock:
+            process = self._processes.pop(handle, None)
+            found = self._checks.pop(handle, None) is not None or process is not None
+            self._close_unregistered_fd(handle, process)
+        if found:
+            self._wake_up()
+        return found
+
+    def is_watching(self, handle):
+        # type: (int) -> bool
+        """
+        :param handle: The handle returned by add_check() or add_process()
+        :return: True if the handle is registered and its callback wasn't called yet
+        """
+        with self._lock:
+            return handle in self._checks or handle in self._processes
+
+    def stop(self, join_timeout=DEFAULT_JOIN_TIMEOUT):
+        # type: (int) -> None
+        """
+        Removes everything registered and waits for the monitor thread to stop. The monitor can be used again
+        afterwards.
+
+        :param join_timeout: The timeout to wait for the monitor thread to join.
+        :return: None
+        """
+        with self._lock:
+            for handle, process in self._processes.items():
+                self._close_unregistered_fd(handle, process)
+            self._checks.clear()
+            self._processes.clear()
+            self._schedule = []
+            thread = self._thread
+        self._wake_up()
+        if thread is not None:
+            thread.join(timeout=join_timeout)
+            if thread.is_alive():
+                logger.error(f'Thread: {self.name} timed out when calling join()')
+
+    def _close_unregistered_fd(self, handle, process):
+        # type: (int, list) -> None
+        """
+        Closes the pidfd of a removed process watch which the monitor thread didn't register with the selector yet,
+        the thread closes the registered ones. Called with the lock held.
+        """
+        if process is not None and process[1] is not None and handle not in self._registered_fds:
+            os.close(process[1])
+            process[1] = None
+
+    def _wake_up(self):
+        # type: () -> None
+        """
+        Starts the monitor thread if needed, or interrupts its wait so it sees the registrations which changed.
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                if not self._checks and not self._processes:
+                    return
+                self._selector = selectors.DefaultSelector()
+                self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+                self._wakeup_reader.setblocking(False)
+                self._wakeup_writer.setblocking(False)
+                self._selector.register(self._wakeup_reader, selectors.EVENT_READ)
+                self._registered_fds = {}
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+                return
+            writer = self._wakeup_writer
+        try:
+            writer.send(b'\0')
+        except (BlockingIOError, OSError):
+            # the wake up buffer is full, so the thread is already going to wake up, or the thread stopped
+            # and closed it because nothing was registered anymore
+            pass
+
+    def _run(self):
+        # type: () -> None
+        """
+        The main function of the monitor thread, which returns once nothing is registered anymore.
+        """
+        try:
+            while True:
+                with self._lock:
+                    if not self._checks and not self._processes and not self._exited_handles:
+                        # a registration after this starts a new thread since this one is not the monitor's anymore
+                        self._close_thread_resources()
+                        return
+                    self._sync_process_fds()
+                    timeout = self._next_timeout()
+                for key, _ in self._selector.select(timeout):
+                    if key.fileobj is self._wakeup_reader:
+                        self._drain_wake_ups()
+                    else:
+                        with self._lock:
+                            self._exited_handles.append(key.data)
+                self._poll_processes()
+                self._notify_exited_processes()
+                self._run_due_checks()
+        except BaseException:
+            with self._lock:
+                self._close_thread_resources()
+            raise
+
+    def _close_thread_resources(self):
+        # type: () -> None
+        """
+        Closes the selector, the wake up sockets and the registered pidfds of the monitor thread, which is then
+        forgotten so the next registration starts a new thread. Only called by the monitor thread with the lock held.
+        """
+        for pidfd in self._registered_fds.values():
+            os.close(pidfd)
+        self._registered_fds = {}
+        self._selector.close()
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+        self._thread = None
+
+    def _sync_process_fds(self):
+        # type: () -> None
+        """
+        Registers the pidfds of new process watches with the selector and closes the ones of removed watches. Only
+        called by the monitor thread with the lock held, since selectors can't be changed while another thread selects.
+        """
+        for handle, process in self._processes.items():
+            if process[1] is not None and handle not in self._registered_fds:
+                self._selector.register(process[1], selectors.EVENT_READ, data=handle)
+                self._registered_fds[handle] = process[1]
+        for handle in [handle for handle in self._registered_fds if handle not in self._processes]:
+            pidfd = self._registered_fds.pop(handle)
+            self._selector.unregister(pidfd)
+            os.close(pidfd)
+
+    def _next_timeout(self):
+        # type: () -> float or None
+        """
+        :return: Seconds until the next check is due, None to wait until woken up when nothing needs to be polled
+        """
+        while self._schedule and self._schedule[0][1] not in self._checks:
+            heapq.heappop(self._schedule)
+        timeout = None
+        if self._schedule:
+            timeout = max(self._schedule[0][0] - time.monotonic(), 0)
+        if any(process[1] is None for process in self._processes.values()):
+            timeout = PROCESS_POLL_INTERVAL if timeout is None else min(timeout, PROCESS_POLL_INTERVAL)
+        return timeout
+
+    def _drain_wake_ups(self):
+        # type: () -> None
+        try:
+            while self._wakeup_reader.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _poll_processes(self):
+        # type: () -> None
+        """
+        Checks the processes watched without a pidfd, which is a cheap check of a single process
+        """
+        with self._lock:
+            polled = [(handle, process[0]) for handle, process in self._processes.items() if process[1] is None]
+        exited = [handle for handle, process in polled if process is not None and not process.is_running()]
+        if exited:
+            with self._lock:
+                self._exited_handles.extend(exited)
+
+    def _notify_exited_processes(self):
+        # type: () -> None
+        with self._lock:
+            exited = [(self._processes.pop(handle), handle) for handle in self._exited_handles
+                      if handle in self._processes]
+            self._exited_handles = []
+            for process, handle in exited:
+                if handle in self._registered_fds:
+                    self._selector.unregister(self._registered_fds.pop(handle))
+                if process[1] is not None:
+                    os.close(process[1])
+        for process, _ in exited:
+            self._call(process[2], process[3])
+
+    def _run_due_checks(self):
+        # type: () -> None
+        now = time.monotonic()
+        due_checks = []
+        with self._lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                _, handle = heapq.heappop(self._schedule)
+                if handle in self._checks:
+                    due_checks.append((handle, self._checks[handle]))
+        for handle, (check_fn, callback, interval) in due_checks:
+            try:
+                condition_met = check_fn()
+            except Exception:  # purposefully broad, a failing check must not stop the other watchdogs
+                logger.warning(f"Watchdog check {check_fn} raised an exception, it is not checked anymore",
+                               exc_info=True)
+                self.remove(handle)
+                continue
+            with self._lock:
+                if handle not in self._checks:
+                    continue
+                if condition_met:
+                    del self._checks[handle]
+                else:
+                    heapq.heappush(self._schedule, (time.monotonic() + interval, handle))
+            if condition_met:
+                self._call(callback)
+
+    def _call(self, callback, *args):
+        # type: (function, ...) -> None
+        try:
+            callback(*args)
+        except Exception:  # purposefully broad, a failing callback must not stop the other watchdogs
+            logger.warning(f"Watchdog callback {callback} raised an exception", exc_info=True)
+
+
+_shared_monitor = None
+_shared_monitor_lock = threading.Lock()
+
+
+def get_shared_monitor():
+    # type: () -> WatchdogMonitor
+    """
+    :return: The WatchdogMonitor shared by the watchdogs of all the tests, its thread only runs while it watches
+    """
+    global _shared_monitor
+    with _shared_monitor_lock:
+        if _shared_monitor is None:
+            _shared_monitor = WatchdogMonitor()
+        return _shared_monitor
+
+
 class Watchdog(object):
     DEFAULT_JOIN_TIMEOUT = 10  # seconds
 
-    def __init__(self, bool_fn, interval=1, raise_on_condition=True, name='ly_test_watchdog', error_message=''):
-        # type: (function, int, bool, str, str) -> Watchdog
+    def __init__(self, bool_fn, interval=1, raise_on_condition=True, name='ly_test_watchdog', error_message='',
+                 monitor=None, callback=None):
+        # type: (function, int, bool, str, str, WatchdogMonitor, function) -> Watchdog
         """
         A Watchdog object that takes in a boolean function. It spawns a thread that loops over the boolean function
         until it returns True. If the boolean function returns True, then a flag will be set and an exception
-        will be raised when stop() is called.
+        will be raised when stop() is called. When a monitor is given, the monitor's thread calls the boolean function
+        instead of a thread of the watchdog.
 
         :param bool_fn: A function that must return a boolean. It will be ran by the spawned thread until it's True
         :param interval: The interval (in seconds) for how frequently the bool_fn is called on the thread.
@@ -41,6 +375,9 @@ class Watchdog(object):
         :param name: The name of the thread.
         :param error_message: The error message to log when bool_fn returns True. Defaults to printing the watchdog name
         and function name.
+        :param monitor: The WatchdogMonitor to run the watchdog on, i.e. get_shared_monitor(). Defaults to a thread of
+        the watchdog.
+        :param callback: A function called with the watchdog as soon as bool_fn returns True, on the thread running it.
         """
         self.caught_failure = False
         self.name = name
@@ -50,8 +387,11 @@ class Watchdog(object):
         self._raise_on_condition = raise_on_condition
         default_error_message = f'Watchdog: {name} caught an unexpected condition from function: {bool_fn.__name__}()'
         self._error_message = error_message if error_message else default_error_message
+        self._monitor = monitor
+        self._monitor_handle = None
+        self._callback = callback
         self._shutdown = threading.Event()
-        self._watchdog_thread = threading.Thread(target=self._watchdog, name=name)
+        self._watchdog_thread = None if monitor else threading.Thread(target=self._watchdog, name=name)
 
     def start(self):
         # type: () -> None
@@ -61,10 +401,35 @@ class Watchdog(object):
 
         :return: None
         """
+        if self._monitor:
+            self.caught_failure = False
+            self._monitor_handle = self._register(self._monitor)
+            return
         self._shutdown.clear()
         self._watchdog_thread.start()
         self.caught_failure = False
 
+    def _register(self, monitor):
+        # type: (WatchdogMonitor) -> int
+        """
+        Registers the watchdog's condition with a monitor.
+
+        :param monitor: The WatchdogMonitor to run the watchdog on
+        :return: The handle of the registration
+        """
+        return monitor.add_check(self._bool_fn, self._on_condition, self._interval)
+
+    def _on_condition(self):
+        # type: () -> None
+        """
+        Records that the watchdog's condition was met and calls the callback, if any.
+
+        :return: None
+        """
+        self.caught_failure = True
+        if self._callback:
+            self._callback(self)
+
     def stop(self, join_timeout=DEFAULT_JOIN_TIMEOUT):
         # type: (int) -> None
         """
@@ -74,14 +439,18 @@ class Watchdog(object):
         :param join_timeout: The timeout to wait for the watchdog thread to join.
         :return: None
         """
-        # Set the Event attribute so that the thread stops running
-        self._shutdown.set()
+        if self._monitor:
+            if self._monitor_handle is not None:
+                self._monitor.remove(self._monitor_handle)
+        else:
+            # Set the Event attribute so that the thread stops running
+            self._shutdown.set()
 
-        # Join the watchdog thread back to primary thread
-        self._watchdog_thread.join(timeout=join_timeout)
-        if self.is_alive():
-            # thread has timed out because it's still alive
-            logger.error(f'Thread: {self.name} timed out when calling join()')
+            # Join the watchdog thread back to primary thread
+            self._watchdog_thread.join(timeout=join_timeout)
+            if self.is_alive():
+                # thread has timed out because it's still alive
+                logger.error(f'Thread: {self.name} timed out when calling join()')
 
         # No further action taken if nothing was caught
         if not self.caught_failure:
@@ -96,9 +465,12 @@ class Watchdog(object):
         # type: () -> bool
         """
         The thread is killed when it times out or its target returns True. Timed out threads are considered not alive.
+        Watchdogs run by a monitor are alive until they are stopped or their condition is met.
 
         :return: Returns True if the thread is alive, else False
         """
+        if self._monitor:
+            return self._monitor_handle is not None and self._monitor.is_watching(self._monitor_handle)
         return self._watchdog_thread.is_alive()
 
     def _watchdog(self):
@@ -116,14 +488,14 @@ class Watchdog(object):
                 return
             # call the target function and see if it returned True
             if self._bool_fn():
-                self.caught_failure = True
+                self._on_condition()
                 return
 
 
 class ProcessUnresponsiveWatchdog(Watchdog):
     def __init__(self, process_id, interval=1, raise_on_condition=True, name='process_watchdog', error_message='',
-                 unresponsive_timeout_seconds=30):
-        # type: (int, int, bool, str, str, int) -> ProcessUnresponsiveWatchdog
+                 unresponsive_timeout_seconds=30, monitor=None, callback=None):
+        # type: (int, int, bool, str, str, int, WatchdogMonitor, function) -> ProcessUnresponsiveWatchdog
         """
         Watches a process ID and reports if it is unresponsive for a given timeout. If multiple processes need to be
         watched, then multiple watchdogs should be instantiated.
@@ -137,6 +509,8 @@ class ProcessUnresponsiveWatchdog(Watchdog):
         :param error_message: The error message when bool_fn returns True. Defaults to the watchdog name and pid
         :param unresponsive_timeout_seconds: How long the process needs to be unresponsive for in order for the watchdog
         to report (in seconds).
+        :param monitor: The WatchdogMonitor to run the watchdog on, defaults to a thread of the watchdog.
+        :param callback: A function called with the watchdog as soon as the process is found unresponsive.
         """
         if not ly_test_tools.WINDOWS:
             pass # TODO add non-windows support
@@ -152,7 +526,8 @@ class ProcessUnresponsiveWatchdog(Watchdog):
 
         super(ProcessUnresponsiveWatchdog, self).__init__(bool_fn=self._process_not_responding, interval=interval,
                                                           raise_on_condition=raise_on_condition, name=name,
-                                                          error_message=error_message)
+                                                          error_message=error_message, monitor=monitor,
+                                                          callback=callback)
 
     def _process_not_responding(self):
         # type: () -> bool
@@ -196,8 +571,9 @@ class ProcessUnresponsiveWatchdog(Watchdog):
 
 
 class CrashLogWatchdog(Watchdog):
-    def __init__(self, log_path, interval=1, raise_on_condition=True, name='crash_log_watchdog', error_message=''):
-        # type: (str, int, bool, str, str) -> CrashLogWatchdog
+    def __init__(self, log_path, interval=1, raise_on_condition=True, name='crash_log_watchdog', error_message='',
+                 monitor=None, callback=None):
+        # type: (str, int, bool, str, str, WatchdogMonitor, function) -> CrashLogWatchdog
         """
         A watchdog that watches if a file gets created and reports if it finds the file. The watchdog will check to see
         if the file already exists and removes it before starting to watch.
@@ -208,6 +584,8 @@ class CrashLogWatchdog(Watchdog):
         when bool_fn returns True.
         :param name: The name of the thread.
         :param error_message: The error message to log when bool_fn returns True. Defaults to printing the watchdog name
+        :param monitor: The WatchdogMonitor to run the watchdog on, defaults to a thread of the watchdog.
+        :param callback: A function called with the watchdog as soon as the log is found.
         """
         self._log_path = log_path
 
@@ -224,7 +602,8 @@ class CrashLogWatchdog(Watchdog):
 
         super(CrashLogWatchdog, self).__init__(bool_fn=crash_exists, interval=interval,
                                                raise_on_condition=raise_on_condition,
-                                               name=name, error_message=error_message)
+                                               name=name, error_message=error_message, monitor=monitor,
+                                               callback=callback)
 
     def stop(self):
         # type: () -> None
@@ -241,4 +620,60 @@ class CrashLogWatchdog(Watchdog):
                     print(line.strip('\n'))
             print("=" * len(header) + "\n")
 
-        super(CrashLogWatchdog, self).stop()
\ No newline at end of file
+        super(CrashLogWatchdog, self).stop()
+
+
+class ProcessExitWatchdog(Watchdog):
+    def __init__(self, process_id, interval=1, raise_on_condition=True, name='process_exit_watchdog', error_message='',
+                 monitor=None, callback=None):
+        # type: (int, int, bool, str, str, WatchdogMonitor, function) -> ProcessExitWatchdog
+        """
+        Watches a process ID and reports if the process exits before the watchdog is stopped, i.e. when it crashed
+        during the test. With a monitor the exit is seen as soon as it happens on platforms with pidfds (Linux), and
+        the interval is unused.
+
+        :param process_id: The process id to watch
+        :param interval: The interval (in seconds) for how frequently the process is checked when run on a thread.
+        :param raise_on_condition: If True, raises an exception when the process exits. If False, logs an error message
+        when the process exits.
+        :param name: The name of the thread.
+        :param error_message: The error message when the process exits. Defaults to the watchdog name and pid
+        :param monitor: The WatchdogMonitor to run the watchdog on, defaults to a thread of the watchdog.
+        :param callback: A function called with the watchdog as soon as the process exits.
+        """
+        self._pid = process_id
+        try:
+            self._process = psutil.Process(process_id)
+        except psutil.NoSuchProcess:
+            # the process already exited, which the first check reports
+            logger.debug(f"Process with pid: {process_id} exited before its exit watchdog was created")
+            self._process = None
+        if not error_message:
+            error_message = f"Process exit watchdog has found that process with pid: {process_id} exited during the " \
+                            f"test run. Investigate the process for crashes."
+
+        def process_exited():
+            return self._process is None or not self._process.is_running()
+
+        super(ProcessExitWatchdog, self).__init__(bool_fn=process_exited, interval=interval,
+                                                  raise_on_condition=raise_on_condition, name=name,
+                                                  error_message=error_message, monitor=monitor, callback=callback)
+
+    def _register(self, monitor):
+        # type: (WatchdogMonitor) -> int
+        """
+        Registers the process with the monitor, which waits for its exit instead of checking it on an interval.
+
+        :param monitor: The WatchdogMonitor to run the watchdog on
+        :return: The handle of the registration
+        """
+        return monitor.add_process(self._pid, lambda pid: self._on_condition())
+
+    def get_pid(self):
+        # type: () -> int
+        """
+        Get the pid that the watchdog is watching.
+
+        :return: The process id of the watchdog
+        """
+        return self._pid
@@ -6,16 +6,20 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 
 Functions to aid in monitoring log files being actively written to for a set of lines to read for.
 """
+import functools
+import io
 import logging
 import os
 import re
+import time
 
 import ly_test_tools.environment.waiter as waiter
 import ly_test_tools.launchers.platforms.base
 
 logger = logging.getLogger(__name__)
 
-LOG_MONITOR_INTERVAL = 0.1  # seconds
+LOG_MONITOR_INTERVAL = 0.1  # seconds, the longest time to wait for new log data before checking the launcher again
+LOG_MONITOR_MIN_POLL_INTERVAL = 0.005  # seconds, the first time to wait for the log file to grow
 
 
 class LogMonitorException(Exception):
@@ -38,14 +42,140 @@ def check_exact_match(line, expected_line):
     :return: An exact match for the string if one is found, None otherwise.
     """
 
-    # Look for either start of line or whitespace, then the expected_line, then either end of the line or whitespace.
-    # This way we don't partial match inside of a string.  So for example, 'foo' matches 'foo bar' but not 'foobar'
-    regex_pattern = re.compile("(^|\\s){}($|\\s)".format(re.escape(expected_line)), re.UNICODE)
-    if regex_pattern.search(line) is not None:
+    if _get_exact_match_pattern(expected_line).search(line) is not None:
         return expected_line
 
     return None
 
+
+@functools.lru_cache(maxsize=1024)
+def _get_exact_match_pattern(expected_line):
+    """
+    Compiles the regular expression used by check_exact_match() to find an exact match for 'expected_line'.
+
+    :param expected_line: The exact string to match
+    :return: The compiled regular expression
+    """
+    # Look for either start of line or whitespace, then the expected_line, then either end of the line or whitespace.
+    # This way we don't partial match inside of a string.  So for example, 'foo' matches 'foo bar' but not 'foobar'
+    return re.compile("(^|\\s){}($|\\s)".format(re.escape(expected_line)), re.UNICODE)
+
+
+class LineMatcher(object):
+    """
+    Finds which strings of a list have an exact match in a line, as check_exact_match() does for a single string.
+    A line is first scanned once for all the strings with a single precompiled pattern, so only the lines that contain
+    at least one of the strings, which are few in a log file, are checked for an exact match of each string.
+    """
+
+    def __init__(self, lines):
+        """
+        :param lines: list of strings to search for, this list is not modified
+        """
+        self.lines = list(lines)
+        self._any_line_pattern = None
+        self._compile()
+
+    def _compile(self):
+        unique_lines = list(dict.fromkeys(self.lines))
+        self._any_line_pattern = re.compile(
+            "|".join(re.escape(line) for line in unique_lines), re.UNICODE) if unique_lines else None
+
+    def find(self, line):
+        """
+        Finds the strings that have an exact match in the line.
+
+        :param line: The log line string to search
+        :return: list of the matching strings, in the order of the list of strings searched for
+        """
+        if self._any_line_pattern is None or self._any_line_pattern.search(line) is None:
+            return []
+        return [expected_line for expected_line in self.lines if check_exact_match(line, expected_line) is not None]
+
+    def remove(self, lines):
+        """
+        Stops searching for the strings.
+
+        :param lines: list of strings to remove from the strings searched for
+        """
+        if not lines:
+            return
+        for line in lines:
+            self.lines.remove(line)
+        self._compile()
+
+
+class LogTailer(object):
+    """
+    Reads the lines of a log file which is still being written to as they are appended.
+    A partially written last line is kept until the rest of it is written, and wait_for_data() returns as soon as the
+    log file grows rather than after a fixed interval.
+    """
+
+    def __init__(self, log):
+        """
+        :param log: TextIO file object opened for reading
+        """
+        self._log = log
+        self._partial_line = ""
+        self._log_size = None
+
+    def _get_log_size(self):
+        try:
+            return os.fstat(self._log.fileno()).st_size
+        except (OSError, ValueError, io.UnsupportedOperation):
+            # not a file on disk
+            return None
+
+    def read_lines(self, flush=False):
+        """
+        Reads the complete lines appended to the log file since the last call.
+
+        :param flush: whether to also return the last line when it doesn't end with a newline yet, i.e. when the log
+            file won't be written to anymore
+        :return: list of lines without their newline
+        """
+        # anything appended after the size is read is read now or on the next call
+        self._log_size = self._get_log_size()
+        data = self._log.read()
+        if data:
+            data = self._partial_line + data
+            lines = data.split("\n")
+            self._partial_line = lines.pop()
+        else:
+            lines = []
+
+        if flush and self._partial_line:
+            lines.append(self._partial_line)
+            self._partial_line = ""
+        return lines
+
+    def wait_for_data(self, timeout):
+        """
+        Blocks until the log file grows or until the timeout expires. The size of the log file is polled at an interval
+        starting at LOG_MONITOR_MIN_POLL_INTERVAL and doubling until the timeout, so bursts of log lines are read
+        as they are written without polling continuously while the log file is idle.
+
+        :param timeout: The longest time to wait in seconds
+        :return: True if the log file grew, False otherwise
+        """
+        if self._log_size is None:
+            time.sleep(timeout)
+            return False
+
+        timeout_end = time.time() + timeout
+        poll_interval = LOG_MONITOR_MIN_POLL_INTERVAL
+        while True:
+            log_size = self._get_log_size()
+            if log_size is None or log_size != self._log_size:
+                return True
+            remaining_time = timeout_end - time.time()
+            if remaining_time <= 0:
+                return False
+            time.sleep(min(poll_interval, remaining_time))
+            poll_interval *= 2
+
+
 class LogMonitor(object):
 
     def __init__(self, launcher, log_file_path, log_creation_max_wait_time=5):
@@ -61,9 +191,14 @@ class LogMonitor(object):
         self.expected_lines_not_found = []
         self.launcher = launcher
         self.log_file_path = log_file_path
-        self.py_log = ""
+        self.py_log_lines = []
         self.log_creation_max_wait_time = log_creation_max_wait_time
 
+    @property
+    def py_log(self):
+        """The log lines read by the last call to monitor_log_for_lines(), prefixed by the log file name."""
+        return "".join(self.py_log_lines)
+
     def monitor_log_for_lines(self,
                               expected_lines=None,
                               unexpected_lines=None,
@@ -125,18 +260,21 @@ class LogMonitor(object):
             raise LogMonitorException("Found expected_lines in unexpected_lines:\n{}".format("\n".join(unexpected_lines_in_expected)))
 
         # Log file is now opened by our process, start monitoring log lines:
-        self.py_log = ""
+        self.py_log_lines = []
         try:
             with open(self.log_file_path, mode='r', encoding='utf-8') as log:
                 logger.info(
                     "Monitoring log file '{}' for '{}' seconds".format(self.log_file_path, timeout))
                     
-                search_expected_lines = expected_lines.copy()
-                search_unexpected_lines = unexpected_lines.copy()
+                search_expected_lines = LineMatcher(expected_lines)
+                search_unexpected_lines = LineMatcher(unexpected_lines)
+                self.expected_lines_not_found = search_expected_lines.lines
+                log_tailer = LogTailer(log)
                 waiter.wait_for(  # Sets the values for self.unexpected_lines_found & self.expected_lines_not_found
-                    lambda: self._find_lines(log, search_expected_lines, search_unexpected_lines, halt_on_unexpected),
+                    lambda: self._find_lines(log_tailer, search_expected_lines, search_unexpected_lines,
+                                             halt_on_unexpected),
                     timeout=timeout,
-                    interval=LOG_MONITOR_INTERVAL)
+                    interval=0)  # _find_lines() waits for new log data
         except AssertionError:  # Raised by waiter when timeout is reached.
             logger.warning(f"Timeout of '{timeout}' seconds was reached, log lines may not have been found")
             # exception will be raised below by _validate_results with failure analysis
@@ -151,26 +289,22 @@ class LogMonitor(object):
 
     def _find_expected_lines(self, line, expected_lines):
         """
-        Checks for any matches between the 'line' string and strings in the 'expected_lines' list.
+        Checks for any matches between the 'line' string and strings in the 'expected_lines' LineMatcher.
         Removes expected_lines strings that are found from the main expected_lines list and returns the remaining
         expected_lines list values.
 
         :param line: string from a TextIO or BinaryIO file object being read line by line.
-        :param expected_lines: list of strings to search for in each read line from the log file.
+        :param expected_lines: LineMatcher of the strings to search for in each read line from the log file.
         :return: updated expected_lines list of strings after parsing the value of the line param.
         """
-        expected_lines_to_remove = []
-
-        for expected_line in expected_lines:
-            searched_line = check_exact_match(line, expected_line)
-            if expected_line == searched_line:
-                logger.debug("Found expected line: {} from line: {}".format(expected_line, line))
-                expected_lines_to_remove.append(expected_line)
+        expected_lines_to_remove = expected_lines.find(line)
 
         for expected_line in expected_lines_to_remove:
-            expected_lines.remove(expected_line)
+            logger.debug("Found expected line: {} from line: {}".format(expected_line, line))
 
-        return expected_lines
+        expected_lines.remove(expected_lines_to_remove)
+
+        return expected_lines.lines
 
     def _find_unexpected_lines(self, line, unexpected_lines, halt_on_unexpected):
         """
@@ -179,7 +313,7 @@ class LogMonitor(object):
         unexpected_lines_found list.
 
         :param line: string from a TextIO or BinaryIO file object being read line by line.
-        :param unexpected_lines: list of strings to search for in each read line from the log file.
+        :param unexpected_lines: LineMatcher of the strings to search for in each read line from the log file.
         :param halt_on_unexpected: boolean to determine whether to raise ValueError on the first
             unexpected line found (True) or not (False)
         :return: unexpected_lines_found from the unexpected_lines searched for in the current log line.
@@ -187,18 +321,15 @@ class LogMonitor(object):
         unexpected_lines_found = self.unexpected_lines_found
         unexpected_lines_to_remove = []
 
-        for unexpected_line in unexpected_lines:
-            searched_line = check_exact_match(line, unexpected_line)
-            if unexpected_line == searched_line:
-                logger.debug("Found unexpected line: {} from line: {}".format(unexpected_line, line))
-                if halt_on_unexpected:
-                    raise LogMonitorException(
-                        "Unexpected line appeared: {} from line: {}".format(unexpected_line, line))
-                unexpected_lines_found.append(unexpected_line)
-                unexpected_lines_to_remove.append(unexpected_line)
+        for unexpected_line in unexpected_lines.find(line):
+            logger.debug("Found unexpected line: {} from line: {}".format(unexpected_line, line))
+            if halt_on_unexpected:
+                raise LogMonitorException(
+                    "Unexpected line appeared: {} from line: {}".format(unexpected_line, line))
+            unexpected_lines_found.append(unexpected_line)
+            unexpected_lines_to_remove.append(unexpected_line)
 
-        for unexpected_line in unexpected_lines_to_remove:
-            unexpected_lines.remove(unexpected_line)
+        unexpected_lines.remove(unexpected_lines_to_remove)
 
         return unexpected_lines_found
 
@@ -253,11 +384,13 @@ class LogMonitor(object):
         """
         Given a list of strings in expected_lines, unexpected_lines, and a log file, read every line in the log file,
         and make sure all expected_lines strings appear & no unexpected_lines strings appear in the log file.
+        While the launcher process is running, waits up to LOG_MONITOR_INTERVAL for more lines to be written
+        before returning.
         NOTE: This loop will only end when a launcher process ends or if used as a callback function (i.e. waiter).
 
-        :param log: TextIO or BinaryIO file object to read lines from.
-        :param expected_lines: list of strings to search for in each read line from the log file.
-        :param unexpected_lines: list of strings that must not be present in the log_file_path file.
+        :param log: LogTailer of the log file to read lines from.
+        :param expected_lines: LineMatcher of the strings to search for in each read line from the log file.
+        :param unexpected_lines: LineMatcher of the strings that must not be present in the log_file_path file.
         :param halt_on_unexpected: boolean to determine whether to raise LogMonitorException on the first
             unexpected line found (True) or not (False)
         :return: (wait_condition) Whether the log processing has finished(True: finished, False: unfinished)
@@ -266,7 +399,7 @@ class LogMonitor(object):
         log_filename = os.path.basename(self.log_file_path)
 
         def process_line(line):
-            self.py_log += ("|%s| %s\n" % (log_filename, line))
+            self.py_log_lines.append("|%s| %s\n" % (log_filename, line))
             expected_lines_not_found = self._find_expected_lines(line, expected_lines)
             unexpected_lines_found = self._find_unexpected_lines(line, unexpected_lines, halt_on_unexpected)
             self.unexpected_lines_found = unexpected_lines_found
@@ -278,8 +411,7 @@ class LogMonitor(object):
         # If in the mean time the file is closed, we will make sure we read everything by issuing an extra call
         # by returning the previous alive state
         process_runing = self.launcher.is_alive() 
-        for line in log:
-            line = line[:-1]  # remove /n
+        for line in log.read_lines(flush=not process_runing):
             try:
                 process_line(line)
             except LogMonitorException as e:
@@ -289,4 +421,7 @@ class LogMonitor(object):
         if exception_info is not None:
             raise LogMonitorException(*exception_info)
 
+        if process_runing:
+            log.wait_for_data(LOG_MONITOR_INTERVAL)
+
         return not process_runing  # Will loop until the process ends
@@ -3,26 +3,226 @@ Copyright (c) Contributors to the Open 3D Engine Project.
 For complete copyright and license terms please see the LICENSE at the root of this distribution.
 
 SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Client sending events to the Filebeat TCP input, which forwards them to MARS.
+
+Events are serialised on the calling thread and queued to a FilebeatShipper, whose background thread writes them to the
+socket in batches bounded by size and by delay. The queue is bounded, so callers producing events faster than Filebeat
+accepts them block until there is room again. When Filebeat can't be reached the batches are appended to an optional
+spill file, which is sent first the next time the shipper connects, even by another process.
 """
 
 import datetime
 import json
+import os
+import queue
 import socket
+import threading
+import time
+
+# Maximum size in bytes of a batch of events written to the socket at once
+MAX_BATCH_BYTES = 256 * 1024
+# Maximum time in seconds an event waits for more events to batch with
+MAX_BATCH_DELAY = 0.2
+# Maximum number of events waiting to be sent, sending more events blocks until the oldest ones are sent
+MAX_QUEUED_EVENTS = 10000
+# Time in seconds after a failed connection during which batches are spilled without trying to connect again
+RECONNECT_INTERVAL = 5
+# Size in bytes of the chunks of the spill file sent to Filebeat
+SPILL_CHUNK_SIZE = 1024 * 1024
 
 
 class FilebeatExn(Exception):
     pass
 
 
-class FilebeatClient(object):
-    def __init__(self, logger, host="127.0.0.1", port=9000, timeout=20):
-        self._logger = logger.getChild("filebeat_client")
+class FilebeatShipper(object):
+    """
+    Sends newline terminated events to Filebeat from a background thread, in size and time bounded batches
+    """
+
+    def __init__(self, logger, host="127.0.0.1", port=9000, timeout=20, spill_path=None,
+                 max_batch_bytes=MAX_BATCH_BYTES, max_batch_delay=MAX_BATCH_DELAY, max_queued_events=MAX_QUEUED_EVENTS):
+        """
+        :param logger: Logger used for the connection messages
+        :param host: Host of the Filebeat TCP input
+        :param port: Port of the Filebeat TCP input
+        :param timeout: Timeout in seconds of the socket operations, and of sending an event to a full queue
+        :param spill_path: Path of the file the batches are appended to when Filebeat can't be reached, None to fail
+        :param max_batch_bytes: Maximum size in bytes of a batch
+        :param max_batch_delay: Maximum time in seconds an event waits for more events to batch with
+        :param max_queued_events: Maximum number of events waiting to be sent
+        """
+        self._logger = logger
         self._filebeat_host = host
         self._filebeat_port = port
         self._socket_timeout = timeout
+        self._spill_path = spill_path
+        self._max_batch_bytes = max_batch_bytes
+        self._max_batch_delay = max_batch_delay
         self._socket = None
+        self._next_connect_time = 0
+        self._error = None
+        self._closed = False
+        self._queue = queue.Queue(maxsize=max_queued_events)
+        self._thread = threading.Thread(target=self._run, name="FilebeatShipper", daemon=True)
+        self._thread.start()
+
+    def connect(self):
+        """
+        Connects to Filebeat right away instead of on the first batch, sending the spill file if there is one
+        :return: None
+        :raises FilebeatExn: When Filebeat can't be reached and there is no spill file to fall back to
+        """
+        try:
+            self._open_socket()
+        except FilebeatExn:
+            if self._spill_path is None:
+                raise
+            self._logger.warning(f"Filebeat can't be reached, spilling events to {self._spill_path}")
+
+    def send(self, data):
+        """
+        Queues serialised events, blocking while the queue is full
+        :param data: Bytes of one or more newline terminated events
+        :return: None
+        :raises FilebeatExn: When the shipper is closed, previous events were lost or the queue stayed full
+        """
+        self._raise_error()
+        if self._closed:
+            raise FilebeatExn("Filebeat shipper is closed")
+        try:
+            self._queue.put(data, timeout=self._socket_timeout)
+        except queue.Full:
+            raise FilebeatExn(f"Filebeat didn't accept events for {self._socket_timeout} seconds") from None
+
+    def flush(self):
+        """
+        Waits until all the queued events are sent or spilled
+        :return: None
+        :raises FilebeatExn: When events were lost
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """
+        Sends the queued events and stops the background thread
+        :return: None
+        :raises FilebeatExn: When events were lost
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise FilebeatExn(self._error)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            data = self._queue.get()
+            if data is None:
+                self._queue.task_done()
+                break
+            batch = [data]
+            batch_size = len(data)
+            batch_end_time = time.monotonic() + self._max_batch_delay
+            while batch_size < self._max_batch_bytes:
+                try:
+                    data = self._queue.get(timeout=max(batch_end_time - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if data is None:
+                    stopping = True
+                    break
+                batch.append(data)
+                batch_size += len(data)
+
+            try:
+                self._write_batch(b"".join(batch))
+            except Exception as e:  # Report any failure to the caller instead of losing the thread silently
+                self._logger.error(f"Failed to send {len(batch)} events to Filebeat: {e}")
+                self._error = f"Failed to send events to Filebeat: {e}"
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+        self._close_socket()
+
+    def _write_batch(self, batch):
+        # A batch is only sent again after reconnecting when sending it failed, since sendall() doesn't tell how much of
+        # it was received. Only that batch can be sent twice, not the events sent before it.
+        for attempt in range(2):
+            try:
+                if self._socket is None:
+                    if time.monotonic() < self._next_connect_time:
+                        break
+                    self._open_socket()
+                self._socket.sendall(batch)
+                return
+            except FilebeatExn:
+                break
+            except OSError as e:
+                self._logger.debug(f"Filebeat socket failed: {e}")
+                self._close_socket()
+        if self._spill_path is None:
+            raise FilebeatExn("Failed to connect to Filebeat")
+        with open(self._spill_path, "ab") as spill_file:
+            spill_file.write(batch)
+
+    def _open_socket(self):
+        self._logger.info(f"Connecting to Filebeat on {self._filebeat_host}:{self._filebeat_port}")
+
+        try:
+            self._socket = socket.create_connection((self._filebeat_host, self._filebeat_port), self._socket_timeout)
+        except OSError:
+            self._socket = None
+            self._next_connect_time = time.monotonic() + RECONNECT_INTERVAL
+            raise FilebeatExn("Failed to connect to Filebeat") from None
 
-        self._open_socket()
+        if self._spill_path is not None and os.path.exists(self._spill_path):
+            self._send_spill_file()
+
+    def _send_spill_file(self):
+        self._logger.info(f"Sending events spilled to {self._spill_path} to Filebeat")
+        try:
+            with open(self._spill_path, "rb") as spill_file:
+                for chunk in iter(lambda: spill_file.read(SPILL_CHUNK_SIZE), b""):
+                    self._socket.sendall(chunk)
+        except OSError as e:
+            # The spill file is kept, so it is sent again entirely on the next connection
+            self._close_socket()
+            self._next_connect_time = time.monotonic() + RECONNECT_INTERVAL
+            raise FilebeatExn(f"Failed to send the spilled events to Filebeat: {e}") from None
+        os.remove(self._spill_path)
+
+    def _close_socket(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+class FilebeatClient(object):
+    def __init__(self, logger, host="127.0.0.1", port=9000, timeout=20, spill_path=None, **shipper_options):
+        """
+        :param logger: Logger used by the client
+        :param host: Host of the Filebeat TCP input
+        :param port: Port of the Filebeat TCP input
+        :param timeout: Timeout in seconds of the socket operations
+        :param spill_path: Path of the file the events are appended to when Filebeat can't be reached, None to fail
+        :param shipper_options: Keyword arguments of FilebeatShipper, i.e. max_batch_bytes or max_batch_delay
+        :raises FilebeatExn: When Filebeat can't be reached and there is no spill file to fall back to
+        """
+        self._logger = logger.getChild("filebeat_client")
+        self._shipper = FilebeatShipper(self._logger, host, port, timeout, spill_path, **shipper_options)
+        try:
+            self._shipper.connect()
+        except FilebeatExn:
+            self._shipper.close()
+            raise
 
     def send_event(self, payload, index, timestamp=None, pipeline="filebeat"):
         if timestamp is None:
@@ -40,29 +240,24 @@ class FilebeatClient(object):
         data = data.encode()
 
         self._logger.debug(f"-> {data}")
-        self._send_data(data)
+        self._shipper.send(data)
 
-    def _open_socket(self):
-        self._logger.info(f"Connecting to Filebeat on {self._filebeat_host}:{self._filebeat_port}")
+    def flush(self):
+        """
+        Waits until all the events sent so far are delivered to Filebeat or spilled
+        :raises FilebeatExn: When events were lost
+        """
+        self._shipper.flush()
 
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._socket.settimeout(self._socket_timeout)
+    def close(self):
+        """
+        Delivers the remaining events and closes the connection
+        :raises FilebeatExn: When events were lost
+        """
+        self._shipper.close()
 
-        try:
-            self._socket.connect((self._filebeat_host, self._filebeat_port))
-        except (ConnectionError, socket.timeout):
-            raise FilebeatExn("Failed to connect to Filebeat") from None
+    def __enter__(self):
+        return self
 
-    def _send_data(self, data):
-        total_sent = 0
-
-        while total_sent < len(data):
-            try:
-                sent = self._socket.send(data[total_sent:])
-            except BrokenPipeError:
-                self._logger.debug("Filebeat socket closed by peer")
-                self._socket.close()
-                self._open_socket()
-                total_sent = 0
-            else:
-                total_sent = total_sent + sent
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
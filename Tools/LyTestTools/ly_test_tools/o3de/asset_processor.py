@@ -25,8 +25,10 @@ import ly_test_tools.environment.file_system as file_system
 import ly_test_tools.environment.process_utils as process_utils
 import ly_test_tools.environment.waiter as waiter
 import ly_test_tools._internal.exceptions as exceptions
+import ly_test_tools.o3de.asset_staging as asset_staging
 import ly_test_tools.o3de.pipeline_utils as utils
 from ly_test_tools.o3de.ap_log_parser import APLogParser
+from ly_test_tools.o3de.asset_processor_control import AssetProcessorControlClient
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +68,12 @@ class StopReason(IntEnum):
     NO_STOP = 5
 
 class AssetProcessor(object):
+    # Reset the temporary asset roots released by previous tests instead of creating new ones, see asset_staging
+    reuse_temp_asset_roots = False
+    # Hard link the test assets of prepare_test_environment() to the shared asset store instead of copying them. Only
+    # for tests which don't write to their source assets, since the linked files are read-only
+    link_test_assets = False
+
     def __init__(self, workspace, port=45643):
         # type: (AbstractWorkspaceManager, int) -> AssetProcessor
         """
@@ -80,6 +88,7 @@ class AssetProcessor(object):
         self._ap_proc = None
         self._temp_asset_directory = None
         self._temp_asset_root = None
+        self._staged_asset_root = None
         self._project_path = self._workspace.paths.project()
         self._override_scan_folders = []
         self._test_assets_source_folder = None
@@ -225,6 +234,20 @@ class AssetProcessor(object):
         waiter.wait_for(_get_port_from_log, timeout=ap_max_activate_time, exc=err)
         return port
 
+    def create_control_client(self):
+        # type: () -> AssetProcessorControlClient
+        """
+        Creates an asyncio client for the control port of the running AP, which keeps its own connection open and can
+        wait for idle without blocking other requests, i.e.:
+            async with asset_processor.create_control_client() as client:
+                await client.next_idle()
+
+        :return: The AssetProcessorControlClient, not connected yet
+        """
+        if not self._ap_proc:
+            raise AssetProcessorError("Attempted to create an AP control client but AP is not currently running")
+        return AssetProcessorControlClient(self.read_control_port())
+
     def set_control_connection(self, connection):
         self._control_connection = connection
 
@@ -703,11 +726,11 @@ class AssetProcessor(object):
             make_dir = os.path.join(self._temp_asset_root, copy_dir)
             if not os.path.isdir(make_dir):
                 os.makedirs(make_dir)
-        for copyfile_name in ['Registry/AssetProcessorPlatformConfig.setreg',
-                              os.path.join(self._workspace.project, "project.json"),
-                              os.path.join('Assets', 'Engine', 'exclude.filetag')]:
-            shutil.copyfile(os.path.join(self._workspace.paths.engine_root(), copyfile_name),
-                            os.path.join(self._temp_asset_root, copyfile_name))
+        self._staged_asset_root.stage_files(
+            [(os.path.join(self._workspace.paths.engine_root(), copyfile_name), copyfile_name)
+             for copyfile_name in ['Registry/AssetProcessorPlatformConfig.setreg',
+                                   os.path.join(self._workspace.project, "project.json"),
+                                   os.path.join('Assets', 'Engine', 'exclude.filetag')]])
 
     def delete_temp_asset_root(self):
         """
@@ -717,6 +740,22 @@ class AssetProcessor(object):
         """
         if self._temp_asset_directory:
             self._temp_asset_directory = None
+            self._staged_asset_root = None
+
+    def release_temp_asset_root(self):
+        """
+        Done with our current temporary asset directory. With reuse_temp_asset_roots it is kept for the next test, which
+        resets it instead of creating a new one, otherwise it is cleaned up.
+
+        :return: None
+        """
+        if self._temp_asset_directory and self.reuse_temp_asset_roots:
+            asset_staging.temp_asset_root_pool.release(
+                self._temp_asset_root_key(), self._temp_asset_directory, self._staged_asset_root)
+        self.delete_temp_asset_root()
+
+    def _temp_asset_root_key(self):
+        return f"{self._workspace.paths.engine_root()}|{self._workspace.project}"
 
     def _del_readonly(self, action, name, exc):
         os.chmod(name, stat.S_IWRITE)
@@ -745,16 +784,37 @@ class AssetProcessor(object):
         :param project_scan_folder: Set the current active project's folder as one of our scan folders
         :return: None
         """
-        if self._temp_asset_root:
+        if self.reuse_temp_asset_roots:
+            if self._temp_asset_directory:
+                logger.debug(f'Resetting old asset root at {self._temp_asset_root}')
+                self._staged_asset_root.reset()
+            else:
+                self._reuse_released_temp_asset_root()
+        elif self._temp_asset_root:
             logger.debug(f'Cleaning up old asset root at {self._temp_asset_root}')
             shutil.rmtree(self._temp_asset_root, True)
-        self._temp_asset_directory = tempfile.TemporaryDirectory()
-        self._temp_asset_root = self._temp_asset_directory.name
-        self._copy_asset_root_files()
+            self._temp_asset_directory = None
+        if not self._temp_asset_directory:
+            self._temp_asset_directory = tempfile.TemporaryDirectory()
+            self._temp_asset_root = self._temp_asset_directory.name
+            self._staged_asset_root = asset_staging.StagedDirectory(
+                self._temp_asset_root, asset_staging.get_shared_asset_store())
+            self._copy_asset_root_files()
+            self._staged_asset_root.set_baseline()
         self._project_path = os.path.join(self._temp_asset_root, self._workspace.project)
         if project_scan_folder:
             self.add_scan_folder(self._project_path)
 
+    def _reuse_released_temp_asset_root(self):
+        """
+        Takes a temporary asset root released by a previous test, reset to its baseline
+        """
+        released = asset_staging.temp_asset_root_pool.acquire(self._temp_asset_root_key())
+        if released:
+            self._temp_asset_directory, self._staged_asset_root = released
+            self._temp_asset_root = self._temp_asset_directory.name
+            logger.debug(f'Reusing released asset root at {self._temp_asset_root}')
+
     def log_root(self):
         """
         Return the temp log root
@@ -852,7 +912,13 @@ class AssetProcessor(object):
         if add_scan_folder:
             self.add_scan_folder(test_asset_root)
         self._function_name = function_name
-        self._assets_source_folder = utils.prepare_test_assets(assets_path, function_name, test_folder)
+        if self.link_test_assets and self._staged_asset_root:
+            self._assets_source_folder = os.path.join(assets_path, "assets", function_name)
+            if os.path.exists(self._assets_source_folder):
+                self._staged_asset_root.stage_tree(
+                    self._assets_source_folder, os.path.relpath(test_folder, self._temp_asset_root), link=True)
+        else:
+            self._assets_source_folder = utils.prepare_test_assets(assets_path, function_name, test_folder)
         self._test_assets_source_folder = test_folder
         self._cache_folder = os.path.join(self._temp_asset_root, self._workspace.project,'Cache', cache_platform or
                                           ASSET_PROCESSOR_PLATFORM_MAP[self._workspace.asset_processor_platform],
@@ -1005,7 +1071,7 @@ class AssetProcessor(object):
         source_folder = os.path.join(self._workspace.paths.engine_root(), relative_source)
         dest_relative = relative_dest or relative_source
         dest_folder = os.path.join(self._temp_asset_root, dest_relative)
-        shutil.copytree(source_folder, dest_folder)
+        utils.copy_tree_parallel(source_folder, dest_folder)
         self.clear_readonly(dest_relative)
 
     @staticmethod
@@ -0,0 +1,425 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Asyncio client for the control port of the Asset Processor GUI, plus a stub control server for tests.
+
+The control protocol has no message framing: AP treats whatever it reads from the socket in one go as a single command,
+and answers "ping" with "pong", "isidle" with "true" or "false", and both "waitforidle" and "signalidle" with "idle".
+"waitforidle" is answered right away when AP is idle, otherwise "idle" is written once for every waiter registered on the
+connection when AP becomes idle. The protocol has no job notifications, so only idle transitions can be subscribed to.
+
+The client keeps one connection open and doesn't wait for the answer of a command before sending the next one. Answers
+are matched to requests by their value, since the answers to different commands differ and the answers to the same
+command come in order. Commands are written at least CONTROL_COMMAND_INTERVAL seconds apart, so AP doesn't read two
+of them as one.
+"""
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import socket
+import typing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTROL_HOST = "127.0.0.1"
+DEFAULT_CONTROL_TIMEOUT = 60
+# Seconds between two commands written to the control connection, AP reads commands sent closer together as one
+CONTROL_COMMAND_INTERVAL = 0.05
+# Commands and answers of the control port
+PING_COMMAND = "ping"
+IS_IDLE_COMMAND = "isidle"
+WAIT_FOR_IDLE_COMMAND = "waitforidle"
+SIGNAL_IDLE_COMMAND = "signalidle"
+QUIT_COMMAND = "quit"
+PONG_ANSWER = "pong"
+TRUE_ANSWER = "true"
+FALSE_ANSWER = "false"
+IDLE_ANSWER = "idle"
+CONTROL_ANSWERS = (PONG_ANSWER, TRUE_ANSWER, FALSE_ANSWER, IDLE_ANSWER)
+
+
+class AssetProcessorControlError(Exception):
+    """ Indicates that the Asset Processor control connection failed or didn't answer in time """
+
+
+class AssetProcessorControlClient(object):
+    """
+    Connection to the control port of a running Asset Processor GUI. Every request is a coroutine, so several of them
+    can wait on the same connection at once, i.e. a wait for idle while pinging AP:
+        async with AssetProcessorControlClient(port) as client:
+            await client.wait_for_idle(timeout=300)
+    """
+
+    def __init__(self, port: int, host: str = DEFAULT_CONTROL_HOST):
+        """
+        :param port: The control port of AP, read from its log by AssetProcessor.read_control_port()
+        :param host: The host AP listens on
+        """
+        self.port = port
+        self.host = host
+        self._reader = None
+        self._writer = None
+        self._read_task = None
+        self._write_lock = None
+        self._answer_buffer = ""
+        self._ping_futures = collections.deque()
+        self._is_idle_futures = collections.deque()
+        # AP answers every registered idle waiter on the next idle, so at most one waiter of each kind is registered
+        # and all the requests waiting on it share its answer
+        self._wait_for_idle_futures = []
+        self._next_idle_futures = []
+        self._next_idle_registered = False
+        self._idle_listeners = []
+
+    async def __aenter__(self) -> AssetProcessorControlClient:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def is_connected(self) -> bool:
+        """
+        :return: True if the connection to AP is open
+        """
+        return self._read_task is not None and not self._read_task.done()
+
+    async def connect(self, timeout: float = DEFAULT_CONTROL_TIMEOUT) -> None:
+        """
+        Opens the connection to the control port, retrying until AP accepts it or the timeout expires
+        :param timeout: Maximum time in seconds to wait for AP to accept the connection
+        :return: None
+        """
+        if self.is_connected():
+            return
+        loop = asyncio.get_running_loop()
+        timeout_end = loop.time() + timeout
+        while True:
+            try:
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port), max(timeout_end - loop.time(), 0))
+                break
+            except (OSError, asyncio.TimeoutError) as e:
+                if loop.time() >= timeout_end:
+                    raise AssetProcessorControlError(
+                        f"Could not connect to AP Control Connection on {self.host}:{self.port}. "
+                        f"Waited for {timeout}.") from e
+                await asyncio.sleep(CONTROL_COMMAND_INTERVAL)
+
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._write_lock = asyncio.Lock()
+        self._answer_buffer = ""
+        self._next_idle_registered = False
+        self._read_task = asyncio.ensure_future(self._read_answers())
+        logger.debug(f"Connection to AP Control Connection {self.host}:{self.port} was successful")
+
+    async def close(self) -> None:
+        """
+        Closes the connection, failing the requests still waiting for an answer
+        :return: None
+        """
+        if self._read_task:
+            self._read_task.cancel()
+            try:
+                await self._read_task
+            except asyncio.CancelledError:
+                pass
+            self._read_task = None
+        if self._writer:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
+        self._fail_pending(AssetProcessorControlError("AP Control Connection was closed"))
+
+    async def ping(self, timeout: float = DEFAULT_CONTROL_TIMEOUT) -> bool:
+        """
+        :param timeout: Maximum time in seconds to wait for the answer
+        :return: True if AP answered the ping
+        """
+        try:
+            await self._request(PING_COMMAND, self._ping_futures, timeout)
+            return True
+        except AssetProcessorControlError:
+            return False
+
+    async def is_idle(self, timeout: float = DEFAULT_CONTROL_TIMEOUT) -> bool:
+        """
+        :param timeout: Maximum time in seconds to wait for the answer
+        :return: True if the asset processor manager of AP has no jobs left to process
+        """
+        return await self._request(IS_IDLE_COMMAND, self._is_idle_futures, timeout) == TRUE_ANSWER
+
+    async def wait_for_idle(self, timeout: float = DEFAULT_CONTROL_TIMEOUT) -> None:
+        """
+        Waits until AP is idle, returning right away if it already is
+        :param timeout: Maximum time in seconds to wait for AP to be idle
+        :return: None
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._wait_for_idle_futures.append(future)
+        if len(self._wait_for_idle_futures) == 1:
+            try:
+                await self._send(WAIT_FOR_IDLE_COMMAND)
+            except AssetProcessorControlError:
+                self._wait_for_idle_futures.remove(future)
+                raise
+        await self._wait_answer(future, WAIT_FOR_IDLE_COMMAND, timeout)
+
+    async def next_idle(self, timeout: float = DEFAULT_CONTROL_TIMEOUT) -> None:
+        """
+        Waits until AP next becomes idle, even if it is idle now. Useful after making source file changes which AP
+        will pick up but may not have started processing yet.
+        :param timeout: Maximum time in seconds to wait for AP to become idle
+        :return: None
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._next_idle_futures.append(future)
+        try:
+            await self._register_next_idle()
+        except AssetProcessorControlError:
+            self._next_idle_futures.remove(future)
+            raise
+        await self._wait_answer(future, SIGNAL_IDLE_COMMAND, timeout)
+
+    async def add_idle_listener(self, listener: typing.Callable[[], None]) -> None:
+        """
+        Subscribes to the idle transitions of AP, listener is called every time AP becomes idle until it is removed
+        :param listener: Function called without arguments
+        :return: None
+        """
+        self._idle_listeners.append(listener)
+        await self._register_next_idle()
+
+    def remove_idle_listener(self, listener: typing.Callable[[], None]) -> None:
+        """
+        :param listener: A function passed to add_idle_listener()
+        :return: None
+        """
+        self._idle_listeners.remove(listener)
+
+    async def send_quit(self) -> None:
+        """
+        Requests AP to quit once it finishes its current task
+        :return: None
+        """
+        await self._send(QUIT_COMMAND)
+
+    async def _register_next_idle(self) -> None:
+        if not self._next_idle_registered:
+            self._next_idle_registered = True
+            try:
+                await self._send(SIGNAL_IDLE_COMMAND)
+            except AssetProcessorControlError:
+                self._next_idle_registered = False
+                raise
+
+    async def _request(self, command: str, futures: collections.deque, timeout: float) -> str:
+        future = asyncio.get_running_loop().create_future()
+        futures.append(future)
+        try:
+            await self._send(command)
+        except AssetProcessorControlError:
+            futures.remove(future)
+            raise
+        return await self._wait_answer(future, command, timeout)
+
+    async def _wait_answer(self, future: asyncio.Future, command: str, timeout: float) -> str:
+        try:
+            # Shielded so a timeout doesn't cancel the future, its answer is still expected and must be consumed
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise AssetProcessorControlError(f"AP didn't answer '{command}' within {timeout} seconds") from None
+
+    async def _send(self, command: str) -> None:
+        if not self.is_connected():
+            raise AssetProcessorControlError(f"Failed to send '{command}', AP Control Connection is not open")
+        async with self._write_lock:
+            try:
+                self._writer.write(command.encode())
+                await self._writer.drain()
+            except OSError as e:
+                raise AssetProcessorControlError(f"Failed to send '{command}' to AP with error {e}") from e
+            logger.debug(f"Sent input {command}")
+            await asyncio.sleep(CONTROL_COMMAND_INTERVAL)
+
+    async def _read_answers(self) -> None:
+        try:
+            while True:
+                data = await self._reader.read(4096)
+                if not data:
+                    break
+                self._answer_buffer += data.decode(errors="replace")
+                for answer in self._split_answers():
+                    self._dispatch_answer(answer)
+        except OSError as e:
+            logger.warning(f"Failed in LyTestTools to read message from AP with error {e}")
+        self._fail_pending(AssetProcessorControlError("AP Control Connection was closed by AP"))
+
+    def _split_answers(self) -> typing.Iterator[str]:
+        """
+        Takes the complete answers out of the answer buffer, answers written close together are read as one string
+        :return: Iterator of answers
+        """
+        while self._answer_buffer:
+            answer = next((answer for answer in CONTROL_ANSWERS if self._answer_buffer.startswith(answer)), None)
+            if answer:
+                self._answer_buffer = self._answer_buffer[len(answer):]
+                yield answer
+            elif any(answer.startswith(self._answer_buffer) for answer in CONTROL_ANSWERS):
+                # The rest of the answer wasn't received yet
+                return
+            else:
+                logger.warning(f"Dropping unexpected data from AP Control Connection: {self._answer_buffer[0]}")
+                self._answer_buffer = self._answer_buffer[1:]
+
+    def _dispatch_answer(self, answer: str) -> None:
+        logger.debug(f"Got result message {answer}")
+        if answer == PONG_ANSWER:
+            self._resolve_next(self._ping_futures, answer)
+        elif answer in (TRUE_ANSWER, FALSE_ANSWER):
+            self._resolve_next(self._is_idle_futures, answer)
+        elif self._wait_for_idle_futures:
+            # AP answers waitforidle right away when idle, so the first idle goes to it when both kinds are waiting.
+            # When AP becomes idle it writes idle for both, and the second one reaches the signalidle waiters.
+            futures, self._wait_for_idle_futures = self._wait_for_idle_futures, []
+            self._resolve_all(futures, answer)
+        elif self._next_idle_registered:
+            self._next_idle_registered = False
+            futures, self._next_idle_futures = self._next_idle_futures, []
+            self._resolve_all(futures, answer)
+            for listener in list(self._idle_listeners):
+                try:
+                    listener()
+                except Exception:  # Intentionally broad, a failing listener must not stop the connection
+                    logger.warning("Error in Asset Processor idle listener", exc_info=True)
+            if self._idle_listeners:
+                asyncio.ensure_future(self._register_next_idle())
+
+    @staticmethod
+    def _resolve_next(futures: collections.deque, answer: str) -> None:
+        while futures:
+            future = futures.popleft()
+            if not future.done():
+                future.set_result(answer)
+                return
+
+    @staticmethod
+    def _resolve_all(futures: list, answer: str) -> None:
+        for future in futures:
+            if not future.done():
+                future.set_result(answer)
+
+    def _fail_pending(self, error: AssetProcessorControlError) -> None:
+        pending = list(self._ping_futures) + list(self._is_idle_futures) + \
+            self._wait_for_idle_futures + self._next_idle_futures
+        self._ping_futures.clear()
+        self._is_idle_futures.clear()
+        self._wait_for_idle_futures = []
+        self._next_idle_futures = []
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+
+class StubAssetProcessorControlServer(object):
+    """
+    Stand-in for the control port of the Asset Processor GUI, which answers the same commands the same way, for tests
+    of code using the control connection without running AP. Idle transitions are driven by the test with set_idle().
+    """
+
+    def __init__(self, idle: bool = True):
+        """
+        :param idle: Whether the stub starts idle
+        """
+        self.idle = idle
+        self.port = None
+        self.requests = []
+        self.quit_requested = False
+        self._server = None
+        self._writers = []
+        self._idle_waiters = []
+
+    async def __aenter__(self) -> StubAssetProcessorControlServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    async def start(self, host: str = DEFAULT_CONTROL_HOST, port: int = 0) -> int:
+        """
+        :param host: The host to listen on
+        :param port: The port to listen on, any free port when 0
+        :return: The port the stub listens on
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self) -> None:
+        """
+        Closes the stub and all its connections
+        :return: None
+        """
+        for writer in self._writers:
+            writer.close()
+        self._writers = []
+        self._idle_waiters = []
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def set_idle(self, idle: bool) -> None:
+        """
+        Changes the idle state, answering the registered idle waiters when it changes to idle like AP does
+        :param idle: The new idle state
+        :return: None
+        """
+        self.idle = idle
+        if idle:
+            for writer in self._idle_waiters:
+                if writer in self._writers:
+                    writer.write(IDLE_ANSWER.encode())
+            self._idle_waiters = []
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.append(writer)
+        try:
+            while True:
+                data = await reader.read(4096)
+                if not data:
+                    break
+                # Like AP, everything read at once is a single command
+                self._handle_command(data.decode(), writer)
+        except OSError:
+            pass
+        finally:
+            if writer in self._writers:
+                self._writers.remove(writer)
+
+    def _handle_command(self, command: str, writer: asyncio.StreamWriter) -> None:
+        self.requests.append(command)
+        if command == QUIT_COMMAND:
+            self.quit_requested = True
+        elif command == PING_COMMAND:
+            writer.write(PONG_ANSWER.encode())
+        elif command == IS_IDLE_COMMAND:
+            writer.write((TRUE_ANSWER if self.idle else FALSE_ANSWER).encode())
+        elif command == WAIT_FOR_IDLE_COMMAND:
+            if self.idle:
+                writer.write(IDLE_ANSWER.encode())
+            else:
+                self._idle_waiters.append(writer)
+        elif command == SIGNAL_IDLE_COMMAND:
+            self._idle_waiters.append(writer)
@@ -0,0 +1,298 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Staging of test assets into the temporary asset roots of ly_test_tools.o3de.asset_processor.AssetProcessor.
+
+AssetStore keeps one read-only copy of each file content, named by its hash, which staged files are hard linked to when
+possible or copied from. StagedDirectory remembers which content each file of a temporary asset root had when its
+baseline was set, so the root can be reused by the next test after a reset which only deletes the files created since
+and restores the files that were changed, instead of deleting and rebuilding the whole root.
+
+Hard linked files share their content with the store, so they are only used for assets the tests don't write to. The
+store files are read-only, so writing to a hard linked asset fails instead of changing the store.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import os
+import shutil
+import stat
+import tempfile
+import threading
+
+import ly_test_tools.o3de.pipeline_utils as utils
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the temporary directories created for the shared store and the reusable asset roots
+TEMP_DIRECTORY_PREFIX = "ly_test_tools_assets_"
+
+
+class AssetStore(object):
+    """
+    Content addressed store of asset files. The hash of each source file is cached by its path, size and modification
+    time, so staging the same unchanged file again doesn't read it again.
+    """
+
+    def __init__(self, store_root: str):
+        """
+        :param store_root: Path to the directory holding the stored files, created if needed
+        """
+        self.store_root = store_root
+        self._hashes = {}
+        self._lock = threading.Lock()
+        os.makedirs(store_root, exist_ok=True)
+
+    def get_store_path(self, digest: str) -> str:
+        """
+        :param digest: The hash of a stored content
+        :return: The path of the stored file with that content
+        """
+        return os.path.join(self.store_root, digest[:2], digest[2:])
+
+    def add(self, source_path: str) -> str:
+        """
+        Stores the content of a file, unless the same content is already stored
+        :param source_path: Path to the file to store
+        :return: The hash of the content, used to get the stored file
+        """
+        source_stat = os.stat(source_path)
+        hash_key = (os.path.abspath(source_path), source_stat.st_size, source_stat.st_mtime_ns)
+        with self._lock:
+            digest = self._hashes.get(hash_key)
+        if digest is None:
+            digest = utils.get_file_hash(source_path)
+            with self._lock:
+                self._hashes[hash_key] = digest
+
+        store_path = self.get_store_path(digest)
+        if not os.path.exists(store_path):
+            os.makedirs(os.path.dirname(store_path), exist_ok=True)
+            temp_path = f"{store_path}.{threading.get_ident()}.tmp"
+            shutil.copyfile(source_path, temp_path)
+            os.chmod(temp_path, stat.S_IREAD)
+            os.replace(temp_path, store_path)
+        return digest
+
+    def stage(self, digest: str, target_path: str, link: bool = False) -> None:
+        """
+        Creates a file with a stored content
+        :param digest: The hash of the content
+        :param target_path: Path to the file to create, it must not exist
+        :param link: Whether to hard link the file to the store, it is copied when False or when linking fails
+        :return: None
+        """
+        store_path = self.get_store_path(digest)
+        if link:
+            try:
+                os.link(store_path, target_path)
+                return
+            except OSError as e:
+                # i.e. the target is on another file system or the file system doesn't support hard links
+                logger.debug(f"Could not hard link {target_path} to {store_path}, copying it instead: {e}")
+        shutil.copyfile(store_path, target_path)
+        os.chmod(target_path, stat.S_IREAD | stat.S_IWRITE)
+
+
+class StagedDirectory(object):
+    """
+    A directory whose files are staged from an AssetStore, which can be reset to its baseline content
+    """
+
+    def __init__(self, root: str, store: AssetStore):
+        """
+        :param root: Path to the directory
+        :param store: The store the files are staged from
+        """
+        self.root = root
+        self.store = store
+        # Relative file path to (content hash, size, modification time) of the files of the baseline
+        self._baseline_files = {}
+        self._baseline_directories = set()
+        self._staged_digests = {}
+
+    def stage_files(self, file_pairs: list[tuple[str, str]], link: bool = False,
+                    max_workers: int = utils.ASSET_COPY_WORKERS) -> None:
+        """
+        Stages files into the directory, replacing existing files
+        :param file_pairs: A list of (source path, path relative to the directory) pairs
+        :param link: Whether to hard link the files to the store instead of copying them
+        :param max_workers: The maximum number of files staged at once
+        :return: None
+        """
+        for _, relative_path in file_pairs:
+            os.makedirs(os.path.dirname(os.path.join(self.root, relative_path)), exist_ok=True)
+
+        def stage_file(source_path, relative_path):
+            digest = self.store.add(source_path)
+            target_path = os.path.join(self.root, relative_path)
+            if os.path.lexists(target_path):
+                os.remove(target_path)
+            self.store.stage(digest, target_path, link)
+            self._staged_digests[os.path.normpath(relative_path)] = digest
+
+        if len(file_pairs) <= 1 or max_workers <= 1:
+            for source_path, relative_path in file_pairs:
+                stage_file(source_path, relative_path)
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(stage_file, source_path, relative_path)
+                           for source_path, relative_path in file_pairs]:
+                future.result()
+
+    def stage_tree(self, source_directory: str, relative_target: str, link: bool = False) -> None:
+        """
+        Stages all the files of a directory tree into the directory
+        :param source_directory: Path to the directory tree to stage
+        :param relative_target: Path relative to the directory to stage the tree to
+        :param link: Whether to hard link the files to the store instead of copying them
+        :return: None
+        """
+        file_pairs = []
+        for root, dirs, files in os.walk(source_directory):
+            relative_root = os.path.normpath(os.path.join(relative_target, os.path.relpath(root, source_directory)))
+            os.makedirs(os.path.join(self.root, relative_root), exist_ok=True)
+            file_pairs.extend((os.path.join(root, file_name), os.path.join(relative_root, file_name))
+                              for file_name in files)
+        self.stage_files(file_pairs, link)
+
+    def set_baseline(self) -> None:
+        """
+        Records the current content of the directory as the content reset() restores. Files which weren't staged are
+        added to the store.
+        :return: None
+        """
+        self._baseline_files = {}
+        self._baseline_directories = set()
+        for relative_path, is_directory in self._walk():
+            full_path = os.path.join(self.root, relative_path)
+            if is_directory:
+                self._baseline_directories.add(relative_path)
+                continue
+            digest = self._staged_digests.get(relative_path) or self.store.add(full_path)
+            file_stat = os.stat(full_path)
+            self._baseline_files[relative_path] = (digest, file_stat.st_size, file_stat.st_mtime_ns)
+
+    def reset(self) -> tuple[int, int]:
+        """
+        Brings the directory back to its baseline content, deleting the files and directories created since the baseline
+        was set and restoring the baseline files which were changed or deleted.
+        :return: The number of (deleted, restored) files
+        """
+        deleted_count = 0
+        restored_count = 0
+        found_files = set()
+        extra_directories = []
+        for relative_path, is_directory in self._walk():
+            full_path = os.path.join(self.root, relative_path)
+            if is_directory:
+                if relative_path not in self._baseline_directories:
+                    extra_directories.append(full_path)
+                continue
+            baseline = self._baseline_files.get(relative_path)
+            if baseline is None:
+                _remove_file(full_path)
+                deleted_count += 1
+                continue
+            found_files.add(relative_path)
+            file_stat = os.lstat(full_path)
+            if (file_stat.st_size, file_stat.st_mtime_ns) != baseline[1:]:
+                _remove_file(full_path)
+                self._restore(relative_path, baseline[0])
+                restored_count += 1
+
+        # Deepest directories first, their files were deleted above
+        for directory in sorted(extra_directories, reverse=True):
+            shutil.rmtree(directory, ignore_errors=True)
+        for relative_path, baseline in self._baseline_files.items():
+            if relative_path not in found_files:
+                os.makedirs(os.path.dirname(os.path.join(self.root, relative_path)), exist_ok=True)
+                self._restore(relative_path, baseline[0])
+                restored_count += 1
+        for relative_path in self._baseline_directories:
+            os.makedirs(os.path.join(self.root, relative_path), exist_ok=True)
+
+        self._staged_digests = {relative_path: baseline[0] for relative_path, baseline in self._baseline_files.items()}
+        logger.debug(f"Reset {self.root}, deleted {deleted_count} files and restored {restored_count} files")
+        return deleted_count, restored_count
+
+    def _restore(self, relative_path: str, digest: str) -> None:
+        full_path = os.path.join(self.root, relative_path)
+        self.store.stage(digest, full_path)
+        file_stat = os.stat(full_path)
+        self._baseline_files[relative_path] = (digest, file_stat.st_size, file_stat.st_mtime_ns)
+
+    def _walk(self):
+        """
+        :return: Iterator of (path relative to the directory, whether it is a directory) pairs, parents first
+        """
+        for root, dirs, files in os.walk(self.root):
+            relative_root = os.path.relpath(root, self.root)
+            for dir_name in dirs:
+                yield os.path.normpath(os.path.join(relative_root, dir_name)), True
+            for file_name in files:
+                yield os.path.normpath(os.path.join(relative_root, file_name)), False
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE)
+        os.remove(path)
+
+
+class TempAssetRootPool(object):
+    """
+    Temporary asset roots released by the tests which finished with them, kept with their baseline so the next test
+    can reset one instead of creating a new one
+    """
+
+    def __init__(self):
+        self._released = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> tuple[tempfile.TemporaryDirectory, StagedDirectory] or None:
+        """
+        :param key: Identifies what the baseline of the root holds, i.e. the engine root and the project
+        :return: A released (temporary directory, staged directory) pair reset to its baseline, None if there is none
+        """
+        with self._lock:
+            released = self._released.get(key)
+            temp_root = released.pop() if released else None
+        if temp_root:
+            temp_root[1].reset()
+        return temp_root
+
+    def release(self, key: str, temp_directory: tempfile.TemporaryDirectory, staged_directory: StagedDirectory) -> None:
+        """
+        Keeps a temporary asset root for the next test
+        :param key: Identifies what the baseline of the root holds, i.e. the engine root and the project
+        :param temp_directory: The temporary directory of the root, which keeps the directory alive
+        :param staged_directory: The staged directory of the root
+        :return: None
+        """
+        with self._lock:
+            self._released.setdefault(key, []).append((temp_directory, staged_directory))
+
+
+_shared_store_directory = None
+_shared_store = None
+_shared_store_lock = threading.Lock()
+temp_asset_root_pool = TempAssetRootPool()
+
+
+def get_shared_asset_store() -> AssetStore:
+    """
+    :return: The AssetStore shared by all the AssetProcessor objects, in a temporary directory deleted on exit
+    """
+    global _shared_store_directory, _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store_directory = tempfile.TemporaryDirectory(prefix=TEMP_DIRECTORY_PREFIX)
+            _shared_store = AssetStore(_shared_store_directory.name)
+        return _shared_store
@@ -21,6 +21,9 @@ Usage example:
 
        class MyTestInParallel_2(EditorParallelTest):
            from . import yet_another_script_to_be_run_by_editor as test_module
+
+Single tests can also run one after another in warm Editors kept open between tests, by setting
+use_warm_editor_pool = True on the suite. See ly_test_tools.o3de.editor_test_pool for the isolation guarantees.
 """
 
 from __future__ import annotations
@@ -32,8 +35,11 @@ import pytest
 import _pytest.python
 import _pytest.outcomes
 
+import ly_test_tools.o3de.editor_test_utils as editor_utils
 from ly_test_tools._internal.managers.workspace import AbstractWorkspaceManager
-from ly_test_tools.o3de.multi_test_framework import MultiTestSuite, SharedTest, SingleTest
+from ly_test_tools.launchers import launcher_helper
+from ly_test_tools.o3de.editor_test_pool import EditorPool
+from ly_test_tools.o3de.multi_test_framework import MultiTestSuite, Result, SharedTest, SingleTest
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +49,8 @@ class EditorSingleTest(SingleTest):
     Test that will run alone in one editor with no parallel editors, limiting environmental side-effects at the
     expense of redundant isolated work
     """
+    # Whether the test can run in a warm Editor when its suite uses the warm Editor pool
+    use_warm_editor = True
 
     def __init__(self):
         super(EditorSingleTest, self).__init__()
@@ -140,6 +148,16 @@ class EditorTestSuite(MultiTestSuite):
     use_null_renderer = True
     # Maximum time in seconds for a single Editor to stay open across the set of shared tests.
     timeout_shared_test = 900
+    # Run the single tests in warm Editors kept open between tests, see ly_test_tools.o3de.editor_test_pool.
+    use_warm_editor_pool = False
+    # Number of warm Editors kept open by the pool.
+    warm_editor_pool_size = 1
+    # Number of tests after which a warm Editor is replaced by a new one.
+    warm_editor_max_tests = 20
+    # Level opened without saving to reset a warm Editor before each test, the current level is reloaded when empty.
+    warm_editor_reset_level = ""
+    # Maximum time in seconds for a warm Editor to start up.
+    timeout_warm_editor_startup = 300
     # Name of the executable's log file.
     log_name = "editor_test.log"
     # Maximum time (seconds) for waiting for a crash file to finish being dumped to disk.
@@ -165,3 +183,102 @@ class EditorTestSuite(MultiTestSuite):
         :return: MultiTestCollector
         """
         return EditorTestSuite.MultiTestCollector.from_parent(parent=collector, name=name)
+
+    def _uses_warm_editor_pool(self, request: _pytest.fixtures.FixtureRequest, test_spec: EditorSingleTest) -> bool:
+        """
+        Whether a single test runs in a warm Editor of the pool instead of a new Editor
+        :param request: The Pytest Request
+        :param test_spec: The test class
+        :return: True if the test runs in a warm Editor
+        """
+        return ((self.use_warm_editor_pool or request.config.getoption("--warm-editor-pool", default=False))
+                and not self.atom_tools_executable_name
+                and getattr(test_spec, "use_warm_editor", False)
+                and not test_spec.attach_debugger and not test_spec.wait_for_debugger)
+
+    def _run_single_test(self,
+                         request: _pytest.fixtures.FixtureRequest,
+                         workspace: AbstractWorkspaceManager,
+                         collected_test_data: EditorTestSuite.TestData,
+                         test_spec: EditorSingleTest) -> None:
+        """
+        Runs a single test in a warm Editor of the pool when the suite uses it, else in a new Editor.
+        :param request: The Pytest Request
+        :param workspace: The LyTestTools Workspace object
+        :param collected_test_data: The TestData from calling collected_test_data()
+        :param test_spec: The test class that should be a subclass of SingleTest
+        :return: None
+        """
+        if not self._uses_warm_editor_pool(request, test_spec):
+            super(EditorTestSuite, self)._run_single_test(request, workspace, collected_test_data, test_spec)
+            return
+
+        result = self._exec_warm_editor_test(request, workspace, collected_test_data, test_spec)
+        collected_test_data.results.update(result)
+        test_name, test_result = next(iter(result.items()))
+        self._report_result(test_name, test_result)
+
+        # If test did not pass, save assets with errors and warnings
+        if not isinstance(test_result, Result.Pass):
+            editor_utils.save_failed_asset_joblogs(workspace)
+
+    def _exec_warm_editor_test(self,
+                               request: _pytest.fixtures.FixtureRequest,
+                               workspace: AbstractWorkspaceManager,
+                               collected_test_data: EditorTestSuite.TestData,
+                               test_spec: EditorSingleTest) -> dict[str, Result.ResultType]:
+        """
+        Runs a test in a warm Editor of the pool, which is replaced if the test doesn't pass.
+        :param request: The Pytest Request
+        :param workspace: The LyTestTools Workspace object
+        :param collected_test_data: The TestData from calling collected_test_data()
+        :param test_spec: The test class that should be a subclass of SingleTest
+        :return: a dictionary with the Result of the test
+        """
+        # Preparing the AP kills any running Editor, so it only happens while no warm Editor is running
+        if collected_test_data.editor_pool is None or not collected_test_data.editor_pool.has_live_editors():
+            editor_utils.prepare_asset_processor(workspace, collected_test_data)
+        if collected_test_data.editor_pool is None:
+            def create_executable():
+                executable = launcher_helper.create_editor(workspace)
+                executable.workspace = workspace
+                executable.configure_settings()
+                return executable
+
+            collected_test_data.editor_pool = EditorPool(
+                create_executable, workspace, self.log_name, self.warm_editor_pool_size, self.warm_editor_max_tests)
+        editor_pool = collected_test_data.editor_pool
+
+        # The Editor of this test instance is only used for preparing the command line args of the warm Editor
+        self.executable = launcher_helper.create_editor(workspace)
+        self.executable.workspace = workspace
+        extra_cmdline_args = getattr(test_spec, "extra_cmdline_args", [])
+        cmdline_args = self._setup_cmdline_args(extra_cmdline_args, self.executable, [test_spec], workspace)
+        warm_editor = editor_pool.acquire(cmdline_args)
+        test_result = None
+        run_result = None
+        if warm_editor.wait_until_ready(self.timeout_warm_editor_startup):
+            run_result = warm_editor.run_test(editor_utils.get_testcase_module_filepath(test_spec.test_module),
+                                              editor_utils.compile_test_case_name(request, test_spec),
+                                              self.warm_editor_reset_level,
+                                              test_spec.timeout)
+        output = warm_editor.get_output()
+        executable_log_content = warm_editor.get_log_content()
+        if run_result is not None:
+            if run_result["success"]:
+                test_result = Result.Pass(test_spec, run_result["output"], executable_log_content)
+            else:
+                test_output = run_result["output"]
+                if run_result["exception"]:
+                    test_output += f"\n{run_result['exception']}"
+                test_result = Result.Fail(test_spec, test_output, executable_log_content)
+        elif warm_editor.is_alive():
+            test_result = Result.Timeout(test_spec, output, test_spec.timeout, executable_log_content)
+        else:
+            crash_output = editor_utils.retrieve_crash_output(warm_editor.run_id, workspace, self._timeout_crash_log)
+            editor_utils.cycle_crash_report(warm_editor.run_id, workspace)
+            test_result = Result.Crash(test_spec, output, warm_editor.executable.get_returncode(), crash_output,
+                                       executable_log_content)
+
+        editor_pool.release(warm_editor, recycle=not isinstance(test_result, Result.Pass))
+        return {test_spec.__name__: test_result}
@@ -0,0 +1,275 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Pool of warm Editors which run EditorSingleTests one after another without starting a new Editor for every test.
+
+The pool is an opt-in mode of EditorTestSuite, enabled with use_warm_editor_pool = True on the suite or for every suite
+with the --warm-editor-pool CLI arg. Each warm Editor runs editor_test_pool_server.py, which waits for the tests
+requested by the pool and runs them one at a time as __main__ in the Editor's Python interpreter.
+
+Isolation guarantees between the tests that run in the same warm Editor:
+- Before each test the Editor leaves game mode, clears the selection and opens the suite's warm_editor_reset_level
+  without saving, or reloads the current level when it is not set. Unsaved level and prefab changes made by the
+  previous test are discarded, files saved to disk by it are not restored.
+- Each test module runs in a new __main__ namespace with its own sys.argv, and the modules imported from the directory
+  of the test are unloaded after it. Other modules, such as azlmbr and editor_python_test_tools, keep their state.
+- Editor settings, console variables, open panes and any other global Editor state are NOT reset.
+- A warm Editor is replaced by a new one after any test that doesn't pass, so a crash, timeout or failure never leaks
+  into the next test, and after warm_editor_max_tests tests to bound the state it accumulates.
+- Tests only share a warm Editor when the Editor command line args they need are the same.
+- EditorSingleTests with use_warm_editor = False, attach_debugger or wait_for_debugger always start a new Editor.
+  Tests whose setup() or wrap_run() prepares files the Editor only reads on startup should set use_warm_editor = False.
+"""
+
+from __future__ import annotations
+__test__ = False  # Avoid pytest collection & warnings since this module is for test functions, but not a test itself.
+
+import itertools
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+import typing
+
+import ly_test_tools.launchers.platforms.base
+import ly_test_tools.o3de.editor_test_utils as editor_utils
+from ly_test_tools._internal.managers.workspace import AbstractWorkspaceManager
+from ly_test_tools.launchers.exceptions import WaitTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Script run by the warm Editors, it can't be imported here since it depends on the Editor Python bindings
+SERVER_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "editor_test_pool_server.py")
+# File names shared with the server script
+READY_FILE_NAME = "ready.json"
+REQUEST_FILE_NAME = "request.json"
+RESULT_FILE_NAME = "result_{}.json"
+# Run ids of the warm Editors start from this value, so their log folders don't collide with the ones of other Editors
+FIRST_RUN_ID = 1000
+# Seconds between checks for the readiness of a warm Editor or the result of a test
+POLL_INTERVAL = 0.1
+# Name of the test case passed to the Editor for the pool server script
+POOL_TEST_CASE_NAME = "editor_test_pool"
+
+
+class WarmEditor(object):
+    """
+    An Editor running the pool server script, with its own directory for exchanging test requests and results
+    """
+
+    def __init__(self,
+                 executable: ly_test_tools.launchers.platforms.base.Launcher,
+                 workspace: AbstractWorkspaceManager,
+                 run_id: int,
+                 log_name: str,
+                 cmdline_args: list[str]):
+        """
+        :param executable: The Editor launcher, not started yet
+        :param workspace: The LyTestTools Workspace object
+        :param run_id: The unique run id of the Editor, used for its log path
+        :param log_name: The name of the Editor log
+        :param cmdline_args: The command line args needed by the tests, the Editor can only run tests needing the same
+        """
+        self.executable = executable
+        self.workspace = workspace
+        self.run_id = run_id
+        self.log_name = log_name
+        self.cmdline_args = list(cmdline_args)
+        self.tests_run = 0
+        self.pool_directory = tempfile.mkdtemp(prefix="editor_test_pool_")
+        self._request_ids = itertools.count(1)
+        self._output_position = 0
+        self._log_position = 0
+        self._ready = False
+
+    def start(self) -> None:
+        """
+        Starts the Editor with the pool server script, without waiting for it to be ready
+        :return: None
+        """
+        server_script = os.path.join(self.pool_directory, os.path.basename(SERVER_SCRIPT_PATH))
+        shutil.copyfile(SERVER_SCRIPT_PATH, server_script)
+        editor_utils.cycle_crash_report(self.run_id, self.workspace)
+        self.executable.args.extend(["-runpythontest", server_script.replace('\\', '/'),
+                                     "-pythontestcase", POOL_TEST_CASE_NAME,
+                                     "-logfile", f"@log@/{self.log_name}",
+                                     "-project-log-path", editor_utils.retrieve_log_path(self.run_id, self.workspace)]
+                                    + self.cmdline_args)
+        self.executable.start(backupFiles=False, launch_ap=False, configure_settings=False)
+
+    def is_alive(self) -> bool:
+        """
+        :return: True if the Editor process is running
+        """
+        return self.executable.is_alive()
+
+    def wait_until_ready(self, timeout: float) -> bool:
+        """
+        Waits for the pool server script to start serving requests
+        :param timeout: Maximum time in seconds to wait
+        :return: True if the Editor is ready, False if it exited or didn't get ready in time
+        """
+        ready_path = os.path.join(self.pool_directory, READY_FILE_NAME)
+        timeout_end = time.monotonic() + timeout
+        while not self._ready:
+            self._ready = os.path.exists(ready_path)
+            if not self._ready:
+                if not self.is_alive() or time.monotonic() > timeout_end:
+                    return False
+                time.sleep(POLL_INTERVAL)
+        return True
+
+    def run_test(self, test_script: str, test_case_name: str, reset_level: str, timeout: float) -> dict or None:
+        """
+        Requests the Editor to run a test and waits for its result
+        :param test_script: The path of the test module
+        :param test_case_name: The name of the test case
+        :param reset_level: The level opened to reset the Editor before the test, empty to reload the current level
+        :param timeout: Maximum time in seconds for the test to run
+        :return: The result written by the pool server script, or None if the Editor exited or the test timed out
+        """
+        request_id = next(self._request_ids)
+        result_path = os.path.join(self.pool_directory, RESULT_FILE_NAME.format(request_id))
+        self._write_request({"id": request_id,
+                             "test_script": test_script.replace('\\', '/'),
+                             "test_case": test_case_name,
+                             "reset_level": reset_level})
+        self.tests_run += 1
+
+        timeout_end = time.monotonic() + timeout
+        while not os.path.exists(result_path):
+            if not self.is_alive() or time.monotonic() > timeout_end:
+                return None
+            time.sleep(POLL_INTERVAL)
+        with open(result_path, "r") as result_file:
+            return json.load(result_file)
+
+    def get_output(self) -> str:
+        """
+        :return: The output of the Editor since the last call
+        """
+        output = self.executable.get_output()
+        new_output = output[self._output_position:]
+        self._output_position = len(output)
+        return new_output
+
+    def get_log_content(self) -> str:
+        """
+        :return: The content of the Editor log since the last call
+        """
+        log_content = editor_utils.retrieve_editor_log_content(self.run_id, self.log_name, self.workspace)
+        new_log_content = log_content[self._log_position:]
+        self._log_position = len(log_content)
+        return new_log_content
+
+    def stop(self, timeout: float = 30) -> None:
+        """
+        Requests the pool server script to close the Editor, killing it if it doesn't exit in time, and saves its log
+        :param timeout: Maximum time in seconds to wait for the Editor to exit
+        :return: None
+        """
+        try:
+            if self.is_alive():
+                self._write_request({"shutdown": True})
+                self.executable.wait(timeout)
+        except WaitTimeoutError:
+            logger.warning(f"Warm Editor with run id {self.run_id} didn't exit after {timeout} seconds, killing it")
+        finally:
+            self.executable.stop()
+            try:
+                self.workspace.artifact_manager.save_artifact(
+                    os.path.join(editor_utils.retrieve_log_path(self.run_id, self.workspace), self.log_name),
+                    f"({self.run_id}){self.log_name}")
+            except FileNotFoundError:
+                pass
+            shutil.rmtree(self.pool_directory, ignore_errors=True)
+
+    def _write_request(self, request: dict) -> None:
+        request_path = os.path.join(self.pool_directory, REQUEST_FILE_NAME)
+        with open(f"{request_path}.tmp", "w") as request_file:
+            json.dump(request, request_file)
+        os.replace(f"{request_path}.tmp", request_path)
+
+
+class EditorPool(object):
+    """
+    Keeps up to size warm Editors started with the command line args of the last test, replacing each of them after
+    max_tests tests or after a test which didn't pass. Replacements are started as soon as an Editor is released, so
+    they start up while the next tests are being prepared.
+    """
+
+    def __init__(self,
+                 create_executable: typing.Callable[[], ly_test_tools.launchers.platforms.base.Launcher],
+                 workspace: AbstractWorkspaceManager,
+                 log_name: str,
+                 size: int = 1,
+                 max_tests: int = 20):
+        """
+        :param create_executable: Function returning a new configured Editor launcher
+        :param workspace: The LyTestTools Workspace object
+        :param log_name: The name of the Editor logs
+        :param size: The number of warm Editors to keep
+        :param max_tests: The number of tests after which a warm Editor is replaced
+        """
+        self.create_executable = create_executable
+        self.workspace = workspace
+        self.log_name = log_name
+        self.size = max(size, 1)
+        self.max_tests = max(max_tests, 1)
+        self._run_ids = itertools.count(FIRST_RUN_ID)
+        self._warm_editors = []
+
+    def has_live_editors(self) -> bool:
+        """
+        :return: True if any of the warm Editors is running
+        """
+        return any(warm_editor.is_alive() for warm_editor in self._warm_editors)
+
+    def acquire(self, cmdline_args: list[str]) -> WarmEditor:
+        """
+        Takes a warm Editor started with cmdline_args out of the pool, starting Editors to fill the pool when needed.
+        Editors which exited or were started with different args are replaced.
+        :param cmdline_args: The command line args needed by the test
+        :return: The warm Editor, which may still be starting up
+        """
+        for warm_editor in list(self._warm_editors):
+            if warm_editor.cmdline_args != list(cmdline_args) or not warm_editor.is_alive():
+                self._warm_editors.remove(warm_editor)
+                warm_editor.stop()
+        self._fill(cmdline_args)
+        return self._warm_editors.pop(0)
+
+    def release(self, warm_editor: WarmEditor, recycle: bool = False) -> None:
+        """
+        Returns a warm Editor to the pool, replacing it if requested or if it ran max_tests tests
+        :param warm_editor: The warm Editor returned by acquire()
+        :param recycle: Whether to replace the Editor, i.e. after a test which didn't pass
+        :return: None
+        """
+        if recycle or warm_editor.tests_run >= self.max_tests or not warm_editor.is_alive():
+            warm_editor.stop()
+            self._fill(warm_editor.cmdline_args)
+        else:
+            # The same Editor runs the next test, the other Editors are kept as warm replacements
+            self._warm_editors.insert(0, warm_editor)
+
+    def stop(self) -> None:
+        """
+        Stops all the warm Editors
+        :return: None
+        """
+        warm_editors, self._warm_editors = self._warm_editors, []
+        for warm_editor in warm_editors:
+            warm_editor.stop()
+
+    def _fill(self, cmdline_args: list[str]) -> None:
+        while len(self._warm_editors) < self.size:
+            warm_editor = WarmEditor(
+                self.create_executable(), self.workspace, next(self._run_ids), self.log_name, cmdline_args)
+            warm_editor.start()
+            self._warm_editors.append(warm_editor)
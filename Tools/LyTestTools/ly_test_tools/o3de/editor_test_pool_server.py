@@ -0,0 +1,140 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Script run inside a warm Editor of ly_test_tools.o3de.editor_test_pool.EditorPool, through -runpythontest.
+It is copied into the directory of its pool process and waits for test requests written to that directory by the pool,
+resetting the level state through the Editor Python bindings and running each test module as __main__, then writes the
+result of every test next to its request. It only depends on the Python standard library and azlmbr, since it runs in
+the Editor's Python interpreter instead of the one running pytest.
+"""
+__test__ = False  # Avoid pytest collection & warnings since this module runs inside the Editor, it is not a test.
+
+import json
+import os
+import runpy
+import sys
+import time
+import traceback
+
+import azlmbr.legacy.general as general
+
+# File names shared with ly_test_tools.o3de.editor_test_pool
+READY_FILE_NAME = "ready.json"
+REQUEST_FILE_NAME = "request.json"
+RESULT_FILE_NAME = "result_{}.json"
+# Seconds the Editor idles between checks for a new request, the Editor keeps ticking while idling
+POLL_INTERVAL = 0.05
+# Frames to wait for the Editor to leave game mode before resetting the level
+EXIT_GAME_MODE_FRAMES = 100
+
+
+def _write_json_atomically(json_path: str, json_data: dict) -> None:
+    """
+    Writes json_data to a temporary file and moves it to json_path, so the pool never reads a partial file
+    :param json_path: The path of the json file
+    :param json_data: The data to write
+    :return: None
+    """
+    temp_path = f"{json_path}.tmp"
+    with open(temp_path, "w") as json_file:
+        json.dump(json_data, json_file)
+    os.replace(temp_path, json_path)
+
+
+def _reset_editor_state(reset_level: str) -> None:
+    """
+    Brings the Editor back to a clean level state before a test: leaves game mode, clears the selection and reopens
+    the level without saving, which discards the unsaved level and prefab changes of the previous test
+    :param reset_level: The level to open, the current level is reloaded when empty
+    :return: None
+    """
+    if general.is_in_game_mode():
+        general.exit_game_mode()
+        for _ in range(EXIT_GAME_MODE_FRAMES):
+            if not general.is_in_game_mode():
+                break
+            general.idle_wait_frames(1)
+    general.clear_selection()
+    if reset_level:
+        general.open_level_no_prompt(reset_level)
+    elif general.get_current_level_name():
+        general.reload_current_level()
+    general.idle_wait_frames(1)
+
+
+def _run_test(request: dict) -> dict:
+    """
+    Runs the test module of a request as __main__, capturing the test report it outputs with general.test_output
+    :param request: The request written by the pool
+    :return: The result to write back to the pool
+    """
+    test_script = request["test_script"]
+    test_directory = os.path.normcase(os.path.dirname(os.path.abspath(test_script)))
+    captured_output = []
+    original_test_output = general.test_output
+
+    def test_output(text):
+        captured_output.append(text)
+        original_test_output(text)
+
+    original_argv = sys.argv
+    original_modules = set(sys.modules)
+    success = True
+    exception = None
+    start_time = time.time()
+    general.test_output = test_output
+    try:
+        sys.argv = [test_script] + request.get("args", [])
+        runpy.run_path(test_script, run_name="__main__")
+    except SystemExit as e:
+        success = e.code in (None, 0)
+    except BaseException:  # Intentionally broad, any error raised by the test is a test failure
+        success = False
+        exception = traceback.format_exc()
+    finally:
+        general.test_output = original_test_output
+        sys.argv = original_argv
+        # Unload the helper modules imported from the directory of the test, so the next test imports them again
+        for module_name in set(sys.modules) - original_modules:
+            module_file = getattr(sys.modules[module_name], "__file__", None)
+            if module_file and os.path.normcase(os.path.abspath(module_file)).startswith(test_directory):
+                del sys.modules[module_name]
+
+    return {"id": request["id"],
+            "success": success,
+            "output": "".join(captured_output),
+            "exception": exception,
+            "duration": time.time() - start_time}
+
+
+def main() -> None:
+    """
+    Serves test requests until the pool requests a shutdown
+    :return: None
+    """
+    pool_directory = os.path.dirname(os.path.abspath(sys.argv[0]))
+    request_path = os.path.join(pool_directory, REQUEST_FILE_NAME)
+    general.idle_enable(True)
+    _write_json_atomically(os.path.join(pool_directory, READY_FILE_NAME), {"pid": os.getpid()})
+
+    while True:
+        if not os.path.exists(request_path):
+            general.idle_wait(POLL_INTERVAL)
+            continue
+
+        with open(request_path, "r") as request_file:
+            request = json.load(request_file)
+        os.remove(request_path)
+        if request.get("shutdown", False):
+            break
+
+        _reset_editor_state(request.get("reset_level", ""))
+        result = _run_test(request)
+        _write_json_atomically(os.path.join(pool_directory, RESULT_FILE_NAME.format(request["id"])), result)
+
+
+if __name__ == "__main__":
+    main()
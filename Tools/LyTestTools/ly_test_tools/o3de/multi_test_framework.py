@@ -20,7 +20,10 @@ from __future__ import annotations
 __test__ = False  # Avoid pytest collection & warnings since this module is for test functions, but not a test itself.
 
 import abc
+import codecs
+import collections
 import functools
+import itertools
 import json
 import inspect
 import logging
@@ -29,6 +32,7 @@ import os
 import re
 import tempfile
 import threading
+import time
 import types
 import typing
 import warnings
@@ -38,6 +42,8 @@ import _pytest.python
 import _pytest.outcomes
 from _pytest.skipping import pytest_runtest_setup as skip_pytest_runtest_setup
 
+import ly_test_tools._internal.pytest_plugin
+import ly_test_tools._internal.pytest_plugin.test_durations as test_durations
 import ly_test_tools.launchers.platforms.base as Launchers
 import ly_test_tools.o3de.editor_test_utils as editor_utils
 from ly_test_tools._internal.managers.workspace import AbstractWorkspaceManager
@@ -49,6 +55,9 @@ from ly_test_tools.launchers.platforms.win.launcher import WinEditor, WinAtomToo
 
 logger = logging.getLogger(__name__)
 
+# Seconds between reads of the executable log while looking for the results of the tests running in it
+RESULT_STREAM_POLL_INTERVAL = 1
+
 
 class AbstractTestBase(object):
     """
@@ -318,6 +327,245 @@ class Result(object):
             return output
 
 
+class SharedTestQueue(object):
+    """
+    Queue of shared tests which the parallel executables take batches of tests from whenever they finish their previous
+    batch, so no executable is left idle while tests remain to run.
+    The longest tests are taken first. Each batch is sized to a share of the remaining estimated duration which
+    shrinks as the queue empties (guided self-scheduling), so the executables are started few times early on and the
+    small batches at the end let them all finish close together.
+    """
+
+    def __init__(self, test_spec_list: list[SharedTest], num_executables: int, get_duration_estimate: typing.Callable):
+        """
+        :param test_spec_list: A list of SharedTest tests to run
+        :param num_executables: The number of executables taking batches from the queue
+        :param get_duration_estimate: Function returning the estimated duration of a test in seconds
+        """
+        self._lock = threading.Lock()
+        self._num_executables = max(num_executables, 1)
+        self._durations = {test_spec: max(float(get_duration_estimate(test_spec)), 0.0)
+                           for test_spec in test_spec_list}
+        self._tests = collections.deque(
+            sorted(test_spec_list, key=lambda test_spec: self._durations[test_spec], reverse=True))
+        self._remaining_duration = sum(self._durations[test_spec] for test_spec in self._tests)
+        self._requeued_tests = set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tests)
+
+    def get_batch(self) -> list[SharedTest]:
+        """
+        Takes the next batch of tests to run in one executable.
+        :return: A list of SharedTest tests, empty when no tests remain
+        """
+        with self._lock:
+            if not self._tests:
+                return []
+            batch_duration_target = self._remaining_duration / (2 * self._num_executables)
+            test_spec = self._tests.popleft()
+            batch = [test_spec]
+            batch_duration = self._durations[test_spec]
+            while self._tests and batch_duration + self._durations[self._tests[0]] <= batch_duration_target:
+                test_spec = self._tests.popleft()
+                batch.append(test_spec)
+                batch_duration += self._durations[test_spec]
+            self._remaining_duration = max(self._remaining_duration - batch_duration, 0.0)
+            return batch
+
+    def requeue(self, test_spec: SharedTest) -> bool:
+        """
+        Puts a test which could not run, because another test of its batch crashed or timed out the executable,
+        back at the front of the queue. Each test is only put back once.
+        :param test_spec: The test to run again
+        :return: True if the test was put back in the queue
+        """
+        with self._lock:
+            if test_spec in self._requeued_tests:
+                return False
+            self._requeued_tests.add(test_spec)
+            self._tests.appendleft(test_spec)
+            self._remaining_duration += self._durations.get(test_spec, 0.0)
+            return True
+
+
+class ResultStreamParser(object):
+    """
+    Finds the JSON_START(...)JSON_END results printed by the tests of a batch as the executable output and log are read
+    in chunks, so the result of every test is known as soon as it finishes instead of after the whole batch. Only the
+    results of the tests in the batch and the log offsets where each of them ends are kept, plus the last unfinished
+    line of each stream, so memory doesn't grow with the size of the output or the number of tests.
+    """
+    RESULT_PATTERN = re.compile(r"JSON_START\((.+?)\)JSON_END")
+    RESULT_END_MARKER = "JSON_END"
+
+    class _Stream(object):
+        """
+        Lines of an output stream fed in chunks, counted in characters from the start of the stream
+        """
+        def __init__(self, line_prefix: str = ""):
+            self.line_prefix = line_prefix
+            self.partial_line = ""
+            self.position = 0
+            self.file_position = 0
+            self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def __init__(self,
+                 test_spec_list: list[AbstractTestBase],
+                 log_line_prefix: str = "",
+                 on_result: typing.Callable[[AbstractTestBase, bool], None] = None):
+        """
+        :param test_spec_list: The list of test classes, in the order they run
+        :param log_line_prefix: Prefix added to every line of the log content passed to get_results(), so the log
+            offsets found while reading the log file match it
+        :param on_result: Function called with the test class and whether it passed as soon as its result is found in
+            the log, the result is logged when None
+        """
+        self.test_spec_list = test_spec_list
+        self.on_result = on_result
+        self._test_names = [(editor_utils.get_module_filename(test_spec.test_module), test_spec)
+                            for test_spec in test_spec_list]
+        self._test_specs_by_name = dict(self._test_names)
+        self._found_jsons = {}
+        self._log_ends = {}
+        self._reported = set()
+        self._output_stream = ResultStreamParser._Stream()
+        self._log_stream = ResultStreamParser._Stream(log_line_prefix)
+
+    def _feed(self, stream: ResultStreamParser._Stream, text: str, flush: bool = False) -> typing.Iterator:
+        """
+        Parses the complete lines of a stream chunk, the result markers never span lines since the JSON is dumped in one
+        :param stream: The stream the chunk belongs to
+        :param text: The chunk of text
+        :param flush: Whether to also parse the unfinished last line, i.e. when the stream ended
+        :return: Iterator of (result dict, offset in the stream where its marker ends) tuples
+        """
+        lines = (stream.partial_line + text).split("\n")
+        stream.partial_line = lines.pop()
+        if flush and stream.partial_line:
+            lines.append(stream.partial_line)
+            stream.partial_line = ""
+        for line in lines:
+            line = line.rstrip("\r")
+            line_start = stream.position + len(stream.line_prefix)
+            for m in ResultStreamParser.RESULT_PATTERN.finditer(line):
+                try:
+                    elem = json.loads(m.group(1))
+                    name = elem["name"]
+                except Exception:  # Intentionally broad to avoid failing if the output data is corrupt
+                    logger.warning("Error reading result JSON", exc_info=True)
+                    continue
+                if name in self._test_specs_by_name:
+                    yield elem, line_start + m.end()
+            stream.position = line_start + len(line) + 1
+
+    def feed_output(self, text: str, flush: bool = False) -> None:
+        """
+        Parses a chunk of the executable output, which holds the results used for the test outcome
+        :param text: The chunk of output
+        :param flush: Whether the output ended
+        :return: None
+        """
+        for elem, _ in self._feed(self._output_stream, text, flush):
+            self._found_jsons[elem["name"]] = elem
+
+    def feed_log(self, text: str, flush: bool = False) -> None:
+        """
+        Parses a chunk of the executable log, recording where the log of each test ends and reporting its result
+        :param text: The chunk of log
+        :param flush: Whether the log ended
+        :return: None
+        """
+        for elem, end in self._feed(self._log_stream, text, flush):
+            name = elem["name"]
+            if name in self._log_ends:
+                continue
+            self._log_ends[name] = end
+            if name not in self._reported:
+                self._reported.add(name)
+                self._report(self._test_specs_by_name[name], bool(elem.get("success")))
+
+    def feed_log_file(self, log_path: str, modified_since: float = 0) -> None:
+        """
+        Parses what was appended to the log file since the last call. The file is only open while it is read, so the
+        executable can still rename or replace it.
+        :param log_path: The path of the log file
+        :param modified_since: Log files last modified before this time are ignored, as they belong to a previous run
+        :return: None
+        """
+        try:
+            log_stat = os.stat(log_path)
+            if log_stat.st_mtime < modified_since:
+                return
+            if log_stat.st_size < self._log_stream.file_position:
+                # The log file was replaced, its content is parsed again from the start
+                self._log_stream = ResultStreamParser._Stream(self._log_stream.line_prefix)
+                self._log_ends.clear()
+            with open(log_path, "rb") as log_file:
+                log_file.seek(self._log_stream.file_position)
+                data = log_file.read()
+        except OSError:
+            return
+        self._log_stream.file_position += len(data)
+        self.feed_log(self._log_stream.decoder.decode(data))
+
+    def _report(self, test_spec: AbstractTestBase, success: bool) -> None:
+        if self.on_result:
+            self.on_result(test_spec, success)
+        else:
+            logger.info(f"Test {test_spec.__name__} finished: {'PASS' if success else 'FAIL'}")
+
+    def _has_log_offsets_of(self, log_output: str) -> bool:
+        """
+        :param log_output: The complete log content
+        :return: True if the log offsets found while reading the log file point to the result markers of log_output
+        """
+        marker_length = len(ResultStreamParser.RESULT_END_MARKER)
+        return 0 < self._log_stream.position <= len(log_output) + 1 and all(
+            log_output[end - marker_length:end] == ResultStreamParser.RESULT_END_MARKER
+            for end in self._log_ends.values())
+
+    def get_results(self, output: str, log_output: str) -> dict[str, Result.ResultType]:
+        """
+        Creates the results of the tests from the complete executable output and log. The output is parsed here unless
+        it was fed already, the log is only parsed again when the offsets found while it was read don't match it.
+        :param output: The complete executable output
+        :param log_output: The complete log content
+        :return: A dict of the test names and their respective Result objects
+        """
+        if self._output_stream.position == 0 and not self._found_jsons:
+            self.feed_output(output, flush=True)
+        if not self._has_log_offsets_of(log_output):
+            self._log_stream = ResultStreamParser._Stream()
+            self._log_ends.clear()
+            self.feed_log(log_output, flush=True)
+
+        results = {}
+        log_start = 0
+        for name, test_spec in self._test_names:
+            if name not in self._found_jsons:
+                results[test_spec.__name__] = Result.Unknown(
+                    test_spec,
+                    output,
+                    f"Found no test run information on stdout for {name} in the test output",
+                    log_output)
+                continue
+
+            json_result = self._found_jsons[name]
+            # Cut the log output so it only has the log contents for this run
+            log_end = self._log_ends.get(name) if test_spec is not self.test_spec_list[-1] else None
+            cur_log = log_output[log_start:log_end]
+            if log_end is not None:
+                log_start = log_end
+
+            if json_result["success"]:
+                results[test_spec.__name__] = Result.Pass(test_spec, json_result["output"], cur_log)
+            else:
+                results[test_spec.__name__] = Result.Fail(test_spec, json_result["output"], cur_log)
+        return results
+
+
 class MultiTestSuite(object):
     """
     Main object used to run the tests.
@@ -342,6 +590,10 @@ class MultiTestSuite(object):
     _single_test_class = SingleTest
     # Test class to use for shared test collection
     _shared_test_class = SharedTest
+    # Durations in seconds measured for the tests during this session, by test class
+    _test_durations = {}
+    # Pytest node ids of the collected tests, by test class, for looking up their durations from previous runs
+    _test_node_ids = {}
 
     class TestData:
         __test__ = False  # Avoid pytest collection & warnings since "test" is in the class name.
@@ -349,6 +601,7 @@ class MultiTestSuite(object):
         def __init__(self):
             self.results = {}  # Dict of str(test_spec.__name__) -> Result
             self.asset_processor = None
+            self.editor_pool = None
 
     class Runner:
         def __init__(self, name, func, tests):
@@ -463,6 +716,10 @@ class MultiTestSuite(object):
                         {"runner": target_runner, "test_spec": inner_test_spec, "run_type": "result"})
                     def result(self, request, workspace, collected_test_data, launcher_platform):
                         result_key = inner_test_spec.__name__
+                        # The test ran in the runner, so record the duration measured there instead of this function's
+                        if inner_test_spec in MultiTestSuite._test_durations:
+                            request.node.user_properties.append(
+                                (test_durations.DURATION_USER_PROPERTY, MultiTestSuite._test_durations[inner_test_spec]))
                         # The runner must have filled the collected_test_data.results dict fixture for this test.
                         # Hitting this assert could mean if there was an error executing the runner
                         if result_key not in collected_test_data.results:
@@ -586,6 +843,41 @@ class MultiTestSuite(object):
 
         return count
 
+    @classmethod
+    def get_test_duration_estimate(cls, test_spec: AbstractTestBase) -> float:
+        """
+        Estimated duration of a test in seconds, the parallel executables run the longest tests first and size their
+        batches of tests with it. This method can be overridden by the user.
+        :param test_spec: The test class
+        :return: The duration measured for the test earlier in this session, else the duration recorded for it in
+            previous runs when pytest runs with --test-durations-path, or its timeout if it has never run
+        """
+        if test_spec in MultiTestSuite._test_durations:
+            return MultiTestSuite._test_durations[test_spec]
+
+        duration_store = ly_test_tools._internal.pytest_plugin.duration_store
+        node_id = MultiTestSuite._test_node_ids.get(test_spec, None)
+        if duration_store is not None and node_id is not None:
+            estimate = duration_store.get_duration_estimate(node_id)
+            if estimate is not None:
+                return estimate
+
+        return getattr(test_spec, "timeout", AbstractTestBase.timeout)
+
+    @staticmethod
+    def _record_batch_durations(test_spec_list: list[AbstractTestBase], duration: float, estimates: dict) -> None:
+        """
+        Records the duration of a batch of tests that ran in one executable, split between the tests in proportion to
+        their estimated durations since the executable doesn't report the duration of each test.
+        :param test_spec_list: The tests that ran
+        :param duration: The duration of the executable run in seconds
+        :param estimates: Dict of test class to its estimated duration
+        """
+        total_estimate = sum(estimates[test_spec] for test_spec in test_spec_list)
+        for test_spec in test_spec_list:
+            share = estimates[test_spec] / total_estimate if total_estimate else 1.0 / len(test_spec_list)
+            MultiTestSuite._test_durations[test_spec] = duration * share
+
     def _get_number_parallel_executables(self, request: _pytest.fixtures.FixtureRequest) -> int:
         """
         Retrieves the number of parallel executables preference based on cmdline overrides or class overrides.
@@ -604,15 +896,28 @@ class MultiTestSuite(object):
             cls, session: _pytest.main.Session, items: list[AbstractTestBase], config: _pytest.config.Config) -> None:
         """
         Adds the runners' functions and filters the tests that will run. The runners will be added if they have any
-        selected tests
+        selected tests. When pytest runs with --test-durations-path, the single tests and the tests of each runner are
+        ordered longest first by the durations recorded in previous runs.
         :param session: The Pytest Session
         :param items: The test case functions
         :param config: The Pytest Config object
         :return: None
         """
+        test_specs_by_name = {test_spec.__name__: test_spec
+                              for test_spec in cls.get_single_tests() + cls.get_shared_tests()}
+        for item in items:
+            if getattr(item, "cls", None) is cls and item.originalname in test_specs_by_name:
+                MultiTestSuite._test_node_ids[test_specs_by_name[item.originalname]] = item.nodeid
+
+        order_by_duration = ly_test_tools._internal.pytest_plugin.duration_store is not None
+        if order_by_duration:
+            cls._order_single_test_items(items, test_specs_by_name)
+
         new_items = []
         for runner in cls._runners:
             runner.tests[:] = cls.filter_session_shared_tests(items, runner.tests)
+            if order_by_duration:
+                runner.tests.sort(key=lambda test_spec: -cls.get_test_duration_estimate(test_spec))
             if len(runner.tests) > 0:
                 new_items.append(runner.run_pytestfunc)
                 # Re-order dependent tests so they are run just after the runner
@@ -624,6 +929,23 @@ class MultiTestSuite(object):
 
         items[:] = items + new_items
 
+    @classmethod
+    def _order_single_test_items(cls, items: list[_pytest.python.Function], test_specs_by_name: dict) -> None:
+        """
+        Orders the single tests of this suite longest first, in the positions of items they already had
+        :param items: The test case functions
+        :param test_specs_by_name: Dict of test class name to test class for the tests of this suite
+        :return: None
+        """
+        positions = [index for index, item in enumerate(items)
+                     if getattr(item, "cls", None) is cls and item.originalname in test_specs_by_name
+                     and getattr(item.function, "marks", {}).get("run_type", None) == "run_single"]
+        ordered_items = sorted(
+            (items[index] for index in positions),
+            key=lambda item: -cls.get_test_duration_estimate(test_specs_by_name[item.originalname]))
+        for index, item in zip(positions, ordered_items):
+            items[index] = item
+
     @pytest.fixture(scope="class")
     def collected_test_data(self, request: _pytest.fixtures.FixtureRequest) -> MultiTestSuite.TestData:
         """
@@ -643,6 +965,9 @@ class MultiTestSuite(object):
         test_data = MultiTestSuite.TestData()
         yield test_data  # yield to pytest while test-class executes
         # resumed by pytest after each test-class finishes
+        if test_data.editor_pool:  # was assigned a pool of warm Editors to manage
+            test_data.editor_pool.stop()
+            test_data.editor_pool = None
         if test_data.asset_processor:  # was assigned an AP to manage
             test_data.asset_processor.teardown()
             test_data.asset_processor = None
@@ -959,8 +1284,14 @@ class MultiTestSuite(object):
         if extra_cmdline_args is None:
             extra_cmdline_args = []
 
+        estimates = {test_spec: max(float(self.get_test_duration_estimate(test_spec)), 0.0)
+                     for test_spec in test_spec_list}
+        start_time = time.monotonic()
         results = self._exec_multitest(
             request, workspace, self.executable, 1, self.log_name, test_spec_list, extra_cmdline_args)
+        if results and not any(isinstance(result, (Result.Crash, Result.Timeout, Result.Unknown))
+                               for result in results.values()):
+            self._record_batch_durations(test_spec_list, time.monotonic() - start_time, estimates)
         self._test_reporting(collected_test_data, [results], workspace, BatchedTest)
 
     #####################
@@ -1005,6 +1336,7 @@ class MultiTestSuite(object):
             for i in range(total_threads):
                 def make_parallel_test_func(test_spec, index, current_executable):
                     def run(request, workspace, extra_cmdline_args):
+                        start_time = time.monotonic()
                         try:
                             results = self._exec_single_test(
                                 request, workspace, current_executable, index + 1, self.log_name, test_spec,
@@ -1016,6 +1348,8 @@ class MultiTestSuite(object):
                         if not results:
                             raise EditorToolsFrameworkException(f"Results not found. Current log name is "
                                                                 f"{self.log_name} and test name is {str(test_spec)}")
+                        if not isinstance(results.get(test_spec.__name__, None), (Result.Crash, Result.Timeout)):
+                            MultiTestSuite._test_durations[test_spec] = time.monotonic() - start_time
                         results_per_thread[index] = results
                     return run
 
@@ -1044,6 +1378,8 @@ class MultiTestSuite(object):
                                     extra_cmdline_args: list[str] = None) -> None:
         """
         Runs multiple executables with a batch of tests for each executable (multiple executables, multiple tests each)
+        The executables take their batches from a SharedTestQueue, longest tests first, and each executable starts again
+        with the next batch when it finishes or crashes until no tests remain.
         This function also sets up self.executable for a given program under test.
         :request: The Pytest Request
         :workspace: The LyTestTools Workspace object
@@ -1063,37 +1399,71 @@ class MultiTestSuite(object):
         if not total_threads > 0:
             logger.warning("Expected 1 or more total_threads, found 0. Setting to 1.")
             total_threads = 1
-
+        total_threads = min(total_threads, len(test_spec_list))
+
+        # Each executable takes the next batch of tests from the shared queue as soon as it finishes its previous batch
+        estimates = {test_spec: max(float(self.get_test_duration_estimate(test_spec)), 0.0)
+                     for test_spec in test_spec_list}
+        test_queue = SharedTestQueue(test_spec_list, total_threads, estimates.get)
+        run_ids = itertools.count(1)
+        run_ids_lock = threading.Lock()
         threads = []
-        tests_per_executable = int(math.ceil(len(test_spec_list) / total_threads))
         results_per_thread = [None] * total_threads
         for iteration in range(total_threads):
-            tests_for_thread = test_spec_list[iteration*tests_per_executable:(iteration+1)*tests_per_executable]
-
-            def make_shared_test_function(test_spec_list_for_executable, index, current_executable):
+            def make_shared_test_function(index):
                 def run(request, workspace, extra_cmdline_args):
-                    results = None
-                    if len(test_spec_list_for_executable) > 0:
+                    results = {}
+                    test_spec_list_for_executable = test_queue.get_batch()
+                    while test_spec_list_for_executable:
+                        # Every batch runs in a new executable with its own run id, so logs and crash reports of
+                        # earlier batches are kept
+                        with run_ids_lock:
+                            run_id = next(run_ids)
+                        # Duplicate the executable using the one coming from the fixture
+                        current_executable = self.executable.__class__(workspace, self.executable.args.copy())
+                        start_time = time.monotonic()
                         try:
-                            results = self._exec_multitest(
-                                request, workspace, current_executable, index + 1, self.log_name,
+                            batch_results = self._exec_multitest(
+                                request, workspace, current_executable, run_id, self.log_name,
                                 test_spec_list_for_executable, extra_cmdline_args)
-                        except Exception as e:
+                        except Exception:
                             logger.warning(f"Found exception trying to run Editor tests. Current log name is "
-                                           f"{self.log_name} and tests are {str(test_spec_list_for_executable)}")
-                            raise e
-                        if not results:
-                            raise EditorToolsFrameworkException(f"Results not found. Current log name is "
-                                                                f"{self.log_name} and tests are "
-                                                                f"{str(test_spec_list_for_executable)}")
-                    else:
-                        results = {}
+                                           f"{self.log_name} and tests are {str(test_spec_list_for_executable)}",
+                                           exc_info=True)
+                            batch_results = None
+                        if not batch_results:
+                            logger.error(f"Results not found. Current log name is {self.log_name} and tests are "
+                                         f"{str(test_spec_list_for_executable)}")
+                            batch_results = {test_spec.__name__: Result.Unknown(
+                                test_spec=test_spec,
+                                extra_info="Unexpectedly found no test run information on stdout in the "
+                                           "executable log")
+                                for test_spec in test_spec_list_for_executable}
+
+                        # Tests that couldn't run because an earlier test of the batch crashed or timed out the
+                        # executable go back to the queue to run in another executable
+                        interrupted = any(isinstance(result, (Result.Crash, Result.Timeout))
+                                          for result in batch_results.values())
+                        if not interrupted and not any(isinstance(result, Result.Unknown)
+                                                       for result in batch_results.values()):
+                            self._record_batch_durations(
+                                test_spec_list_for_executable, time.monotonic() - start_time, estimates)
+                        for test_spec in test_spec_list_for_executable:
+                            result = batch_results.get(test_spec.__name__, None)
+                            if result is None:
+                                result = Result.Unknown(test_spec=test_spec,
+                                                        extra_info="No result was found for this test")
+                            if interrupted and isinstance(result, Result.Unknown) and test_queue.requeue(test_spec):
+                                logger.info(f"Re-queuing test {test_spec.__name__} which could not run because "
+                                            f"another test of its batch stopped the executable")
+                                continue
+                            results[test_spec.__name__] = result
+
+                        test_spec_list_for_executable = test_queue.get_batch()
                     results_per_thread[index] = results
                 return run
 
-            # Duplicate the executable using the one coming from the fixture
-            current_executable = self.executable.__class__(workspace, self.executable.args.copy())
-            shared_test_function = make_shared_test_function(tests_for_thread, iteration, current_executable)
+            shared_test_function = make_shared_test_function(iteration)
             shared_test_thread = threading.Thread(
                 target=shared_test_function, args=(request, workspace, extra_cmdline_args))
             shared_test_thread.start()
@@ -1182,12 +1552,23 @@ class MultiTestSuite(object):
             cmdline = ["-runpythontest", test_filenames_str,
                        "-logfile", os.path.join(log_path_function(run_id, workspace), log_name)] + test_cmdline_args
         executable.args.extend(cmdline)
+        start_time = time.time()
         executable.start(backupFiles=False, launch_ap=False, configure_settings=False)
 
         output = ""
         executable_log_content = ""
+        result_parser = None
         try:
-            executable.wait(self.timeout_shared_test)
+            if type(executable) in [WinEditor, LinuxEditor]:
+                # Read the results from the log while the tests run, so each one is reported as soon as it finishes
+                result_parser = ResultStreamParser(test_spec_list, log_line_prefix=f"[{log_name}]  ")
+                self._wait_streaming_results(executable,
+                                             os.path.join(log_path_function(run_id, workspace), log_name),
+                                             result_parser,
+                                             self.timeout_shared_test,
+                                             start_time)
+            else:
+                executable.wait(self.timeout_shared_test)
             output = executable.get_output()
             return_code = executable.get_returncode()
             executable_log_content = log_content_function(run_id, log_name, workspace)
@@ -1212,7 +1593,8 @@ class MultiTestSuite(object):
                 # Scrape the output to attempt to find out which tests failed.
                 # This function should always populate the result list.
                 # If it didn't then it will have "Unknown" as the type of result.
-                results = self._get_results_using_output(test_spec_list, output, executable_log_content)
+                results = self._get_results_using_output(
+                    test_spec_list, output, executable_log_content, result_parser)
                 if not len(results) == len(test_spec_list):
                     logger.debug(f"\nList of Results: {results}\n"
                                  f"Test Spec List: {test_spec_list}\n")
@@ -1263,7 +1645,7 @@ class MultiTestSuite(object):
             executable_log_content = log_content_function(run_id, log_name, workspace)
 
             # The executable timed out when running the tests, get the data from the output to find out which ones ran
-            results = self._get_results_using_output(test_spec_list, output, executable_log_content)
+            results = self._get_results_using_output(test_spec_list, output, executable_log_content, result_parser)
             if not len(results) == len(test_spec_list):
                 logger.debug(f"\nList of Results: {results}\n"
                              f"Test Spec List: {test_spec_list}\n")
@@ -1299,71 +1681,49 @@ class MultiTestSuite(object):
                 os.unlink(temp_batched_case_file.name)
         return results
 
+    @staticmethod
+    def _wait_streaming_results(executable: ly_test_tools.launchers.platforms.base.Launcher,
+                                log_path: str,
+                                result_parser: ResultStreamParser,
+                                timeout: float,
+                                start_time: float) -> None:
+        """
+        Waits for the executable to exit while feeding what it appends to its log to result_parser
+        :param executable: The started program executable under test
+        :param log_path: The path of the executable log
+        :param result_parser: The parser of the results of the tests run by the executable
+        :param timeout: Maximum time in seconds to wait for the executable to exit
+        :param start_time: The time when the executable was started, older log files belong to previous runs
+        :return: None
+        """
+        timeout_end = time.monotonic() + timeout
+        try:
+            while executable.is_alive() and time.monotonic() < timeout_end:
+                result_parser.feed_log_file(log_path, start_time)
+                time.sleep(RESULT_STREAM_POLL_INTERVAL)
+            # Raises WaitTimeoutError if the executable is still running
+            executable.wait(max(timeout_end - time.monotonic(), 0))
+        finally:
+            result_parser.feed_log_file(log_path, start_time)
+
     @staticmethod
     def _get_results_using_output(test_spec_list: list[AbstractTestBase],
                                   output: str,
-                                  log_output: str) -> dict[any, [Result.Unknown, Result.Pass, Result.Fail]]:
+                                  log_output: str,
+                                  result_parser: ResultStreamParser = None
+                                  ) -> dict[any, [Result.Unknown, Result.Pass, Result.Fail]]:
         """
         Utility function for parsing the output information from the program being tested (i.e. Editor).
         It de-serializes the JSON content printed in the output for every test and returns that information.
         :param test_spec_list: The list of test classes
         :param output: The test output
         :param log_output: The program's log output
+        :param result_parser: The parser which already read the log while the program ran, if any
         :return: A dict of the tests and their respective Result objects
         """
-        results = {}
-        pattern = re.compile(r"JSON_START\((.+?)\)JSON_END")
-        out_matches = pattern.finditer(output)
-        found_jsons = {}
-        for m in out_matches:
-            try:
-                elem = json.loads(m.groups()[0])
-                found_jsons[elem["name"]] = elem
-            except Exception:  # Intentionally broad to avoid failing if the output data is corrupt
-                logger.warning("Error reading result JSON", exc_info=True)
-                continue
-
-        # Try to find the element in the log output, this is used for cutting the log contents later
-        log_matches = pattern.finditer(log_output)
-        for m in log_matches:
-            try:
-                elem = json.loads(m.groups()[0])
-                if elem["name"] in found_jsons:
-                    found_jsons[elem["name"]]["log_match"] = m
-            except Exception:  # Intentionally broad, to avoid failing if the log data is corrupt
-                logger.warning("Error reading result JSON", exc_info=True)
-                continue
-
-        log_start = 0
-        for test_spec in test_spec_list:
-            name = editor_utils.get_module_filename(test_spec.test_module)
-            if name not in found_jsons.keys():
-                results[test_spec.__name__] = Result.Unknown(
-                    test_spec,
-                    output,
-                    f"Found no test run information on stdout for {name} in the test output",
-                    log_output)
-            else:
-                result = None
-                json_result = found_jsons[name]
-                json_output = json_result["output"]
-
-                # Cut the log output so it only has the log contents for this run
-                if "log_match" in json_result:
-                    m = json_result["log_match"]
-                    end = m.end() if test_spec != test_spec_list[-1] else -1
-                else:
-                    end = -1
-                cur_log = log_output[log_start: end]
-                log_start = end
-
-                if json_result["success"]:
-                    result = Result.Pass(test_spec, json_output, cur_log)
-                else:
-                    result = Result.Fail(test_spec, json_output, cur_log)
-                results[test_spec.__name__] = result
-
-        return results
+        if result_parser is None:
+            result_parser = ResultStreamParser(test_spec_list)
+        return result_parser.get_results(output, log_output)
 
     @staticmethod
     def _report_result(name: str, result: Result.ResultType) -> None:
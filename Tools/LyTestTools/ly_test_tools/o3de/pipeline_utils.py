@@ -11,6 +11,8 @@ Small library of functions to support autotests for asset processor
 # Import builtin libraries
 import pytest
 import binascii
+import collections
+import concurrent.futures
 import hashlib
 import os
 import re
@@ -34,6 +36,9 @@ logger = logging.getLogger(__name__)
 AP_FASTSCAN_KEY = r"Software\O3DE\O3DE Asset Processor\Options"
 AP_FASTSCAN_SUBKEY = r"EnableZeroAnalysis"
 
+# Number of threads copying test assets, copies wait on the file system much more than on the CPU
+ASSET_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 class ProcessOutput(object):
     # Process data holding object
@@ -57,12 +62,13 @@ def compare_assets_with_cache(assets: List[str], assets_cache_path: str) -> Tupl
     missing_assets = []
     existing_assets = []
     if os.path.exists(assets_cache_path):
-        files_in_cache = list(map(fs.remove_path_and_extension, os.listdir(assets_cache_path)))
+        # Count the cache files by name, each of them can only match one asset
+        files_in_cache = collections.Counter(map(fs.remove_path_and_extension, os.listdir(assets_cache_path)))
         for asset in assets:
             file_without_ext = fs.remove_path_and_extension(asset).lower()
-            if file_without_ext in files_in_cache:
+            if files_in_cache[file_without_ext] > 0:
                 existing_assets.append(file_without_ext)
-                files_in_cache.remove(file_without_ext)
+                files_in_cache[file_without_ext] -= 1
             else:
                 missing_assets.append(file_without_ext)
     else:
@@ -70,6 +76,49 @@ def compare_assets_with_cache(assets: List[str], assets_cache_path: str) -> Tupl
     return missing_assets, existing_assets
 
 
+def copy_files_parallel(file_pairs: List[Tuple[str, str]], copy_function: Callable = shutil.copyfile,
+                        max_workers: int = ASSET_COPY_WORKERS) -> None:
+    """
+    Copies files on a pool of threads, the target directories must exist already
+
+    :param file_pairs: A list of (source path, target path) pairs
+    :param copy_function: The function copying a single file, i.e. shutil.copyfile or shutil.copy2
+    :param max_workers: The maximum number of files copied at once
+    :return: None
+    """
+    if len(file_pairs) <= 1 or max_workers <= 1:
+        for source_path, target_path in file_pairs:
+            copy_function(source_path, target_path)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(copy_function, source_path, target_path)
+                   for source_path, target_path in file_pairs]
+        for future in futures:
+            # Raises the first error of any copy
+            future.result()
+
+
+def copy_tree_parallel(source_directory: str, target_directory: str, copy_function: Callable = shutil.copy2) -> None:
+    """
+    Parallel equivalent of shutil.copytree, the target directory must not exist yet
+
+    :param source_directory: A path to the directory to copy
+    :param target_directory: A path to the new directory
+    :param copy_function: The function copying a single file
+    :return: None
+    """
+    file_pairs = []
+    os.makedirs(target_directory)
+    for root, dirs, files in os.walk(source_directory):
+        target_root = os.path.join(target_directory, os.path.relpath(root, source_directory))
+        for dir_name in dirs:
+            os.makedirs(os.path.join(target_root, dir_name), exist_ok=True)
+        file_pairs.extend((os.path.join(root, file_name), os.path.join(target_root, file_name))
+                          for file_name in files)
+    copy_files_parallel(file_pairs, copy_function)
+
+
 def copy_assets_to_project(assets: List[str], source_directory: str, target_asset_dir: str) -> None:
     """
     Given a list of asset names and a directory, copy those assets into the target project directory
@@ -81,14 +130,17 @@ def copy_assets_to_project(assets: List[str], source_directory: str, target_asse
     """
     if not os.path.exists(target_asset_dir):
         os.mkdir(target_asset_dir)
+    file_pairs = []
     for asset in assets:
         full_name = os.path.join(source_directory, asset)
         destination_fullname = os.path.join(target_asset_dir, asset)
         if os.path.isdir(full_name):
-            shutil.copytree(full_name, destination_fullname)
+            copy_tree_parallel(full_name, destination_fullname)
         else:
-            shutil.copyfile(full_name, destination_fullname)
-        os.chmod(destination_fullname, 0o0777)
+            file_pairs.append((full_name, destination_fullname))
+    copy_files_parallel(file_pairs)
+    for asset in assets:
+        os.chmod(os.path.join(target_asset_dir, asset), 0o0777)
 
 
 def prepare_test_assets(assets_path: str, function_name: str, project_test_assets_dir: str) -> str:
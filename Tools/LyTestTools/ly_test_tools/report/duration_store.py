@@ -0,0 +1,221 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Persistent store of the durations and outcomes of tests across runs, saved as a JSON-lines file with one record per
+test run. It is written by the ly_test_tools._internal.pytest_plugin.test_durations plugin when pytest runs with
+--test-durations-path, and can be queried to order tests longest-first, split them into balanced shards and find tests
+whose duration regressed.
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Outcome recorded for tests that passed, only these durations are used for estimates when available
+PASSED_OUTCOME = "passed"
+
+
+class DurationStore(object):
+    """
+    Durations of tests by test id, loaded lazily from a JSON-lines file where each line is a record like:
+        {"test": "path/test_file.py::TestSuite::test_name", "duration": 12.5, "outcome": "passed", "time": 1690000000.0}
+    New records are appended to the file by save(), so several test runs can share the same file. Only the most
+    recent max_records_per_test records of each test are kept when the file is compacted.
+    """
+
+    def __init__(self, path: str = None, max_records_per_test: int = 20):
+        """
+        :param path: Path of the JSON-lines file, it doesn't need to exist yet. Nothing is read or saved when None
+        :param max_records_per_test: Number of recent records of each test used for estimates and kept on compaction
+        """
+        self.path = path
+        self.max_records_per_test = max_records_per_test
+        self._records = None
+        self._line_count = 0
+        self._pending_records = []
+        self._lock = threading.Lock()
+
+    def _load_records(self) -> dict:
+        """
+        Reads the records of the file into a dict of test id to list of records, oldest first. Malformed lines are
+        ignored, since a line may have been cut short by a run which was killed while saving.
+        :return: The dict of records by test id
+        """
+        if self._records is not None:
+            return self._records
+
+        self._records = {}
+        self._line_count = 0
+        if not self.path:
+            return self._records
+        try:
+            with open(self.path, "r") as durations_file:
+                for line in durations_file:
+                    self._line_count += 1
+                    try:
+                        record = json.loads(line)
+                        self._add_loaded_record(record["test"], float(record["duration"]), record.get("outcome"),
+                                                float(record.get("time", 0.0)))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Test durations file {self.path} could not be read: {e}")
+        return self._records
+
+    def _add_loaded_record(self, test_id: str, duration: float, outcome: str, timestamp: float) -> None:
+        records = self._records.setdefault(test_id, [])
+        records.append({"test": test_id, "duration": duration, "outcome": outcome, "time": timestamp})
+        if len(records) > self.max_records_per_test:
+            del records[0]
+
+    def add(self, test_id: str, duration: float, outcome: str = PASSED_OUTCOME, timestamp: float = None) -> None:
+        """
+        Records a run of a test, which is written to the file on the next call to save()
+        :param test_id: The id of the test, normally its pytest node id
+        :param duration: The duration of the test in seconds
+        :param outcome: The outcome of the test, i.e. "passed", "failed"
+        :param timestamp: The time when the test ran in seconds since the epoch, defaults to now
+        :return: None
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._load_records()
+            self._add_loaded_record(test_id, float(duration), outcome, timestamp)
+            self._pending_records.append(self._records[test_id][-1])
+
+    def save(self) -> bool:
+        """
+        Appends the records added since the last save to the file. The file is rewritten with only the most recent
+        records of each test once it holds more than twice the records that are kept.
+        :return: True if the file is up to date, False if it could not be written
+        """
+        with self._lock:
+            if not self._pending_records or not self.path:
+                return True
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                kept_record_count = sum(len(records) for records in self._records.values())
+                if self._line_count + len(self._pending_records) > 2 * max(kept_record_count, 1):
+                    temp_path = f"{self.path}.{os.getpid()}.tmp"
+                    with open(temp_path, "w") as durations_file:
+                        for records in self._records.values():
+                            durations_file.writelines(json.dumps(record) + "\n" for record in records)
+                    os.replace(temp_path, self.path)
+                    self._line_count = kept_record_count
+                else:
+                    # A single write per save keeps the lines of concurrent runs appending to the same file whole
+                    with open(self.path, "a") as durations_file:
+                        durations_file.write("".join(json.dumps(record) + "\n" for record in self._pending_records))
+                    self._line_count += len(self._pending_records)
+            except OSError as e:
+                logger.warning(f"Test durations file {self.path} could not be written: {e}")
+                return False
+
+            self._pending_records = []
+            return True
+
+    def get_durations(self, test_id: str, passed_only: bool = False) -> list[float]:
+        """
+        :param test_id: The id of the test
+        :param passed_only: Only return the durations of runs which passed
+        :return: The recent durations of the test in seconds, oldest first
+        """
+        with self._lock:
+            records = self._load_records().get(test_id, [])
+            return [record["duration"] for record in records
+                    if not passed_only or record["outcome"] == PASSED_OUTCOME]
+
+    def get_duration_estimate(self, test_id: str, default: float = None) -> float or None:
+        """
+        Estimates the duration of a test as the median of its recent passing runs, or of all its recent runs if it
+        never passed
+        :param test_id: The id of the test
+        :param default: The value to return for tests without records
+        :return: The estimated duration in seconds
+        """
+        durations = self.get_durations(test_id, passed_only=True) or self.get_durations(test_id)
+        return statistics.median(durations) if durations else default
+
+    def _get_estimates(self, test_ids: list[str], default: float = None) -> dict:
+        """
+        :param test_ids: The ids of the tests
+        :param default: The estimate of tests without records, defaults to the mean estimate of the tests with records
+        :return: Dict of test id to estimated duration
+        """
+        estimates = {test_id: self.get_duration_estimate(test_id) for test_id in test_ids}
+        if default is None:
+            known_estimates = [estimate for estimate in estimates.values() if estimate is not None]
+            default = statistics.mean(known_estimates) if known_estimates else 1.0
+        return {test_id: default if estimate is None else estimate for test_id, estimate in estimates.items()}
+
+    def order_longest_first(self, test_ids: list[str], default: float = None) -> list[str]:
+        """
+        Sorts tests by their estimated duration, longest first. Tests with the same estimate keep their relative order.
+        :param test_ids: The ids of the tests
+        :param default: The estimate of tests without records, defaults to the mean estimate of the tests with records
+        :return: The sorted list of test ids
+        """
+        estimates = self._get_estimates(test_ids, default)
+        return sorted(test_ids, key=lambda test_id: -estimates[test_id])
+
+    def split_into_shards(self, test_ids: list[str], shard_count: int, default: float = None) -> list[list[str]]:
+        """
+        Splits tests into shards with balanced total durations, assigning the longest tests first to the shard with the
+        least total duration so far. The split only depends on the test ids and the records, so every CI node sharing
+        the same durations file computes the same shards.
+        :param test_ids: The ids of the tests
+        :param shard_count: The number of shards
+        :param default: The estimate of tests without records, defaults to the mean estimate of the tests with records
+        :return: A list of shard_count lists of test ids, each keeping the relative order of test_ids
+        """
+        if shard_count < 1:
+            raise ValueError(f"Expected 1 or more shards, found {shard_count}")
+
+        estimates = self._get_estimates(test_ids, default)
+        positions = {test_id: position for position, test_id in enumerate(test_ids)}
+        shard_heap = [(0.0, shard_index) for shard_index in range(shard_count)]
+        shards = [[] for _ in range(shard_count)]
+        for test_id in sorted(test_ids, key=lambda test_id: (-estimates[test_id], test_id)):
+            total_duration, shard_index = heapq.heappop(shard_heap)
+            shards[shard_index].append(test_id)
+            heapq.heappush(shard_heap, (total_duration + estimates[test_id], shard_index))
+        return [sorted(shard, key=positions.get) for shard in shards]
+
+    def find_regressions(self, test_ids: list[str] = None, threshold: float = 2.0,
+                         min_duration: float = 1.0, min_history: int = 3) -> list[tuple[str, float, float]]:
+        """
+        Finds tests whose latest passing run took threshold times longer than the median of their previous passing runs
+        :param test_ids: The ids of the tests to check, defaults to all tests with records
+        :param threshold: The ratio between the latest and the median duration considered a regression
+        :param min_duration: Latest durations shorter than this many seconds are ignored, as they are mostly noise
+        :param min_history: The minimum number of previous passing runs to compare with
+        :return: List of (test id, median previous duration, latest duration) tuples, biggest regression first
+        """
+        if test_ids is None:
+            with self._lock:
+                test_ids = list(self._load_records().keys())
+
+        regressions = []
+        for test_id in test_ids:
+            durations = self.get_durations(test_id, passed_only=True)
+            if len(durations) - 1 < min_history:
+                continue
+            latest = durations[-1]
+            baseline = statistics.median(durations[:-1])
+            if latest >= min_duration and latest > baseline * threshold:
+                regressions.append((test_id, baseline, latest))
+        return sorted(regressions, key=lambda regression: -regression[2] / max(regression[1], 1e-9))
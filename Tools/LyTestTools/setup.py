@@ -49,6 +49,7 @@ if __name__ == '__main__':
                 'testrail_filter=ly_test_tools._internal.pytest_plugin.case_id',
                 'terminal_report=ly_test_tools._internal.pytest_plugin.terminal_report',
                 'multi_testing=ly_test_tools._internal.pytest_plugin.multi_testing',
+                'test_durations=ly_test_tools._internal.pytest_plugin.test_durations',
                 'pytester=_pytest.pytester'
             ],
         },
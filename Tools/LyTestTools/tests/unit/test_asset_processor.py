@@ -202,6 +202,57 @@ class TestAssetProcessor(object):
         mock_run.assert_called_once()
         assert f'--regset="/Amazon/AzCore/Bootstrap/project_path={mock_project_path}"' in mock_run.call_args[0][0]
 
+    @mock.patch('ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager')
+    @mock.patch('ly_test_tools.o3de.asset_processor.AssetProcessor.read_control_port')
+    def test_CreateControlClient_ProcRunning_ClientUsesControlPort(self, mock_read_port, mock_workspace):
+        mock_read_port.return_value = 12345
+        under_test = ly_test_tools.o3de.asset_processor.AssetProcessor(mock_workspace)
+        under_test._ap_proc = mock.MagicMock()
+
+        client = under_test.create_control_client()
+
+        assert client.port == 12345
+        assert not client.is_connected()
+
+    @mock.patch('ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager')
+    @mock.patch('ly_test_tools.o3de.asset_staging.temp_asset_root_pool', mock.MagicMock())
+    def test_CreateTempAssetRoot_ReuseEnabled_ResetsCurrentRoot(self, mock_workspace):
+        mock_workspace.project = mock_project
+        under_test = ly_test_tools.o3de.asset_processor.AssetProcessor(mock_workspace)
+        under_test.reuse_temp_asset_roots = True
+        mock_temp_directory = mock.MagicMock()
+        mock_staged_root = mock.MagicMock()
+        under_test._temp_asset_directory = mock_temp_directory
+        under_test._temp_asset_root = 'mock_temp_root'
+        under_test._staged_asset_root = mock_staged_root
+
+        under_test.create_temp_asset_root(project_scan_folder=False)
+
+        assert mock_staged_root.reset.called
+        assert under_test._temp_asset_directory is mock_temp_directory
+
+    @mock.patch('ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager')
+    @mock.patch('ly_test_tools.o3de.asset_staging.temp_asset_root_pool')
+    def test_ReleaseTempAssetRoot_ReuseEnabled_ReleasedToPool(self, mock_pool, mock_workspace):
+        under_test = ly_test_tools.o3de.asset_processor.AssetProcessor(mock_workspace)
+        under_test.reuse_temp_asset_roots = True
+        mock_temp_directory = mock.MagicMock()
+        mock_staged_root = mock.MagicMock()
+        under_test._temp_asset_directory = mock_temp_directory
+        under_test._staged_asset_root = mock_staged_root
+
+        under_test.release_temp_asset_root()
+
+        mock_pool.release.assert_called_once_with(mock.ANY, mock_temp_directory, mock_staged_root)
+        assert under_test._temp_asset_directory is None
+
+    @mock.patch('ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager')
+    def test_CreateControlClient_NoneRunning_RaisesError(self, mock_workspace):
+        under_test = ly_test_tools.o3de.asset_processor.AssetProcessor(mock_workspace)
+
+        with pytest.raises(ly_test_tools.o3de.asset_processor.AssetProcessorError):
+            under_test.create_control_client()
+
     @mock.patch('ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager')
     def test_EnableAssetProcessorPlatform_AssetProcessorObject_Updated(self, mock_workspace):
         under_test = ly_test_tools.o3de.asset_processor.AssetProcessor(mock_workspace)
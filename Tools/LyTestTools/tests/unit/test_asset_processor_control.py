@@ -0,0 +1,170 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.o3de.asset_processor_control
+"""
+import asyncio
+import unittest.mock as mock
+
+import pytest
+
+from ly_test_tools.o3de.asset_processor_control import AssetProcessorControlClient, AssetProcessorControlError, \
+    StubAssetProcessorControlServer
+
+pytestmark = pytest.mark.SUITE_smoke
+
+mock_timeout = 5
+
+
+def run_with_stub(test_coroutine, idle=True):
+    async def run():
+        async with StubAssetProcessorControlServer(idle=idle) as stub:
+            async with AssetProcessorControlClient(stub.port) as client:
+                return await test_coroutine(stub, client)
+    return asyncio.run(run())
+
+
+class TestAssetProcessorControlClient(object):
+
+    def test_Ping_StubRunning_ReturnsTrue(self):
+        async def test(stub, client):
+            return await client.ping(mock_timeout)
+
+        assert run_with_stub(test)
+
+    def test_IsIdle_StubBusy_ReturnsFalse(self):
+        async def test(stub, client):
+            return await client.is_idle(mock_timeout)
+
+        assert not run_with_stub(test, idle=False)
+
+    def test_WaitForIdle_StubIdle_ReturnsRightAway(self):
+        async def test(stub, client):
+            await client.wait_for_idle(mock_timeout)
+            return stub.requests
+
+        assert run_with_stub(test) == ['waitforidle']
+
+    def test_WaitForIdle_StubBusy_ReturnsWhenIdle(self):
+        async def test(stub, client):
+            wait_task = asyncio.ensure_future(client.wait_for_idle(mock_timeout))
+            await asyncio.sleep(0.2)
+            assert not wait_task.done()
+            stub.set_idle(True)
+            await wait_task
+
+        run_with_stub(test, idle=False)
+
+    def test_Requests_SentConcurrently_PipelinedOnOneConnection(self):
+        async def test(stub, client):
+            wait_task = asyncio.ensure_future(client.wait_for_idle(mock_timeout))
+            results = await asyncio.gather(client.ping(mock_timeout), client.is_idle(mock_timeout),
+                                           client.ping(mock_timeout))
+            assert not wait_task.done()
+            stub.set_idle(True)
+            await wait_task
+            return results, stub.requests
+
+        results, requests = run_with_stub(test, idle=False)
+
+        assert results == [True, False, True]
+        assert sorted(requests) == ['isidle', 'ping', 'ping', 'waitforidle']
+
+    def test_NextIdle_StubIdle_WaitsForNextIdle(self):
+        async def test(stub, client):
+            next_idle_task = asyncio.ensure_future(client.next_idle(mock_timeout))
+            await asyncio.sleep(0.2)
+            assert not next_idle_task.done()
+            stub.set_idle(True)
+            await next_idle_task
+
+        run_with_stub(test)
+
+    def test_NextIdle_ManyWaiters_RegistersOnce(self):
+        async def test(stub, client):
+            next_idle_tasks = [asyncio.ensure_future(client.next_idle(mock_timeout)) for _ in range(3)]
+            await asyncio.sleep(0.2)
+            stub.set_idle(True)
+            await asyncio.gather(*next_idle_tasks)
+            return stub.requests
+
+        assert run_with_stub(test, idle=False) == ['signalidle']
+
+    def test_WaitForIdleAndNextIdle_StubIdle_OnlyWaitForIdleReturns(self):
+        async def test(stub, client):
+            next_idle_task = asyncio.ensure_future(client.next_idle(mock_timeout))
+            await asyncio.sleep(0.1)
+            await client.wait_for_idle(mock_timeout)
+            await asyncio.sleep(0.1)
+            assert not next_idle_task.done()
+            stub.set_idle(True)
+            await next_idle_task
+
+        run_with_stub(test)
+
+    def test_AddIdleListener_IdleTwice_ListenerCalledEachTime(self):
+        mock_listener = mock.MagicMock()
+
+        async def test(stub, client):
+            await client.add_idle_listener(mock_listener)
+            for _ in range(2):
+                await asyncio.sleep(0.2)
+                stub.set_idle(True)
+            await asyncio.sleep(0.2)
+
+        run_with_stub(test)
+
+        assert mock_listener.call_count == 2
+
+    def test_WaitForIdle_NeverIdle_RaisesError(self):
+        async def test(stub, client):
+            with pytest.raises(AssetProcessorControlError):
+                await client.wait_for_idle(0.2)
+
+        run_with_stub(test, idle=False)
+
+    def test_WaitForIdle_ServerStops_RaisesError(self):
+        async def test(stub, client):
+            wait_task = asyncio.ensure_future(client.wait_for_idle(mock_timeout))
+            await asyncio.sleep(0.1)
+            await stub.stop()
+            with pytest.raises(AssetProcessorControlError):
+                await wait_task
+
+        run_with_stub(test, idle=False)
+
+    def test_SendQuit_StubRunning_QuitRequested(self):
+        async def test(stub, client):
+            await client.send_quit()
+            await asyncio.sleep(0.1)
+            return stub.quit_requested
+
+        assert run_with_stub(test)
+
+    def test_Connect_NoServer_RaisesError(self):
+        async def test():
+            stub = StubAssetProcessorControlServer()
+            port = await stub.start()
+            await stub.stop()
+            with pytest.raises(AssetProcessorControlError):
+                await AssetProcessorControlClient(port).connect(timeout=0.2)
+
+        asyncio.run(test())
+
+    def test_SplitAnswers_AnswersReadTogether_SplitsAndKeepsPartial(self):
+        under_test = AssetProcessorControlClient(0)
+        under_test._answer_buffer = 'pongidletruepo'
+
+        assert list(under_test._split_answers()) == ['pong', 'idle', 'true']
+        assert under_test._answer_buffer == 'po'
+
+    @mock.patch('ly_test_tools.o3de.asset_processor_control.logger.warning')
+    def test_SplitAnswers_UnexpectedData_Dropped(self, mock_warning):
+        under_test = AssetProcessorControlClient(0)
+        under_test._answer_buffer = 'xpong'
+
+        assert list(under_test._split_answers()) == ['pong']
+        assert mock_warning.called
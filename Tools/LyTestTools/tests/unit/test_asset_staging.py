@@ -0,0 +1,130 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.o3de.asset_staging
+"""
+import os
+import unittest.mock as mock
+
+import pytest
+
+import ly_test_tools.o3de.asset_staging as asset_staging
+
+pytestmark = pytest.mark.SUITE_smoke
+
+
+def write_file(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+def read_file(path):
+    with open(path) as file:
+        return file.read()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return asset_staging.AssetStore(str(tmp_path / 'store'))
+
+
+@pytest.fixture
+def source_assets(tmp_path):
+    source_root = tmp_path / 'source'
+    write_file(str(source_root / 'a.txt'), 'content_a')
+    write_file(str(source_root / 'sub' / 'b.txt'), 'content_b')
+    write_file(str(source_root / 'sub' / 'c.txt'), 'content_a')
+    return str(source_root)
+
+
+class TestAssetStore(object):
+
+    def test_Add_SameContentTwice_StoredOnce(self, store, source_assets):
+        digest = store.add(os.path.join(source_assets, 'a.txt'))
+        same_digest = store.add(os.path.join(source_assets, 'sub', 'c.txt'))
+
+        assert digest == same_digest
+        assert read_file(store.get_store_path(digest)) == 'content_a'
+
+    @mock.patch('ly_test_tools.o3de.pipeline_utils.get_file_hash')
+    def test_Add_UnchangedFileTwice_HashedOnce(self, mock_get_hash, store, source_assets):
+        mock_get_hash.return_value = 'ab1234'
+
+        store.add(os.path.join(source_assets, 'a.txt'))
+        store.add(os.path.join(source_assets, 'a.txt'))
+
+        assert mock_get_hash.call_count == 1
+
+    def test_Stage_Link_SharesStoredFile(self, store, source_assets, tmp_path):
+        digest = store.add(os.path.join(source_assets, 'a.txt'))
+        target_path = str(tmp_path / 'linked.txt')
+
+        store.stage(digest, target_path, link=True)
+
+        assert os.path.samefile(target_path, store.get_store_path(digest))
+
+    @mock.patch('os.link', mock.MagicMock(side_effect=OSError()))
+    def test_Stage_LinkFails_CopiesWritableFile(self, store, source_assets, tmp_path):
+        digest = store.add(os.path.join(source_assets, 'a.txt'))
+        target_path = str(tmp_path / 'copied.txt')
+
+        store.stage(digest, target_path, link=True)
+
+        assert not os.path.samefile(target_path, store.get_store_path(digest))
+        assert read_file(target_path) == 'content_a'
+        assert os.access(target_path, os.W_OK)
+
+
+class TestStagedDirectory(object):
+
+    def test_StageTree_Tree_StagesAllFiles(self, store, source_assets, tmp_path):
+        under_test = asset_staging.StagedDirectory(str(tmp_path / 'root'), store)
+
+        under_test.stage_tree(source_assets, 'project')
+
+        assert read_file(str(tmp_path / 'root' / 'project' / 'a.txt')) == 'content_a'
+        assert read_file(str(tmp_path / 'root' / 'project' / 'sub' / 'b.txt')) == 'content_b'
+
+    def test_Reset_ChangesAfterBaseline_RestoresBaseline(self, store, source_assets, tmp_path):
+        root = tmp_path / 'root'
+        under_test = asset_staging.StagedDirectory(str(root), store)
+        under_test.stage_tree(source_assets, 'project')
+        os.makedirs(str(root / 'empty'))
+        under_test.set_baseline()
+        write_file(str(root / 'project' / 'a.txt'), 'changed content')
+        os.remove(str(root / 'project' / 'sub' / 'b.txt'))
+        write_file(str(root / 'project' / 'Cache' / 'pc' / 'new.txt'), 'new')
+        os.rmdir(str(root / 'empty'))
+
+        deleted_count, restored_count = under_test.reset()
+
+        assert (deleted_count, restored_count) == (1, 2)
+        assert read_file(str(root / 'project' / 'a.txt')) == 'content_a'
+        assert read_file(str(root / 'project' / 'sub' / 'b.txt')) == 'content_b'
+        assert not os.path.exists(str(root / 'project' / 'Cache'))
+        assert os.path.isdir(str(root / 'empty'))
+
+    def test_Reset_NoChanges_NothingRestored(self, store, source_assets, tmp_path):
+        under_test = asset_staging.StagedDirectory(str(tmp_path / 'root'), store)
+        under_test.stage_tree(source_assets, 'project', link=True)
+        under_test.set_baseline()
+
+        assert under_test.reset() == (0, 0)
+
+
+class TestTempAssetRootPool(object):
+
+    def test_Acquire_Released_ReturnsResetRoot(self):
+        under_test = asset_staging.TempAssetRootPool()
+        mock_temp_directory = mock.MagicMock()
+        mock_staged_directory = mock.MagicMock()
+        under_test.release('mock_key', mock_temp_directory, mock_staged_directory)
+
+        assert under_test.acquire('other_key') is None
+        assert under_test.acquire('mock_key') == (mock_temp_directory, mock_staged_directory)
+        assert mock_staged_directory.reset.called
+        assert under_test.acquire('mock_key') is None
@@ -0,0 +1,140 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.benchmark.data_aggregator
+"""
+import json
+import unittest.mock as mock
+
+import pytest
+
+import ly_test_tools.benchmark.data_aggregator as data_aggregator
+
+pytestmark = pytest.mark.SUITE_smoke
+
+
+def write_benchmark(benchmark_dir, gpu_frames, cpu_frame_times=()):
+    benchmark_dir.mkdir(parents=True, exist_ok=True)
+    (benchmark_dir / 'benchmark_metadata.json').write_text(json.dumps({'ClassData': {'benchmarkName': 'mock'}}))
+    for index, passes in enumerate(gpu_frames):
+        entries = [{'passName': name, 'timestampResultInNanoseconds': time_ns} for name, time_ns in passes]
+        (benchmark_dir / f'frame{index}_timestamps.json').write_text(
+            json.dumps({'ClassData': {'timestampEntries': entries}}))
+    for index, frame_time in enumerate(cpu_frame_times):
+        (benchmark_dir / f'cpu_frame{index}_time.json').write_text(json.dumps({'ClassData': {'frameTime': frame_time}}))
+
+
+class TestColumnarStatistics(object):
+
+    def test_Stats_KnownValues_MatchExpected(self):
+        under_test = data_aggregator.ColumnarStatistics(range(1, 101))
+
+        assert under_test.getCount() == 100
+        assert under_test.getAvg() == 50.5
+        assert (under_test.getMin(), under_test.getMax()) == (1, 100)
+        assert under_test.getPercentiles((50, 90)) == {50: 50.5, 90: pytest.approx(90.1)}
+        assert under_test.getStdDev() == pytest.approx(28.866, abs=1e-3)
+
+    def test_GetHistogram_Values_CountsAllValues(self):
+        edges, counts = data_aggregator.ColumnarStatistics([1, 1, 2, 10]).getHistogram(3)
+
+        assert edges == [1, 4, 7, 10]
+        assert counts == [3, 0, 1]
+
+
+class TestLoadBenchmarkStatistics(object):
+
+    def test_LoadBenchmarkStatistics_GpuAndCpuCaptures_AggregatesPerFrameAndPass(self, tmp_path):
+        write_benchmark(tmp_path, [[('PassA', 100), ('PassB', 300)], [('PassB', 500), ('PassA', 200)]], [10, 30])
+
+        gpu_frame_stats, gpu_pass_stats, cpu_frame_stats = data_aggregator.load_benchmark_statistics(tmp_path)
+
+        assert sorted(gpu_frame_stats.values.tolist()) == [400, 700]
+        assert list(gpu_pass_stats) == ['PassA', 'PassB']
+        assert sorted(gpu_pass_stats['PassA'].values.tolist()) == [100, 200]
+        assert sorted(gpu_pass_stats['PassB'].values.tolist()) == [300, 500]
+        assert cpu_frame_stats.getAvg() == 20
+
+    def test_LoadBenchmarkStatistics_NoCpuCaptures_CpuStatsNone(self, tmp_path):
+        write_benchmark(tmp_path, [[('PassA', 100)]])
+
+        _, _, cpu_frame_stats = data_aggregator.load_benchmark_statistics(tmp_path)
+
+        assert cpu_frame_stats is None
+
+    @mock.patch('ly_test_tools.benchmark.data_aggregator.PARALLEL_PARSE_MIN_FILES', 2)
+    @mock.patch('ly_test_tools.benchmark.data_aggregator.ProcessPoolExecutor')
+    def test_LoadBenchmarkStatistics_ManyCaptures_ParsedInParallel(self, mock_executor, tmp_path):
+        write_benchmark(tmp_path, [[('PassA', 100)], [('PassA', 200)]])
+        mock_executor.return_value.__enter__.return_value.map.side_effect = \
+            lambda function, files, chunksize: map(function, files)
+
+        gpu_frame_stats, _, _ = data_aggregator.load_benchmark_statistics(tmp_path)
+
+        assert mock_executor.called
+        assert gpu_frame_stats.getCount() == 2
+
+
+class TestBenchmarkDataAggregator(object):
+
+    @mock.patch('ly_test_tools.benchmark.data_aggregator.FilebeatClient', mock.MagicMock())
+    def test_GeneratePayloads_GpuCaptures_IncludesDistribution(self, tmp_path):
+        mock_workspace = mock.MagicMock()
+        mock_workspace.paths.project.return_value = str(tmp_path)
+        write_benchmark(tmp_path / 'benchmark', [[('PassA', 1e6)], [('PassA', 3e6)]])
+        under_test = data_aggregator.BenchmarkDataAggregator(mock_workspace, mock.MagicMock(), 'mock_suite')
+        metadata = {}
+
+        payloads = under_test._generate_payloads(metadata, *under_test._process_benchmark(tmp_path / 'benchmark', metadata))
+
+        frame_payload = dict(payloads)['gpu.frame_data']
+        assert frame_payload['frameTime']['p50'] == 2.0
+        assert frame_payload['frameTime']['stddev'] == 1.0
+        assert sum(frame_payload['frameTime']['histogram']['counts']) == 2
+        assert frame_payload['benchmarkName'] == 'mock'
+        assert dict(payloads)['gpu.pass_data']['passTime']['p99'] == pytest.approx(2.98)
+        assert 'cpu.frame_data' not in dict(payloads)
+
+    @mock.patch('subprocess.check_output', mock.MagicMock(return_value=b'abc1234'))
+    @mock.patch('ly_test_tools.benchmark.data_aggregator.FilebeatClient')
+    def test_UploadMetrics_FirstUpload_ConnectsToFilebeat(self, mock_filebeat_client, tmp_path):
+        mock_workspace = mock.MagicMock()
+        mock_workspace.paths.project.return_value = str(tmp_path)
+        write_benchmark(tmp_path / 'user' / 'Scripts' / 'PerformanceBenchmarks' / 'benchmark', [[('PassA', 1e6)]])
+        under_test = data_aggregator.BenchmarkDataAggregator(mock_workspace, mock.MagicMock(), 'mock_suite')
+        mock_filebeat_client.assert_not_called()
+
+        under_test.upload_metrics('dx12')
+        under_test.upload_metrics('dx12')
+
+        mock_filebeat_client.assert_called_once()
+        assert mock_filebeat_client.return_value.send_event.call_count == 4
+        assert mock_filebeat_client.return_value.flush.call_count == 2
+
+
+class TestCompareResults(object):
+
+    def test_Main_PercentileRegressed_ReturnsFailure(self, tmp_path, capsys):
+        write_benchmark(tmp_path / 'baseline' / 'benchmark', [[('PassA', 1e6)], [('PassA', 1e6)]])
+        write_benchmark(tmp_path / 'current' / 'benchmark', [[('PassA', 2e6)], [('PassA', 2e6)]])
+
+        result = data_aggregator.main([str(tmp_path / 'baseline'), str(tmp_path / 'current'), '--passes',
+                                       '--threshold', '0.1'])
+
+        assert result == 1
+        output = capsys.readouterr().out
+        assert 'benchmark gpu.frameTime' in output
+        assert 'benchmark gpu.pass.PassA' in output
+        assert 'REGRESSION' in output
+
+    def test_CompareResults_NoChange_ZeroChange(self, tmp_path):
+        for run in ['baseline', 'current']:
+            write_benchmark(tmp_path / run / 'benchmark', [[('PassA', 1e6)]], [5])
+
+        rows = data_aggregator.compare_results(tmp_path / 'baseline', tmp_path / 'current')
+
+        assert [series for _, series, _ in rows] == ['gpu.frameTime', 'cpu.frameTime']
+        assert all(change == 0 for _, _, comparison in rows for _, _, change in comparison.values())
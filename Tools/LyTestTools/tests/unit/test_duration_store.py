@@ -0,0 +1,103 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.report.duration_store
+"""
+import json
+import pytest
+
+import ly_test_tools.report.duration_store as duration_store
+
+pytestmark = pytest.mark.SUITE_smoke
+
+
+class TestDurationStore(object):
+
+    def test_Save_RecordsAdded_LoadedByNewStore(self, tmp_path):
+        durations_path = str(tmp_path / 'durations.jsonl')
+        store = duration_store.DurationStore(durations_path)
+        store.add('test_a', 10.0)
+        store.add('test_a', 30.0, 'failed')
+        assert store.save()
+
+        new_store = duration_store.DurationStore(durations_path)
+        assert new_store.get_durations('test_a') == [10.0, 30.0]
+        assert new_store.get_durations('test_a', passed_only=True) == [10.0]
+
+    def test_Save_SeveralSaves_AppendsRecords(self, tmp_path):
+        durations_path = tmp_path / 'durations.jsonl'
+        for duration in [1.0, 2.0]:
+            store = duration_store.DurationStore(str(durations_path))
+            store.add('test_a', duration)
+            store.save()
+
+        lines = durations_path.read_text().splitlines()
+        assert [json.loads(line)['duration'] for line in lines] == [1.0, 2.0]
+
+    def test_Save_TooManyRecords_CompactsFile(self, tmp_path):
+        durations_path = tmp_path / 'durations.jsonl'
+        store = duration_store.DurationStore(str(durations_path), max_records_per_test=2)
+        for duration in range(5):
+            store.add('test_a', float(duration))
+        store.save()
+
+        lines = durations_path.read_text().splitlines()
+        assert [json.loads(line)['duration'] for line in lines] == [3.0, 4.0]
+
+    def test_GetDurationEstimate_MalformedLines_Ignored(self, tmp_path):
+        durations_path = tmp_path / 'durations.jsonl'
+        durations_path.write_text('{"test": "test_a", "duration": 4.0, "outcome": "passed"}\n'
+                                  '{"test": "test_a", "durat\n')
+
+        store = duration_store.DurationStore(str(durations_path))
+
+        assert store.get_duration_estimate('test_a') == 4.0
+
+    def test_GetDurationEstimate_NoRecords_ReturnsDefault(self):
+        store = duration_store.DurationStore()
+
+        assert store.get_duration_estimate('test_a', default=5.0) == 5.0
+        assert store.save()
+
+    def test_GetDurationEstimate_FailedRuns_UsesPassedMedian(self):
+        store = duration_store.DurationStore()
+        for duration, outcome in [(1.0, 'passed'), (3.0, 'passed'), (5.0, 'passed'), (100.0, 'failed')]:
+            store.add('test_a', duration, outcome)
+
+        assert store.get_duration_estimate('test_a') == 3.0
+
+    def test_OrderLongestFirst_UnknownTests_UseMeanEstimate(self):
+        store = duration_store.DurationStore()
+        store.add('short', 1.0)
+        store.add('long', 9.0)
+
+        assert store.order_longest_first(['short', 'unknown', 'long']) == ['long', 'unknown', 'short']
+
+    def test_SplitIntoShards_RecordedDurations_BalancesShards(self):
+        store = duration_store.DurationStore()
+        durations = {'a': 8.0, 'b': 7.0, 'c': 6.0, 'd': 5.0, 'e': 4.0}
+        for test_id, duration in durations.items():
+            store.add(test_id, duration)
+
+        shards = store.split_into_shards(list(durations), 2)
+
+        assert sorted(sum(durations[test_id] for test_id in shard) for shard in shards) == [13.0, 17.0]
+        assert sorted(test_id for shard in shards for test_id in shard) == list(durations)
+
+    def test_SplitIntoShards_InvalidCount_RaisesValueError(self):
+        with pytest.raises(ValueError):
+            duration_store.DurationStore().split_into_shards(['a'], 0)
+
+    def test_FindRegressions_SlowerLatestRun_ReturnsRegression(self):
+        store = duration_store.DurationStore()
+        for duration in [10.0, 11.0, 9.0, 30.0]:
+            store.add('slower', duration)
+        for duration in [10.0, 11.0, 9.0, 12.0]:
+            store.add('stable', duration)
+        for duration in [10.0, 30.0]:
+            store.add('new', duration)
+
+        assert store.find_regressions() == [('slower', 10.0, 30.0)]
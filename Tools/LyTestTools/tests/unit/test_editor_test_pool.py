@@ -0,0 +1,157 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.o3de.editor_test_pool
+"""
+import json
+import os
+import pytest
+import unittest.mock as mock
+
+import ly_test_tools.o3de.editor_test_pool as editor_test_pool
+
+pytestmark = pytest.mark.SUITE_smoke
+
+
+def _make_warm_editor(alive=True):
+    mock_executable = mock.MagicMock()
+    mock_executable.args = []
+    mock_executable.is_alive.return_value = alive
+    warm_editor = editor_test_pool.WarmEditor(mock_executable, mock.MagicMock(), 1000, 'editor_test.log', ['-rhi=null'])
+    return warm_editor
+
+
+@pytest.fixture(autouse=True)
+def pool_directory(tmp_path):
+    with mock.patch('tempfile.mkdtemp', return_value=str(tmp_path)):
+        yield tmp_path
+
+
+class TestWarmEditor(object):
+
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.cycle_crash_report')
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.retrieve_log_path', mock.MagicMock(return_value='log_path'))
+    def test_Start_CopiesServerScript_StartsEditorWithScript(self, mock_cycle_crash_report):
+        warm_editor = _make_warm_editor()
+
+        warm_editor.start()
+
+        server_script = os.path.join(warm_editor.pool_directory, 'editor_test_pool_server.py')
+        assert os.path.isfile(server_script)
+        assert warm_editor.executable.args[:4] == ['-runpythontest', server_script.replace('\\', '/'),
+                                                   '-pythontestcase', editor_test_pool.POOL_TEST_CASE_NAME]
+        assert warm_editor.executable.args[-1] == '-rhi=null'
+        warm_editor.executable.start.assert_called_once_with(
+            backupFiles=False, launch_ap=False, configure_settings=False)
+        mock_cycle_crash_report.assert_called_once()
+
+    def test_WaitUntilReady_ReadyFileWritten_ReturnsTrue(self):
+        warm_editor = _make_warm_editor()
+        with open(os.path.join(warm_editor.pool_directory, editor_test_pool.READY_FILE_NAME), 'w') as ready_file:
+            ready_file.write('{}')
+
+        assert warm_editor.wait_until_ready(timeout=1)
+
+    def test_WaitUntilReady_EditorExited_ReturnsFalse(self):
+        warm_editor = _make_warm_editor(alive=False)
+
+        assert not warm_editor.wait_until_ready(timeout=1)
+
+    def test_RunTest_ResultWritten_WritesRequestReturnsResult(self):
+        warm_editor = _make_warm_editor()
+        result = {'id': 1, 'success': True, 'output': 'JSON_START({})JSON_END', 'exception': None}
+        with open(os.path.join(warm_editor.pool_directory, 'result_1.json'), 'w') as result_file:
+            json.dump(result, result_file)
+
+        assert warm_editor.run_test('C:\\tests\\test_module.py', 'test_case', 'Base', timeout=1) == result
+
+        with open(os.path.join(warm_editor.pool_directory, editor_test_pool.REQUEST_FILE_NAME)) as request_file:
+            request = json.load(request_file)
+        assert request == {'id': 1, 'test_script': 'C:/tests/test_module.py', 'test_case': 'test_case',
+                           'reset_level': 'Base'}
+        assert warm_editor.tests_run == 1
+
+    def test_RunTest_EditorExited_ReturnsNone(self):
+        warm_editor = _make_warm_editor(alive=False)
+
+        assert warm_editor.run_test('test_module.py', 'test_case', '', timeout=1) is None
+
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.retrieve_editor_log_content')
+    def test_GetLogContent_CalledTwice_ReturnsNewContentOnly(self, mock_log_content):
+        warm_editor = _make_warm_editor()
+        mock_log_content.side_effect = ['first\n', 'first\nsecond\n']
+
+        assert warm_editor.get_log_content() == 'first\n'
+        assert warm_editor.get_log_content() == 'second\n'
+
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.retrieve_log_path', mock.MagicMock(return_value='log_path'))
+    def test_Stop_EditorAlive_RequestsShutdownAndRemovesDirectory(self):
+        warm_editor = _make_warm_editor()
+        pool_directory = warm_editor.pool_directory
+        written_requests = []
+        warm_editor._write_request = written_requests.append
+
+        warm_editor.stop()
+
+        assert written_requests == [{'shutdown': True}]
+        warm_editor.executable.wait.assert_called_once()
+        warm_editor.executable.stop.assert_called_once()
+        assert not os.path.exists(pool_directory)
+
+
+class TestEditorPool(object):
+
+    @pytest.fixture(autouse=True)
+    def setup_pool(self):
+        self.started_editors = []
+
+        def start(warm_editor):
+            self.started_editors.append(warm_editor)
+
+        with mock.patch.object(editor_test_pool.WarmEditor, 'start', start), \
+                mock.patch.object(editor_test_pool.WarmEditor, 'stop', autospec=True) as self.mock_stop:
+            self.pool = editor_test_pool.EditorPool(
+                lambda: mock.MagicMock(), mock.MagicMock(), 'editor_test.log', size=2, max_tests=2)
+            yield
+
+    def test_Acquire_EmptyPool_StartsAllEditors(self):
+        warm_editor = self.pool.acquire(['-rhi=null'])
+
+        assert len(self.started_editors) == 2
+        assert warm_editor is self.started_editors[0]
+        assert [editor.run_id for editor in self.started_editors] == [1000, 1001]
+
+    def test_Release_TestPassed_ReusesSameEditor(self):
+        warm_editor = self.pool.acquire([])
+        warm_editor.tests_run = 1
+        self.pool.release(warm_editor)
+
+        assert self.pool.acquire([]) is warm_editor
+        self.mock_stop.assert_not_called()
+
+    def test_Release_Recycle_StopsAndStartsReplacement(self):
+        warm_editor = self.pool.acquire([])
+        self.pool.release(warm_editor, recycle=True)
+
+        self.mock_stop.assert_called_once_with(warm_editor)
+        assert len(self.started_editors) == 3
+        assert self.pool.acquire([]) is self.started_editors[1]
+
+    def test_Release_MaxTestsRun_StopsEditor(self):
+        warm_editor = self.pool.acquire([])
+        warm_editor.tests_run = 2
+        self.pool.release(warm_editor)
+
+        self.mock_stop.assert_called_once_with(warm_editor)
+
+    def test_Acquire_DifferentArgs_ReplacesEditors(self):
+        warm_editor = self.pool.acquire(['-rhi=null'])
+        self.pool.release(warm_editor)
+
+        new_warm_editor = self.pool.acquire(['-rhi=dx12'])
+
+        assert self.mock_stop.call_count == 2
+        assert new_warm_editor.cmdline_args == ['-rhi=dx12']
@@ -0,0 +1,181 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.mars.filebeat_client
+"""
+import json
+import logging
+import socket
+import threading
+import unittest.mock as mock
+
+import pytest
+
+import ly_test_tools.mars.filebeat_client as filebeat_client
+
+pytestmark = pytest.mark.SUITE_smoke
+
+mock_logger = logging.getLogger('test_filebeat_client')
+mock_timeout = 5
+
+
+class LocalFilebeat(object):
+    """
+    TCP listener standing in for the Filebeat TCP input, recording the received data and the number of reads
+    """
+
+    def __init__(self, port=0):
+        self.server_socket = socket.create_server(('127.0.0.1', port))
+        self.port = self.server_socket.getsockname()[1]
+        self.received = b''
+        self.reads = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self.server_socket.accept()
+            except OSError:
+                return
+            with connection:
+                for data in iter(lambda: connection.recv(65536), b''):
+                    with self._lock:
+                        self.received += data
+                        self.reads += 1
+
+    def get_events(self):
+        with self._lock:
+            return [json.loads(line) for line in self.received.splitlines()]
+
+    def close(self):
+        self.server_socket.close()
+
+
+@pytest.fixture
+def local_filebeat():
+    server = LocalFilebeat()
+    yield server
+    server.close()
+
+
+def get_unused_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as unused_socket:
+        unused_socket.bind(('127.0.0.1', 0))
+        return unused_socket.getsockname()[1]
+
+
+def wait_for_events(server, count):
+    for _ in range(100):
+        if len(server.get_events()) >= count:
+            break
+        threading.Event().wait(0.05)
+    return server.get_events()
+
+
+class TestFilebeatClient(object):
+
+    def test_SendEvent_ListenerRunning_EventFormatUnchanged(self, local_filebeat):
+        with filebeat_client.FilebeatClient(mock_logger, port=local_filebeat.port, timeout=mock_timeout) as under_test:
+            under_test.send_event({'value': 1}, 'mock.index', timestamp=10.0)
+
+        events = wait_for_events(local_filebeat, 1)
+
+        assert events == [{'index': 'mock.index', 'timestamp': 10.0, 'pipeline': 'filebeat', 'payload': '{"value": 1}'}]
+
+    def test_SendEvent_ManyEvents_SentInFewBatches(self, local_filebeat):
+        under_test = filebeat_client.FilebeatClient(mock_logger, port=local_filebeat.port, timeout=mock_timeout,
+                                                    max_batch_delay=1)
+        for value in range(1000):
+            under_test.send_event({'value': value}, 'mock.index')
+        under_test.close()
+
+        events = wait_for_events(local_filebeat, 1000)
+
+        assert [json.loads(event['payload'])['value'] for event in events] == list(range(1000))
+        assert local_filebeat.reads < 100
+
+    def test_Flush_EventsQueued_DeliveredBeforeReturning(self, local_filebeat):
+        under_test = filebeat_client.FilebeatClient(mock_logger, port=local_filebeat.port, timeout=mock_timeout,
+                                                    max_batch_delay=0.5)
+        under_test.send_event({}, 'mock.index')
+        under_test.flush()
+
+        assert len(wait_for_events(local_filebeat, 1)) == 1
+        under_test.close()
+
+    def test_Init_NoListenerNoSpillFile_RaisesError(self):
+        with pytest.raises(filebeat_client.FilebeatExn):
+            filebeat_client.FilebeatClient(mock_logger, port=get_unused_port(), timeout=mock_timeout)
+
+    def test_SendEvent_NoListener_SpilledThenSentOnReconnect(self, tmp_path):
+        port = get_unused_port()
+        spill_path = tmp_path / 'spill.jsonl'
+        with filebeat_client.FilebeatClient(mock_logger, port=port, timeout=mock_timeout,
+                                            spill_path=str(spill_path)) as under_test:
+            under_test.send_event({'value': 1}, 'mock.index')
+        assert len(spill_path.read_bytes().splitlines()) == 1
+
+        server = LocalFilebeat(port)
+        try:
+            with filebeat_client.FilebeatClient(mock_logger, port=port, timeout=mock_timeout,
+                                                spill_path=str(spill_path)) as under_test:
+                under_test.send_event({'value': 2}, 'mock.index')
+
+            events = wait_for_events(server, 2)
+        finally:
+            server.close()
+
+        assert [json.loads(event['payload'])['value'] for event in events] == [1, 2]
+        assert not spill_path.exists()
+
+
+class TestFilebeatShipper(object):
+
+    def test_Send_QueueFull_BlocksUntilTimeout(self):
+        writing = threading.Event()
+        release = threading.Event()
+
+        def mock_write_batch(batch):
+            writing.set()
+            release.wait(mock_timeout)
+
+        under_test = filebeat_client.FilebeatShipper(mock_logger, timeout=0.1, max_batch_delay=0, max_queued_events=1)
+        with mock.patch.object(under_test, '_write_batch', side_effect=mock_write_batch):
+            under_test.send(b'1\n')
+            assert writing.wait(mock_timeout)
+            under_test.send(b'2\n')
+
+            with pytest.raises(filebeat_client.FilebeatExn):
+                under_test.send(b'3\n')
+            release.set()
+            under_test.close()
+
+    def test_Send_BatchFailed_ErrorRaisedOnNextCalls(self):
+        under_test = filebeat_client.FilebeatShipper(mock_logger, port=get_unused_port(), timeout=mock_timeout,
+                                                     max_batch_delay=0)
+        under_test.send(b'1\n')
+
+        with pytest.raises(filebeat_client.FilebeatExn):
+            under_test.flush()
+        with pytest.raises(filebeat_client.FilebeatExn):
+            under_test.send(b'2\n')
+        with pytest.raises(filebeat_client.FilebeatExn):
+            under_test.close()
+
+    def test_Send_ConnectionDropped_BatchSentAgainAfterReconnect(self, local_filebeat):
+        under_test = filebeat_client.FilebeatShipper(mock_logger, port=local_filebeat.port, timeout=mock_timeout,
+                                                     max_batch_delay=0)
+        mock_socket = mock.MagicMock()
+        mock_socket.sendall.side_effect = BrokenPipeError()
+        under_test._socket = mock_socket
+
+        under_test.send(b'{"value": 1}\n')
+        under_test.close()
+
+        assert wait_for_events(local_filebeat, 1) == [{'value': 1}]
+        assert mock_socket.close.called
@@ -14,6 +14,7 @@ import unittest.mock as mock
 import pytest
 
 import ly_test_tools._internal.pytest_plugin.test_tools_fixtures as test_tools_fixtures
+import ly_test_tools.environment.watchdog as watchdog
 
 pytestmark = pytest.mark.SUITE_smoke
 
@@ -279,7 +280,9 @@ class TestFixtures(object):
         mock_raise_on_crash = mock.MagicMock()
         mock_watchdog = test_tools_fixtures._crash_log_watchdog(mock_request, mock_workspace, mock_raise_on_crash)
 
-        under_test.assert_called_once_with(mock_workspace.paths.crash_log.return_value, raise_on_condition=mock_raise_on_crash)
+        under_test.assert_called_once_with(mock_workspace.paths.crash_log.return_value, raise_on_condition=mock_raise_on_crash,
+                                           interval=watchdog.MONITOR_CHECK_INTERVAL,
+                                           monitor=watchdog.get_shared_monitor())
 
     @mock.patch('ly_test_tools.environment.watchdog.CrashLogWatchdog.start')
     def test_CrashLogWatchdog_Instantiates_StartsThread(self, under_test):
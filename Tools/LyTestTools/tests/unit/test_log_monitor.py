@@ -190,6 +190,59 @@ class TestLogMonitor(object):
             with pytest.raises(ly_test_tools.log.log_monitor.LogMonitorException):
                 mock_log_monitor().monitor_log_for_lines(['exactly'], [])
 
+    @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
+    def test_Monitor_LastLineWithoutNewline_Success(self):
+        mock_file = io.StringIO(u'foo\nbar')
+        mock_launcher.is_alive.side_effect = [True, False]
+
+        with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
+            under_test = mock_log_monitor()
+            under_test.monitor_log_for_lines(['foo', 'bar'], [])
+
+        assert under_test.py_log == '|mock_path| foo\n|mock_path| bar\n'
+
+    def test_LineMatcher_OverlappingLines_FindsEachExactMatch(self):
+        under_test = ly_test_tools.log.log_monitor.LineMatcher(['exact match', 'exact', 'match', 'exactly'])
+
+        assert under_test.find('an exact match') == ['exact match', 'exact', 'match']
+        assert under_test.find('no matches') == []
+
+    def test_LineMatcher_RemoveLines_StopsFindingLines(self):
+        under_test = ly_test_tools.log.log_monitor.LineMatcher(['foo', 'bar'])
+
+        under_test.remove(['foo'])
+
+        assert under_test.lines == ['bar']
+        assert under_test.find('foo bar') == ['bar']
+
+    def test_LogTailer_PartialLine_ReadOnceComplete(self):
+        mock_file = io.StringIO()
+        under_test = ly_test_tools.log.log_monitor.LogTailer(mock_file)
+
+        mock_file.write(u'foo\nba')
+        mock_file.seek(0)
+        assert under_test.read_lines() == ['foo']
+
+        mock_file.write(u'r\nbaz')
+        mock_file.seek(len(u'foo\nba'))
+        assert under_test.read_lines() == ['bar']
+        assert under_test.read_lines(flush=True) == ['baz']
+
+    def test_LogTailer_LogFileGrows_WaitForDataReturnsTrue(self, tmp_path):
+        log_file_path = tmp_path / 'test.log'
+        log_file_path.write_text(u'foo\n')
+
+        with open(log_file_path, mode='r', encoding='utf-8') as log:
+            under_test = ly_test_tools.log.log_monitor.LogTailer(log)
+            assert under_test.read_lines() == ['foo']
+            assert not under_test.wait_for_data(0)
+
+            with open(log_file_path, mode='a', encoding='utf-8') as log_writer:
+                log_writer.write(u'bar\n')
+
+            assert under_test.wait_for_data(0)
+            assert under_test.read_lines() == ['bar']
+
     def test_ValidateResults_Valid_ReturnsTrue(self):
         mock_lm = mock_log_monitor()
         mock_expected_lines = ['expected_foo']
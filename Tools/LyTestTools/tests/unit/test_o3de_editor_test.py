@@ -217,3 +217,83 @@ class TestEditorTestSuite(unittest.TestCase):
         filtered_tests = editor_test.EditorTestSuite.filter_shared_tests(
             mock_shared_tests, is_batchable=False, is_parallelizable=False)
         assert filtered_tests == [mock_test_2]
+
+    def test_UsesWarmEditorPool_PoolEnabled_OnlyForEligibleTests(self):
+        class MockTestSuite(editor_test.EditorTestSuite):
+            use_warm_editor_pool = True
+
+        class MockSingleTest(editor_test.EditorSingleTest):
+            pass
+
+        class MockDebuggedTest(editor_test.EditorSingleTest):
+            attach_debugger = True
+
+        class MockColdTest(editor_test.EditorSingleTest):
+            use_warm_editor = False
+
+        mock_request = mock.MagicMock()
+        mock_request.config.getoption.return_value = False
+        suite = MockTestSuite()
+        assert suite._uses_warm_editor_pool(mock_request, MockSingleTest)
+        assert not suite._uses_warm_editor_pool(mock_request, MockDebuggedTest)
+        assert not suite._uses_warm_editor_pool(mock_request, MockColdTest)
+        assert not editor_test.EditorTestSuite()._uses_warm_editor_pool(mock_request, MockSingleTest)
+
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.compile_test_case_name', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.get_testcase_module_filepath', mock.MagicMock())
+    @mock.patch('ly_test_tools.launchers.launcher_helper.create_editor', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.prepare_asset_processor')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorPool')
+    def test_ExecWarmEditorTest_TestPasses_ReleasesEditorForReuse(self, mock_pool_class, mock_prepare_ap):
+        mock_test_data = editor_test.EditorTestSuite.TestData()
+        mock_warm_editor = mock_pool_class.return_value.acquire.return_value
+        mock_warm_editor.wait_until_ready.return_value = True
+        mock_warm_editor.run_test.return_value = {'success': True, 'output': 'output', 'exception': None}
+        suite = editor_test.EditorTestSuite()
+        suite._setup_cmdline_args = mock.MagicMock(return_value=['-rhi=null'])
+
+        class MockSingleTest(editor_test.EditorSingleTest):
+            pass
+
+        results = suite._exec_warm_editor_test(mock.MagicMock(), mock.MagicMock(), mock_test_data, MockSingleTest)
+
+        assert isinstance(results['MockSingleTest'], editor_test.Result.Pass)
+        mock_prepare_ap.assert_called_once()
+        mock_pool_class.return_value.acquire.assert_called_once_with(['-rhi=null'])
+        mock_pool_class.return_value.release.assert_called_once_with(mock_warm_editor, recycle=False)
+
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.cycle_crash_report', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.retrieve_crash_output', mock.MagicMock(return_value='crash'))
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.compile_test_case_name', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.get_testcase_module_filepath', mock.MagicMock())
+    @mock.patch('ly_test_tools.launchers.launcher_helper.create_editor', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.prepare_asset_processor')
+    def test_ExecWarmEditorTest_EditorCrashes_RecyclesEditor(self, mock_prepare_ap):
+        mock_test_data = editor_test.EditorTestSuite.TestData()
+        mock_test_data.editor_pool = mock.MagicMock()
+        mock_test_data.editor_pool.has_live_editors.return_value = True
+        mock_warm_editor = mock_test_data.editor_pool.acquire.return_value
+        mock_warm_editor.wait_until_ready.return_value = True
+        mock_warm_editor.run_test.return_value = None
+        mock_warm_editor.is_alive.return_value = False
+        suite = editor_test.EditorTestSuite()
+        suite._setup_cmdline_args = mock.MagicMock(return_value=[])
+
+        class MockSingleTest(editor_test.EditorSingleTest):
+            pass
+
+        results = suite._exec_warm_editor_test(mock.MagicMock(), mock.MagicMock(), mock_test_data, MockSingleTest)
+
+        assert isinstance(results['MockSingleTest'], editor_test.Result.Crash)
+        mock_prepare_ap.assert_not_called()
+        mock_test_data.editor_pool.release.assert_called_once_with(mock_warm_editor, recycle=True)
+
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.kill_all_ly_processes', mock.MagicMock())
+    def test_TestData_EditorPool_StopsPool(self):
+        mock_test_data_generator = editor_test.EditorTestSuite()._collected_test_data(mock.MagicMock())
+        mock_editor_pool = mock.MagicMock()
+        for test_data in mock_test_data_generator:
+            test_data.editor_pool = mock_editor_pool
+
+        mock_editor_pool.stop.assert_called_once()
+        assert test_data.editor_pool is None
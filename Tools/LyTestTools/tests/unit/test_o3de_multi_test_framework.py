@@ -230,6 +230,58 @@ class TestMultiTestSuite(unittest.TestCase):
         MockTestSuite.pytest_custom_modify_items(mock.MagicMock(), mock_items, mock.MagicMock())
         assert mock_items == [mock_run_pytest_func, mock_result_pytestfuncs[0]]
 
+    @mock.patch('ly_test_tools._internal.pytest_plugin.duration_store')
+    @mock.patch('ly_test_tools.o3de.multi_test_framework.MultiTestSuite.filter_session_shared_tests')
+    def test_PytestCustomModifyItems_DurationStore_OrdersLongestFirst(self, mock_filter_tests, mock_duration_store):
+        class MockTestSuite(multi_test_framework.MultiTestSuite):
+            class ShortSingleTest(multi_test_framework.SingleTest):
+                pass
+
+            class LongSingleTest(multi_test_framework.SingleTest):
+                pass
+
+            class ShortSharedTest(multi_test_framework.SharedTest):
+                pass
+
+            class LongSharedTest(multi_test_framework.SharedTest):
+                pass
+
+        def make_item(name, run_type):
+            item = mock.MagicMock()
+            item.cls = MockTestSuite
+            item.originalname = name
+            item.nodeid = f'test_suite.py::MockTestSuite::{name}'
+            item.function.marks = {'run_type': run_type}
+            return item
+
+        durations = {'test_suite.py::MockTestSuite::ShortSingleTest': 1.0,
+                     'test_suite.py::MockTestSuite::LongSingleTest': 100.0,
+                     'test_suite.py::MockTestSuite::ShortSharedTest': 2.0,
+                     'test_suite.py::MockTestSuite::LongSharedTest': 50.0}
+        mock_duration_store.get_duration_estimate.side_effect = lambda node_id: durations.get(node_id)
+        other_item = mock.MagicMock()
+        short_single_item = make_item('ShortSingleTest', 'run_single')
+        long_single_item = make_item('LongSingleTest', 'run_single')
+        mock_items = [short_single_item, other_item, long_single_item,
+                      make_item('ShortSharedTest', 'result'), make_item('LongSharedTest', 'result')]
+        runner = multi_test_framework.MultiTestSuite.Runner(
+            'mock_runner', mock.MagicMock(), [MockTestSuite.ShortSharedTest, MockTestSuite.LongSharedTest])
+        MockTestSuite._runners = [runner]
+        mock_filter_tests.side_effect = lambda items, tests: tests
+
+        MockTestSuite.pytest_custom_modify_items(mock.MagicMock(), mock_items, mock.MagicMock())
+
+        assert mock_items[:3] == [long_single_item, other_item, short_single_item]
+        assert runner.tests == [MockTestSuite.LongSharedTest, MockTestSuite.ShortSharedTest]
+        assert MockTestSuite.get_test_duration_estimate(MockTestSuite.LongSharedTest) == 50.0
+
+    @mock.patch('ly_test_tools._internal.pytest_plugin.duration_store', None)
+    def test_GetTestDurationEstimate_NoDurations_ReturnsTimeout(self):
+        class MockTest(multi_test_framework.SharedTest):
+            timeout = 42
+
+        assert multi_test_framework.MultiTestSuite.get_test_duration_estimate(MockTest) == 42
+
     def test_GetSingleTests_NoSingleTests_EmptyList(self):
         class MockTestSuite(multi_test_framework.MultiTestSuite):
             pass
@@ -565,6 +617,103 @@ class TestUtils(unittest.TestCase):
             f"{mock_log_output}\n")
 
 
+class TestResultStreamParser(unittest.TestCase):
+
+    def setUp(self):
+        self.test_spec = mock.MagicMock()
+        self.test_spec.__name__ = 'mock_test_name'
+        self.test_spec_2 = mock.MagicMock()
+        self.test_spec_2.__name__ = 'mock_test_name_2'
+        self.result_line = 'JSON_START({"name": "mock_module", "output": "mock_output", "success": true})JSON_END\n'
+        self.result_line_2 = 'JSON_START({"name": "mock_module_2", "output": "mock_output_2", "success": false})' \
+                             'JSON_END\n'
+        patcher = mock.patch('ly_test_tools.o3de.editor_test_utils.get_module_filename')
+        self.addCleanup(patcher.stop)
+        patcher.start().side_effect = ['mock_module', 'mock_module_2']
+
+    def test_FeedLog_MarkerSplitAcrossChunks_ReportsResultOnceComplete(self):
+        mock_on_result = mock.MagicMock()
+        parser = multi_test_framework.ResultStreamParser([self.test_spec, self.test_spec_2], on_result=mock_on_result)
+
+        parser.feed_log('starting\n' + self.result_line[:20])
+        assert not mock_on_result.called
+        parser.feed_log(self.result_line[20:])
+
+        mock_on_result.assert_called_once_with(self.test_spec, True)
+
+    def test_FeedLog_MarkersOfOtherTests_Ignored(self):
+        mock_on_result = mock.MagicMock()
+        parser = multi_test_framework.ResultStreamParser([self.test_spec, self.test_spec_2], on_result=mock_on_result)
+
+        parser.feed_log(self.result_line.replace('mock_module', 'other_module'))
+
+        assert not mock_on_result.called
+
+    def test_FeedLog_ManyLines_KeepsOnlyUnfinishedLine(self):
+        parser = multi_test_framework.ResultStreamParser([self.test_spec, self.test_spec_2])
+
+        for _ in range(1000):
+            parser.feed_log('mock log line\n')
+        parser.feed_log('unfinished')
+
+        assert parser._log_stream.partial_line == 'unfinished'
+
+    def test_GetResults_LogFedInChunks_CutsLogAtResultOffsets(self):
+        log_output = 'first\n' + self.result_line + 'second\n' + self.result_line_2 + 'closing\n'
+        parser = multi_test_framework.ResultStreamParser([self.test_spec, self.test_spec_2])
+        for i in range(0, len(log_output), 7):
+            parser.feed_log(log_output[i:i + 7])
+
+        results = parser.get_results(self.result_line + self.result_line_2, log_output)
+
+        assert isinstance(results['mock_test_name'], multi_test_framework.Result.Pass)
+        assert isinstance(results['mock_test_name_2'], multi_test_framework.Result.Fail)
+        assert results['mock_test_name'].log_output == 'first\n' + self.result_line[:-1]
+        assert results['mock_test_name_2'].log_output == '\nsecond\n' + self.result_line_2 + 'closing\n'
+
+    def test_GetResults_LogLinePrefix_OffsetsMatchPrefixedLog(self):
+        log_lines = ['first\n', self.result_line, 'second\n']
+        parser = multi_test_framework.ResultStreamParser(
+            [self.test_spec, self.test_spec_2], log_line_prefix='[log]  ')
+        parser.feed_log(''.join(log_lines))
+
+        results = parser.get_results(self.result_line, ''.join(f'[log]  {line}' for line in log_lines))
+
+        assert results['mock_test_name'].log_output == '[log]  first\n[log]  ' + self.result_line[:-1]
+        assert isinstance(results['mock_test_name_2'], multi_test_framework.Result.Unknown)
+
+    def test_GetResults_FedLogDoesNotMatch_ParsesLogAgain(self):
+        parser = multi_test_framework.ResultStreamParser([self.test_spec, self.test_spec_2])
+        parser.feed_log('stale log line\n' + self.result_line)
+        log_output = self.result_line + 'second\n'
+
+        results = parser.get_results(self.result_line, log_output)
+
+        assert results['mock_test_name'].log_output == self.result_line[:-1]
+
+    def test_FeedLogFile_AppendedContent_ReadsOnlyNewData(self):
+        mock_on_result = mock.MagicMock()
+        parser = multi_test_framework.ResultStreamParser([self.test_spec, self.test_spec_2], on_result=mock_on_result)
+        mock_stat = mock.MagicMock(st_mtime=10, st_size=len(self.result_line))
+
+        with mock.patch('os.stat', return_value=mock_stat), \
+                mock.patch('builtins.open', mock.mock_open(read_data=self.result_line.encode())) as mock_file:
+            parser.feed_log_file('mock_log_path', modified_since=5)
+
+        mock_file.return_value.seek.assert_called_once_with(0)
+        mock_on_result.assert_called_once_with(self.test_spec, True)
+        assert parser._log_stream.file_position == len(self.result_line)
+
+    def test_FeedLogFile_OlderThanRun_Ignored(self):
+        parser = multi_test_framework.ResultStreamParser([self.test_spec, self.test_spec_2])
+        mock_stat = mock.MagicMock(st_mtime=1, st_size=100)
+
+        with mock.patch('os.stat', return_value=mock_stat), mock.patch('builtins.open') as mock_open:
+            parser.feed_log_file('mock_log_path', modified_since=5)
+
+        assert not mock_open.called
+
+
 class TestRunningTests(unittest.TestCase):
 
     @mock.patch('ly_test_tools.o3de.multi_test_framework.MultiTestSuite._get_results_using_output')
@@ -846,6 +995,31 @@ class TestRunningTests(unittest.TestCase):
         assert isinstance(results[mock_test_spec_2.__name__], multi_test_framework.Result.Unknown)
         assert results[mock_test_spec_2.__name__].extra_info, "Extra info missing from Unknown failure"
 
+    @mock.patch('time.sleep', mock.MagicMock())
+    def test_WaitStreamingResults_ExecutableExits_FeedsLogUntilExit(self):
+        mock_executable = mock.MagicMock()
+        mock_executable.is_alive.side_effect = [True, True, False]
+        mock_parser = mock.MagicMock()
+
+        multi_test_framework.MultiTestSuite._wait_streaming_results(
+            mock_executable, 'mock_log_path', mock_parser, 60, 5)
+
+        assert mock_parser.feed_log_file.call_count == 3
+        mock_parser.feed_log_file.assert_called_with('mock_log_path', 5)
+        assert mock_executable.wait.called
+
+    @mock.patch('time.sleep', mock.MagicMock())
+    def test_WaitStreamingResults_ExecutableTimesOut_FeedsLogAndRaises(self):
+        mock_executable = mock.MagicMock()
+        mock_executable.wait.side_effect = ly_test_tools.launchers.exceptions.WaitTimeoutError()
+        mock_parser = mock.MagicMock()
+
+        with pytest.raises(ly_test_tools.launchers.exceptions.WaitTimeoutError):
+            multi_test_framework.MultiTestSuite._wait_streaming_results(
+                mock_executable, 'mock_log_path', mock_parser, 0, 5)
+
+        assert mock_parser.feed_log_file.called
+
     @mock.patch('ly_test_tools.o3de.multi_test_framework.MultiTestSuite._report_result')
     @mock.patch('ly_test_tools.o3de.multi_test_framework.MultiTestSuite._exec_single_test')
     @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
@@ -1002,6 +1176,71 @@ class TestRunningTests(unittest.TestCase):
         assert mock_collected_test_data.results.update.call_count == 3
         assert mock_thread.call_count == 3
 
+    @mock.patch('ly_test_tools.o3de.multi_test_framework.MultiTestSuite._exec_multitest')
+    @mock.patch('ly_test_tools.o3de.multi_test_framework.MultiTestSuite._setup_test', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.multi_test_framework.MultiTestSuite._get_number_parallel_executables')
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
+    def test_RunParallelBatchedTests_BatchCrashes_RequeuesTestsThatDidNotRun(self, mock_get_number_executables,
+                                                                           mock_exec_multitest):
+        class MockExecutable(object):
+            def __init__(self, workspace, args):
+                self.args = args
+
+        mock_test_suite = ly_test_tools.o3de.multi_test_framework.MultiTestSuite()
+        mock_test_suite.executable = MockExecutable(None, [])
+        mock_collected_test_data = ly_test_tools.o3de.multi_test_framework.MultiTestSuite.TestData()
+        mock_get_number_executables.return_value = 1
+        mock_test_spec_list = [type(f'MockTest{i}', (ly_test_tools.o3de.multi_test_framework.SharedTest,), {})
+                               for i in range(6)]
+        results = ly_test_tools.o3de.multi_test_framework.Result
+        executed_batches = []
+
+        def exec_multitest(request, workspace, executable, run_id, log_name, test_spec_list, cmdline_args):
+            executed_batches.append([test_spec.__name__ for test_spec in test_spec_list])
+            if len(executed_batches) == 1:
+                # the first test crashes the executable before the other tests of the batch run
+                return {test_spec.__name__: results.Crash(test_spec, '', 1, None, None) if i == 0 else
+                        results.Unknown(test_spec) for i, test_spec in enumerate(test_spec_list)}
+            return {test_spec.__name__: results.Pass(test_spec, '', '') for test_spec in test_spec_list}
+        mock_exec_multitest.side_effect = exec_multitest
+
+        mock_test_suite._run_parallel_batched_tests(
+            mock.MagicMock(), mock.MagicMock(), mock_collected_test_data, mock_test_spec_list, [])
+
+        assert len(executed_batches[0]) > 1
+        assert sorted(name for batch in executed_batches[1:] for name in batch) == \
+               sorted(executed_batches[0][1:] + [test_spec.__name__ for test_spec in mock_test_spec_list
+                                                 if test_spec.__name__ not in executed_batches[0]])
+        assert isinstance(mock_collected_test_data.results[executed_batches[0][0]], results.Crash)
+        for name in executed_batches[0][1:]:
+            assert isinstance(mock_collected_test_data.results[name], results.Pass)
+
+    def test_SharedTestQueue_Batches_LongestTestsFirstInShrinkingBatches(self):
+        durations = {'long': 100, 'medium': 50, 'short1': 10, 'short2': 10, 'short3': 10, 'short4': 10}
+        test_queue = ly_test_tools.o3de.multi_test_framework.SharedTestQueue(list(durations), 2, durations.get)
+
+        batches = []
+        batch = test_queue.get_batch()
+        while batch:
+            batches.append(batch)
+            batch = test_queue.get_batch()
+
+        assert [test for batch in batches for test in batch] == ['long', 'medium', 'short1', 'short2', 'short3',
+                                                                  'short4']
+        assert batches[0] == ['long']
+        assert len(batches[-1]) == 1
+        assert len(test_queue) == 0
+
+    def test_SharedTestQueue_Requeue_OnlyOnce(self):
+        test_queue = ly_test_tools.o3de.multi_test_framework.SharedTestQueue(['test1', 'test2'], 1, lambda test: 1)
+
+        assert test_queue.get_batch() == ['test1']
+        assert test_queue.requeue('test1')
+        assert test_queue.get_batch() == ['test1']
+        assert not test_queue.requeue('test1')
+        assert test_queue.get_batch() == ['test2']
+        assert test_queue.get_batch() == []
+
     def test_GetNumberParallelEditors_ConfigExists_ReturnsConfig(self):
         mock_test_suite = ly_test_tools.o3de.multi_test_framework.MultiTestSuite()
         mock_request = mock.MagicMock()
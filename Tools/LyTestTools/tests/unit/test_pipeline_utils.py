@@ -88,3 +88,39 @@ class TestPipelineUtils(object):
         first_list = [ "ListOneUniqueEntry", "OutOfOrderEntry", "SomeEntry", "AnotherEntry"]
         second_list = ["SomeEntry", "AnotherEntry", "ListTwoUniqueEntry", "OutOfOrderEntry", "SecondUniqueEntry"]
         assert pipeline_utils.compare_lists(first_list, second_list) == False
+
+    def test_CompareAssetsWithCache_DuplicateNames_EachCacheFileMatchedOnce(self, tmp_path):
+        for file_name in ['asset_a.azmodel', 'asset_b.azbuffer', 'asset_b.azmaterial']:
+            (tmp_path / file_name).write_text('')
+
+        missing, existing = pipeline_utils.compare_assets_with_cache(
+            ['Asset_A.fbx', 'asset_b.fbx', 'asset_b.png', 'asset_b.tif', 'asset_c.fbx'], str(tmp_path))
+
+        assert existing == ['asset_a', 'asset_b', 'asset_b']
+        assert missing == ['asset_b', 'asset_c']
+
+    def test_CompareAssetsWithCache_NoCache_AllMissing(self, tmp_path):
+        missing, existing = pipeline_utils.compare_assets_with_cache(['asset_a.fbx'], str(tmp_path / 'missing'))
+
+        assert missing == ['asset_a.fbx']
+        assert existing == []
+
+    def test_CopyAssetsToProject_FilesAndFolders_AllCopied(self, tmp_path):
+        source = tmp_path / 'source'
+        (source / 'folder' / 'sub').mkdir(parents=True)
+        (source / 'file.txt').write_text('file')
+        (source / 'folder' / 'sub' / 'nested.txt').write_text('nested')
+        target = tmp_path / 'target'
+
+        pipeline_utils.copy_assets_to_project(['file.txt', 'folder'], str(source), str(target))
+
+        assert (target / 'file.txt').read_text() == 'file'
+        assert (target / 'folder' / 'sub' / 'nested.txt').read_text() == 'nested'
+
+    def test_CopyFilesParallel_CopyFails_RaisesError(self, tmp_path):
+        (tmp_path / 'exists.txt').write_text('')
+        file_pairs = [(str(tmp_path / 'exists.txt'), str(tmp_path / 'copy.txt')),
+                      (str(tmp_path / 'missing.txt'), str(tmp_path / 'copy2.txt'))]
+
+        with pytest.raises(FileNotFoundError):
+            pipeline_utils.copy_files_parallel(file_pairs)
@@ -0,0 +1,165 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.benchmark.regression_gate
+"""
+import json
+import unittest.mock as mock
+
+import numpy as np
+import pytest
+
+import ly_test_tools.benchmark.regression_gate as regression_gate
+from ly_test_tools.benchmark.data_aggregator import BenchmarkDataAggregator
+from ly_test_tools.mars.filebeat_client import FilebeatExn
+
+pytestmark = pytest.mark.SUITE_smoke
+
+mock_suite = 'mock_suite'
+mock_rhi = 'dx12'
+
+
+def write_benchmark(benchmark_dir, pass_times):
+    """
+    Writes one timestamps capture and one CPU frame time capture per frame, with a single pass named PassA
+    """
+    benchmark_dir.mkdir(parents=True, exist_ok=True)
+    for index, time_ns in enumerate(pass_times):
+        entries = [{'passName': 'PassA', 'timestampResultInNanoseconds': float(time_ns)}]
+        (benchmark_dir / f'frame{index}_timestamps.json').write_text(
+            json.dumps({'ClassData': {'timestampEntries': entries}}))
+        (benchmark_dir / f'cpu_frame{index}_time.json').write_text(json.dumps({'ClassData': {'frameTime': 10.0}}))
+
+
+def frame_times(median, count=40, seed=1):
+    return np.random.default_rng(seed).normal(median, median * 0.01, count)
+
+
+class TestStatistics(object):
+
+    def test_MannWhitneyU_CurrentSlower_SmallPValue(self):
+        _, p_value = regression_gate.mann_whitney_u(frame_times(100), frame_times(120, seed=2))
+
+        assert p_value < 1e-6
+
+    def test_MannWhitneyU_CurrentFaster_LargePValue(self):
+        _, p_value = regression_gate.mann_whitney_u(frame_times(100), frame_times(80, seed=2))
+
+        assert p_value > 0.99
+
+    def test_MannWhitneyU_KnownValues_MatchesReference(self):
+        # U = 46.5 - 21, z = (25.5 - 15 - 0.5) / sqrt(2.5 * (12 - 18 / 110))
+        u_statistic, p_value = regression_gate.mann_whitney_u([1, 2, 3, 4, 5], [3, 4, 5, 6, 7, 8])
+
+        assert u_statistic == 25.5
+        assert p_value == pytest.approx(0.0330, abs=1e-4)
+
+    def test_MannWhitneyU_AllEqual_PValueOne(self):
+        assert regression_gate.mann_whitney_u([5] * 10, [5] * 10)[1] == 1.0
+
+    def test_BootstrapMedianChange_CurrentSlower_IntervalAroundChange(self):
+        lower, upper = regression_gate.bootstrap_median_change(frame_times(100), frame_times(120, seed=2))
+
+        assert 0.15 < lower < 0.2 < upper < 0.25
+
+    def test_BootstrapMedianChange_SameSeed_SameInterval(self):
+        baseline = frame_times(100)
+        current = frame_times(101, seed=2)
+
+        assert regression_gate.bootstrap_median_change(baseline, current) == \
+            regression_gate.bootstrap_median_change(baseline, current)
+
+
+class TestBaselineStore(object):
+
+    def test_SaveLoad_Samples_RoundTrips(self, tmp_path):
+        under_test = regression_gate.BaselineStore(tmp_path)
+
+        under_test.save(mock_suite, 'DX12', 'benchmark', {'gpu.frameTime': [1, 2], 'gpu.pass.PassA': [3]})
+
+        loaded = under_test.load(mock_suite, 'dx12', 'benchmark')
+        assert loaded['gpu.frameTime'].tolist() == [1, 2]
+        assert loaded['gpu.pass.PassA'].tolist() == [3]
+        assert [path.name for path in (tmp_path / mock_suite / 'dx12').iterdir()] == ['benchmark.npz']
+
+    def test_Load_NoBaseline_ReturnsEmpty(self, tmp_path):
+        assert regression_gate.BaselineStore(tmp_path).load(mock_suite, mock_rhi, 'benchmark') == {}
+
+
+class TestPerformanceRegressionGate(object):
+
+    def create_gate(self, tmp_path, baseline_times, **kwargs):
+        write_benchmark(tmp_path / 'baseline' / 'benchmark', baseline_times)
+        under_test = regression_gate.PerformanceRegressionGate(
+            regression_gate.BaselineStore(tmp_path / 'store'), mock_suite, mock_rhi, **kwargs)
+        under_test.update_baseline(tmp_path / 'baseline')
+        return under_test
+
+    @pytest.mark.parametrize('method', [regression_gate.MANN_WHITNEY, regression_gate.BOOTSTRAP])
+    def test_Check_PassRegressed_RaisesError(self, tmp_path, method):
+        under_test = self.create_gate(tmp_path, frame_times(1e6), method=method)
+        write_benchmark(tmp_path / 'current' / 'benchmark', frame_times(1.2e6, seed=2))
+
+        with pytest.raises(regression_gate.PerformanceRegressionError) as error:
+            under_test.check(tmp_path / 'current')
+
+        assert 'benchmark gpu.pass.PassA' in str(error.value)
+        assert 'benchmark gpu.frameTime' in str(error.value)
+        assert 'cpu.frameTime' not in str(error.value)
+
+    @pytest.mark.parametrize('method', [regression_gate.MANN_WHITNEY, regression_gate.BOOTSTRAP])
+    def test_Check_ChangeBelowThreshold_NoRegression(self, tmp_path, method):
+        under_test = self.create_gate(tmp_path, frame_times(1e6), method=method, threshold=0.05)
+        write_benchmark(tmp_path / 'current' / 'benchmark', frame_times(1.02e6, seed=2))
+
+        comparisons = under_test.check(tmp_path / 'current')
+
+        assert sorted(comparison.series for comparison in comparisons) == \
+            ['cpu.frameTime', 'gpu.frameTime', 'gpu.pass.PassA']
+        assert not any(comparison.regressed for comparison in comparisons)
+
+    def test_Compare_IncludePassesFalse_OnlyFrameSeries(self, tmp_path):
+        under_test = self.create_gate(tmp_path, frame_times(1e6), include_passes=False)
+        write_benchmark(tmp_path / 'current' / 'benchmark', frame_times(1e6, seed=2))
+
+        comparisons = under_test.compare(tmp_path / 'current')
+
+        assert sorted(comparison.series for comparison in comparisons) == ['cpu.frameTime', 'gpu.frameTime']
+
+    def test_Compare_NoBaseline_Skipped(self, tmp_path):
+        under_test = self.create_gate(tmp_path, frame_times(1e6))
+        write_benchmark(tmp_path / 'current' / 'other_benchmark', frame_times(2e6))
+
+        assert under_test.compare(tmp_path / 'current') == []
+
+    def test_Compare_TooFewFrames_Skipped(self, tmp_path):
+        under_test = self.create_gate(tmp_path, frame_times(1e6, count=regression_gate.MIN_SAMPLE_COUNT - 1))
+        write_benchmark(tmp_path / 'current' / 'benchmark', frame_times(2e6))
+
+        assert under_test.compare(tmp_path / 'current') == []
+
+    def test_Init_UnknownMethod_RaisesError(self, tmp_path):
+        with pytest.raises(ValueError):
+            regression_gate.PerformanceRegressionGate(regression_gate.BaselineStore(tmp_path), mock_suite, mock_rhi,
+                                                      method='t-test')
+
+
+class TestCheckRegressions(object):
+
+    @mock.patch('ly_test_tools.benchmark.data_aggregator.FilebeatClient')
+    def test_CheckRegressions_NoFilebeat_UpdateThenRegressed_RaisesError(self, mock_filebeat_client, tmp_path):
+        mock_filebeat_client.side_effect = FilebeatExn('Failed to connect to Filebeat')
+        mock_workspace = mock.MagicMock()
+        mock_workspace.paths.project.return_value = str(tmp_path)
+        results_dir = tmp_path / 'user' / 'Scripts' / 'PerformanceBenchmarks' / 'benchmark'
+        write_benchmark(results_dir, frame_times(1e6))
+        under_test = BenchmarkDataAggregator(mock_workspace, mock.MagicMock(), mock_suite)
+
+        assert under_test.check_regressions(mock_rhi, tmp_path / 'store', update_baseline=True) == []
+        write_benchmark(results_dir, frame_times(1.5e6))
+        with pytest.raises(regression_gate.PerformanceRegressionError):
+            under_test.check_regressions(mock_rhi, tmp_path / 'store')
+        mock_filebeat_client.assert_not_called()
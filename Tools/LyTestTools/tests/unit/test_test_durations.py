@@ -0,0 +1,95 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools._internal.pytest_plugin.test_durations
+"""
+import pytest
+import unittest.mock as mock
+
+import ly_test_tools._internal.pytest_plugin.test_durations as test_durations
+from ly_test_tools.report.duration_store import DurationStore
+
+pytestmark = pytest.mark.SUITE_smoke
+
+
+def _make_config(shard_count=1, shard_index=0, durations_path=None):
+    options = {'--test-shard-count': shard_count,
+               '--test-shard-index': shard_index,
+               '--test-durations-path': durations_path,
+               '--test-duration-regression-threshold': 2.0}
+    mock_config = mock.MagicMock()
+    mock_config.getoption.side_effect = options.get
+    return mock_config
+
+
+def _make_item(node_id):
+    item = mock.MagicMock()
+    item.nodeid = node_id
+    return item
+
+
+class TestTestDurations(object):
+
+    @mock.patch('ly_test_tools._internal.pytest_plugin.duration_store', None)
+    def test_PytestConfigure_DurationsPath_CreatesStore(self, tmp_path):
+        durations_path = str(tmp_path / 'durations.jsonl')
+
+        test_durations.pytest_configure(_make_config(durations_path=durations_path))
+
+        import ly_test_tools._internal.pytest_plugin as pytest_plugin
+        assert pytest_plugin.duration_store.path == durations_path
+
+    @pytest.mark.parametrize('shard_count, shard_index', [(0, 0), (2, 2), (2, -1)])
+    def test_PytestConfigure_InvalidShard_RaisesUsageError(self, shard_count, shard_index):
+        with pytest.raises(pytest.UsageError):
+            test_durations.pytest_configure(_make_config(shard_count, shard_index))
+
+    def test_PytestCollectionModifyItems_TwoShards_DeselectsOtherShard(self):
+        store = DurationStore()
+        store.add('long', 10.0)
+        store.add('short1', 4.0)
+        store.add('short2', 4.0)
+        items = [_make_item('short1'), _make_item('long'), _make_item('short2')]
+        mock_config = _make_config(shard_count=2, shard_index=1)
+
+        with mock.patch('ly_test_tools._internal.pytest_plugin.duration_store', store):
+            test_durations.pytest_collection_modifyitems(mock.MagicMock(), mock_config, items)
+
+        assert [item.nodeid for item in items] == ['short1', 'short2']
+        deselected = mock_config.hook.pytest_deselected.call_args[1]['items']
+        assert [item.nodeid for item in deselected] == ['long']
+
+    def test_PytestCollectionModifyItems_OneShard_KeepsItems(self):
+        items = [_make_item('a'), _make_item('b')]
+
+        test_durations.pytest_collection_modifyitems(mock.MagicMock(), _make_config(), items)
+
+        assert [item.nodeid for item in items] == ['a', 'b']
+
+    def test_PytestRuntestLogreport_DurationUserProperty_RecordsProperty(self):
+        store = DurationStore()
+        call_report = mock.MagicMock(nodeid='shared_test', when='call', duration=0.01, outcome='passed',
+                                     user_properties=[(test_durations.DURATION_USER_PROPERTY, 25.0)])
+        setup_report = mock.MagicMock(nodeid='shared_test', when='setup', duration=1.0, user_properties=[])
+
+        with mock.patch('ly_test_tools._internal.pytest_plugin.duration_store', store):
+            test_durations.pytest_runtest_logreport(setup_report)
+            test_durations.pytest_runtest_logreport(call_report)
+
+        assert store.get_durations('shared_test') == [25.0]
+
+    def test_PytestTerminalSummary_Regression_WritesSection(self):
+        store = DurationStore()
+        for duration in [10.0, 10.0, 10.0, 40.0]:
+            store.add('slower', duration)
+        mock_reporter = mock.MagicMock()
+        mock_reporter.stats = {'passed': [mock.MagicMock(nodeid='slower', when='call')]}
+
+        with mock.patch('ly_test_tools._internal.pytest_plugin.duration_store', store):
+            test_durations.pytest_terminal_summary(mock_reporter, 0, _make_config())
+
+        mock_reporter.section.assert_called_once()
+        mock_reporter.write_line.assert_called_once_with('slower: 40.00s, previously 10.00s')
@@ -6,8 +6,12 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 
 Unit Tests for watchdog.py
 """
+import subprocess
+import sys
+import threading
 import unittest
 import unittest.mock as mock
+import psutil
 import pytest
 
 import ly_test_tools.environment.watchdog as watchdog
@@ -258,3 +262,214 @@ class TestCrashLogWatchdog(unittest.TestCase):
         mock_watchdog.stop()
         assert not mock_open.called
         assert not mock_print.called
+
+
+def start_sleeping_process(seconds):
+    return subprocess.Popen([sys.executable, '-c', f'import time; time.sleep({seconds})'])
+
+
+class TestWatchdogMonitor(object):
+    mock_timeout = 5
+
+    def setup_method(self):
+        self.monitor = watchdog.WatchdogMonitor()
+
+    def teardown_method(self):
+        self.monitor.stop()
+
+    def test_AddCheck_ConditionMet_CallbackCalledOnceAndRemoved(self):
+        mock_check = mock.MagicMock(side_effect=[False, True])
+        called = threading.Event()
+        mock_callback = mock.MagicMock(side_effect=lambda: called.set())
+
+        handle = self.monitor.add_check(mock_check, mock_callback, interval=0.01)
+
+        assert called.wait(self.mock_timeout)
+        assert mock_check.call_count == 2
+        mock_callback.assert_called_once_with()
+        assert not self.monitor.is_watching(handle)
+
+    def test_Remove_CheckRegistered_NotCheckedAnymore(self):
+        mock_check = mock.MagicMock(return_value=False)
+        handle = self.monitor.add_check(mock_check, mock.MagicMock(), interval=0.01)
+
+        assert self.monitor.remove(handle)
+        call_count = mock_check.call_count
+        threading.Event().wait(0.1)
+
+        assert mock_check.call_count <= call_count + 1
+        assert not self.monitor.remove(handle)
+
+    def test_AddCheck_ManyChecks_OneThread(self):
+        for _ in range(10):
+            self.monitor.add_check(mock.MagicMock(return_value=False), mock.MagicMock(), interval=0.01)
+
+        monitor_threads = [thread for thread in threading.enumerate() if thread.name == self.monitor.name]
+        assert len(monitor_threads) == 1
+
+    def test_AddCheck_CheckRaises_OtherChecksKeepRunning(self):
+        called = threading.Event()
+        self.monitor.add_check(mock.MagicMock(side_effect=RuntimeError), mock.MagicMock(), interval=0.01)
+        self.monitor.add_check(mock.MagicMock(side_effect=[False, True]), called.set, interval=0.01)
+
+        assert called.wait(self.mock_timeout)
+
+    def test_AddProcess_ProcessExits_CallbackCalledWithPid(self):
+        process = start_sleeping_process(0.2)
+        exited = threading.Event()
+        mock_callback = mock.MagicMock(side_effect=lambda pid: exited.set())
+        try:
+            handle = self.monitor.add_process(process.pid, mock_callback)
+            assert self.monitor.is_watching(handle)
+
+            # the exit is only seen once the child is reaped, like the Popen of a launcher does
+            process.wait(self.mock_timeout)
+            assert exited.wait(self.mock_timeout)
+        finally:
+            process.kill()
+
+        mock_callback.assert_called_once_with(process.pid)
+        assert not self.monitor.is_watching(handle)
+
+    @mock.patch('os.pidfd_open', mock.MagicMock(side_effect=OSError), create=True)
+    def test_AddProcess_NoPidfd_ProcessPolled(self):
+        process = start_sleeping_process(0.2)
+        exited = threading.Event()
+        try:
+            self.monitor.add_process(process.pid, lambda pid: exited.set())
+            process.wait(self.mock_timeout)
+
+            assert exited.wait(self.mock_timeout)
+        finally:
+            process.kill()
+
+    def test_AddProcess_ProcessAlreadyExited_CallbackCalled(self):
+        process = start_sleeping_process(0)
+        process.wait(self.mock_timeout)
+        exited = threading.Event()
+
+        self.monitor.add_process(process.pid, lambda pid: exited.set())
+
+        assert exited.wait(self.mock_timeout)
+
+    def test_Stop_ThingsRegistered_ThreadStopsAndMonitorReusable(self):
+        self.monitor.add_check(mock.MagicMock(return_value=False), mock.MagicMock(), interval=0.01)
+        thread = self.monitor._thread
+        self.monitor.stop()
+
+        assert not thread.is_alive()
+        called = threading.Event()
+        self.monitor.add_check(mock.MagicMock(return_value=True), called.set, interval=0.01)
+        assert called.wait(self.mock_timeout)
+
+    def test_Remove_LastHandle_ThreadStops(self):
+        first_handle = self.monitor.add_check(mock.MagicMock(return_value=False), mock.MagicMock(), interval=0.01)
+        second_handle = self.monitor.add_check(mock.MagicMock(return_value=False), mock.MagicMock(), interval=30)
+        thread = self.monitor._thread
+
+        self.monitor.remove(first_handle)
+        thread.join(0.1)
+        assert thread.is_alive()
+
+        self.monitor.remove(second_handle)
+        thread.join(self.mock_timeout)
+        assert not thread.is_alive()
+        assert self.monitor._thread is None
+
+    def test_AddCheck_LastConditionMet_ThreadStopsAndRestartsOnNextAdd(self):
+        called = threading.Event()
+        self.monitor.add_check(mock.MagicMock(return_value=True), called.set, interval=0.01)
+        thread = self.monitor._thread
+
+        assert called.wait(self.mock_timeout)
+        thread.join(self.mock_timeout)
+        assert not thread.is_alive()
+
+        called.clear()
+        self.monitor.add_check(mock.MagicMock(return_value=True), called.set, interval=0.01)
+        assert called.wait(self.mock_timeout)
+
+
+class TestWatchdogOnMonitor(object):
+    mock_timeout = 5
+
+    def test_StartStop_ConditionNotMet_NoThreadAndNoRaise(self):
+        mock_monitor = mock.MagicMock()
+        under_test = watchdog.Watchdog(lambda: False, monitor=mock_monitor)
+
+        under_test.start()
+        under_test.stop()
+
+        assert under_test._watchdog_thread is None
+        mock_monitor.add_check.assert_called_once_with(under_test._bool_fn, under_test._on_condition, 1)
+        mock_monitor.remove.assert_called_once_with(mock_monitor.add_check.return_value)
+
+    def test_Stop_ConditionMet_CallbackCalledAndRaisesWatchdogError(self):
+        monitor = watchdog.WatchdogMonitor()
+        called = threading.Event()
+        mock_callback = mock.MagicMock(side_effect=lambda caught_watchdog: called.set())
+        under_test = watchdog.Watchdog(lambda: True, interval=0.01, monitor=monitor,
+                                       callback=mock_callback)
+        try:
+            under_test.start()
+            assert called.wait(self.mock_timeout)
+            assert not under_test.is_alive()
+            with pytest.raises(watchdog.WatchdogError):
+                under_test.stop()
+        finally:
+            monitor.stop()
+
+        mock_callback.assert_called_once_with(under_test)
+
+    def test_ProcessExitWatchdog_ProcessExits_CaughtFailure(self):
+        monitor = watchdog.WatchdogMonitor()
+        process = start_sleeping_process(0.2)
+        called = threading.Event()
+        try:
+            under_test = watchdog.ProcessExitWatchdog(process.pid, raise_on_condition=False, monitor=monitor,
+                                                      callback=lambda caught_watchdog: called.set())
+            under_test.start()
+            process.wait(self.mock_timeout)
+
+            assert called.wait(self.mock_timeout)
+            assert under_test.caught_failure
+            under_test.stop()
+        finally:
+            process.kill()
+            monitor.stop()
+
+    def test_ProcessExitWatchdog_ProcessRunning_NoCaughtFailure(self):
+        monitor = watchdog.WatchdogMonitor()
+        process = start_sleeping_process(30)
+        try:
+            under_test = watchdog.ProcessExitWatchdog(process.pid, monitor=monitor)
+            under_test.start()
+            assert under_test.is_alive()
+            under_test.stop()
+
+            assert not under_test.caught_failure
+        finally:
+            process.kill()
+            process.wait()
+            monitor.stop()
+
+    @mock.patch('psutil.Process', mock.MagicMock(side_effect=psutil.NoSuchProcess(11111)))
+    def test_ProcessExitWatchdog_ProcessAlreadyExited_CaughtFailure(self):
+        monitor = watchdog.WatchdogMonitor()
+        called = threading.Event()
+        try:
+            under_test = watchdog.ProcessExitWatchdog(11111, raise_on_condition=False, monitor=monitor,
+                                                      callback=lambda caught_watchdog: called.set())
+            under_test.start()
+
+            assert called.wait(self.mock_timeout)
+            assert under_test.caught_failure
+            under_test.stop()
+        finally:
+            monitor.stop()
+
+    @mock.patch('psutil.Process', mock.MagicMock(side_effect=psutil.NoSuchProcess(11111)))
+    def test_ProcessExitWatchdog_ProcessAlreadyExitedOnThread_BoolFnReturnsTrue(self):
+        under_test = watchdog.ProcessExitWatchdog(11111)
+
+        assert under_test._bool_fn()
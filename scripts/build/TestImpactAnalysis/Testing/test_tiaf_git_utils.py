@@ -0,0 +1,112 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import subprocess
+import pytest
+from git_utils import ChangeListService, parse_name_status
+
+
+def run_git(repo_path, *args):
+    return subprocess.run(["git", "-c", "user.name=tiaf", "-c", "user.email=tiaf@example.com"] + list(args), cwd=repo_path,
+                          check=True, stdout=subprocess.PIPE, encoding="utf-8").stdout.strip()
+
+
+def commit_files(repo_path, files, removed=()):
+    for name, content in files.items():
+        (repo_path / name).write_text(content)
+    for name in removed:
+        (repo_path / name).unlink()
+    run_git(repo_path, "add", "-A")
+    run_git(repo_path, "commit", "-q", "-m", "change")
+    return run_git(repo_path, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    run_git(repo_path, "init", "-q")
+    return repo_path
+
+
+class TestChangeListService():
+
+    def test_parse_name_status(self):
+        # given:
+        diff = "A\tnew.cpp\nM\tchanged file.cpp\nD\tremoved.cpp\nR095\told.h\trenamed.h\nC100\tsource.h\tcopy.h\n"
+
+        # when:
+        change_list = parse_name_status(diff)
+
+        # then:
+        assert change_list == {"createdFiles": ["new.cpp", "renamed.h"],
+                               "updatedFiles": ["changed file.cpp"],
+                               "deletedFiles": ["removed.cpp", "old.h"]}
+
+    def test_change_list_between_commits(self, repo, tmp_path):
+        # given:
+        src_commit = commit_files(repo, {"a.cpp": "a", "b.cpp": "b"})
+        dst_commit = commit_files(repo, {"a.cpp": "changed", "c.cpp": "c"}, removed=["b.cpp"])
+        service = ChangeListService(str(repo), tmp_path / "cache")
+
+        # when:
+        change_list = service.get_change_list(src_commit, dst_commit, False)
+
+        # then:
+        assert change_list == {"createdFiles": ["c.cpp"], "updatedFiles": ["a.cpp"], "deletedFiles": ["b.cpp"]}
+
+    def test_change_list_is_cached(self, repo, tmp_path, mocker):
+        # given:
+        src_commit = commit_files(repo, {"a.cpp": "a"})
+        dst_commit = commit_files(repo, {"a.cpp": "changed"})
+        ChangeListService(str(repo), tmp_path / "cache").get_change_list(src_commit, dst_commit, True)
+        mock_run = mocker.patch("subprocess.run")
+
+        # when:
+        change_list = ChangeListService(str(repo), tmp_path / "cache").get_change_list(src_commit, dst_commit, True)
+
+        # then:
+        assert change_list["updatedFiles"] == ["a.cpp"]
+        mock_run.assert_not_called()
+
+    def test_invalid_commits_raise_and_are_not_cached(self, repo, tmp_path):
+        # given:
+        src_commit = commit_files(repo, {"a.cpp": "a"})
+        service = ChangeListService(str(repo), tmp_path / "cache")
+
+        # when:
+        with pytest.raises(RuntimeError):
+            service.get_change_list(src_commit, "0" * 40, False)
+
+        # then:
+        assert not (tmp_path / "cache").exists()
+
+    def test_commit_relation_of_descendent(self, repo, tmp_path):
+        # given:
+        src_commit = commit_files(repo, {"a.cpp": "a"})
+        commit_files(repo, {"a.cpp": "b"})
+        dst_commit = commit_files(repo, {"a.cpp": "c"})
+        service = ChangeListService(str(repo), tmp_path / "cache")
+
+        # when:
+        relation = service.get_commit_relation(src_commit, dst_commit)
+
+        # then:
+        assert relation == (True, 2)
+        assert service.get_commit_relation(dst_commit, src_commit) == (False, 0)
+
+    def test_commit_relation_of_invalid_commit(self, repo, tmp_path):
+        # given:
+        src_commit = commit_files(repo, {"a.cpp": "a"})
+        service = ChangeListService(str(repo), tmp_path / "cache")
+
+        # when:
+        relation = service.get_commit_relation(src_commit, "0" * 40)
+
+        # then:
+        assert relation == (False, None)
@@ -0,0 +1,189 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import json
+import os
+import pytest
+from persistent_storage import PersistentStorage, PersistentStorageLocal
+
+SUITES = "main"
+COVERAGE_DATA = "source.cpp,TestTarget\n" * 1000
+TEST_RUNS = [{"name": "TestTarget", "result": "passed"}]
+
+
+@pytest.fixture
+def storage_paths(tmp_path):
+    return {
+        'active_workspace': str(tmp_path / "active"),
+        'unpacked_coverage_data_file_path': "coverage.csv",
+        'previous_test_run_data_file_path': "previous_test_runs.json",
+        'historic_workspace': str(tmp_path / "historic"),
+        'historic_data_file_path': "historic_data.json",
+        'temp_workspace': str(tmp_path / "temp")}
+
+
+def create_storage(storage_paths, commit):
+    return PersistentStorageLocal({}, SUITES, commit, storage_paths['active_workspace'], storage_paths['unpacked_coverage_data_file_path'],
+                                  storage_paths['previous_test_run_data_file_path'], storage_paths['historic_workspace'],
+                                  storage_paths['historic_data_file_path'], storage_paths['temp_workspace'])
+
+
+def run_sequence(storage_paths, commit, coverage_data=COVERAGE_DATA, test_runs=TEST_RUNS):
+    storage = create_storage(storage_paths, commit)
+    coverage_file = storage._unpacked_coverage_data_file
+    coverage_file.parent.mkdir(parents=True, exist_ok=True)
+    coverage_file.write_text(coverage_data)
+    storage.update_and_store_historic_data(test_runs)
+    return storage
+
+
+def historic_data_directory(storage_paths):
+    return f"{storage_paths['historic_workspace']}/{SUITES}/{PersistentStorageLocal.HISTORIC_DATA_DIRECTORY}"
+
+
+def read_manifest(storage_paths):
+    with open(f"{historic_data_directory(storage_paths)}/{PersistentStorage.MANIFEST_SECTION}") as manifest_file:
+        return json.load(manifest_file)
+
+
+class TestPersistentStorageLocal():
+
+    def test_no_historic_data(self, storage_paths):
+        # when:
+        storage = create_storage(storage_paths, "commit_a")
+
+        # then:
+        assert not storage.has_historic_data
+        assert storage.last_commit_hash is None
+
+    def test_stored_sections_are_unpacked(self, storage_paths):
+        # given:
+        run_sequence(storage_paths, "commit_a")
+
+        # when:
+        storage = create_storage(storage_paths, "commit_b")
+
+        # then:
+        assert storage.has_historic_data
+        assert storage.last_commit_hash == "commit_a"
+        assert not storage.has_previous_last_commit_hash
+        assert storage._unpacked_coverage_data_file.read_text() == COVERAGE_DATA
+        assert json.loads(storage._previous_test_run_data_file.read_text()) == TEST_RUNS
+
+    def test_unchanged_sections_are_not_stored_again(self, storage_paths, mocker):
+        # given:
+        run_sequence(storage_paths, "commit_a")
+        write_section = mocker.spy(PersistentStorageLocal, "_write_section")
+
+        # when:
+        run_sequence(storage_paths, "commit_b", test_runs=[])
+
+        # then:
+        written_sections = [call.args[1] for call in write_section.call_args_list]
+        assert not any(section.startswith(f"{PersistentStorage.COVERAGE_DATA_SECTION}.") for section in written_sections)
+        assert any(section.startswith(f"{PersistentStorage.PREVIOUS_TEST_RUNS_SECTION}.") for section in written_sections)
+        assert create_storage(storage_paths, "commit_c")._unpacked_coverage_data_file.read_text() == COVERAGE_DATA
+
+    def test_historic_sequences_are_appended(self, storage_paths):
+        # given:
+        run_sequence(storage_paths, "commit_a")
+        run_sequence(storage_paths, "commit_b")
+
+        # when:
+        storage = create_storage(storage_paths, "commit_b")
+
+        # then:
+        sequences_section = read_manifest(storage_paths)[PersistentStorage.SECTIONS_KEY][PersistentStorage.HISTORIC_SEQUENCES_SECTION]
+        sequences_file = f"{historic_data_directory(storage_paths)}/{sequences_section[PersistentStorage.NAME_KEY]}"
+        with open(sequences_file) as sequences:
+            assert [json.loads(line) for line in sequences] == [
+                {"commit": "commit_a", "last_commit_hash": None},
+                {"commit": "commit_b", "last_commit_hash": "commit_a"}]
+        assert storage.is_last_commit_hash_equal_to_this_commit_hash
+        assert storage.has_previous_last_commit_hash
+        assert storage.this_commit_last_commit_hash == "commit_a"
+
+    def test_single_json_historic_data_is_migrated(self, storage_paths, tmp_path):
+        # given:
+        historic_data_file = tmp_path / "historic" / SUITES / storage_paths['historic_data_file_path']
+        historic_data_file.parent.mkdir(parents=True)
+        historic_data_file.write_text(json.dumps({
+            PersistentStorage.LAST_COMMIT_HASH_KEY: "commit_a",
+            PersistentStorage.HISTORIC_SEQUENCES_KEY: {"commit_a": None},
+            PersistentStorage.PREVIOUS_TEST_RUNS_KEY: TEST_RUNS,
+            PersistentStorage.COVERAGE_DATA_KEY: COVERAGE_DATA}))
+        storage = create_storage(storage_paths, "commit_b")
+        assert storage.has_historic_data
+        assert storage.last_commit_hash == "commit_a"
+
+        # when:
+        storage.update_and_store_historic_data(TEST_RUNS)
+        historic_data_file.unlink()
+        storage = create_storage(storage_paths, "commit_b")
+
+        # then:
+        assert storage.has_historic_data
+        assert storage.last_commit_hash == "commit_b"
+        assert storage.this_commit_last_commit_hash == "commit_a"
+        assert storage._unpacked_coverage_data_file.read_text() == COVERAGE_DATA
+
+    def test_section_not_matching_manifest_is_rejected(self, storage_paths, caplog):
+        # given:
+        run_sequence(storage_paths, "commit_a")
+        run_sequence(storage_paths, "commit_b", coverage_data="other.cpp,TestTarget\n")
+        manifest = read_manifest(storage_paths)
+        manifest[PersistentStorage.SECTIONS_KEY][PersistentStorage.COVERAGE_DATA_SECTION][PersistentStorage.DIGEST_KEY] = "0" * 40
+        with open(f"{historic_data_directory(storage_paths)}/{PersistentStorage.MANIFEST_SECTION}", "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        # when:
+        storage = create_storage(storage_paths, "commit_c")
+
+        # then:
+        assert not storage.has_historic_data
+        assert f"The historic data section '{PersistentStorage.COVERAGE_DATA_SECTION}' does not match the manifest." in caplog.messages
+
+    def test_interrupted_store_keeps_stored_historic_data(self, storage_paths, mocker):
+        # given:
+        run_sequence(storage_paths, "commit_a")
+        write_section_data = PersistentStorageLocal._write_section_data
+
+        def write_section_data_without_manifest(storage, section, data):
+            if section == PersistentStorage.MANIFEST_SECTION:
+                raise OSError("Interrupted")
+            write_section_data(storage, section, data)
+
+        mocker.patch.object(PersistentStorageLocal, "_write_section_data", write_section_data_without_manifest)
+        run_sequence(storage_paths, "commit_b", coverage_data="other.cpp,TestTarget\n", test_runs=[])
+        mocker.stopall()
+
+        # when:
+        storage = create_storage(storage_paths, "commit_b")
+
+        # then:
+        assert storage.has_historic_data
+        assert storage.last_commit_hash == "commit_a"
+        assert not storage.has_previous_last_commit_hash
+        assert storage._unpacked_coverage_data_file.read_text() == COVERAGE_DATA
+        assert json.loads(storage._previous_test_run_data_file.read_text()) == TEST_RUNS
+
+    def test_unreferenced_sections_are_removed(self, storage_paths):
+        # given:
+        run_sequence(storage_paths, "commit_a", coverage_data="a.cpp,TestTarget\n")
+        run_sequence(storage_paths, "commit_b", coverage_data="b.cpp,TestTarget\n")
+        previous_manifest = read_manifest(storage_paths)
+
+        # when:
+        run_sequence(storage_paths, "commit_c", coverage_data="c.cpp,TestTarget\n")
+
+        # then:
+        referenced_sections = {PersistentStorage.MANIFEST_SECTION}
+        for manifest in [previous_manifest, read_manifest(storage_paths)]:
+            referenced_sections.update(section[PersistentStorage.NAME_KEY] for section in manifest[PersistentStorage.SECTIONS_KEY].values())
+        assert set(os.listdir(historic_data_directory(storage_paths))) == referenced_sections
+        assert create_storage(storage_paths, "commit_d")._unpacked_coverage_data_file.read_text() == "c.cpp,TestTarget\n"
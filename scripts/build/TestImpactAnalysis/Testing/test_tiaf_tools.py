@@ -12,6 +12,7 @@ from tiaf_tools import run
 import os
 import json
 from pathlib import Path
+from persistent_storage import PersistentStorage, PersistentStorageLocal
 logging = getLogger("tiaf_tools")
 
 class TestTIAFToolsLocal():
@@ -95,6 +96,29 @@ class TestTIAFToolsLocalJSON():
         assert test_string in caplog.messages
         os.startfile.assert_called_once_with(os.path.split(full_address)[0])
 
+    def test_local_full_address_action_read_historic_data_sections(self, caplog, tmp_path_factory):
+        # given:
+        workspace = tmp_path_factory.mktemp("test")
+        storage = PersistentStorageLocal({}, "main", "commit_a", str(workspace / "active"), "coverage.csv", "previous_test_runs.json",
+                                         str(workspace / "historic"), "historic_data.json", str(workspace / "temp"))
+        storage._unpacked_coverage_data_file.parent.mkdir(parents=True)
+        storage._unpacked_coverage_data_file.write_text("source.cpp,TestTarget\n")
+        storage.update_and_store_historic_data([{"name": "TestTarget"}])
+        full_address = workspace / "historic" / "main" / PersistentStorage.HISTORIC_DATA_DIRECTORY / PersistentStorage.MANIFEST_SECTION
+        file_out = tmp_path_factory.mktemp("test")
+        args = {'full_address' : full_address, 'action': 'read', 'file_out': file_out, 'file_type' : 'json'}
+
+        # when:
+        run(args)
+
+        # then:
+        historic_data = json.loads((file_out / "historic_data.json").read_text())
+        assert historic_data == {
+            PersistentStorage.LAST_COMMIT_HASH_KEY: "commit_a",
+            PersistentStorage.HISTORIC_SEQUENCES_KEY: {"commit_a": None},
+            PersistentStorage.COVERAGE_DATA_KEY: "source.cpp,TestTarget\n",
+            PersistentStorage.PREVIOUS_TEST_RUNS_KEY: [{"name": "TestTarget"}]}
+
     def test_local_full_address_action_delete(self, caplog, tmp_path_factory):
         # given:
         fn = tmp_path_factory.mktemp("test") / "test_file.txt"
@@ -6,9 +6,19 @@
 #
 #
 
+import hashlib
+import json
+import os
+import re
 import subprocess
 import git
 import pathlib
+from tiaf_logger import get_logger
+
+logger = get_logger(__file__)
+
+# Matches the lines of "git diff --name-status" of added, modified, deleted and renamed files, with the new path of renames
+NAME_STATUS_PATTERN = re.compile(r"^(?P<status>[AMD]|R[0-9]+)\t(?P<path>[^\t\n]+)(?:\t(?P<new_path>[^\t\n]+))?$", re.MULTILINE)
 
 # Basic representation of a git repository
 class Repo:
@@ -87,3 +97,129 @@ class Repo:
             return None
         commits = self._repo.iter_commits(src_commit_hash + '..' + dst_commit_hash)
         return len(list(commits))
+
+
+def parse_name_status(diff: str):
+    """
+    Parses the output of "git diff --name-status" into a change list.
+
+    @param diff: The output of git diff.
+    @return:     The change list, with the "createdFiles", "updatedFiles" and "deletedFiles" keys.
+    """
+
+    change_list = {"createdFiles": [], "updatedFiles": [], "deletedFiles": []}
+    for match in NAME_STATUS_PATTERN.finditer(diff):
+        status = match["status"][0]
+        if status == 'R':
+            # Treat renames as a deletion and an addition
+            change_list["deletedFiles"].append(match["path"])
+            change_list["createdFiles"].append(match["new_path"])
+        elif status == 'A':
+            change_list["createdFiles"].append(match["path"])
+        elif status == 'M':
+            change_list["updatedFiles"].append(match["path"])
+        else:
+            change_list["deletedFiles"].append(match["path"])
+    return change_list
+
+class ChangeListService:
+    """
+    Generates the change lists and commit relations of pairs of commits, caching them in a directory so that builds of
+    the same commits (i.e. pull request builds triggered again) don't run git again.
+    Commits are expected to be hashes, as the cached results of branch names would go stale.
+    """
+
+    def __init__(self, repo_path: str, cache_path: pathlib.Path):
+        """
+        @param repo_path:  The path to the git repository.
+        @param cache_path: The path to the directory of the cached results, created when needed.
+        """
+
+        self._repo_path = repo_path
+        self._cache_path = pathlib.Path(cache_path)
+
+    def get_commit_relation(self, src_commit_hash: str, dst_commit_hash: str):
+        """
+        Determines whether dst_commit descends from src_commit and the number of commits between them, with one git call.
+
+        @param src_commit_hash: The hash for the source commit.
+        @param dst_commit_hash: The hash for the destination commit.
+        @return:                A tuple of whether dst_commit descends from src_commit, and of the distance between the
+                                commits (None if either commit is invalid).
+        """
+
+        if not src_commit_hash or not dst_commit_hash:
+            return False, None
+
+        def compute():
+            # Counts the commits only reachable from src (none when src is an ancestor of dst) and only reachable from dst
+            result = self._run_git(["rev-list", "--left-right", "--count", f"{src_commit_hash}...{dst_commit_hash}"])
+            if result.returncode != 0:
+                return None
+            src_only, dst_only = (int(count) for count in result.stdout.split())
+            return {"is_descendent": src_only == 0, "distance": dst_only}
+
+        relation = self._get_cached("relation", src_commit_hash, dst_commit_hash, compute)
+        if relation is None:
+            return False, None
+        return relation["is_descendent"], relation["distance"]
+
+    def get_change_list(self, src_commit_hash: str, dst_commit_hash: str, multi_branch: bool):
+        """
+        Generates the change list of the files added, modified, deleted or renamed between src_commit and dst_commit.
+
+        @param src_commit_hash: The hash for the source commit.
+        @param dst_commit_hash: The hash for the destination commit.
+        @param multi_branch:    The two commits are on different branches so view the changes on the
+                                branch containing and up to dst_commit, starting at a common ancestor of both.
+        @return:                The change list, with the "createdFiles", "updatedFiles" and "deletedFiles" keys.
+        """
+
+        def compute():
+            args = ["diff", "--name-status"]
+            if multi_branch:
+                args.append(f"{src_commit_hash}...{dst_commit_hash}")
+            else:
+                args.append(src_commit_hash)
+                args.append(dst_commit_hash)
+            result = self._run_git(args)
+            if result.returncode != 0:
+                return None
+            return parse_name_status(result.stdout)
+
+        kind = "diff.multi_branch" if multi_branch else "diff"
+        change_list = self._get_cached(kind, src_commit_hash, dst_commit_hash, compute)
+        if change_list is None:
+            raise RuntimeError(f"Source commit '{src_commit_hash}' and/or destination commit '{dst_commit_hash}' are invalid")
+        return change_list
+
+    def _run_git(self, args: list):
+        return subprocess.run(["git"] + args, cwd=self._repo_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              encoding="utf-8")
+
+    def _get_cached(self, kind: str, src_commit_hash: str, dst_commit_hash: str, compute):
+        """
+        Returns the cached result of the kind for the two commits, computing and caching it if there is none.
+        Failures (None results) aren't cached.
+        """
+
+        key = hashlib.sha1(f"{src_commit_hash}:{dst_commit_hash}".encode()).hexdigest()
+        cache_file = self._cache_path.joinpath(f"{key}.{kind}.json")
+        try:
+            with open(cache_file, "r") as cache_data:
+                return json.load(cache_data)
+        except (EnvironmentError, json.JSONDecodeError):
+            pass
+
+        result = compute()
+        if result is not None:
+            try:
+                self._cache_path.mkdir(parents=True, exist_ok=True)
+                temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(temp_file, "w") as cache_data:
+                    json.dump(result, cache_data)
+                os.replace(temp_file, cache_file)
+            except EnvironmentError as e:
+                # The cache only saves git calls, the result is still valid
+                logger.warning(f"Could not cache the git results in '{cache_file}': {e}")
+        return result
@@ -7,68 +7,12 @@
 #
 
 import datetime
-import json
-import socket
+from ly_test_tools.mars.filebeat_client import FilebeatClient, FilebeatExn
 from tiaf_logger import get_logger
 import tiaf_report_constants as constants
 
 logger = get_logger(__file__)
 
-class FilebeatExn(Exception):
-    pass
-
-class FilebeatClient(object):
-    def __init__(self, host="127.0.0.1", port=9000, timeout=20):
-        self._filebeat_host = host
-        self._filebeat_port = port
-        self._socket_timeout = timeout
-        self._socket = None
-
-        self._open_socket()
-
-    def send_event(self, payload, index, timestamp=None, pipeline="filebeat"):
-        if not timestamp:
-            timestamp = datetime.datetime.utcnow().timestamp()
-
-        event = {
-            "index": index,
-            "timestamp": timestamp,
-            "pipeline": pipeline,
-            "payload": json.dumps(payload)
-        }
-
-        # Serialise event, add new line and encode as UTF-8 before sending to Filebeat.
-        data = json.dumps(event, sort_keys=True) + "\n"
-        data = data.encode()
-
-        #print(f"-> {data}")
-        self._send_data(data)
-
-    def _open_socket(self):
-        logger.info(f"Connecting to Filebeat on {self._filebeat_host}:{self._filebeat_port}")
-
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._socket.settimeout(self._socket_timeout)
-
-        try:
-            self._socket.connect((self._filebeat_host, self._filebeat_port))
-        except (ConnectionError, socket.timeout):
-            raise FilebeatExn("Failed to connect to Filebeat") from None
-
-    def _send_data(self, data):
-        total_sent = 0
-
-        while total_sent < len(data):
-            try:
-                sent = self._socket.send(data[total_sent:])
-            except BrokenPipeError:
-                logger.error("Filebeat socket closed by peer")
-                self._socket.close()
-                self._open_socket()
-                total_sent = 0
-            else:
-                total_sent = total_sent + sent
-
 def format_timestamp(timestamp: float):
     """
     Formats the given floating point timestamp into "yyyy-MM-dd'T'HH:mm:ss.SSSXX" format.
@@ -362,24 +306,27 @@ def transmit_report_to_mars(mars_index_prefix: str, tiaf_result: dict, driver_ar
     """
     
     try:
-        filebeat = FilebeatClient("localhost", 9000, 60)
-
-        # T0 is the current timestamp that the report timings will be offset from
-        t0_timestamp = datetime.datetime.now().timestamp()
-
-        # Generate and transmit the MARS job document
-        mars_job = generate_mars_job(tiaf_result, driver_args, build_number)
-        filebeat.send_event(mars_job, f"{mars_index_prefix}.tiaf.job")
-
-        if tiaf_result[constants.REPORT_KEY]:
-            # Generate and transmit the MARS sequence document
-            mars_sequence = generate_mars_sequence(tiaf_result[constants.REPORT_KEY], mars_job, tiaf_result[constants.CHANGE_LIST_KEY], t0_timestamp)
-            filebeat.send_event(mars_sequence, f"{mars_index_prefix}.tiaf.sequence")
-            
-            # Generate and transmit the MARS test target documents
-            mars_test_targets = generate_mars_test_targets(tiaf_result[constants.REPORT_KEY], mars_job, t0_timestamp)
-            for mars_test_target in mars_test_targets:
-                filebeat.send_event(mars_test_target, f"{mars_index_prefix}.tiaf.test_target")
+        filebeat = FilebeatClient(logger, "localhost", 9000, 60)
+        try:
+            # T0 is the current timestamp that the report timings will be offset from
+            t0_timestamp = datetime.datetime.now().timestamp()
+
+            # Generate and transmit the MARS job document
+            mars_job = generate_mars_job(tiaf_result, driver_args, build_number)
+            filebeat.send_event(mars_job, f"{mars_index_prefix}.tiaf.job")
+
+            if tiaf_result[constants.REPORT_KEY]:
+                # Generate and transmit the MARS sequence document
+                mars_sequence = generate_mars_sequence(tiaf_result[constants.REPORT_KEY], mars_job, tiaf_result[constants.CHANGE_LIST_KEY], t0_timestamp)
+                filebeat.send_event(mars_sequence, f"{mars_index_prefix}.tiaf.sequence")
+
+                # Generate and transmit the MARS test target documents, which are batched by the shipper
+                mars_test_targets = generate_mars_test_targets(tiaf_result[constants.REPORT_KEY], mars_job, t0_timestamp)
+                for mars_test_target in mars_test_targets:
+                    filebeat.send_event(mars_test_target, f"{mars_index_prefix}.tiaf.test_target")
+        finally:
+            # Delivers the events still queued before the driver exits
+            filebeat.close()
     except FilebeatExn as e:
         logger.error(e)
     except KeyError as e:
@@ -6,14 +6,149 @@
 #
 #
 
+import hashlib
 import json
+import os
 import pathlib
+import tempfile
+import uuid
+import zlib
 from abc import ABC, abstractmethod
+from contextlib import closing
 from tiaf_logger import get_logger
 
 logger = get_logger(__file__)
 
+# Size of the chunks the historic data sections are streamed, hashed and compressed in
+SECTION_CHUNK_SIZE = 1024 * 1024
+
+def _hash_file(file_path: pathlib.Path):
+    """
+    Hashes the content of a file in chunks.
+
+    @param file_path: The file to hash.
+
+    @return: The SHA-1 hex digest of the file content.
+    """
+
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(SECTION_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _compress_file(source_path: pathlib.Path, target_path: pathlib.Path):
+    """
+    Compresses a file into another in chunks, without holding either in memory.
+
+    @param source_path: The file to compress.
+    @param target_path: The compressed file to write.
+    """
+
+    compressor = zlib.compressobj()
+    with open(source_path, "rb") as source, open(target_path, "wb") as target:
+        for chunk in iter(lambda: source.read(SECTION_CHUNK_SIZE), b""):
+            target.write(compressor.compress(chunk))
+        target.write(compressor.flush())
+
+def _decompress_stream(source, target_path: pathlib.Path):
+    """
+    Decompresses a stream into a file in chunks, without holding either in memory.
+
+    @param source: The readable binary stream of compressed data.
+    @param target_path: The decompressed file to write.
+
+    @return: The SHA-1 hex digest of the decompressed data.
+    """
+
+    decompressor = zlib.decompressobj()
+    digest = hashlib.sha1()
+    with open(target_path, "wb") as target:
+        for chunk in iter(lambda: source.read(SECTION_CHUNK_SIZE), b""):
+            data = decompressor.decompress(chunk)
+            digest.update(data)
+            target.write(data)
+        data = decompressor.flush()
+        digest.update(data)
+        target.write(data)
+    if not decompressor.eof:
+        raise zlib.error("The compressed data is truncated")
+    return digest.hexdigest()
+
+def read_historic_data_manifest(open_section):
+    """
+    Reads the manifest of historic data stored as sections.
+
+    @param open_section: A function opening a stored section by name, which returns a readable binary stream or None if the
+    section is not stored.
+
+    @return: The manifest, or None if the historic data is not stored as sections.
+    """
+
+    manifest_stream = open_section(PersistentStorage.MANIFEST_SECTION)
+    if manifest_stream is None:
+        return None
+    with closing(manifest_stream):
+        manifest = json.loads(manifest_stream.read())
+    if manifest.get(PersistentStorage.FORMAT_VERSION_KEY) != PersistentStorage.FORMAT_VERSION:
+        raise ValueError(f"The historic data format version '{manifest.get(PersistentStorage.FORMAT_VERSION_KEY)}' is not supported")
+    return manifest
+
+def read_historic_sequences(open_section, manifest: dict):
+    """
+    Reads the historic sequences of historic data stored as sections, up to the size recorded in the manifest.
+
+    @param open_section: A function opening a stored section by name, as for read_historic_data_manifest.
+    @param manifest: The manifest of the historic data.
+
+    @return: The last commit hash used by the sequence of each commit, later sequences of a commit take precedence.
+    """
+
+    section = manifest[PersistentStorage.SECTIONS_KEY][PersistentStorage.HISTORIC_SEQUENCES_SECTION]
+    historic_sequences = {}
+    sequences_stream = open_section(section[PersistentStorage.NAME_KEY])
+    if sequences_stream is None:
+        raise KeyError(PersistentStorage.HISTORIC_SEQUENCES_SECTION)
+    with closing(sequences_stream):
+        # Lines appended by a store that didn't complete are past the recorded size and are not read
+        for line in sequences_stream.read(section[PersistentStorage.SIZE_KEY]).decode("UTF-8").splitlines():
+            if line.strip():
+                sequence = json.loads(line)
+                historic_sequences[sequence[PersistentStorage.COMMIT_KEY]] = sequence[PersistentStorage.LAST_COMMIT_HASH_KEY]
+    return historic_sequences
+
+def unpack_historic_data_section(open_section, manifest: dict, section: str, target_path: pathlib.Path):
+    """
+    Decompresses a section of historic data stored as sections into a file and checks it against the manifest.
+
+    @param open_section: A function opening a stored section by name, as for read_historic_data_manifest.
+    @param manifest: The manifest of the historic data.
+    @param section: The section to unpack, i.e. PersistentStorage.COVERAGE_DATA_SECTION.
+    @param target_path: The file to write the section content to.
+
+    @return: True if the section content matches the digest in the manifest, otherwise False.
+    """
+
+    section_entry = manifest[PersistentStorage.SECTIONS_KEY][section]
+    section_stream = open_section(section_entry[PersistentStorage.NAME_KEY])
+    if section_stream is None:
+        raise KeyError(section)
+    with closing(section_stream):
+        return _decompress_stream(section_stream, target_path) == section_entry[PersistentStorage.DIGEST_KEY]
+
 # Abstraction for the persistent storage required by TIAF to store and retrieve the branch coverage data and other meta-data
+#
+# The historic data is stored as separate sections in the HistoricData directory of the storage location:
+#   manifest.json                        - the last commit hash and the stored name of each section, written last
+#   coverage_data.<digest>.zlib          - the coverage data file, compressed as is
+#   previous_test_runs.<digest>.zlib     - the test runs of the last sequence, compressed
+#   historic_sequences.<unique id>.jsonl - one {"commit": ..., "last_commit_hash": ...} line appended per sequence
+# Sections are streamed to and from disk in chunks, and the ones whose digest didn't change are not written again.
+# A stored section is never replaced, new content is written under a new name and the manifest is only replaced once
+# all the sections it refers to are stored, so the stored historic data stays consistent if a store is interrupted. The
+# manifest records how much of the historic sequences it covers, and lines appended past that are not read. Sections no
+# longer referred to by the new or the previous manifest are removed once the new manifest is stored.
+# Historic data stored as a single JSON document by previous versions is still read, and replaced by sections on store.
 class PersistentStorage(ABC):
 
     COMMON_CONFIG_KEY = "common"
@@ -29,6 +164,18 @@ class PersistentStorage(ABC):
     PREVIOUS_TEST_RUNS_KEY = "previous_test_runs"
     RUNTIME_ARTIFACT_DIRECTORY = "RuntimeArtifacts"
     RUNTIME_COVERAGE_DIRECTORY = "RuntimeCoverage"
+    HISTORIC_DATA_DIRECTORY = "HistoricData"
+    MANIFEST_SECTION = "manifest.json"
+    COVERAGE_DATA_SECTION = "coverage_data"
+    PREVIOUS_TEST_RUNS_SECTION = "previous_test_runs"
+    HISTORIC_SEQUENCES_SECTION = "historic_sequences"
+    FORMAT_VERSION_KEY = "format_version"
+    SECTIONS_KEY = "sections"
+    NAME_KEY = "name"
+    DIGEST_KEY = "digest"
+    SIZE_KEY = "size"
+    COMMIT_KEY = "commit"
+    FORMAT_VERSION = 3
 
     def __init__(self, config: dict, suites_string: str, commit: str, active_workspace: str, unpacked_coverage_data_file_path: str, previous_test_run_data_file_path: str, temp_workspace: str):
         """
@@ -47,6 +194,8 @@ class PersistentStorage(ABC):
         self._this_commit_hash = commit
         self._this_commit_hash_last_commit_hash = None
         self._historic_data = None
+        self._historic_sequences = {}
+        self._manifest = None
         logger.info(f"Attempting to access persistent storage for the commit '{self._this_commit_hash}' for suites '{self._suites_string}'")
 
         self._temp_workspace = pathlib.Path(temp_workspace)
@@ -73,20 +222,8 @@ class PersistentStorage(ABC):
             logger.info(f"Last commit hash '{self._last_commit_hash}' found.")
 
             # Last commit hash for the sequence that was run for this commit previously (if any)
-            if self.HISTORIC_SEQUENCES_KEY in self._historic_data:
-                if self._this_commit_hash in self._historic_data[self.HISTORIC_SEQUENCES_KEY]:
-                    # 'None' is a valid value for the previously used last commit hash if there was no coverage data at that time
-                    self._this_commit_hash_last_commit_hash = self._historic_data[self.HISTORIC_SEQUENCES_KEY][self._this_commit_hash]
-                    self._has_previous_last_commit_hash = self._this_commit_hash_last_commit_hash is not None
-
-                    if self._has_previous_last_commit_hash:
-                        logger.info(f"Last commit hash '{self._this_commit_hash_last_commit_hash}' was used previously for the commit '{self._last_commit_hash}'.")
-                    else:
-                        logger.info(f"Prior sequence data found for this commit but it is empty (there was no coverage data available at that time).")
-                else:
-                    logger.info(f"No prior sequence data found for commit '{self._this_commit_hash}', this is the first sequence for this commit.")
-            else:
-                logger.info(f"No prior sequence data found for any commits.")
+            self._historic_sequences = self._historic_data.get(self.HISTORIC_SEQUENCES_KEY, {})
+            self._apply_historic_sequences()
 
             # Test runs for the previous sequence associated with the last commit hash
             previous_test_runs = self._historic_data.get(self.PREVIOUS_TEST_RUNS_KEY, None)
@@ -118,53 +255,178 @@ class PersistentStorage(ABC):
         except EnvironmentError as e:
             logger.error(f"There was a problem the coverage data file '{self._unpacked_coverage_data_file}': '{e}'.")
 
-    def _pack_historic_data(self, test_runs: list):
+    def _apply_historic_sequences(self):
+        """
+        Looks up the last commit hash used by the sequence previously run for this commit (if any) in the historic sequences.
+        """
+
+        if self._historic_sequences:
+            if self._this_commit_hash in self._historic_sequences:
+                # 'None' is a valid value for the previously used last commit hash if there was no coverage data at that time
+                self._this_commit_hash_last_commit_hash = self._historic_sequences[self._this_commit_hash]
+                self._has_previous_last_commit_hash = self._this_commit_hash_last_commit_hash is not None
+
+                if self._has_previous_last_commit_hash:
+                    logger.info(f"Last commit hash '{self._this_commit_hash_last_commit_hash}' was used previously for the commit '{self._last_commit_hash}'.")
+                else:
+                    logger.info(f"Prior sequence data found for this commit but it is empty (there was no coverage data available at that time).")
+            else:
+                logger.info(f"No prior sequence data found for commit '{self._this_commit_hash}', this is the first sequence for this commit.")
+        else:
+            logger.info(f"No prior sequence data found for any commits.")
+
+    def _retrieve_historic_data_sections(self):
+        """
+        Retrieves the historic data sections and unpacks them into the appropriate memory and disk locations, streaming the
+        coverage data and previous test runs straight to their files.
+
+        @return: True if the historic data is stored as sections, False if there is no manifest, in which case there may
+        be historic data stored as a single JSON document instead.
+        """
+
+        self._has_historic_data = False
+        self._has_previous_last_commit_hash = False
+
+        try:
+            self._manifest = read_historic_data_manifest(self._open_section)
+            if self._manifest is None:
+                return False
+
+            # Last commit hash for this branch
+            self._last_commit_hash = self._manifest[self.LAST_COMMIT_HASH_KEY]
+            logger.info(f"Last commit hash '{self._last_commit_hash}' found.")
+
+            # Last commit hash for the sequence that was run for this commit previously (if any)
+            self._historic_sequences = read_historic_sequences(self._open_section, self._manifest)
+            self._apply_historic_sequences()
+
+            # Create the active workspace directory for the unpacked historic data files so they are accessible by the runtime
+            self._active_workspace.mkdir(exist_ok=True, parents=True)
+
+            # Coverage and previous test runs files, checked against the manifest
+            for section, file_path in [(self.COVERAGE_DATA_SECTION, self._unpacked_coverage_data_file),
+                                       (self.PREVIOUS_TEST_RUNS_SECTION, self._previous_test_run_data_file)]:
+                logger.info(f"Writing section '{section}' to '{file_path}'.")
+                if not unpack_historic_data_section(self._open_section, self._manifest, section, file_path):
+                    logger.error(f"The historic data section '{section}' does not match the manifest.")
+                    self._manifest = None
+                    return True
+
+            self._has_historic_data = True
+        except json.JSONDecodeError:
+            logger.error("The historic data does not contain valid JSON.")
+            self._manifest = None
+        except ValueError as e:
+            logger.error(f"{e}.")
+            self._manifest = None
+        except KeyError as e:
+            logger.error(f"The historic data does not contain the key {str(e)}.")
+            self._manifest = None
+        except zlib.error as e:
+            logger.error(f"The historic data could not be decompressed: '{e}'.")
+            self._manifest = None
+        except EnvironmentError as e:
+            logger.error(f"There was a problem unpacking the historic data to '{self._active_workspace}': '{e}'.")
+            self._manifest = None
+
+        return True
+
+    def _store_historic_data_sections(self, test_runs: list):
         """
-        Packs the current historic data into a JSON file for serializing.
+        Stores the sections of the historic data which changed under new names, appends the sequence that just completed to
+        the historic sequences, stores the manifest and then removes the sections no longer referred to.
 
         @param test_runs: The test runs for the sequence that just completed.
 
-        @return: The packed historic data in JSON format.
+        @return: True if the historic data was stored, otherwise False.
         """
 
+        if not self._unpacked_coverage_data_file.is_file():
+            logger.info(f"No coverage data exists at location '{self._unpacked_coverage_data_file}'.")
+            return False
+
+        previous_sections = self._manifest[self.SECTIONS_KEY] if self._manifest else {}
+        sections = {}
         try:
-            # Attempt to read the existing coverage data
-            if self._unpacked_coverage_data_file.is_file():
-                if not self._historic_data:
-                    self._historic_data = {}
-
-                # Last commit hash for this branch
-                self._historic_data[self.LAST_COMMIT_HASH_KEY] = self._this_commit_hash
-
-                # Last commit hash for this commit
-                if not self.HISTORIC_SEQUENCES_KEY in self._historic_data:
-                    self._historic_data[self.HISTORIC_SEQUENCES_KEY] = {}
-                self._historic_data[self.HISTORIC_SEQUENCES_KEY][self._this_commit_hash] = self._last_commit_hash
-
-                # Test runs for this completed sequence
-                self._historic_data[self.PREVIOUS_TEST_RUNS_KEY] = test_runs
-
-                # Coverage data for this branch
-                with open(self._unpacked_coverage_data_file, "r") as coverage_data:
-                    self._historic_data[self.COVERAGE_DATA_KEY] = coverage_data.read()
-                    return json.dumps(self._historic_data)
+            self._temp_workspace.mkdir(exist_ok=True, parents=True)
+            with tempfile.TemporaryDirectory(dir=self._temp_workspace) as temp_directory:
+                temp_directory = pathlib.Path(temp_directory)
+                test_runs_file = temp_directory.joinpath("previous_test_runs.json")
+                with open(test_runs_file, "w", newline='\n') as test_runs_data:
+                    json.dump(test_runs, test_runs_data)
+
+                for section, file_path in [(self.COVERAGE_DATA_SECTION, self._unpacked_coverage_data_file),
+                                           (self.PREVIOUS_TEST_RUNS_SECTION, test_runs_file)]:
+                    digest = _hash_file(file_path)
+                    # The section is named by its digest so a stored section is never replaced
+                    sections[section] = {self.NAME_KEY: f"{section}.{digest}.zlib", self.DIGEST_KEY: digest}
+                    if sections[section] == previous_sections.get(section):
+                        logger.info(f"The historic data section '{section}' is unchanged and will not be stored again.")
+                        continue
+                    compressed_file = temp_directory.joinpath(sections[section][self.NAME_KEY])
+                    _compress_file(file_path, compressed_file)
+                    logger.info(f"Storing historic data section '{section}' ({os.path.getsize(compressed_file)} bytes)...")
+                    self._write_section(sections[section][self.NAME_KEY], compressed_file)
+
+            # Last commit hash for this commit, the whole section is written under a new name when it isn't known to be stored yet
+            sequence = {self.COMMIT_KEY: self._this_commit_hash, self.LAST_COMMIT_HASH_KEY: self._last_commit_hash}
+            previous_sequences_section = previous_sections.get(self.HISTORIC_SEQUENCES_SECTION)
+            if not previous_sequences_section:
+                self._historic_sequences[self._this_commit_hash] = self._last_commit_hash
+                sequences_data = "".join(
+                    json.dumps({self.COMMIT_KEY: commit, self.LAST_COMMIT_HASH_KEY: last_commit_hash}) + "\n"
+                    for commit, last_commit_hash in self._historic_sequences.items()).encode("UTF-8")
+                sections[self.HISTORIC_SEQUENCES_SECTION] = {self.NAME_KEY: f"{self.HISTORIC_SEQUENCES_SECTION}.{uuid.uuid4().hex}.jsonl",
+                                                             self.SIZE_KEY: len(sequences_data)}
+                self._write_section_data(sections[self.HISTORIC_SEQUENCES_SECTION][self.NAME_KEY], sequences_data)
+            elif self._this_commit_hash not in self._historic_sequences or self._historic_sequences[self._this_commit_hash] != self._last_commit_hash:
+                self._historic_sequences[self._this_commit_hash] = self._last_commit_hash
+                sequence_data = (json.dumps(sequence) + "\n").encode("UTF-8")
+                self._append_section_data(previous_sequences_section[self.NAME_KEY], sequence_data, previous_sequences_section[self.SIZE_KEY])
+                sections[self.HISTORIC_SEQUENCES_SECTION] = {self.NAME_KEY: previous_sequences_section[self.NAME_KEY],
+                                                             self.SIZE_KEY: previous_sequences_section[self.SIZE_KEY] + len(sequence_data)}
             else:
-                logger.info(f"No coverage data exists at location '{self._unpacked_coverage_data_file}'.")
+                sections[self.HISTORIC_SEQUENCES_SECTION] = previous_sequences_section
+
+            # The manifest is written last, so the sections it refers to are always stored
+            manifest = {self.FORMAT_VERSION_KEY: self.FORMAT_VERSION,
+                        self.LAST_COMMIT_HASH_KEY: self._this_commit_hash,
+                        self.SECTIONS_KEY: sections}
+            self._write_section_data(self.MANIFEST_SECTION, json.dumps(manifest).encode("UTF-8"))
         except EnvironmentError as e:
-            logger.error(f"There was a problem the coverage data file '{self._unpacked_coverage_data_file}': '{e}'.")
+            logger.error(f"There was a problem storing the historic data: '{e}'.")
+            return False
         except TypeError:
             logger.error("The historic data could not be serialized to valid JSON.")
-        
-        return None
+            return False
 
-    @abstractmethod
-    def _store_historic_data(self, historic_data_json: str):
+        previous_manifest = self._manifest
+        self._manifest = manifest
+        self._remove_unreferenced_sections(previous_manifest)
+        return True
+
+    def _remove_unreferenced_sections(self, previous_manifest: dict):
         """
-        Stores the historic data in the designated persistent storage location.
+        Removes the stored sections which are referred to by neither the manifest nor the previous manifest, i.e. the
+        sections of older sequences and the ones left by stores that didn't complete. The sections of the previous manifest
+        are kept for the sequences which read it before it was replaced.
 
-        @param historic_data_json: The historic data (in JSON format) to be stored in persistent storage.
+        @param previous_manifest: The manifest replaced by the current one, or None.
         """
-        pass
+
+        referenced_sections = {self.MANIFEST_SECTION}
+        for manifest in [self._manifest, previous_manifest]:
+            if manifest:
+                referenced_sections.update(section[self.NAME_KEY] for section in manifest[self.SECTIONS_KEY].values())
+
+        section_prefixes = tuple(f"{section}." for section in [self.COVERAGE_DATA_SECTION, self.PREVIOUS_TEST_RUNS_SECTION, self.HISTORIC_SEQUENCES_SECTION])
+        try:
+            for section in self._list_sections():
+                if section.startswith(section_prefixes) and section not in referenced_sections:
+                    logger.info(f"Removing unreferenced historic data section '{section}'.")
+                    self._delete_section(section)
+        except EnvironmentError as e:
+            logger.warning(f"There was a problem removing the unreferenced historic data sections, they will be removed by a later store: '{e}'.")
 
     def update_and_store_historic_data(self, test_runs: list):
         """
@@ -173,14 +435,82 @@ class PersistentStorage(ABC):
         @param test_runs: The test runs for the sequence that just completed.
         """
 
-        historic_data_json = self._pack_historic_data(test_runs)
-        if historic_data_json:
-            logger.info(f"Attempting to store historic data with new last commit hash '{self._this_commit_hash}'...")
-            self._store_historic_data(historic_data_json)
+        logger.info(f"Attempting to store historic data with new last commit hash '{self._this_commit_hash}'...")
+        if self._store_historic_data_sections(test_runs):
             logger.info("The historic data was successfully stored.")
-
         else:
             logger.info("The historic data could not be successfully stored.")
+
+    @abstractmethod
+    def _open_section(self, section: str):
+        """
+        Opens a historic data section stored in the designated persistent storage location for reading.
+
+        @param section: The name of the section.
+
+        @return: A readable binary stream of the section, closed by the caller, or None if it is not stored.
+        """
+        pass
+
+    @abstractmethod
+    def _write_section(self, section: str, source_file: pathlib.Path):
+        """
+        Stores a historic data section in the designated persistent storage location, replacing the stored section.
+        The source file may be moved by this call.
+
+        @param section: The name of the section.
+        @param source_file: The file with the content of the section.
+        """
+        pass
+
+    @abstractmethod
+    def _list_sections(self):
+        """
+        Lists the historic data sections stored in the designated persistent storage location.
+
+        @return: The names of the stored sections.
+        """
+        pass
+
+    @abstractmethod
+    def _delete_section(self, section: str):
+        """
+        Deletes a historic data section stored in the designated persistent storage location.
+
+        @param section: The name of the section.
+        """
+        pass
+
+    def _write_section_data(self, section: str, data: bytes):
+        """
+        Stores a small historic data section from memory, replacing the stored section.
+
+        @param section: The name of the section.
+        @param data: The content of the section.
+        """
+
+        with tempfile.TemporaryDirectory(dir=self._temp_workspace) as temp_directory:
+            section_file = pathlib.Path(temp_directory).joinpath(section)
+            section_file.write_bytes(data)
+            self._write_section(section, section_file)
+
+    def _append_section_data(self, section: str, data: bytes, size: int):
+        """
+        Appends data to a historic data section after its first size bytes, which are the ones referred to by the manifest,
+        dropping anything appended after them by a store that didn't complete. Storage locations which can't append to
+        their files rewrite the section.
+
+        @param section: The name of the section.
+        @param data: The content to append.
+        @param size: The size of the section content to keep.
+        """
+
+        existing_stream = self._open_section(section)
+        if existing_stream is None:
+            raise FileNotFoundError(f"The historic data section '{section}' is not stored")
+        with closing(existing_stream):
+            existing_data = existing_stream.read(size)
+        self._write_section_data(section, existing_data + data)
     
     def store_artifacts(self, runtime_artifact_dir, runtime_coverage_dir):
         """
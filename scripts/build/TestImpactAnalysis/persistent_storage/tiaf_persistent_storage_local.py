@@ -6,6 +6,7 @@
 #
 #
 
+import os
 import pathlib
 import shutil
 from persistent_storage import PersistentStorage
@@ -33,20 +34,69 @@ class PersistentStorageLocal(PersistentStorage):
         super().__init__(config, suites_string, commit, active_workspace, unpacked_coverage_data_file_path, previous_test_run_data_file_path, temp_workspace)
         self._retrieve_historic_data(config, historic_workspace, historic_data_file_path)
 
-    def _store_historic_data(self, historic_data_json: str):
+    def _open_section(self, section: str):
         """
-        Stores then historical data in historic workspace location specified in the runtime config file.
+        Opens a historic data section stored in the historic workspace location for reading.
 
-        @param historic_data_json: The historic data (in JSON format) to be stored in persistent storage.
+        @param section: The name of the section.
+
+        @return: The section file opened in binary mode, or None if it is not stored.
         """
 
         try:
-            self._historic_workspace.mkdir(exist_ok=True, parents=True)
-            with open(self._historic_data_file, "w") as historic_data_file:
-                historic_data_file.write(historic_data_json)
-        except EnvironmentError as e:
-            logger.error(
-                f"There was a problem the historic data file '{self._historic_data_file}': '{e}'.")
+            return open(self._historic_data_directory.joinpath(section), "rb")
+        except FileNotFoundError:
+            return None
+
+    def _write_section(self, section: str, source_file: pathlib.Path):
+        """
+        Moves a historic data section into the historic workspace location, replacing the stored section.
+
+        @param section: The name of the section.
+        @param source_file: The file with the content of the section.
+        """
+
+        self._historic_data_directory.mkdir(exist_ok=True, parents=True)
+        section_file = self._historic_data_directory.joinpath(section)
+        # Moved next to the section first so the section is replaced atomically, even from another file system
+        temp_section_file = section_file.with_name(f"{section}.tmp")
+        shutil.move(str(source_file), str(temp_section_file))
+        os.replace(temp_section_file, section_file)
+
+    def _append_section_data(self, section: str, data: bytes, size: int):
+        """
+        Appends data to a historic data section in the historic workspace location after its first size bytes.
+
+        @param section: The name of the section.
+        @param data: The content to append.
+        @param size: The size of the section content to keep.
+        """
+
+        with open(self._historic_data_directory.joinpath(section), "r+b") as section_file:
+            # Drop anything appended by a store that didn't complete, which the manifest doesn't refer to
+            section_file.truncate(size)
+            section_file.seek(size)
+            section_file.write(data)
+
+    def _list_sections(self):
+        """
+        Lists the historic data sections stored in the historic workspace location.
+
+        @return: The names of the stored sections.
+        """
+
+        if not self._historic_data_directory.is_dir():
+            return []
+        return [section_file.name for section_file in self._historic_data_directory.iterdir() if section_file.is_file()]
+
+    def _delete_section(self, section: str):
+        """
+        Deletes a historic data section stored in the historic workspace location.
+
+        @param section: The name of the section.
+        """
+
+        self._historic_data_directory.joinpath(section).unlink(missing_ok=True)
 
     def _retrieve_historic_data(self, config: dict, historic_workspace: str, historic_data_file_path: str):
         try:
@@ -55,9 +105,17 @@ class PersistentStorageLocal(PersistentStorage):
             self._historic_workspace = self._historic_workspace.joinpath(pathlib.Path(self._suites_string))
             historic_data_file = pathlib.Path(historic_data_file_path)
             
-            # Attempt to unpack the local historic data file
             self._historic_data_file = self._historic_workspace.joinpath(
                 historic_data_file)
+
+            # Attempt to unpack the local historic data sections
+            self._historic_data_directory = self._historic_workspace.joinpath(self.HISTORIC_DATA_DIRECTORY)
+            logger.info(
+                f"Attempting to retrieve historic data at location '{self._historic_data_directory}'...")
+            if self._retrieve_historic_data_sections():
+                return
+
+            # Otherwise attempt to unpack the local historic data file stored by previous versions
             logger.info(
                 f"Attempting to retrieve historic data at location '{self._historic_data_file}'...")
             if self._historic_data_file.is_file():
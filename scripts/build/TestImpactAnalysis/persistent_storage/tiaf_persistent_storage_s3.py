@@ -13,7 +13,6 @@ import boto3
 import botocore.exceptions
 import zlib
 import pathlib
-from io import BytesIO
 from persistent_storage import PersistentStorage
 from tiaf_logger import get_logger
 
@@ -47,24 +46,82 @@ class PersistentStorageS3(PersistentStorage):
         self._s3 = boto3.client('s3')
         self._retrieve_historic_data(config)
 
-    def _store_historic_data(self, historic_data_json: str):
+    def _section_key(self, section: str):
         """
-        Stores then historical data in specified s3 bucket at the location <branch>/<build_config>/historical_data.json.zip.
+        @param section: The name of the historic data section.
 
-        @param historic_data_json: The historic data (in JSON format) to be stored in persistent storage.
+        @return: The key of the section object in the s3 bucket.
+        """
+        return f"{self._historic_data_dir}/{self.HISTORIC_DATA_DIRECTORY}/{section}"
+
+    def _open_section(self, section: str):
+        """
+        Opens a historic data section object in the s3 bucket for reading, the object is streamed as it is read.
+
+        @param section: The name of the section.
+
+        @return: The streaming body of the section object, or None if it is not stored.
         """
 
         try:
-            data = BytesIO(zlib.compress(bytes(historic_data_json, "UTF-8")))
-            logger.info(
-                f"Uploading historic data to location '{self._historic_data_key}'...")
-            self._s3.upload_fileobj(data, Bucket=self.s3_bucket, Key=self._historic_data_key, ExtraArgs={
-                                    'ACL': 'bucket-owner-full-control'})
+            return self._s3.get_object(Bucket=self.s3_bucket, Key=self._section_key(section))['Body']
+        except botocore.exceptions.ClientError as e:
+            if(e.response['Error']['Code'] == 'NoSuchKey'):
+                return None
+            raise EnvironmentError(f"There was a problem with the s3 client: {e}")
+        except botocore.exceptions.BotoCoreError as e:
+            raise EnvironmentError(f"There was a problem with the s3 bucket: {e}")
+
+    def _write_section(self, section: str, source_file: pathlib.Path):
+        """
+        Uploads a historic data section to the s3 bucket, replacing the stored section object. Large sections are uploaded
+        in parts streamed from the file.
+
+        @param section: The name of the section.
+        @param source_file: The file with the content of the section.
+        """
+
+        try:
+            logger.info(f"Uploading historic data section to location '{self._section_key(section)}'...")
+            self._s3.upload_file(str(source_file), Bucket=self.s3_bucket, Key=self._section_key(section), ExtraArgs={
+                                 'ACL': 'bucket-owner-full-control'})
             logger.info("Upload complete.")
         except botocore.exceptions.BotoCoreError as e:
-            logger.error(f"There was a problem with the s3 bucket: {e}")
+            raise EnvironmentError(f"There was a problem with the s3 bucket: {e}")
         except botocore.exceptions.ClientError as e:
-            logger.error(f"There was a problem with the s3 client: {e}")
+            raise EnvironmentError(f"There was a problem with the s3 client: {e}")
+
+    def _list_sections(self):
+        """
+        Lists the historic data section objects stored in the s3 bucket.
+
+        @return: The names of the stored sections.
+        """
+
+        prefix = self._section_key("")
+        try:
+            paginator = self._s3.get_paginator('list_objects_v2')
+            return [content['Key'][len(prefix):]
+                    for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=prefix)
+                    for content in page.get('Contents', [])]
+        except botocore.exceptions.BotoCoreError as e:
+            raise EnvironmentError(f"There was a problem with the s3 bucket: {e}")
+        except botocore.exceptions.ClientError as e:
+            raise EnvironmentError(f"There was a problem with the s3 client: {e}")
+
+    def _delete_section(self, section: str):
+        """
+        Deletes a historic data section object stored in the s3 bucket.
+
+        @param section: The name of the section.
+        """
+
+        try:
+            self._s3.delete_object(Bucket=self.s3_bucket, Key=self._section_key(section))
+        except botocore.exceptions.BotoCoreError as e:
+            raise EnvironmentError(f"There was a problem with the s3 bucket: {e}")
+        except botocore.exceptions.ClientError as e:
+            raise EnvironmentError(f"There was a problem with the s3 client: {e}")
 
     def _retrieve_historic_data(self, config: dict):
         """
@@ -83,6 +140,12 @@ class PersistentStorageS3(PersistentStorage):
             self._historic_data_dir = f"{self.root_dir}/{self.branch}/{config[self.COMMON_CONFIG_KEY][self.META_KEY][self.BUILD_CONFIG_KEY]}/{self._suites_string}"
             self._historic_data_key = f"{self._historic_data_dir}/{historic_data_file}"
 
+            logger.info(
+                f"Attempting to retrieve historic data sections for branch '{self.branch}' at location '{self._section_key(self.MANIFEST_SECTION)}' on bucket '{self.s3_bucket}'...")
+            if self._retrieve_historic_data_sections():
+                return
+
+            # Otherwise attempt to retrieve the historic data stored as a single object by previous versions
             logger.info(
                 f"Attempting to retrieve historic data for branch '{self.branch}' at location '{self._historic_data_key}' on bucket '{self.s3_bucket}'...")
             object = self._s3.get_object(
@@ -104,6 +167,8 @@ class PersistentStorageS3(PersistentStorage):
             raise SystemError(f"The config does not contain the key {str(e)}.")
         except botocore.exceptions.BotoCoreError as e:
             raise SystemError(f"There was a problem with the s3 bucket: {e}")
+        except EnvironmentError as e:
+            raise SystemError(str(e))
         except botocore.exceptions.ClientError as e:
             if(e.response['Error']['Code'] == 'NoSuchKey'):
                 logger.info(
@@ -6,9 +6,15 @@
 #
 #
 
+import json
+import pathlib
+import tempfile
+import zlib
 from enum import Enum
 from tiaf_logger import get_logger
 from abc import ABC, abstractmethod
+from persistent_storage import PersistentStorage
+from persistent_storage.tiaf_persistent_storage import read_historic_data_manifest, read_historic_sequences, unpack_historic_data_section
 logger = get_logger(__file__)
 
 
@@ -70,6 +76,58 @@ class StorageQueryTool(ABC):
             logger.error(
                 f"File not found at '{file_address}'. Exception:'{e}'.")
 
+    def _is_historic_data_manifest(self, file: str):
+        """
+        Whether the file is the manifest of historic data stored as sections, which is read with the sections it refers to.
+
+        @param file: Address of the file.
+        """
+        return pathlib.PurePath(file).parts[-2:] == (PersistentStorage.HISTORIC_DATA_DIRECTORY, PersistentStorage.MANIFEST_SECTION)
+
+    def _save_historic_data_sections_as_json_file(self, open_section, destination: str):
+        """
+        Saves historic data stored as sections as a json file named historic_data.json in the destination folder, in the same
+        format as historic data stored as a single json file.
+
+        @param open_section: A function opening a stored section by name, which returns a readable binary stream or None if
+        the section is not stored.
+        @param destination: Directory to write json file to.
+        """
+        try:
+            manifest = read_historic_data_manifest(open_section)
+            if manifest is None:
+                logger.error("The historic data manifest was not found.")
+                return
+            historic_data = {
+                PersistentStorage.LAST_COMMIT_HASH_KEY: manifest[PersistentStorage.LAST_COMMIT_HASH_KEY],
+                PersistentStorage.HISTORIC_SEQUENCES_KEY: read_historic_sequences(open_section, manifest)}
+
+            with tempfile.TemporaryDirectory() as temp_directory:
+                for section, key in [(PersistentStorage.COVERAGE_DATA_SECTION, PersistentStorage.COVERAGE_DATA_KEY),
+                                     (PersistentStorage.PREVIOUS_TEST_RUNS_SECTION, PersistentStorage.PREVIOUS_TEST_RUNS_KEY)]:
+                    section_file = pathlib.Path(temp_directory).joinpath(section)
+                    if not unpack_historic_data_section(open_section, manifest, section, section_file):
+                        logger.error(f"The historic data section '{section}' does not match the manifest.")
+                        return
+                    with open(section_file, "r", encoding="UTF-8", newline='') as section_data:
+                        historic_data[key] = section_data.read()
+            historic_data[PersistentStorage.PREVIOUS_TEST_RUNS_KEY] = json.loads(historic_data[PersistentStorage.PREVIOUS_TEST_RUNS_KEY])
+
+            historic_data_file = pathlib.Path(destination).joinpath("historic_data.json")
+            with open(historic_data_file, "w", encoding="UTF-8") as raw_output_file:
+                json.dump(historic_data, raw_output_file, ensure_ascii=False, indent=4)
+            logger.info(f"Data sucessfully saved in: {historic_data_file}")
+        except json.JSONDecodeError:
+            logger.error("The historic data does not contain valid JSON.")
+        except ValueError as e:
+            logger.error(f"{e}.")
+        except KeyError as e:
+            logger.error(f"The historic data does not contain the key {str(e)}.")
+        except zlib.error as e:
+            logger.error(f"The historic data could not be decompressed: '{e}'.")
+        except OSError as e:
+            logger.error(e)
+
     @abstractmethod
     def _display(self):
         """
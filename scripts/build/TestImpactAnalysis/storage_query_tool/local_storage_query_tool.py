@@ -90,13 +90,30 @@ class LocalStorageQueryTool(StorageQueryTool):
 
     def _access(self, file: str):
         """
-        Accesses the specified file.
+        Accesses the specified file. The manifest of historic data stored as sections is saved as a json file in the file out
+        directory, when one is provided, with the sections it refers to.
 
         @param file: Path to the file to be accessed.
-        @param destination: Path to where file should be saved on local machine.
         """
         if self._check_object_exists(file):
-            os.startfile(os.path.split(file)[0])
+            if self._is_historic_data_manifest(file) and self._file_out:
+                self._save_historic_data_sections_as_json_file(
+                    lambda section: self._open_section(Path(file).parent.joinpath(section)), self._file_out)
+            else:
+                os.startfile(os.path.split(file)[0])
+
+    def _open_section(self, section_file: Path):
+        """
+        Opens a historic data section file for reading.
+
+        @param section_file: Path to the section file.
+
+        @return: The section file opened in binary mode, or None if it does not exist.
+        """
+        try:
+            return open(section_file, "rb")
+        except FileNotFoundError:
+            return None
 
     def _put(self, file: str, storage_location: str):
         """
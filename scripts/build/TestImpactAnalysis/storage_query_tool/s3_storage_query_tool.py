@@ -13,6 +13,7 @@ import boto3
 import botocore.exceptions
 from tiaf_logger import get_logger
 from storage_query_tool import StorageQueryTool
+from persistent_storage import PersistentStorage
 
 logger = get_logger(__file__)
 
@@ -118,6 +119,12 @@ class S3StorageQueryTool(StorageQueryTool):
         @param destination: Path to where file should be saved on local machine.
         """
         if self._check_object_exists(bucket_name, file):
+            if self._is_historic_data_manifest(file) and self._file_type == self.FileType.JSON:
+                # Historic data stored as sections is saved with the sections the manifest refers to
+                section_prefix = file[:-len(PersistentStorage.MANIFEST_SECTION)]
+                self._save_historic_data_sections_as_json_file(
+                    lambda section: self._open_section(bucket_name, f"{section_prefix}{section}"), destination)
+                return
             try:
                 logger.info(
                     f"Downloading file in bucket: {bucket_name} with key {file}")
@@ -134,6 +141,22 @@ class S3StorageQueryTool(StorageQueryTool):
                 raise SystemError(
                     "File type not specified or otherwise not passed through to SQT")
 
+    def _open_section(self, bucket_name: str, key: str):
+        """
+        Opens a historic data section object for reading, the object is streamed as it is read.
+
+        @param bucket_name: Bucket to access the section in.
+        @param key: Key of the section object.
+
+        @return: The streaming body of the section object, or None if it does not exist.
+        """
+        try:
+            return self._s3_client.get_object(Bucket=bucket_name, Key=key)['Body']
+        except botocore.exceptions.ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                return None
+            raise e
+
     def _save_as_zip_file(self, file_stream, destination: str):
         """
         Saves the provided file_stream as a zip file named zippedartifacts.zip in the destination folder.
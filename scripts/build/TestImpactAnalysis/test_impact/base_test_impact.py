@@ -10,10 +10,9 @@ from abc import ABC, abstractmethod
 from pathlib import PurePath, Path
 import json
 import subprocess
-import re
 import uuid
 from test_impact import RuntimeArgs
-from git_utils import Repo
+from git_utils import Repo, ChangeListService
 from persistent_storage import PersistentStorageLocal, PersistentStorageS3
 from tiaf_tools import get_logger
 import tiaf_report_constants as constants
@@ -284,6 +283,8 @@ class BaseTestImpact(ABC):
                 self._temp_workspace = config[self.runtime_type][WORKSPACE_KEY][TEMP_KEY][ROOT_KEY]
                 self._report_workspace = config[self.runtime_type][WORKSPACE_KEY][TEMP_KEY][REPORT_KEY]
                 self._change_list_workspace = config[self.runtime_type][WORKSPACE_KEY][TEMP_KEY][CHANGE_LIST_KEY]
+                self._change_list_service = ChangeListService(
+                    self._repo_dir, Path(self._change_list_workspace).joinpath("cache"))
 
                 # Data file paths
                 self._unpacked_coverage_data_file = config[self.runtime_type][
@@ -318,14 +319,14 @@ class BaseTestImpact(ABC):
         if self._src_commit:
             if self._is_source_of_truth_branch:
                 # For branch builds, the dst commit must be descended from the src commit
-                if not self._repo.is_descendent(self._src_commit, self._dst_commit):
+                is_descendent, self._commit_distance = self._change_list_service.get_commit_relation(
+                    self._src_commit, self._dst_commit)
+                if not is_descendent:
                     logger.error(
                         f"Source commit '{self._src_commit}' and destination commit '{self._dst_commit}' must be related for branch builds.")
                     return
 
-                # Calculate the distance (in commits) between the src and dst commits
-                self._commit_distance = self._repo.commit_distance(
-                    self._src_commit, self._dst_commit)
+                # The distance (in commits) between the src and dst commits
                 logger.info(
                     f"The distance between '{self._src_commit}' and '{self._dst_commit}' commits is '{self._commit_distance}' commits.")
                 multi_branch = False
@@ -334,45 +335,15 @@ class BaseTestImpact(ABC):
                 multi_branch = True
 
             try:
-                # Attempt to generate a diff between the src and dst commits
+                # Attempt to generate the change list from a diff between the src and dst commits
                 logger.info(
                     f"Source '{self._src_commit}' and destination '{self._dst_commit}' will be diff'd.")
-                diff_path = Path(PurePath(self._change_list_workspace).joinpath(
-                    f"changelist.{self._instance_id}.diff"))
-                self._repo.create_diff_file(
-                    self._src_commit, self._dst_commit, diff_path, multi_branch)
+                self._change_list = self._change_list_service.get_change_list(
+                    self._src_commit, self._dst_commit, multi_branch)
             except RuntimeError as e:
                 logger.error(e)
                 return
 
-            # A diff was generated, attempt to parse the diff and construct the change list
-            logger.info(
-                f"Generated diff between commits '{self._src_commit}' and '{self._dst_commit}': '{diff_path}'.")
-            with open(diff_path, "r") as diff_data:
-                lines = diff_data.readlines()
-                for line in lines:
-                    match = re.split("^R[0-9]+\\s(\\S+)\\s(\\S+)", line)
-                    if len(match) > 1:
-                        # File rename
-                        # Treat renames as a deletion and an addition
-                        self._change_list["deletedFiles"].append(match[1])
-                        self._change_list["createdFiles"].append(match[2])
-                    else:
-                        match = re.split("^[AMD]\\s(\\S+)", line)
-                        if len(match) > 1:
-                            if line[0] == 'A':
-                                # File addition
-                                self._change_list["createdFiles"].append(
-                                    match[1])
-                            elif line[0] == 'M':
-                                # File modification
-                                self._change_list["updatedFiles"].append(
-                                    match[1])
-                            elif line[0] == 'D':
-                                # File Deletion
-                                self._change_list["deletedFiles"].append(
-                                    match[1])
-
             # Serialize the change list to the JSON format the test impact analysis runtime expects
             change_list_json = json.dumps(self._change_list, indent=4)
             change_list_path = PurePath(self._temp_workspace).joinpath(
@@ -12,7 +12,7 @@ import os
 import pkgutil
 import re
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, List, TextIO, Tuple
 
 VERBOSE = False
 
@@ -38,6 +38,13 @@ class Commit(abc.ABC):
         """
         pass
 
+    def open_file(self, file_name: str, encoding: str = 'utf8', errors: str = 'strict') -> TextIO:
+        """
+        Opens a local file added/modified by the commit for reading in text mode.
+        Validators read files through this so that commits can cache their content.
+        """
+        return open(file_name, 'rt', encoding=encoding, errors=errors)
+
     @abc.abstractmethod
     def get_description(self) -> str:
         """Returns the description of the commit"""
@@ -49,14 +56,17 @@ class Commit(abc.ABC):
         pass
 
 
-def validate_commit(commit: Commit, out_errors: List[str] = None, ignore_validators: List[str] = None) -> bool:
+def validate_commit(commit: Commit, out_errors: List[str] = None, ignore_validators: List[str] = None, max_workers: int = None) -> bool:
     """Validates a commit against all validators
 
     :param commit: The commit to validate
     :param out_errors: if not None, will populate with the list of errors given by the validators
     :param ignore_validators: Optional list of CommitValidator classes to ignore, by class name
+    :param max_workers: The maximum number of processes validating the files concurrently, defaults to the number of CPUs
     :return: True if there are no validation errors, and False otherwise
     """
+    from commit_validation.validation_engine import run_validators
+
     failed_count = 0
     passed_count = 0
     start_time = time.time()
@@ -75,19 +85,17 @@ def validate_commit(commit: Commit, out_errors: List[str] = None, ignore_validat
 
     error_summary = {}
 
-    # Process validators
-    for validator_class in validator_classes:
-        validator = validator_class()
-        validator_name = validator.__class__.__name__
+    # Process validators, each file is read once for all of them
+    results = run_validators(commit, validator_classes, max_workers)
+    for validator_class, (passed, error_list) in zip(validator_classes, results):
+        validator_name = validator_class.__name__
 
-        error_list = []
-        passed = validator.run(commit, errors = error_list)
         if passed:
             passed_count += 1
-            print(f'{validator.__class__.__name__} PASSED')
+            print(f'{validator_name} PASSED')
         else:
             failed_count += 1
-            print(f'{validator.__class__.__name__} FAILED')
+            print(f'{validator_name} FAILED')
         error_summary[validator_name] = error_list
         
     end_time = time.time()
@@ -0,0 +1,98 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import difflib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from commit_validation import validation_engine
+from commit_validation.tests.mocks.mock_commit import MockCommit
+from commit_validation.validators.crc_validator import CrcValidator
+from commit_validation.validators.newline_validator import NewlineValidator
+from commit_validation.validators.tabs_validator import TabsValidator
+from commit_validation.validators.unicode_validator import UnicodeValidator
+
+VALIDATOR_CLASSES = [CrcValidator, NewlineValidator, TabsValidator, UnicodeValidator]
+
+FILE_CONTENTS = [
+    'int valid = 0;\n',
+    'int\tindented = 0;\n',
+    'int missing_newline = 0;',
+    'int crlf = 0;\r\n',
+    'AZ_CRC("Mismatch", 0x12345678);\n',
+    'const char* unicode = "\u00e9";\n',
+]
+
+
+def run_validators_serially(commit, validator_classes):
+    results = []
+    for validator_class in validator_classes:
+        error_list = []
+        passed = validator_class().run(commit, errors=error_list)
+        results.append((passed, error_list))
+    return results
+
+
+class ValidationEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        files = []
+        file_diffs = {}
+        for index in range(validation_engine.PARALLEL_FILE_COUNT * 2):
+            file_name = os.path.join(self.temp_dir, f'file{index}.cpp')
+            content = FILE_CONTENTS[index % len(FILE_CONTENTS)]
+            with open(file_name, 'w', encoding='utf8', newline='') as fh:
+                fh.write(content)
+            files.append(file_name)
+            file_diffs[file_name] = ''.join(difflib.unified_diff([], content.splitlines(True), fromfile=file_name, tofile=file_name))
+        self.commit = MockCommit(files=files, file_diffs=file_diffs)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_runValidators_inProcess_sameResultsAsValidators(self):
+        results = validation_engine.run_validators(self.commit, VALIDATOR_CLASSES, max_workers=1)
+
+        self.assertEqual(results, run_validators_serially(self.commit, VALIDATOR_CLASSES))
+        self.assertFalse(any(passed for passed, _ in results))
+
+    def test_runValidators_workerProcesses_sameResultsAsValidators(self):
+        results = validation_engine.run_validators(self.commit, VALIDATOR_CLASSES, max_workers=2)
+
+        self.assertEqual(results, run_validators_serially(self.commit, VALIDATOR_CLASSES))
+
+    def test_runValidators_inProcess_readsEachFileAndDiffOnce(self):
+        with patch('builtins.open', wraps=open) as mock_open, \
+                patch.object(self.commit, 'get_file_diff', wraps=self.commit.get_file_diff) as mock_get_file_diff:
+            validation_engine.run_validators(self.commit, VALIDATOR_CLASSES, max_workers=1)
+
+        self.assertEqual(mock_open.call_count, len(self.commit.files))
+        self.assertEqual(mock_get_file_diff.call_count, len(self.commit.files))
+
+    def test_runValidators_diffNotPrefetched_partitionRunsInProcess(self):
+        cached_commit = validation_engine.CachedCommit(self.commit.files, [], {})
+        with patch('commit_validation.validation_engine.cache_commit', return_value=cached_commit):
+            cached_commit.source_commit = self.commit
+            results = validation_engine.run_validators(self.commit, [TabsValidator], max_workers=2)
+
+        self.assertEqual(results, run_validators_serially(self.commit, [TabsValidator]))
+
+    def test_cachedCommit_missingFile_raisesOnOpen(self):
+        cached_commit = validation_engine.CachedCommit([], [], {})
+
+        with self.assertRaises(FileNotFoundError):
+            cached_commit.open_file(os.path.join(self.temp_dir, 'missing.cpp'))
+
+    def test_cachedCommit_diffNotCachedWithoutSourceCommit_raises(self):
+        cached_commit = validation_engine.CachedCommit(self.commit.files, [], {})
+
+        with self.assertRaises(validation_engine.NotCachedError):
+            cached_commit.get_file_diff(self.commit.files[0])
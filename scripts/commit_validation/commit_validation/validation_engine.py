@@ -0,0 +1,179 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import concurrent.futures
+import io
+import os
+from typing import Dict, List, Optional, TextIO, Tuple, Type
+
+from commit_validation.commit_validation import Commit, CommitValidator, IsFileSkipped
+
+PARALLEL_FILE_COUNT = 64
+"""Minimum number of files of a commit for the validators to run in worker processes"""
+
+PARTITIONS_PER_WORKER = 4
+"""Number of file partitions per worker process, smaller partitions balance the work better between the workers"""
+
+DIFF_PREFETCH_WORKERS = 8
+"""Number of threads getting the file diffs from the commit"""
+
+
+class NotCachedError(Exception):
+    """Raised by a :class:`CachedCommit` without source commit when a validator requests data which wasn't cached"""
+    pass
+
+
+class CachedCommit(Commit):
+    """
+    A :class:`Commit` holding the files and diffs of another commit, so that each file is read once and each diff is
+    requested once, however many validators use them. It only holds plain data, so it can be sent to worker processes.
+    """
+
+    def __init__(self, files: List[str], removed_files: List[str], file_diffs: Dict[str, object],
+                 source_commit: Commit = None) -> None:
+        """Creates a new instance of :class:`CachedCommit`
+
+        :param files: The files added/modified by the commit
+        :param removed_files: The files removed by the commit
+        :param file_diffs: The prefetched diffs by file name, or the exceptions raised when getting them
+        :param source_commit: The commit the diffs which weren't prefetched, the description and the author are
+            requested from, None to raise :class:`NotCachedError` instead
+        """
+        self.files = files
+        self.removed_files = removed_files
+        self.file_diffs = file_diffs
+        self.source_commit = source_commit
+        self.file_contents: Dict[str, object] = {}
+
+    def partition(self, files: List[str]) -> 'CachedCommit':
+        """Returns a commit holding only some of the files of this one, without the source commit"""
+        return CachedCommit(files, self.removed_files, {file: self.file_diffs[file] for file in files if file in self.file_diffs})
+
+    def get_files(self) -> List[str]:
+        return self.files
+
+    def get_removed_files(self) -> List[str]:
+        return self.removed_files
+
+    def get_file_diff(self, file) -> str:
+        if file not in self.file_diffs:
+            if self.source_commit is None:
+                raise NotCachedError(file)
+            self.file_diffs[file] = _get_file_diff(self.source_commit, file)
+        return _result_or_raise(self.file_diffs[file])
+
+    def open_file(self, file_name: str, encoding: str = 'utf8', errors: str = 'strict') -> TextIO:
+        if file_name not in self.file_contents:
+            try:
+                with open(file_name, 'rb') as fh:
+                    self.file_contents[file_name] = fh.read()
+            except OSError as e:
+                self.file_contents[file_name] = e
+        # Decoded like a file opened in text mode, with the same newline translation and decoding errors
+        return io.TextIOWrapper(io.BytesIO(_result_or_raise(self.file_contents[file_name])), encoding=encoding, errors=errors)
+
+    def get_description(self) -> str:
+        return self._get_source_commit().get_description()
+
+    def get_author(self) -> str:
+        return self._get_source_commit().get_author()
+
+    def _get_source_commit(self) -> Commit:
+        if self.source_commit is None:
+            raise NotCachedError()
+        return self.source_commit
+
+
+def _get_file_diff(commit: Commit, file: str) -> object:
+    try:
+        return commit.get_file_diff(file)
+    except Exception as e:  # Raised again to the validator requesting the diff, as if it had requested it itself
+        return e
+
+
+def _result_or_raise(result: object) -> object:
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def cache_commit(commit: Commit) -> CachedCommit:
+    """Gets the diffs of the source and script files of a commit, which are the ones the validators request diffs of,
+    concurrently since each of them may run a git or p4 command.
+
+    :param commit: The commit to cache
+    :return: The cached commit, which requests the diffs that weren't prefetched from the commit
+    """
+    files = list(commit.get_files())
+    diff_files = [file for file in files if not IsFileSkipped(file)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DIFF_PREFETCH_WORKERS) as executor:
+        file_diffs = dict(zip(diff_files, executor.map(lambda file: _get_file_diff(commit, file), diff_files)))
+    return CachedCommit(files, list(commit.get_removed_files()), file_diffs, source_commit=commit)
+
+
+def _run_validators(validator_classes: List[Type[CommitValidator]], commit: Commit) -> List[Tuple[bool, List[str]]]:
+    results = []
+    for validator_class in validator_classes:
+        error_list = []
+        passed = validator_class().run(commit, errors=error_list)
+        results.append((passed, error_list))
+    return results
+
+
+def _run_validators_on_partition(validator_classes: List[Type[CommitValidator]], commit: CachedCommit) -> Optional[List[Tuple[bool, List[str]]]]:
+    try:
+        return _run_validators(validator_classes, commit)
+    except NotCachedError:
+        # The partition runs again in the main process, which can request the data from the commit
+        return None
+
+
+def _partition_files(files: List[str], partition_count: int) -> List[List[str]]:
+    # Contiguous partitions, so joining their results in order keeps the order of the files
+    partition_size, remainder = divmod(len(files), partition_count)
+    partitions = []
+    start = 0
+    for index in range(partition_count):
+        end = start + partition_size + (1 if index < remainder else 0)
+        partitions.append(files[start:end])
+        start = end
+    return partitions
+
+
+def run_validators(commit: Commit, validator_classes: List[Type[CommitValidator]], max_workers: int = None) -> List[Tuple[bool, List[str]]]:
+    """Runs validators on a commit, reading each of its files and requesting each of its diffs once.
+
+    The validators are file-level validators, so commits with many files are partitioned by file and the partitions are
+    validated concurrently in worker processes. The errors of the partitions are joined in file order, so the results
+    are the same as when each validator runs once on the whole commit.
+
+    :param commit: The commit to validate
+    :param validator_classes: The CommitValidator classes to run
+    :param max_workers: The maximum number of worker processes, defaults to the number of CPUs, 1 to run in this process
+    :return: A (passed, errors) tuple for each validator, in the order of validator_classes
+    """
+    cached_commit = cache_commit(commit)
+    files = cached_commit.get_files()
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers <= 1 or len(files) < PARALLEL_FILE_COUNT:
+        return _run_validators(validator_classes, cached_commit)
+
+    partitions = [cached_commit.partition(partition_files) for partition_files in
+                  _partition_files(files, min(max_workers * PARTITIONS_PER_WORKER, len(files)))]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        partition_results = list(executor.map(_run_validators_on_partition, [validator_classes] * len(partitions), partitions))
+
+    results = [(True, []) for _ in validator_classes]
+    for partition, partition_result in zip(partitions, partition_results):
+        if partition_result is None:
+            partition.source_commit = commit
+            partition_result = _run_validators(validator_classes, partition)
+        for index, (passed, errors) in enumerate(partition_result):
+            results[index] = (results[index][0] and passed, results[index][1] + errors)
+    return results
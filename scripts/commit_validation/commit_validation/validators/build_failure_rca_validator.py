@@ -29,7 +29,7 @@ class BuildFailureRCAValidator(CommitValidator):
                     if VERBOSE: print(f'{file_name}::{self.__class__.__name__} SKIPPED - Validation pattern excluded on path.')
                     continue
                 
-                with open(file_name, 'r', encoding='utf8') as fh:
+                with commit.open_file(file_name, encoding='utf8') as fh:
                     try:
                         data = json.load(fh)
                     except json.decoder.JSONDecodeError:
@@ -57,7 +57,7 @@ class CopyrightHeaderValidator(CommitValidator):
                 has_original_amazon_copyright_pattern = False
                 has_stale_o3de_pattern = False
 
-                with open(file_name, 'rt', encoding='utf8', errors='replace') as fh:
+                with commit.open_file(file_name, encoding='utf8', errors='replace') as fh:
                     for line in fh:
                         if OPEN_3D_ENGINE_PATTERN.search(line):
                             has_o3de_pattern_single_line = True
@@ -28,7 +28,7 @@ class CrcValidator(CommitValidator):
                     if VERBOSE: print(f'{file_name}::{self.__class__.__name__} SKIPPED - File excluded based on extension.')
                     continue
                 
-                with open(file_name, mode='r', encoding='utf8') as fh:
+                with commit.open_file(file_name, encoding='utf8') as fh:
                     fileContents = fh.read()
                     matchesFound = re.findall(r'AZ_CRC\("([^"]+)",([^)]*)\)', fileContents)
                     for element in matchesFound:
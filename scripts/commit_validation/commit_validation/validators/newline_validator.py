@@ -37,7 +37,7 @@ class NewlineValidator(CommitValidator):
 
                 # since this validator focuses on newlines throughout the file, not just in diffs
                 # we use the real file data instead of a diff
-                with open(file_name, 'rt', encoding='utf8', errors='replace') as fh:
+                with commit.open_file(file_name, encoding='utf8', errors='replace') as fh:
                     lines = fh.read()
                     if not _SINGLE_NEWLINE_ENDING_REGEX.search(lines):
                         error_message = str(f'{file_identifier} FAILED - Source file does not end with a trailing newline.')
@@ -31,7 +31,7 @@ class UnicodeValidator(CommitValidator):
                     if VERBOSE: print(f'{file_name} SKIPPED UnicodeValidator - Validation pattern excluded on path.')
                     break
             else:
-                with open(file_name, 'r', encoding='utf-8', errors='strict') as fh:
+                with commit.open_file(file_name, encoding='utf-8', errors='strict') as fh:
                     linecount = 1
                     for line in fh:
                         columncount = 0
@@ -7,12 +7,122 @@
 
 import argparse
 from collections import OrderedDict
+import concurrent.futures
 import fnmatch
 import json
 import os
 import pathlib
 import re
 import sys
+import threading
+import time
+
+
+class ScanCache:
+    """Directory listings and file contents of previous scans, reused while the directories and files are unchanged.
+
+    Adding, removing or renaming an entry of a directory changes its modification time, so the listing of a directory is
+    reused while its modification time is unchanged. The contents of a file are reused while its size and modification
+    time are unchanged. Listings and contents changed shortly before the scan started aren't saved, since a change in the
+    same timestamp tick would not be noticed by the next scan.
+
+    :param cache_file: Path of the JSON file the cache is loaded from and saved to, None to only scan
+    :param key: Settings the cached listings depend on, the cache is discarded when they change
+    """
+
+    VERSION = 1
+    RECENT_CHANGE_SECONDS = 2
+
+    def __init__(self, cache_file=None, key=None):
+        self.cache_file = cache_file
+        self.key = key
+        self.scan_start_ns = time.time_ns()
+        self._directories, self._files = self._load()
+        self._scanned_directories = {}
+        self._scanned_files = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """Returns the cached directory listings and file contents by absolute path."""
+        if not self.cache_file:
+            return {}, {}
+        try:
+            with open(self.cache_file, encoding='utf8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}, {}
+        except (OSError, ValueError) as e:
+            print(f'Unable to read cache file {self.cache_file}, scanning all files: {e}')
+            return {}, {}
+
+        if data.get('version') != self.VERSION or data.get('key') != self.key:
+            print(f'Cache file {self.cache_file} was written with other settings, scanning all files')
+            return {}, {}
+        return data['directories'], data['files']
+
+    def save(self):
+        """Writes the listings and contents of this scan to the cache file, dropping the paths which weren't scanned."""
+        if not self.cache_file:
+            return
+
+        data = {
+            'version': self.VERSION,
+            'key': self.key,
+            'directories': self._scanned_directories,
+            'files': self._scanned_files
+        }
+        temp_file = f'{self.cache_file}.tmp'
+        with open(temp_file, 'w', encoding='utf8') as f:
+            json.dump(data, f)
+        os.replace(temp_file, self.cache_file)
+
+    def get_listing(self, dirpath, list_directory):
+        """Returns the listing of a directory, from the cache when the directory is unchanged.
+
+        :param dirpath: Path of the directory
+        :param list_directory: Function returning the (file names, subdirectory names) listing of a directory
+        :return: The (file names, subdirectory names) listing, empty when the directory can't be listed
+        """
+        key = os.path.abspath(dirpath)
+        try:
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+            cached = self._directories.get(key)
+            if cached and cached['mtime_ns'] == mtime_ns:
+                listing = cached
+            else:
+                filenames, dirnames = list_directory(dirpath)
+                listing = {'mtime_ns': mtime_ns, 'files': filenames, 'dirs': dirnames}
+        except OSError:
+            return [], []  # Skipped like os.walk() skips directories it can't list
+
+        self._add_scanned(self._scanned_directories, key, listing)
+        return listing['files'], listing['dirs']
+
+    def get_contents(self, filepath, read_file):
+        """Returns the contents of a file, from the cache when the file is unchanged.
+
+        :param filepath: Path of the file
+        :param read_file: Function returning the contents of a file
+        :return: The contents of the file
+        """
+        key = os.path.abspath(filepath)
+        file_stat = os.stat(filepath)
+        cached = self._files.get(key)
+        if cached and cached['mtime_ns'] == file_stat.st_mtime_ns and cached['size'] == file_stat.st_size:
+            entry = cached
+        else:
+            entry = {'mtime_ns': file_stat.st_mtime_ns, 'size': file_stat.st_size, 'contents': read_file(filepath)}
+
+        self._add_scanned(self._scanned_files, key, entry)
+        return entry['contents']
+
+    def _add_scanned(self, scanned, key, entry):
+        if not self.cache_file:
+            return
+        if entry['mtime_ns'] > self.scan_start_ns - self.RECENT_CHANGE_SECONDS * 1000000000:
+            return
+        with self._lock:
+            scanned[key] = entry
 
 
 class LicenseScanner:
@@ -60,50 +170,97 @@ class LicenseScanner:
 
         return re.compile('|'.join(regex_patterns), re.IGNORECASE)
 
-    def scan(self, paths=os.curdir):
+    def scan(self, paths=os.curdir, cache_file=None, max_workers=None):
         """Scan directory tree for filenames matching file_regex, package info, and exclusion files.
 
         :param paths: Paths of the directory to run scanner
+        :param cache_file: Path of the file caching directory listings and file contents between scans, None to read all
+        :param max_workers: Maximum number of paths scanned at once
         :return: Package paths and their corresponding file contents
         :rtype: Ordered dict
         """
         files = 0
         matching_files = OrderedDict()
-        excluded_directories = None
 
         if not self.package_info:
             self.package_info = self.DEFAULT_PACKAGE_INFO_FILE
 
-        if not self.excluded_directories:
+        cache = ScanCache(cache_file, self.config_data)
+        if self.excluded_directories:
+            # All the paths are scanned with the same exclusions, so they can be scanned concurrently
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    lambda path: self._scan_path(path, self.excluded_directories, cache)[0], paths))
+        else:
             print(f'No excluded directory in config, looking for {self.DEFAULT_EXCLUDE_FILE} instead')
+            # The exclusions of the last exclusion file found apply to the next paths as well
+            results = []
+            excluded_directories = None
+            for path in paths:
+                path_matching_files, excluded_directories = self._scan_path(path, excluded_directories, cache)
+                results.append(path_matching_files)
+        cache.save()
 
-        for path in paths:
-            for dirpath, dirnames, filenames in os.walk(path, topdown=True):
-                dirnames.sort(key=str.casefold) # Ensure that results are sorted
-                for file in filenames:
-                    if self.file_regex.match(file) or self.package_info.match(file):
-                        file_path = os.path.join(dirpath, file)
-                        matching_file_content = self._get_file_contents(file_path)
-                        matching_files[file_path] = matching_file_content
-                        files += 1
-                        print(f'Matching file: {file_path}')
-                        if self.package_info.match(file):
-                            dirnames[:] = [] # Stop scanning subdirectories if package info file found
-                    if self.DEFAULT_EXCLUDE_FILE in file and not self.excluded_directories:
-                        ignore_list = self._get_file_contents(os.path.join(dirpath, file)).splitlines()
-                        ignore_list.append('.git') # .gitignore doesn't usually have .git in its exclusions
-                        excluded_directories = self._load_file_regex(ignore_list)
-
-                # Remove directories that should not be scanned
-                if self.excluded_directories:
-                    excluded_directories = self.excluded_directories
-                for dir in dirnames:
-                    if excluded_directories.match(dir):
-                        dirnames.remove(dir)
+        for path_matching_files in results:
+            for file_path, matching_file_content in path_matching_files.items():
+                matching_files[file_path] = matching_file_content
+                files += 1
+                print(f'Matching file: {file_path}')
 
         print(f'{files} files found.')
         return matching_files
 
+    def _scan_path(self, path, excluded_directories, cache):
+        """Scan one directory tree, visiting the subdirectories in sorted order after the files of their parent.
+
+        :param path: Path of the directory
+        :param excluded_directories: Regex of the directories not to scan, updated by exclusion files when not in config
+        :param cache: ScanCache the directory listings and file contents are read through
+        :return: Matching file paths and their contents, and the excluded directories after the scan
+        :rtype: tuple
+        """
+        matching_files = OrderedDict()
+        pending_directories = [os.fspath(path)]
+        while pending_directories:
+            dirpath = pending_directories.pop()
+            filenames, dirnames = cache.get_listing(dirpath, self._list_directory)
+            dirnames = sorted(dirnames, key=str.casefold) # Ensure that results are sorted
+            for file in filenames:
+                if self.file_regex.match(file) or self.package_info.match(file):
+                    file_path = os.path.join(dirpath, file)
+                    matching_files[file_path] = cache.get_contents(file_path, self._get_file_contents)
+                    if self.package_info.match(file):
+                        dirnames = [] # Stop scanning subdirectories if package info file found
+                if self.DEFAULT_EXCLUDE_FILE in file and not self.excluded_directories:
+                    ignore_list = cache.get_contents(os.path.join(dirpath, file), self._get_file_contents).splitlines()
+                    ignore_list.append('.git') # .gitignore doesn't usually have .git in its exclusions
+                    excluded_directories = self._load_file_regex(ignore_list)
+
+            # Remove directories that should not be scanned
+            if excluded_directories:
+                dirnames = [dir for dir in dirnames if not excluded_directories.match(dir)]
+            pending_directories.extend(os.path.join(dirpath, dir) for dir in reversed(dirnames))
+
+        return matching_files, excluded_directories
+
+    def _list_directory(self, dirpath):
+        """Returns the names of the files the scan may read and of the subdirectories it may scan, like os.walk()."""
+        filenames = []
+        dirnames = []
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink(): # os.walk() doesn't follow symbolic links to directories
+                        dirnames.append(entry.name)
+                elif (self.file_regex.match(entry.name) or self.package_info.match(entry.name)
+                        or self.DEFAULT_EXCLUDE_FILE in entry.name):
+                    filenames.append(entry.name)
+        return filenames, dirnames
+
     def _get_file_contents(self, filepath):
         try:
             with open(filepath, encoding='utf8') as f:
@@ -164,6 +321,7 @@ def parse_args():
     parser.add_argument('--license-file-path', '-l', type=pathlib.Path, help='Create license file in the provided path')
     parser.add_argument('--package-file-path', '-p', type=pathlib.Path, help='Create package summary file in the provided path')
     parser.add_argument('--scan-path', '-s', default=os.curdir, type=pathlib.Path, nargs='+', help='Path to scan, multiple space separated paths can be used')
+    parser.add_argument('--cache-file', type=pathlib.Path, help='Cache file reused by the next scans to only read the directories and files changed since')
     return parser.parse_args()
 
 
@@ -171,7 +329,7 @@ def main():
     try:
         args = parse_args()
         ls = LicenseScanner(args.config_file)
-        scanned_path_data = ls.scan(args.scan_path)
+        scanned_path_data = ls.scan(args.scan_path, args.cache_file)
 
         if args.license_file_path:
             ls.create_license_file(scanned_path_data, args.license_file_path)
@@ -10,6 +10,7 @@ This file contains compatibility functions
 """
 from packaging.version import Version, InvalidVersion
 from packaging.specifiers import SpecifierSet
+import functools
 import pathlib
 import logging
 from collections import OrderedDict
@@ -18,6 +19,191 @@ from o3de import manifest, utils, cmake, validation
 logger = logging.getLogger('o3de.compatibility')
 logging.basicConfig(format=utils.LOG_FORMAT)
 
+
+class GemDependencyGraph:
+    """
+    Graph of gem dependencies built from the json data of all gems by name.
+    The dependency version specifiers of each gem are parsed once and the incompatible dependencies of each gem,
+    including those of the gems it depends on, are resolved once and memoized, so checking any number of gems
+    visits every gem and dependency of the graph at most once.
+    """
+
+    def __init__(self, gems_json_data_by_name: dict):
+        """
+        :param gems_json_data_by_name: json data of all gems to use for compatibility checks
+        """
+        self.gems_json_data_by_name = gems_json_data_by_name or {}
+        # gem name -> (names of the dependency gems, incompatible dependency descriptions, names of the
+        # compatible dependency gems whose own dependencies must be checked)
+        self._dependency_edges = {}
+        # gem name -> incompatible dependency descriptions of the gem and all the compatible gems it depends on
+        self._incompatible_dependencies = {}
+
+    def _get_gem_dependency_edges(self, gem_json_data: dict) -> tuple:
+        """
+        Parses the dependencies of a gem and checks the version of each dependency gem
+        :param gem_json_data: gem json data dictionary
+        :return: tuple of the dependency gem names, the set of incompatible dependency descriptions and
+         the dependency gem names that are compatible
+        """
+        dependency_gem_names = []
+        incompatible_dependencies = set()
+        compatible_dependency_gem_names = []
+        for gem_version_specifier in gem_json_data.get('dependencies') or []:
+            gem_name, version_specifier = _get_object_name_and_optional_version_specifier(gem_version_specifier)
+            dependency_gem_names.append(gem_name)
+            if gem_name not in self.gems_json_data_by_name:
+                incompatible_dependencies.add(f"{gem_json_data['gem_name']} is missing the dependency {gem_version_specifier}")
+                continue
+
+            # when no version specifier is provided we assume compatibility with any version
+            gem_version = self.gems_json_data_by_name[gem_name].get('version')
+            if version_specifier and gem_version and \
+                    not has_compatible_version([gem_version_specifier], gem_name, gem_version):
+                incompatible_dependencies.add(f"{gem_json_data['gem_name']} depends on {gem_version_specifier} but {gem_name} version {gem_version} was found")
+                continue
+
+            compatible_dependency_gem_names.append(gem_name)
+
+        return dependency_gem_names, incompatible_dependencies, compatible_dependency_gem_names
+
+    def _get_dependency_edges(self, gem_name: str) -> tuple:
+        dependency_edges = self._dependency_edges.get(gem_name)
+        if dependency_edges is None:
+            gem_json_data = self.gems_json_data_by_name.get(gem_name)
+            dependency_edges = self._get_gem_dependency_edges(gem_json_data) if gem_json_data else ([], set(), [])
+            self._dependency_edges[gem_name] = dependency_edges
+        return dependency_edges
+
+    def _resolve_incompatible_dependencies(self, gem_name: str) -> frozenset:
+        """
+        Resolves the incompatible dependencies of the gem and of every gem it depends on that is not resolved yet.
+        Gems which depend on each other share the same result, they are found with Tarjan's strongly
+        connected components algorithm, so each component is resolved after all the components it depends on.
+        :param gem_name: name of the gem to resolve
+        :return: the incompatible dependency descriptions of the gem and all compatible gems it depends on
+        """
+        if gem_name in self._incompatible_dependencies:
+            return self._incompatible_dependencies[gem_name]
+
+        visit_index = {}
+        lowest_index = {}
+        component_stack = []
+        on_component_stack = set()
+        visit_stack = []
+
+        def visit(name: str) -> None:
+            visit_index[name] = lowest_index[name] = len(visit_index)
+            component_stack.append(name)
+            on_component_stack.add(name)
+            visit_stack.append((name, iter(self._get_dependency_edges(name)[2])))
+
+        visit(gem_name)
+        while visit_stack:
+            name, dependency_names = visit_stack[-1]
+            for dependency_name in dependency_names:
+                if dependency_name in self._incompatible_dependencies:
+                    continue
+                if dependency_name not in visit_index:
+                    visit(dependency_name)
+                    break
+                if dependency_name in on_component_stack:
+                    lowest_index[name] = min(lowest_index[name], visit_index[dependency_name])
+            else:
+                visit_stack.pop()
+                if visit_stack:
+                    parent_name = visit_stack[-1][0]
+                    lowest_index[parent_name] = min(lowest_index[parent_name], lowest_index[name])
+
+                if lowest_index[name] == visit_index[name]:
+                    component = set()
+                    while name not in component:
+                        component_name = component_stack.pop()
+                        on_component_stack.discard(component_name)
+                        component.add(component_name)
+
+                    incompatible_dependencies = set()
+                    for component_name in component:
+                        _, component_incompatible_dependencies, dependency_names = \
+                            self._get_dependency_edges(component_name)
+                        incompatible_dependencies.update(component_incompatible_dependencies)
+                        for dependency_name in dependency_names:
+                            if dependency_name not in component:
+                                incompatible_dependencies.update(self._incompatible_dependencies[dependency_name])
+
+                    incompatible_dependencies = frozenset(incompatible_dependencies)
+                    for component_name in component:
+                        self._incompatible_dependencies[component_name] = incompatible_dependencies
+
+        return self._incompatible_dependencies[gem_name]
+
+    def get_incompatible_dependencies(self, gem_json_data: dict) -> set:
+        """
+        Returns a set of descriptions of the dependencies of the gem, and of the gems it depends on,
+        which are missing or whose version is not compatible with the version specifier.
+        If a dependency only has a gem name, it is assumed compatible with every gem version with that name.
+        :param gem_json_data: gem json data dictionary, the gem doesn't need to be in the graph
+        """
+        gem_version_specifier_list = gem_json_data.get('dependencies')
+        if not gem_version_specifier_list:
+            return set()
+
+        if not self.gems_json_data_by_name:
+            # no gems are available
+            return set(gem_version_specifier_list)
+
+        _, incompatible_dependencies, dependency_gem_names = self._get_gem_dependency_edges(gem_json_data)
+        for dependency_gem_name in dependency_gem_names:
+            incompatible_dependencies.update(self._resolve_incompatible_dependencies(dependency_gem_name))
+        return incompatible_dependencies
+
+    def get_dependency_gem_names(self, gem_names: list) -> set:
+        """
+        Returns the names of all gems the gems depend on directly or indirectly, whether they are
+        available and compatible or not
+        :param gem_names: the names of the gems
+        """
+        dependency_gem_names = set()
+        gem_names_to_visit = list(gem_names)
+        while gem_names_to_visit:
+            for dependency_gem_name in self._get_dependency_edges(gem_names_to_visit.pop())[0]:
+                if dependency_gem_name not in dependency_gem_names:
+                    dependency_gem_names.add(dependency_gem_name)
+                    gem_names_to_visit.append(dependency_gem_name)
+        return dependency_gem_names
+
+
+@functools.lru_cache(maxsize=None)
+def _get_object_name_and_optional_version_specifier(name_and_version_specifier: str) -> tuple:
+    """
+    Memoized utils.get_object_name_and_optional_version_specifier, because the same specifiers
+    are parsed for every gem, project and engine that uses them
+    """
+    return utils.get_object_name_and_optional_version_specifier(name_and_version_specifier)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_object_name_and_specifier_set(name_and_version_specifier: str) -> tuple or None:
+    """
+    Returns the object name and the parsed SpecifierSet of a <name><version specifier(s)> string
+    or None if the string is not a valid name and version specifier
+    :param name_and_version_specifier: the name and version specifier
+    """
+    try:
+        name, version_specifier = utils.get_object_name_and_version_specifier(name_and_version_specifier)
+    except (utils.InvalidObjectNameException, utils.InvalidVersionSpecifierException):
+        return None
+    return name, SpecifierSet(version_specifier)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_version(object_version: str) -> Version or None:
+    try:
+        return Version(object_version)
+    except InvalidVersion as e:
+        return None
+
+
 def get_most_compatible_project_engine_path(project_path:pathlib.Path, 
                                             project_json_data:dict = None, 
                                             user_project_json_data:dict = None, 
@@ -58,30 +244,37 @@ def get_most_compatible_project_engine_path(project_path:pathlib.Path,
         engines = manifest.get_manifest_engines()
         for engine in engines:
             if isinstance(engine, dict):
-                engine_path = pathlib.Path(engine['path']).resolve()
+                engine_path = manifest.resolve_path(engine['path'])
             else:
-                engine_path = pathlib.Path(engine).resolve()
+                engine_path = manifest.resolve_path(engine)
             engine_json_data = manifest.get_engine_json_data(engine_path=engine_path)
             if not engine_json_data:
                 continue
             engines_json_data[engine_path] = engine_json_data
 
+    # the engine is selected by the 'engine' name and version specifier of the project alone, gem dependencies
+    # are not resolved for any engine, so the specifier is parsed once and each engine only has its
+    # name and version checked against it
+    project_engine_name_and_specifier_set = _get_object_name_and_specifier_set(project_engine)
+
     most_compatible_engine_path = None
     most_compatible_engine_version = None
     for engine_path, engine_json_data in engines_json_data.items():
         engine_name = engine_json_data.get('engine_name')
-        engine_version = engine_json_data.get('version')
+        # use a default version number in case version is missing or empty
+        engine_version = _get_version(engine_json_data.get('version') or '0.0.0')
         if not engine_version:
-            # use a default version number in case version is missing or empty
-            engine_version = '0.0.0'
-
-        if has_compatible_version([project_engine], engine_name, engine_version):
-            if not most_compatible_engine_path:
-                most_compatible_engine_path = pathlib.Path(engine_path)
-                most_compatible_engine_version = Version(engine_version)
-            elif Version(engine_version) > most_compatible_engine_version:
-                most_compatible_engine_path = pathlib.Path(engine_path)
-                most_compatible_engine_version = Version(engine_version)
+            logger.warning(f'Failed to parse version specifier {engine_json_data.get("version")}, please verify it is PEP 440 compatible.')
+            continue
+
+        if engine_name != project_engine and (not project_engine_name_and_specifier_set
+                                              or project_engine_name_and_specifier_set[0] != engine_name
+                                              or engine_version not in project_engine_name_and_specifier_set[1]):
+            continue
+
+        if not most_compatible_engine_path or engine_version > most_compatible_engine_version:
+            most_compatible_engine_path = pathlib.Path(engine_path)
+            most_compatible_engine_version = engine_version
     
     return most_compatible_engine_path
 
@@ -92,39 +285,43 @@ def get_project_engine_incompatible_objects(project_path:pathlib.Path, engine_pa
     :param project_path: Path to the project
     :param engine_path: Optional path to the engine. If not specified, the current engine path is used
     """
-    # use the specified engine path NOT necessarily engine the project is registered to
-    engine_path = engine_path or manifest.get_this_engine_path()
-    engine_json_data = manifest.get_engine_json_data(engine_path=engine_path)
-    if not engine_json_data:
-        logger.error(f'Failed to load engine.json data needed for compatibility check from {engine_path}. '
-            'Please verify the path is correct, the file exists and is formatted correctly.')
-        return set('engine.json (missing)')
+    with manifest.ManifestSession():
+        # use the specified engine path NOT necessarily engine the project is registered to
+        engine_path = engine_path or manifest.get_this_engine_path()
+        engine_json_data = manifest.get_engine_json_data(engine_path=engine_path)
+        if not engine_json_data:
+            logger.error(f'Failed to load engine.json data needed for compatibility check from {engine_path}. '
+                'Please verify the path is correct, the file exists and is formatted correctly.')
+            return set('engine.json (missing)')
 
-    project_json_data = manifest.get_project_json_data(project_path=project_path)
-    if not project_json_data:
-        logger.error(f'Failed to load project.json data needed for compatibility check from {project_path}. '
-            'Please verify the path is correct, the file exists and is formatted correctly.')
-        return set('project.json (missing)')
-
-    incompatible_objects = get_incompatible_objects_for_engine(project_json_data, engine_json_data)
-
-    # verify project -> gem -> engine compatibility
-    active_gem_names = project_json_data.get('gem_names',[])
-    enabled_gems_file = cmake.get_enabled_gem_cmake_file(project_path=project_path)
-    active_gem_names.extend(cmake.get_enabled_gems(enabled_gems_file))
-    active_gem_names = utils.get_gem_names_set(active_gem_names)
-
-    # it's much more efficient to get all gem data once than to query them by name one by one
-    all_gems_json_data = manifest.get_gems_json_data_by_name(engine_path, project_path, include_manifest_gems=True)
+        project_json_data = manifest.get_project_json_data(project_path=project_path)
+        if not project_json_data:
+            logger.error(f'Failed to load project.json data needed for compatibility check from {project_path}. '
+                'Please verify the path is correct, the file exists and is formatted correctly.')
+            return set('project.json (missing)')
+
+        incompatible_objects = get_incompatible_objects_for_engine(project_json_data, engine_json_data)
+
+        # verify project -> gem -> engine compatibility
+        active_gem_names = project_json_data.get('gem_names',[])
+        enabled_gems_file = cmake.get_enabled_gem_cmake_file(project_path=project_path)
+        active_gem_names.extend(cmake.get_enabled_gems(enabled_gems_file))
+        active_gem_names = utils.get_gem_names_set(active_gem_names)
+
+        # it's much more efficient to get all gem data once than to query them by name one by one
+        all_gems_json_data = manifest.get_gems_json_data_by_name(engine_path, project_path, include_manifest_gems=True)
+
+        # the dependencies shared by the active gems are only checked once
+        gem_dependency_graph = GemDependencyGraph(all_gems_json_data)
+        for gem_name in active_gem_names:
+            if gem_name not in all_gems_json_data:
+                logger.warning(f'Skipping compatibility check for {gem_name} because no gem.json data was found for it. '
+                    'Please verify this gem is registered.')
+                continue
+            incompatible_objects.update(get_incompatible_objects_for_engine(all_gems_json_data[gem_name], engine_json_data))
+            incompatible_objects.update(gem_dependency_graph.get_incompatible_dependencies(all_gems_json_data[gem_name]))
 
-    for gem_name in active_gem_names:
-        if gem_name not in all_gems_json_data:
-            logger.warning(f'Skipping compatibility check for {gem_name} because no gem.json data was found for it. '
-                'Please verify this gem is registered.')
-            continue
-        incompatible_objects.update(get_gem_engine_incompatible_objects(all_gems_json_data[gem_name], engine_json_data, all_gems_json_data))
-
-    return incompatible_objects
+        return incompatible_objects
 
 
 def get_incompatible_gem_dependencies(gem_json_data:dict, all_gems_json_data:dict) -> set:
@@ -139,7 +336,7 @@ def get_incompatible_gem_dependencies(gem_json_data:dict, all_gems_json_data:dic
     if not gem_dependencies:
         return set()
 
-    return get_incompatible_gem_version_specifiers(gem_json_data, all_gems_json_data, checked_specifiers=set())
+    return GemDependencyGraph(all_gems_json_data).get_incompatible_dependencies(gem_json_data)
 
 
 def get_gem_project_incompatible_objects(gem_path:pathlib.Path, 
@@ -153,33 +350,34 @@ def get_gem_project_incompatible_objects(gem_path:pathlib.Path,
     :param all_gems_json_data: optional dictionary containing data for all gems to use in compatibility checks. 
     If not provided, uses all gems from the manifest, engine and project.
     """
-    # early out if this project has no assigned engine
-    engine_path = manifest.get_project_engine_path(project_path=project_path)
-    if not engine_path:
-        logger.warning(f'Project at path {project_path} is not registered to an engine and compatibility cannot be checked.')
-        return set()
+    with manifest.ManifestSession():
+        # early out if this project has no assigned engine
+        engine_path = manifest.get_project_engine_path(project_path=project_path)
+        if not engine_path:
+            logger.warning(f'Project at path {project_path} is not registered to an engine and compatibility cannot be checked.')
+            return set()
 
-    project_json_data = manifest.get_project_json_data(project_path=project_path)
-    if not project_json_data:
-        logger.error(f'Failed to load project.json data from {project_path} needed for checking compatibility')
-        return set(f'project.json (missing)') 
+        project_json_data = manifest.get_project_json_data(project_path=project_path)
+        if not project_json_data:
+            logger.error(f'Failed to load project.json data from {project_path} needed for checking compatibility')
+            return set(f'project.json (missing)') 
 
-    # in the future we should check if the gem and project depend on conflicting engines and/or apis
-    # we need some way of doing version specifier overlap checks
+        # in the future we should check if the gem and project depend on conflicting engines and/or apis
+        # we need some way of doing version specifier overlap checks
 
-    engine_json_data = manifest.get_engine_json_data(engine_path=engine_path)
-    if not engine_json_data:
-        logger.error(f'Failed to load engine.json data based on the engine field in project.json or detect the engine from the current folder')
-        return set(f'engine.json (missing)') 
+        engine_json_data = manifest.get_engine_json_data(engine_path=engine_path)
+        if not engine_json_data:
+            logger.error(f'Failed to load engine.json data based on the engine field in project.json or detect the engine from the current folder')
+            return set(f'engine.json (missing)') 
 
-    # Include the gem_path for the gem we are adding so it 
-    # and any gems in 'external_subdirectories' it has will be considered 
-    all_gems_json_data = manifest.get_gems_json_data_by_name(engine_path, project_path, 
-        external_subdirectories=[gem_path], include_manifest_gems=True)
+        # Include the gem_path for the gem we are adding so it 
+        # and any gems in 'external_subdirectories' it has will be considered 
+        all_gems_json_data = manifest.get_gems_json_data_by_name(engine_path, project_path, 
+            external_subdirectories=[gem_path], include_manifest_gems=True)
 
-    # compatibility will be based on the engine the project uses and the gems visible to
-    # the engine and project
-    return get_gem_engine_incompatible_objects(gem_json_data, engine_json_data, all_gems_json_data)
+        # compatibility will be based on the engine the project uses and the gems visible to
+        # the engine and project
+        return get_gem_engine_incompatible_objects(gem_json_data, engine_json_data, all_gems_json_data)
 
 
 def get_gem_engine_incompatible_objects(gem_json_data:dict, engine_json_data:dict, all_gems_json_data:dict) -> set:
@@ -244,55 +442,21 @@ def get_incompatible_objects_for_engine(object_json_data:dict, engine_json_data:
     return incompatible_objects
 
 
-def get_incompatible_gem_version_specifiers(gem_json_data:dict, all_gems_json_data:dict, checked_specifiers:set) -> set:
+def get_incompatible_gem_version_specifiers(gem_json_data:dict, all_gems_json_data:dict, checked_specifiers:set = None) -> set:
     """
     Returns a set of gem version specifiers that are not compatible with the gem's provided
     If a gem_version_specifier_list entry only has a gem name, it is assumed compatible with every gem version with that name.
-    :param gem_version_specifier_list: a list of gem names and (optional)version specifiers
+    :param gem_json_data: gem json data dictionary
     :param all_gems_json_data: json data of all gems to use for compatibility checks
+    :param checked_specifiers: optional set of the gem version specifiers already checked, these are not checked again
     """
-    gem_version_specifier_list = gem_json_data.get('dependencies')
-    if not gem_version_specifier_list:
-        return set()
-
-    if not all_gems_json_data:
-        # no gems are available
-        return set(gem_version_specifier_list)
+    if checked_specifiers is not None:
+        gem_version_specifier_list = [gem_version_specifier for gem_version_specifier in gem_json_data.get('dependencies') or []
+                                      if gem_version_specifier not in checked_specifiers]
+        checked_specifiers.update(gem_version_specifier_list)
+        gem_json_data = dict(gem_json_data, dependencies=gem_version_specifier_list)
 
-    incompatible_gem_version_specifiers = set()
-
-    # helper function to check dependency tree for incompatible gem dependencies
-    def get_gem_dependency_version_specifiers(gem_name):
-        gem_dependencies = all_gems_json_data[gem_name].get('dependencies')
-        if gem_dependencies:
-            incompatible_dependency_specifiers = get_incompatible_gem_version_specifiers(all_gems_json_data[gem_name], all_gems_json_data, checked_specifiers)
-            if incompatible_dependency_specifiers:
-                incompatible_gem_version_specifiers.update(incompatible_dependency_specifiers)
-
-    for gem_version_specifier in gem_version_specifier_list:
-        if gem_version_specifier in checked_specifiers:
-            continue
-
-        checked_specifiers.add(gem_version_specifier)
-
-        gem_name, version_specifier = utils.get_object_name_and_optional_version_specifier(gem_version_specifier)
-        if not gem_name in all_gems_json_data:
-            incompatible_gem_version_specifiers.add(f"{gem_json_data['gem_name']} is missing the dependency {gem_version_specifier}")
-            continue
-
-        if not version_specifier:
-            # when no version specifier is provided we assume compatibility with any version
-            get_gem_dependency_version_specifiers(gem_name)
-            continue
-        
-        gem_version = all_gems_json_data[gem_name].get('version')
-        if gem_version and not has_compatible_version([gem_version_specifier], gem_name, gem_version):
-            incompatible_gem_version_specifiers.add(f"{gem_json_data['gem_name']} depends on {gem_version_specifier} but {gem_name} version {gem_version} was found")
-            continue
-
-        get_gem_dependency_version_specifiers(gem_name)
-
-    return incompatible_gem_version_specifiers
+    return GemDependencyGraph(all_gems_json_data).get_incompatible_dependencies(gem_json_data)
 
 
 def has_compatible_name(name_and_version_specifier_list:list, object_name:str) -> bool:
@@ -317,9 +481,8 @@ def has_compatible_version(name_and_version_specifier_list:list, object_name:str
     :param object_name: the object name
     :param object_version: the object version
     """
-    try:
-        version = Version(object_version)
-    except InvalidVersion as e:
+    version = _get_version(object_version)
+    if not version:
         logger.warning(f'Failed to parse version specifier {object_version}, please verify it is PEP 440 compatible.')
         return False
 
@@ -328,12 +491,10 @@ def has_compatible_version(name_and_version_specifier_list:list, object_name:str
         if object_name == name_and_version_specifier:
             return True
 
-        try:
-            name, version_specifier = utils.get_object_name_and_version_specifier(name_and_version_specifier)
-            if name == object_name and version in SpecifierSet(version_specifier):
-                return True
-        except (utils.InvalidObjectNameException, utils.InvalidVersionSpecifierException):
-            # skip invalid specifiers
-            pass
+        # skip invalid specifiers
+        name_and_specifier_set = _get_object_name_and_specifier_set(name_and_version_specifier)
+        if name_and_specifier_set and name_and_specifier_set[0] == object_name \
+                and version in name_and_specifier_set[1]:
+            return True
 
     return False 
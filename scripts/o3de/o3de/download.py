@@ -10,7 +10,6 @@ Implements functionality for downloading o3de objects either locally or from a U
 """
 
 import argparse
-import hashlib
 import json
 import logging
 import os
@@ -22,7 +21,7 @@ import urllib.request
 import zipfile
 from datetime import datetime
 
-from o3de import manifest, repo, utils, validation, register
+from o3de import manifest, repo, utils, validation, register, sha256
 
 logger = logging.getLogger('o3de.download')
 logging.basicConfig(format=utils.LOG_FORMAT)
@@ -41,7 +40,14 @@ def unzip_manifest_json_data(download_zip_path: pathlib.Path, zip_file_name: str
 
 
 def validate_downloaded_zip_sha256(download_uri_json_data: dict, download_zip_path: pathlib.Path,
-                                   manifest_json_name) -> int:
+                                   manifest_json_name, sha256_digest: str = None) -> int:
+    """
+    Returns 1 if the downloaded zip is the advertised o3de object, 0 otherwise
+    :param download_uri_json_data: advertised o3de object json data
+    :param download_zip_path: path of the downloaded zip
+    :param manifest_json_name: name of the o3de object json file in the zip
+    :param sha256_digest: sha256 of the downloaded zip if it was just computed, otherwise the zip is hashed
+    """
     # if the json has a sha256 check it against a sha256 of the zip
     try:
         sha256A = download_uri_json_data['sha256']
@@ -55,12 +61,12 @@ def validate_downloaded_zip_sha256(download_uri_json_data: dict, download_zip_pa
                         ' We cannot verify this is the actually the advertised object!!!')
             return 1
 
-        with download_zip_path.open('rb') as f:
-            sha256B = hashlib.sha256(f.read()).hexdigest()
-            if sha256A != sha256B:
-                logger.error(f'SECURITY VIOLATION: Downloaded zip sha256 {sha256B} does not match'
-                            f' the advertised "sha256":{sha256A} in the f{manifest_json_name}.')
-                return 0
+        # always hash the downloaded file, the sha256 index trusts files whose size and modification time didn't change
+        sha256B = sha256_digest or sha256.compute_file_sha256(download_zip_path)
+        if sha256A != sha256B:
+            logger.error(f'SECURITY VIOLATION: Downloaded zip sha256 {sha256B} does not match'
+                        f' the advertised "sha256":{sha256A} in the f{manifest_json_name}.')
+            return 0
 
     unzipped_manifest_json_data = unzip_manifest_json_data(download_zip_path, manifest_json_name)
 
@@ -79,6 +85,25 @@ def validate_downloaded_zip_sha256(download_uri_json_data: dict, download_zip_pa
     return 1
 
 
+def get_current_downloaded_zip_sha256(download_uri_json_data: dict, download_zip_path: pathlib.Path) -> str or None:
+    """
+    Returns the sha256 of the zip previously downloaded to download_zip_path if it is the advertised zip,
+    so it can be validated without hashing it again
+    :param download_uri_json_data: advertised o3de object json data containing the "sha256" of the zip
+    :param download_zip_path: path of the previously downloaded zip
+    :return: the sha256 of the zip or None if there is no zip or it is not the advertised zip
+    """
+    advertised_sha256 = download_uri_json_data.get('sha256', '')
+    if not advertised_sha256 or not download_zip_path.is_file():
+        return None
+    download_zip_sha256 = sha256.compute_file_sha256(download_zip_path)
+    return download_zip_sha256 if download_zip_sha256 == advertised_sha256 else None
+
+
+def get_download_zip_path(object_name: str, default_folder_name: str, object_type: str) -> pathlib.Path:
+    return manifest.get_o3de_cache_folder() / default_folder_name / object_name / f'{object_type}.zip'
+
+
 def get_downloadable(engine_name: str = None,
                      project_name: str = None,
                      gem_name: str = None,
@@ -99,9 +124,8 @@ def download_o3de_object(object_name: str, default_folder_name: str, dest_path:
                          object_type: str, downloadable_kwarg_key, skip_auto_register: bool,
                          force_overwrite: bool, download_progress_callback = None) -> int:
 
-    download_path = manifest.get_o3de_cache_folder() / default_folder_name / object_name
-    download_path.mkdir(parents=True, exist_ok=True)
-    download_zip_path = download_path / f'{object_type}.zip'
+    download_zip_path = get_download_zip_path(object_name, default_folder_name, object_type)
+    download_zip_path.parent.mkdir(parents=True, exist_ok=True)
 
     downloadable_object_data = get_downloadable(**{downloadable_kwarg_key : object_name})
     if not downloadable_object_data:
@@ -126,11 +150,19 @@ def download_o3de_object(object_name: str, default_folder_name: str, dest_path:
             logger.error(f'Could not clone {parsed_uri.geturl()}')
             return 1
     else:
-        download_zip_result = utils.download_zip_file(parsed_uri, download_zip_path, force_overwrite, object_name, download_progress_callback)
-        if download_zip_result != 0:
-            return download_zip_result
-
-        if not validate_downloaded_zip_sha256(downloadable_object_data, download_zip_path, f'{object_type}.json'):
+        # the zip from a previous download is reused if it is the advertised zip, and isn't hashed again to validate it
+        download_zip_sha256 = None
+        if not force_overwrite:
+            download_zip_sha256 = get_current_downloaded_zip_sha256(downloadable_object_data, download_zip_path)
+        if download_zip_sha256:
+            logger.info(f'{download_zip_path} has already been downloaded.')
+        else:
+            download_zip_result = utils.download_zip_file(parsed_uri, download_zip_path, force_overwrite, object_name, download_progress_callback)
+            if download_zip_result != 0:
+                return download_zip_result
+
+        if not validate_downloaded_zip_sha256(downloadable_object_data, download_zip_path, f'{object_type}.json',
+                                              download_zip_sha256):
             logger.error(f'Could not validate zip, deleting {download_zip_path}')
             os.unlink(download_zip_path)
             return 1
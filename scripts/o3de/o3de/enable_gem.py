@@ -42,100 +42,101 @@ def enable_gem_in_project(gem_name: str = None,
     :param optional: mark the gem as optional
     :return: 0 for success or non 0 failure code
     """
-    # we need either a project name or path
-    if not project_name and not project_path:
-        logger.error(f'Must either specify a Project path or Project Name.')
-        return 1
-
-    # if project name resolve it into a path
-    if project_name and not project_path:
-        project_path = manifest.get_registered(project_name=project_name)
-    if not project_path:
-        logger.error(f'Unable to locate project path from the registered manifest.json files:'
-                     f' {str(pathlib.Path.home() / ".o3de/manifest.json")}, engine.json')
-        return 1
-
-    project_path = pathlib.Path(project_path).resolve()
-    if not project_path.is_dir():
-        logger.error(f'Project path {project_path} is not a folder.')
-        return 1
-
-    # we need either a gem name or path
-    if not gem_name and not gem_path:
-        logger.error(f'Must either specify a Gem path or Gem Name.')
-        return 1
-
-    # if gem name resolve it into a path
-    if gem_name and not gem_path:
-        gem_path = manifest.get_registered(gem_name=gem_name, project_path=project_path)
-    if not gem_path:
-        logger.error(f'Unable to locate gem path from the registered manifest.json files:'
-                     f' {str(pathlib.Path( "~/.o3de/o3de_manifest.json").expanduser())},'
-                     f' {project_path / "project.json"}, engine.json')
-        return 1
-
-    gem_path = pathlib.Path(gem_path).resolve()
-    # make sure this gem already exists if we're adding.  We can always remove a gem.
-    if not gem_path.is_dir():
-        logger.error(f'Gem Path {gem_path} does not exist.')
-        return 1
-
-    # Read gem.json from the gem path
-    gem_json_data = manifest.get_gem_json_data(gem_path=gem_path, project_path=project_path)
-    if not gem_json_data:
-        logger.error(f'Could not read gem.json content under {gem_path}.')
-        return 1
-
-    if enabled_gem_file:
-        # make sure this project has an enabled gems file
-        if not enabled_gem_file.is_file():
-            logger.error(f'Enabled gem file {enabled_gem_file} is not present.')
+    with manifest.ManifestSession():
+        # we need either a project name or path
+        if not project_name and not project_path:
+            logger.error(f'Must either specify a Project path or Project Name.')
             return 1
-        project_enabled_gem_file = enabled_gem_file
 
-    else:
-        # Find the path to enabled gem file.
-        # It will be created if it doesn't exist
-        project_enabled_gem_file = cmake.get_enabled_gem_cmake_file(project_path=project_path)
-        if not project_enabled_gem_file.is_file():
-            project_enabled_gem_file.touch()
-
-    # Before adding the gem_dependency check if the gem is registered in either the project or engine manifest
-    buildable_gems = manifest.get_engine_gems()
-    buildable_gems.extend(manifest.get_project_gems(project_path))
-    # Convert each path to pathlib.Path object and filter out duplicates using dict.fromkeys
-    buildable_gems = list(dict.fromkeys(map(lambda gem_path_string: pathlib.Path(gem_path_string), buildable_gems)))
-
-    # check compatibility
-    if force:
-        logger.info(f'Bypassing version compatibility check for {gem_json_data["gem_name"]}.')
-    else:
-        # do not check compatibility if the project has not been registered with an engine 
-        # because most gems depend on engine gems which would not be found 
-        if manifest.get_project_engine_path(project_path):
-            # Note: we don't remove gems that are not active or dependencies
-            # because they will be implicitely found and activated via cmake 
-            incompatible_objects = compatibility.get_gem_project_incompatible_objects(gem_path, gem_json_data, project_path)
-            if incompatible_objects:
-                logger.error(f'{gem_json_data["gem_name"]} has the following dependency compatibility issues and '
-                    'requires the --force parameter to activate:\n  '+ 
-                    "\n  ".join(incompatible_objects))
-                return 1
+        # if project name resolve it into a path
+        if project_name and not project_path:
+            project_path = manifest.get_registered(project_name=project_name)
+        if not project_path:
+            logger.error(f'Unable to locate project path from the registered manifest.json files:'
+                         f' {str(pathlib.Path.home() / ".o3de/manifest.json")}, engine.json')
+            return 1
+
+        project_path = pathlib.Path(project_path).resolve()
+        if not project_path.is_dir():
+            logger.error(f'Project path {project_path} is not a folder.')
+            return 1
+
+        # we need either a gem name or path
+        if not gem_name and not gem_path:
+            logger.error(f'Must either specify a Gem path or Gem Name.')
+            return 1
 
-        if dry_run:
-            logger.info(f'{gem_json_data["gem_name"]} is compatible with this project')
-            return 0
+        # if gem name resolve it into a path
+        if gem_name and not gem_path:
+            gem_path = manifest.get_registered(gem_name=gem_name, project_path=project_path)
+        if not gem_path:
+            logger.error(f'Unable to locate gem path from the registered manifest.json files:'
+                         f' {str(pathlib.Path( "~/.o3de/o3de_manifest.json").expanduser())},'
+                         f' {project_path / "project.json"}, engine.json')
+            return 1
 
-    ret_val = 0
-    # If the gem is not part of buildable set, it's gem_name should be registered to the "gem_names" field
-    if gem_path not in buildable_gems:
-        ret_val = project_properties.edit_project_props(project_path, new_gem_names=gem_json_data['gem_name'],
-                                                        is_optional_gem=optional)
+        gem_path = pathlib.Path(gem_path).resolve()
+        # make sure this gem already exists if we're adding.  We can always remove a gem.
+        if not gem_path.is_dir():
+            logger.error(f'Gem Path {gem_path} does not exist.')
+            return 1
 
-    # add the gem if it is registered in either the project.json or engine.json
-    ret_val = ret_val or cmake.add_gem_dependency(project_enabled_gem_file, gem_json_data['gem_name'])
+        # Read gem.json from the gem path
+        gem_json_data = manifest.get_gem_json_data(gem_path=gem_path, project_path=project_path)
+        if not gem_json_data:
+            logger.error(f'Could not read gem.json content under {gem_path}.')
+            return 1
 
-    return ret_val
+        if enabled_gem_file:
+            # make sure this project has an enabled gems file
+            if not enabled_gem_file.is_file():
+                logger.error(f'Enabled gem file {enabled_gem_file} is not present.')
+                return 1
+            project_enabled_gem_file = enabled_gem_file
+
+        else:
+            # Find the path to enabled gem file.
+            # It will be created if it doesn't exist
+            project_enabled_gem_file = cmake.get_enabled_gem_cmake_file(project_path=project_path)
+            if not project_enabled_gem_file.is_file():
+                project_enabled_gem_file.touch()
+
+        # Before adding the gem_dependency check if the gem is registered in either the project or engine manifest
+        buildable_gems = manifest.get_engine_gems()
+        buildable_gems.extend(manifest.get_project_gems(project_path))
+        # Convert each path to pathlib.Path object and filter out duplicates using dict.fromkeys
+        buildable_gems = list(dict.fromkeys(map(lambda gem_path_string: pathlib.Path(gem_path_string), buildable_gems)))
+
+        # check compatibility
+        if force:
+            logger.info(f'Bypassing version compatibility check for {gem_json_data["gem_name"]}.')
+        else:
+            # do not check compatibility if the project has not been registered with an engine 
+            # because most gems depend on engine gems which would not be found 
+            if manifest.get_project_engine_path(project_path):
+                # Note: we don't remove gems that are not active or dependencies
+                # because they will be implicitely found and activated via cmake 
+                incompatible_objects = compatibility.get_gem_project_incompatible_objects(gem_path, gem_json_data, project_path)
+                if incompatible_objects:
+                    logger.error(f'{gem_json_data["gem_name"]} has the following dependency compatibility issues and '
+                        'requires the --force parameter to activate:\n  '+ 
+                        "\n  ".join(incompatible_objects))
+                    return 1
+
+            if dry_run:
+                logger.info(f'{gem_json_data["gem_name"]} is compatible with this project')
+                return 0
+
+        ret_val = 0
+        # If the gem is not part of buildable set, it's gem_name should be registered to the "gem_names" field
+        if gem_path not in buildable_gems:
+            ret_val = project_properties.edit_project_props(project_path, new_gem_names=gem_json_data['gem_name'],
+                                                            is_optional_gem=optional)
+
+        # add the gem if it is registered in either the project.json or engine.json
+        ret_val = ret_val or cmake.add_gem_dependency(project_enabled_gem_file, gem_json_data['gem_name'])
+
+        return ret_val
 
 
 def add_explicit_gem_activation_for_all_paths(gem_root_folders: list,
@@ -151,35 +152,36 @@ def add_explicit_gem_activation_for_all_paths(gem_root_folders: list,
     :param enabled_gem_file: if this dependency goes/is in a specific file
     :return: 0 for success or non 0 failure code
     """
-    if not gem_root_folders:
-        logger.error('gem_root_folders list cannot be empty')
-        return 1
-
-    def stop_on_template_folders(directories: list, filenames: list) -> bool:
-        return 'template.json' in filenames
-
-    gem_dirs_set = set()
-    ret_val = 0
-    for gem_root_folder in gem_root_folders:
-        gem_root_folder = pathlib.Path(gem_root_folder).resolve()
-        if not gem_root_folder.is_dir():
-            logger.error(f'gem root folder of {gem_root_folder} is not a directory')
-            ret_val = 1
-        for root, dirs, files in os.walk(gem_root_folder):
-            # Skip activating gems within template directories
-            if stop_on_template_folders(dirs, files):
-                dirs[:] = []
-            elif 'gem.json' in files:
-                gem_dirs_set.add(pathlib.Path(root))
-
-    for gem_dir in sorted(gem_dirs_set):
-        # Run the command to add explicit activation even if previous calls failed
-        ret_val = enable_gem_in_project(gem_path=gem_dir,
-                                        project_name=project_name,
-                                        project_path=project_path,
-                                        enabled_gem_file=enabled_gem_file) or ret_val
-
-    return ret_val
+    with manifest.ManifestSession():
+        if not gem_root_folders:
+            logger.error('gem_root_folders list cannot be empty')
+            return 1
+
+        def stop_on_template_folders(directories: list, filenames: list) -> bool:
+            return 'template.json' in filenames
+
+        gem_dirs_set = set()
+        ret_val = 0
+        for gem_root_folder in gem_root_folders:
+            gem_root_folder = pathlib.Path(gem_root_folder).resolve()
+            if not gem_root_folder.is_dir():
+                logger.error(f'gem root folder of {gem_root_folder} is not a directory')
+                ret_val = 1
+            for root, dirs, files in os.walk(gem_root_folder):
+                # Skip activating gems within template directories
+                if stop_on_template_folders(dirs, files):
+                    dirs[:] = []
+                elif 'gem.json' in files:
+                    gem_dirs_set.add(pathlib.Path(root))
+
+        for gem_dir in sorted(gem_dirs_set):
+            # Run the command to add explicit activation even if previous calls failed
+            ret_val = enable_gem_in_project(gem_path=gem_dir,
+                                            project_name=project_name,
+                                            project_path=project_path,
+                                            enabled_gem_file=enabled_gem_file) or ret_val
+
+        return ret_val
 
 
 def _run_enable_gem_in_project(args: argparse) -> int:
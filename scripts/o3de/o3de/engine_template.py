@@ -8,6 +8,9 @@
 This file contains all the code that has to do with creating and instantiate engine templates
 """
 import argparse
+import concurrent.futures
+import functools
+import hashlib
 import logging
 import os
 import pathlib
@@ -18,7 +21,7 @@ import uuid
 import re
 
 
-from o3de import manifest, register, validation, utils
+from o3de import manifest, register, sha256, validation, utils
 
 logger = logging.getLogger('o3de.engine_template')
 logging.basicConfig(format=utils.LOG_FORMAT)
@@ -94,8 +97,16 @@ O3DE_LICENSE_TEXT = \
 # {END_LICENSE}
 """
 
+# the name of the Platform should follow the '/Platform/'
+restricted_platform_pattern = re.compile(r'/Platform/(?P<Platform>[^/:*?\"<>|\r\n]+/?)')
+
 this_script_parent = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
 
+# create_template records the content hash of each source file in a file of this folder of the o3de cache folder,
+# so running it again in incremental mode only transforms the files that changed
+template_cache_folder_name = 'TemplateCache'
+TEMPLATE_CACHE_VERSION = 1
+
 
 def _replace_license_text(source_data: str):
     while '{BEGIN_LICENSE}' in source_data:
@@ -161,24 +172,71 @@ def _remove_license_text_markers(source_data: str):
     return source_data
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_replacements(replacements: tuple) -> tuple or None:
+    """
+    Internal function called to compile the transformation pairs into a single regular expression,
+    so data can be transformed in one pass instead of one pass per pair
+    :param replacements: tuple of transformation pairs A->B
+    :return: tuple of the compiled pattern and a dict of A->B, where B is None for ${Random_Uuid},
+     or None if a single pass can't give the same result as applying each pair in order
+    """
+    replacement_map = {}
+    # the first pair wins when A is repeated, the following pairs have nothing left to replace
+    for replace_this, with_this in replacements + (('${Random_Uuid}', None),):
+        replacement_map.setdefault(replace_this, with_this)
+
+    # a single pass finds the same matches as one pass per pair only if the strings to replace can't overlap
+    for replace_this in replacement_map:
+        if not replace_this:
+            return None
+        for other in replacement_map:
+            if replace_this != other and (replace_this in other or
+                                          any(replace_this.endswith(other[:length])
+                                              for length in range(1, min(len(replace_this), len(other))))):
+                return None
+
+    return re.compile('|'.join(map(re.escape, replacement_map))), replacement_map
+
+
 def _transform(s_data: str,
                replacements: list,
                keep_license_text: bool = False) -> str:
     """
     Internal function called to transform source data into templated data
+    The result is the same as applying each pair in order with str.replace, where a replacement can create a string
+    replaced by a later pair. The pairs are applied in a single pass when the strings to replace can't overlap and the
+    result contains none of them, so no replacement created a string to replace. Otherwise they are applied in order.
     :param s_data: the source data to be transformed
     :param replacements: list of transformation pairs A->B
     :param keep_license_text: whether or not you want to keep license text
     :return: the potentially transformed data
     """
-    # copy the s_data into t_data, then apply all transformations only on t_data
-    t_data = str(s_data)
-    for replacement in replacements:
-        t_data = t_data.replace(replacement[0], replacement[1])
+    t_data = None
+    compiled_replacements = _compile_replacements(tuple(map(tuple, replacements)))
+    if compiled_replacements:
+        pattern, replacement_map = compiled_replacements
+
+        def replace_match(match) -> str:
+            with_this = replacement_map[match.group(0)]
+            # if someone hand edits the template to have ${Random_Uuid} then replace it with a randomly generated uuid
+            return with_this if with_this is not None else str(uuid.uuid4()).upper()
+
+        t_data = pattern.sub(replace_match, s_data)
+        # if a replacement created a new occurrence of a string to replace, alone or with the text around it,
+        # fall back to applying each pair in order, which replaces the occurrences created for the later pairs only
+        if pattern.search(t_data):
+            t_data = None
+
+    if t_data is None:
+        # copy the s_data into t_data, then apply all transformations only on t_data
+        t_data = str(s_data)
+        for replacement in replacements:
+            t_data = t_data.replace(replacement[0], replacement[1])
 
-    # if someone hand edits the template to have ${Random_Uuid} then replace it with a randomly generated uuid
-    while '${Random_Uuid}' in t_data:
-        t_data = t_data.replace('${Random_Uuid}', str(uuid.uuid4()).upper(), 1)
+        # if someone hand edits the template to have ${Random_Uuid} then replace it with a randomly generated uuid
+        while '${Random_Uuid}' in t_data:
+            t_data = t_data.replace('${Random_Uuid}', str(uuid.uuid4()).upper(), 1)
 
     if keep_license_text:
         t_data = _remove_license_text_markers(t_data)
@@ -222,6 +280,36 @@ def _transform_copy(source_file: pathlib.Path,
             pass
 
 
+def _copy_template_files(template_files: list,
+                         replacements: list,
+                         keep_license_text: bool = False) -> None:
+    """
+    Internal function called to copy the files of a template into a concrete instance concurrently
+    :param template_files: list of (source file, destination file, is templated) tuples
+    :param replacements: list of transformation pairs A->B
+    :param keep_license_text: whether or not you want to keep license text
+    """
+    # if a destination file is in the list more than once the last copy wins
+    template_files = {out_file: (in_file, out_file, is_templated) for in_file, out_file, is_templated in template_files}
+
+    def copy_template_file(template_file: tuple) -> None:
+        in_file, out_file, is_templated = template_file
+        # if for some reason the output folder for this file was not created above do it now
+        os.makedirs(os.path.dirname(out_file), exist_ok=True)
+
+        # if templated _transformCopy the file, if not just copy it
+        # shutil.copy uses the platform fast copy, ex. sendfile on linux, for files that are not transformed
+        if is_templated:
+            _transform_copy(in_file, out_file, replacements, keep_license_text)
+        else:
+            shutil.copy(in_file, out_file)
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        # iterate the results so that exceptions raised while copying are raised here
+        for _ in executor.map(copy_template_file, template_files.values()):
+            pass
+
+
 def _execute_template_json(json_data: dict,
                            destination_path: pathlib.Path,
                            template_path: pathlib.Path,
@@ -241,8 +329,7 @@ def _execute_template_json(json_data: dict,
         if not keep_restricted_in_instance and 'Platform' in new_dir.parts:
             try:
                 # the name of the Platform should follow the '/Platform/'
-                pattern = r'/Platform/(?P<Platform>[^/:*?\"<>|\r\n]+/?)'
-                found_platform = re.search(pattern, new_dir.as_posix()).group('Platform')
+                found_platform = restricted_platform_pattern.search(new_dir.as_posix()).group('Platform')
                 found_platform = found_platform.replace('/', '')
                 if found_platform in restricted_platforms:
                     continue
@@ -254,6 +341,7 @@ def _execute_template_json(json_data: dict,
 
     # for each copyFiles entry, _transformCopy the templated source file into a concrete instance file or
     # regular copy if not templated
+    template_files = []
     for copy_file in json_data['copyFiles']:
         # construct the input file name
         in_file = template_path / 'Template' / copy_file['file']
@@ -268,22 +356,16 @@ def _execute_template_json(json_data: dict,
         if not keep_restricted_in_instance and 'Platform' in out_file.parts:
             try:
                 # the name of the Platform should follow the '/Platform/'
-                pattern = r'/Platform/(?P<Platform>[^/:*?\"<>|\r\n]+/?)'
-                found_platform = re.search(pattern, out_file.as_posix()).group('Platform')
+                found_platform = restricted_platform_pattern.search(out_file.as_posix()).group('Platform')
                 found_platform = found_platform.replace('/', '')
                 if found_platform in restricted_platforms:
                     continue
             except Exception as e:
                 pass
 
-        # if for some reason the output folder for this file was not created above do it now
-        os.makedirs(os.path.dirname(out_file), exist_ok=True)
+        template_files.append((in_file, out_file, copy_file['isTemplated']))
 
-        # if templated _transformCopy the file, if not just copy it
-        if copy_file['isTemplated']:
-            _transform_copy(in_file, out_file, replacements, keep_license_text)
-        else:
-            shutil.copy(in_file, out_file)
+    _copy_template_files(template_files, replacements, keep_license_text)
 
 
 def _execute_restricted_template_json(template_json_data: dict,
@@ -317,8 +399,7 @@ def _execute_restricted_template_json(template_json_data: dict,
         if not keep_restricted_in_instance and 'Platform' in new_dir.parts:
             try:
                 # the name of the Platform should follow the '/Platform/'
-                pattern = r'/Platform/(?P<Platform>[^/:*?\"<>|\r\n]+/?)'
-                found_platform = re.search(pattern, new_dir.as_posix()).group('Platform')
+                found_platform = restricted_platform_pattern.search(new_dir.as_posix()).group('Platform')
             except Exception as e:
                 pass
             else:
@@ -336,8 +417,7 @@ def _execute_restricted_template_json(template_json_data: dict,
         if not keep_restricted_in_instance and 'Platform' in new_file.parts:
             try:
                 # the name of the Platform should follow the '/Platform/'
-                pattern = r'/Platform/(?P<Platform>[^/:*?\"<>|\r\n]+/?)'
-                found_platform = re.search(pattern, new_file.as_posix()).group('Platform')
+                found_platform = restricted_platform_pattern.search(new_file.as_posix()).group('Platform')
             except Exception as e:
                 pass
             else:
@@ -374,6 +454,7 @@ def _execute_restricted_template_json(template_json_data: dict,
     # for each copyFiles entry, _transformCopy the templated source file into a concrete instance file or
     # regular copy if not templated
     if 'copyFiles' in json_data:
+        template_files = []
         for copy_file in json_data['copyFiles']:
             # construct the input file name
             if template_restricted_path:
@@ -392,14 +473,9 @@ def _execute_restricted_template_json(template_json_data: dict,
             # transform the output file name
             out_file = _transform(out_file.as_posix(), replacements, keep_license_text)
 
-            # if for some reason the output folder for this file was not created above do it now
-            os.makedirs(os.path.dirname(out_file), exist_ok=True)
+            template_files.append((in_file, out_file, copy_file['isTemplated']))
 
-            # if templated _transformCopy the file, if not just copy it
-            if copy_file['isTemplated']:
-                _transform_copy(in_file, out_file, replacements, keep_license_text)
-            else:
-                shutil.copy(in_file, out_file)
+        _copy_template_files(template_files, replacements, keep_license_text)
 
 
 def _instantiate_template(template_json_data: dict,
@@ -487,6 +563,68 @@ def _instantiate_template(template_json_data: dict,
     return 0
 
 
+def _get_template_cache_path(template_path: pathlib.Path) -> pathlib.Path:
+    """
+    Internal function to get the path of the file recording the source files of a template created incrementally,
+    which is kept in the o3de cache folder so the template folder only holds the template
+    :param template_path: the template folder
+    :return: the path of the template cache file, named by the hash of the resolved template folder path
+    """
+    template_path_hash = hashlib.sha256(pathlib.Path(template_path).resolve().as_posix().encode()).hexdigest()
+    return manifest.get_o3de_cache_folder() / template_cache_folder_name / f'{template_path_hash}.json'
+
+
+def _load_template_cache(template_cache_path: pathlib.Path, keep_license_text: bool) -> dict:
+    """
+    Internal function to load the source files recorded by a previous incremental create_template
+    :param template_cache_path: path of the template cache file
+    :param keep_license_text: whether or not the template is created keeping the license text
+    :return: dict of source file path to its recorded entry, empty if the cache is missing, invalid or was
+     recorded with different settings
+    """
+    if not template_cache_path.is_file():
+        return {}
+    try:
+        with template_cache_path.open('r') as s:
+            template_cache_data = json.load(s)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f'Template cache {template_cache_path} failed to load, all files will be transformed: {str(e)}')
+        return {}
+
+    if not isinstance(template_cache_data, dict) \
+            or template_cache_data.get('version', None) != TEMPLATE_CACHE_VERSION \
+            or template_cache_data.get('keep_license_text', None) != keep_license_text:
+        return {}
+    return template_cache_data.get('files', {})
+
+
+def _save_template_cache(template_cache_path: pathlib.Path, keep_license_text: bool, template_cache_files: dict) -> bool:
+    """
+    Internal function to record the source files transformed by create_template
+    :param template_cache_path: path of the template cache file
+    :param keep_license_text: whether or not the template was created keeping the license text
+    :param template_cache_files: dict of source file path to its entry
+    :return: True if the cache was saved
+    """
+    template_cache_path.parent.mkdir(parents=True, exist_ok=True)
+    return manifest.write_json_file_atomically({'version': TEMPLATE_CACHE_VERSION,
+                                                'keep_license_text': keep_license_text,
+                                                'files': template_cache_files}, template_cache_path)
+
+
+def _get_file_stat(file_path: pathlib.Path) -> list or None:
+    """
+    Internal function to get the size and modification time of a file
+    :param file_path: the file path
+    :return: list of the size and modification time in nanoseconds, None if the file doesn't exist
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    return [file_stat.st_size, file_stat.st_mtime_ns]
+
+
 def create_template(source_path: pathlib.Path,
                     template_path: pathlib.Path,
                     source_name: str = None,
@@ -500,7 +638,8 @@ def create_template(source_path: pathlib.Path,
                     keep_license_text: bool = False,
                     replace: list = None,
                     force: bool = False,
-                    no_register: bool = False) -> int:
+                    no_register: bool = False,
+                    incremental: bool = False) -> int:
     """
     Create a template from a source directory using replacement
 
@@ -527,6 +666,9 @@ def create_template(source_path: pathlib.Path,
      because most people will not want license text in their instances.
      :param force Overrides existing files even if they exist
      :param no_register: whether or not after completion that the new object is registered
+     :param incremental: whether or not to update an existing template, only the source files whose content or
+      replacements changed since the template was last created incrementally are transformed again and the
+      other fields of the existing template.json are kept
     :return: 0 for success or non 0 failure code
     """
 
@@ -553,7 +695,7 @@ def create_template(source_path: pathlib.Path,
         default_templates_folder = manifest.get_registered(default_folder='templates')
         template_path = default_templates_folder / source_name
         logger.info(f'Template path empty. Using default templates folder {template_path}')
-    if not force and template_path.is_dir() and len(list(template_path.iterdir())):
+    if not force and not incremental and template_path.is_dir() and len(list(template_path.iterdir())):
         logger.error(f'Template path {template_path} already exists.')
         return 1
 
@@ -743,6 +885,87 @@ def create_template(source_path: pathlib.Path,
         else:
             return False, t_data
 
+    def _transform_file_into_template(entry_abs: pathlib.Path,
+                                      destination_entry_abs: pathlib.Path) -> bool:
+        """
+        Internal function to transform a source file into a template file, known binary files and files which
+        can't be read as text are copied instead.
+        In incremental mode the file isn't transformed again if its content and the replacements are the same as
+        when it was recorded and the template file wasn't modified since, the recorded result is reused instead
+        :param entry_abs: the source file
+        :param destination_entry_abs: the template file to write
+        :return: bool: whether or not the template file MAY need to be transformed to instantiate it
+        """
+        name, ext = os.path.splitext(entry_abs)
+
+        source_sha256 = None
+        if incremental:
+            # files can add class ids to the replacements, so the templated data depends on the replacements found
+            # in the files transformed before it. Binary files are copied as is
+            replacements_sha256 = '' if ext in binary_file_ext else \
+                hashlib.sha256(json.dumps(replacements).encode()).hexdigest()
+            source_stat = _get_file_stat(entry_abs)
+            cache_entry = template_cache_files.get(entry_abs.as_posix(), None)
+            if cache_entry \
+                    and cache_entry.get('destination', None) == pathlib.Path(destination_entry_abs).as_posix() \
+                    and cache_entry.get('replacements_sha256', None) == replacements_sha256 \
+                    and cache_entry.get('destination_stat', None) == _get_file_stat(destination_entry_abs):
+                # only hash the content again if the size or modification time of the source file changed
+                source_sha256 = cache_entry.get('sha256', None) if cache_entry.get('stat', None) == source_stat \
+                    else sha256.compute_file_sha256(entry_abs)
+                if source_sha256 == cache_entry.get('sha256', None):
+                    replacements.extend(tuple(replacement) for replacement in cache_entry.get('found_replacements', []))
+                    updated_template_cache_files[entry_abs.as_posix()] = dict(cache_entry, stat=source_stat)
+                    return cache_entry.get('templated', False)
+
+            if not source_sha256:
+                source_sha256 = sha256.compute_file_sha256(entry_abs)
+        replacements_count = len(replacements)
+
+        # if this file is a known binary file, there is no transformation needed and just copy it
+        # if not a known binary file open it and try to transform the data. if it is an unknown binary
+        # type it will throw and we catch copy
+        # if we had no known binary type it would still work, but much slower
+        templated = False
+        if ext in binary_file_ext:
+            shutil.copy(entry_abs, destination_entry_abs)
+        else:
+            try:
+                # open the file and attempt to transform it
+                with open(entry_abs, 'r') as s:
+                    source_data = s.read()
+                    templated, source_data = _transform_into_template(source_data, _is_cpp_file(entry_abs))
+
+                    # if the file type is a file that we expect to find a license header and we don't find any
+                    # warn that the we didn't find the license info, this makes it easy to make sure we didn't
+                    # miss any files we want to have license info in.
+                    if keep_license_text and ext in expect_license_info_ext:
+                        if 'Copyright (c)' not in source_data or '{BEGIN_LICENSE}' not in source_data:
+                            logger.warning(f'Un-templated License header in {entry_abs}')
+
+                # if the transformed file we are about to write already exists for some reason, delete it
+                if os.path.isfile(destination_entry_abs):
+                    os.unlink(destination_entry_abs)
+                with open(destination_entry_abs, 'w') as s:
+                    s.write(source_data)
+            except Exception as e:
+                # we were not able to template the file, this is usually due to a unknown binary format
+                # so we catch copy it
+                shutil.copy(entry_abs, destination_entry_abs)
+                pass
+
+        if incremental:
+            updated_template_cache_files[entry_abs.as_posix()] = {
+                'stat': source_stat,
+                'sha256': source_sha256,
+                'replacements_sha256': replacements_sha256,
+                'found_replacements': replacements[replacements_count:],
+                'destination': pathlib.Path(destination_entry_abs).as_posix(),
+                'destination_stat': _get_file_stat(destination_entry_abs),
+                'templated': templated
+            }
+        return templated
+
     def _transform_restricted_into_copyfiles_and_createdirs(root_abs: pathlib.Path,
                                                             path_abs: pathlib.Path = None) -> None:
         """
@@ -811,38 +1034,7 @@ def create_template(source_path: pathlib.Path,
             # if the entry is a folder then we need to add the entry to the createDirs and recurse into that folder
             templated = False
             if os.path.isfile(entry_abs):
-
-                # if this file is a known binary file, there is no transformation needed and just copy it
-                # if not a known binary file open it and try to transform the data.
-                # if it is an unknown binary type it will throw and we catch copy
-                # if we had no known binary type it would still work, but much slower
-                name, ext = os.path.splitext(entry)
-                if ext in binary_file_ext:
-                    shutil.copy(entry_abs, destination_entry_abs)
-                else:
-                    try:
-                        # open the file and attempt to transform it
-                        with open(entry_abs, 'r') as s:
-                            source_data = s.read()
-                            templated, source_data = _transform_into_template(source_data, _is_cpp_file(entry_abs))
-
-                            # if the file type is a file that we expect to find a license header and we don't find any
-                            # warn that the we didn't find the license info, this makes it easy to make sure we didn't
-                            # miss any files we want to have license info in.
-                            if keep_license_text and ext in expect_license_info_ext:
-                                if 'Copyright (c)' not in source_data or '{BEGIN_LICENSE}' not in source_data:
-                                    logger.warning(f'Un-templated License header in {entry_abs}')
-
-                        # if the transformed file we are about to write already exists for some reason, delete it
-                        if os.path.isfile(destination_entry_abs):
-                            os.unlink(destination_entry_abs)
-                        with open(destination_entry_abs, 'w') as s:
-                            s.write(source_data)
-                    except Exception as e:
-                        # we were not able to template the file, this is usually due to a unknown binary format
-                        # so we catch copy it
-                        shutil.copy(entry_abs, destination_entry_abs)
-                        pass
+                templated = _transform_file_into_template(entry_abs, destination_entry_abs)
 
                 if keep_restricted_in_template:
                     copy_files.append({
@@ -904,8 +1096,7 @@ def create_template(source_path: pathlib.Path,
                 platform = True
                 try:
                     # the name of the Platform should follow the '/Platform/'
-                    pattern = r'/Platform/(?P<Platform>[^/:*?\"<>|\r\n]+/?)'
-                    found_platform = re.search(pattern, entry_abs.as_posix()).group('Platform')
+                    found_platform = restricted_platform_pattern.search(entry_abs.as_posix()).group('Platform')
                     found_platform = found_platform.replace('/', '')
                 except Exception as e:
                     pass
@@ -962,38 +1153,7 @@ def create_template(source_path: pathlib.Path,
             # if the entry is a folder then we need to add the entry to the createDirs and recurse into that folder
             templated = False
             if os.path.isfile(entry_abs):
-
-                # if this file is a known binary file, there is no transformation needed and just copy it
-                # if not a known binary file open it and try to transform the data. if it is an unknown binary
-                # type it will throw and we catch copy
-                # if we had no known binary type it would still work, but much slower
-                name, ext = os.path.splitext(entry)
-                if ext in binary_file_ext:
-                    shutil.copy(entry_abs, destination_entry_abs)
-                else:
-                    try:
-                        # open the file and attempt to transform it
-                        with open(entry_abs, 'r') as s:
-                            source_data = s.read()
-                            templated, source_data = _transform_into_template(source_data, _is_cpp_file(entry_abs))
-
-                            # if the file type is a file that we expect to fins license header and we don't find any
-                            # warn that the we didn't find the license info, this makes it easy to make sure we didn't
-                            # miss any files we want to have license info in.
-                            if keep_license_text and ext in expect_license_info_ext:
-                                if 'Copyright (c)' not in source_data or '{BEGIN_LICENSE}' not in source_data:
-                                    logger.warning(f'Un-templated License header in {entry_abs}')
-
-                        # if the transformed file we are about to write already exists for some reason, delete it
-                        if os.path.isfile(destination_entry_abs):
-                            os.unlink(destination_entry_abs)
-                        with open(destination_entry_abs, 'w') as s:
-                            s.write(source_data)
-                    except Exception as e:
-                        # we were not able to template the file, this is usually due to a unknown binary format
-                        # so we catch copy it
-                        shutil.copy(entry_abs, destination_entry_abs)
-                        pass
+                templated = _transform_file_into_template(entry_abs, destination_entry_abs)
 
                 # if the file was for a restricted platform add the entry to the restricted platform, otherwise add it
                 # to the non restricted
@@ -1029,6 +1189,12 @@ def create_template(source_path: pathlib.Path,
     # when we run the transformation any restricted platforms entries we find will go in here
     restricted_platform_entries = {}
 
+    # in incremental mode, the source files recorded when the template was last created are looked up in here
+    # and the source files transformed or reused by this run will go in here
+    template_cache_path = _get_template_cache_path(template_path)
+    template_cache_files = _load_template_cache(template_cache_path, keep_license_text) if incremental else {}
+    updated_template_cache_files = {}
+
     # Every template will have a unrestricted folder which is src_path_abs which MAY have restricted files in it, and
     # each template MAY have a restricted folder which will only have restricted files in them. The process is the
     # same for all of them and the result will be a separation of all restricted files from unrestricted files. We do
@@ -1074,9 +1240,29 @@ def create_template(source_path: pathlib.Path,
 
     json_name = template_path / source_restricted_platform_relative_path / 'template.json'
 
+    # in incremental mode keep any fields of the existing template.json, such as an edited summary
+    if incremental and json_name.is_file():
+        try:
+            with json_name.open('r') as s:
+                existing_json_data = json.load(s)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f'Failed to load the existing {json_name}, it will be replaced: {str(e)}')
+        else:
+            json_data.update({key: value for key, value in existing_json_data.items()
+                              if key not in ('copyFiles', 'createDirectories')})
+
     with json_name.open('w') as s:
         s.write(json.dumps(json_data, indent=4) + '\n')
 
+    if incremental:
+        # remove the template files of source files that no longer exist
+        destinations = {entry['destination'] for entry in updated_template_cache_files.values()}
+        for source_file, entry in template_cache_files.items():
+            destination = entry.get('destination', None)
+            if source_file not in updated_template_cache_files and destination and destination not in destinations:
+                pathlib.Path(destination).unlink(missing_ok=True)
+        _save_template_cache(template_cache_path, keep_license_text, updated_template_cache_files)
+
     # copy the default preview.png
     preview_png_src = this_script_parent / 'resources' / 'preview.png'
     preview_png_dst = template_path / 'preview.png'
@@ -2270,7 +2456,8 @@ def _run_create_template(args: argparse) -> int:
                            args.keep_license_text,
                            args.replace,
                            args.force,
-                           args.no_register)
+                           args.no_register,
+                           args.incremental)
 
 
 def _run_create_from_template(args: argparse) -> int:
@@ -2437,6 +2624,10 @@ def add_args(subparsers) -> None:
     create_template_subparser.add_argument('--no-register', action='store_true', default=False,
                                            help='If the template is created successfully, it will not register the'
                                                 ' template with the global or engine manifest file.')
+    create_template_subparser.add_argument('--incremental', action='store_true', default=False,
+                                           help='Updates an existing template, only the source files that changed'
+                                                ' since the template was last created incrementally are transformed'
+                                                ' again and the other fields of the existing template.json are kept.')
     create_template_subparser.set_defaults(func=_run_create_template)
 
     # create from template
@@ -9,12 +9,16 @@
 Contains functions for data from json files such as the o3de_manifests.json, engine.json, project.json, etc...
 """
 
+import atexit
+import concurrent.futures
+import copy
 import json
 import logging
 import os
 import pathlib
+import threading
 
-from o3de import validation, utils, repo, compatibility
+from o3de import validation, utils, repo, compatibility, registry_index
 
 logging.basicConfig(format=utils.LOG_FORMAT)
 logger = logging.getLogger('o3de.manifest')
@@ -54,6 +58,18 @@ def get_o3de_cache_folder() -> pathlib.Path:
     return cache_folder
 
 
+def get_o3de_registry_index_path() -> pathlib.Path:
+    return get_o3de_cache_folder() / 'o3de_registry_index.json'
+
+
+def get_o3de_sha256_index_path() -> pathlib.Path:
+    return get_o3de_cache_folder() / 'o3de_sha256_index.json'
+
+
+def get_o3de_repo_cache_index_path() -> pathlib.Path:
+    return get_o3de_cache_folder() / 'o3de_repo_cache_index.json'
+
+
 def get_o3de_download_folder() -> pathlib.Path:
     download_folder = get_o3de_folder() / 'Download'
     download_folder.mkdir(parents=True, exist_ok=True)
@@ -102,6 +118,219 @@ def get_o3de_third_party_folder() -> pathlib.Path:
     return third_party_folder
 
 
+# Registry index methods
+_registry_index = None
+
+def get_registry_index() -> registry_index.RegistryIndex:
+    """
+    Returns the registry index used to avoid re-parsing engine, project, gem, template and manifest
+    json files that have not changed since they were last loaded.
+    The index is stored in the o3de cache folder and is saved when the process exits.
+    """
+    global _registry_index
+    if not _registry_index:
+        _registry_index = registry_index.RegistryIndex(get_o3de_registry_index_path())
+        atexit.register(_registry_index.save)
+    return _registry_index
+
+
+def load_json_file(json_path: pathlib.Path) -> dict:
+    """
+    Loads the json file using the registry index, so it is only parsed again if it has changed on disk
+    If a manifest session is active, the json data is loaded once for the session and json data saved
+    by a session that defers saves is returned before it is written
+    raises Json.JSONDecodeError if the json data could not be decoded
+    :param json_path: path of the json file to load
+    """
+    def load_json(path: pathlib.Path) -> dict:
+        with path.open('r') as f:
+            return json.load(f)
+
+    def load_indexed_json(path: pathlib.Path) -> dict:
+        return get_registry_index().load_json_data(path, 'json', load_json)
+
+    session = get_manifest_session()
+    if not session:
+        return load_indexed_json(json_path)
+
+    json_data = session.get_deferred_json_data(json_path)
+    if json_data is not None:
+        return json_data
+    return session.get_json_data(json_path, 'json', load_indexed_json)
+
+
+# Manifest session methods
+_active_manifest_session = None
+
+class ManifestSession:
+    """
+    Context manager that loads the o3de manifest once and caches o3de object json data and resolved paths
+    for its lifetime, so back-to-back queries don't re-read the same files.
+    Every manifest query made while a session is active uses the active session. Entering a session while
+    another one is active reuses the outer session, so entry points can safely open their own session.
+    The caches are invalidated whenever save_o3de_manifest writes a file.
+
+    If defer_saves is True, save_o3de_manifest does not write files while the session is active. The saved json
+    data is kept in memory instead, is returned by subsequent queries for the same files and every changed file
+    is written once when the outermost session exits or save_deferred_json_data() is called.
+    Deferred json data is discarded if the session exits because of an exception.
+
+    Ex.
+        with manifest.ManifestSession():
+            gem_paths = manifest.get_all_gems(project_path)
+            gems_json_data = manifest.get_gems_json_data_by_name(project_path=project_path, include_engine_gems=True)
+    """
+
+    def __init__(self, defer_saves: bool = False):
+        self.defer_saves = defer_saves
+        self._manifest_json_data = None
+        self._json_data = {}
+        self._resolved_paths = {}
+        self._deferred_json_data = {}
+        self._outer_sessions = []
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        global _active_manifest_session
+        self._outer_sessions.append(_active_manifest_session)
+        if not _active_manifest_session:
+            _active_manifest_session = self
+        elif self.defer_saves:
+            # the outer session owns the caches, so it is the one writing the deferred files when it exits
+            _active_manifest_session.defer_saves = True
+        return _active_manifest_session
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _active_manifest_session
+        if not self._outer_sessions.pop() and _active_manifest_session is self:
+            if exc_type:
+                if self._deferred_json_data:
+                    logger.warning(f'Discarding unsaved changes to {len(self._deferred_json_data)} json file(s).')
+                self._deferred_json_data.clear()
+            else:
+                self.save_deferred_json_data()
+            _active_manifest_session = None
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Clears all cached data, so it is loaded from disk the next time it is queried
+        """
+        with self._lock:
+            self._manifest_json_data = None
+            self._json_data.clear()
+            self._resolved_paths.clear()
+
+    def get_manifest_json_data(self, loader: callable) -> dict:
+        """
+        Returns a copy of the o3de manifest json data, calling loader() the first time
+        :param loader: callable that loads the o3de manifest json data
+        """
+        with self._lock:
+            if self._manifest_json_data is None:
+                self._manifest_json_data = loader()
+            return copy.deepcopy(self._manifest_json_data)
+
+    def get_json_data(self, json_path: pathlib.Path, loader_key: str, loader: callable) -> dict or None:
+        """
+        Returns a copy of the json data for json_path, calling loader(json_path) the first time
+        the file is queried with loader_key
+        :param json_path: path of the json file
+        :param loader_key: identifies the loader, different loaders of the same file are cached separately
+        :param loader: callable that validates and loads the json file
+        """
+        key = (pathlib.PurePath(json_path).as_posix(), loader_key)
+        with self._lock:
+            if key in self._json_data:
+                return copy.deepcopy(self._json_data[key])
+
+        # load without holding the lock so files can be loaded concurrently
+        json_data = loader(json_path)
+        with self._lock:
+            self._json_data[key] = copy.deepcopy(json_data)
+        return json_data
+
+    def defer_save(self, json_path: pathlib.Path, json_data: dict, is_o3de_manifest: bool = False) -> None:
+        """
+        Keeps a copy of json_data as the content of json_path until the deferred json data is saved
+        :param json_path: path of the json file to save
+        :param json_data: json data to save
+        :param is_o3de_manifest: True if json_path is the o3de manifest
+        """
+        json_path = self.resolve_path(json_path)
+        with self._lock:
+            self._deferred_json_data[json_path.as_posix()] = (json_path, copy.deepcopy(json_data))
+            if is_o3de_manifest:
+                self._manifest_json_data = copy.deepcopy(json_data)
+            # the json data loaded from the file is stale once the deferred json data is written
+            for key in [key for key in self._json_data if self.resolve_path(key[0]) == json_path]:
+                del self._json_data[key]
+
+    def discard_deferred_save(self, json_path: pathlib.Path) -> None:
+        """
+        Forgets the json data saved for json_path that hasn't been written yet
+        :param json_path: path of the json file
+        """
+        with self._lock:
+            self._deferred_json_data.pop(self.resolve_path(json_path).as_posix(), None)
+
+    def get_deferred_json_data(self, json_path: pathlib.Path) -> dict or None:
+        """
+        Returns a copy of the json data saved for json_path that hasn't been written yet or None
+        :param json_path: path of the json file
+        """
+        if not self._deferred_json_data:
+            return None
+        with self._lock:
+            _, json_data = self._deferred_json_data.get(self.resolve_path(json_path).as_posix(), (None, None))
+            return copy.deepcopy(json_data)
+
+    def save_deferred_json_data(self) -> bool:
+        """
+        Writes every json file saved while the session deferred saves, each file is written once
+        :return: True if all files were written, False if any failed to save
+        """
+        with self._lock:
+            deferred_json_data = list(self._deferred_json_data.values())
+            self._deferred_json_data.clear()
+
+        result = True
+        for json_path, json_data in deferred_json_data:
+            get_registry_index().invalidate(json_path)
+            if not write_json_file_atomically(json_data, json_path):
+                result = False
+        return result
+
+    def resolve_path(self, path: str or pathlib.Path) -> pathlib.Path:
+        """
+        Returns the resolved path, only resolving each path once for the lifetime of the session
+        :param path: path to resolve
+        """
+        with self._lock:
+            resolved_path = self._resolved_paths.get(path, None)
+        if not resolved_path:
+            resolved_path = pathlib.Path(path).resolve()
+            with self._lock:
+                self._resolved_paths[path] = resolved_path
+        return resolved_path
+
+
+def get_manifest_session() -> ManifestSession or None:
+    """
+    Returns the active manifest session or None if no session is active
+    """
+    return _active_manifest_session
+
+
+def resolve_path(path: str or pathlib.Path) -> pathlib.Path:
+    """
+    Resolves the path, using the active manifest session to avoid resolving the same path repeatedly
+    :param path: path to resolve
+    """
+    session = get_manifest_session()
+    return session.resolve_path(path) if session else pathlib.Path(path).resolve()
+
+
 # o3de manifest file methods
 def get_default_o3de_manifest_json_data() -> dict:
     """
@@ -167,6 +396,34 @@ def load_o3de_manifest(manifest_path: pathlib.Path = None) -> dict:
     In the former if the o3de_manifest.json doesn't exist, default o3de manifest data is returned.
     In the later that the o3de_manifest.json must exist as the caller explicitly specified the manifest path
 
+    raises Json.JSONDecodeError if manifest data could not be decoded to JSON
+    :param manifest_path: optional path to manifest file to load
+    """
+    session = get_manifest_session()
+    if not manifest_path:
+        if session:
+            return session.get_manifest_json_data(load_o3de_manifest_json_data)
+        return load_o3de_manifest_json_data()
+
+    if session and is_o3de_manifest_path(manifest_path):
+        # the o3de manifest is loaded once for the session, whether its path is supplied or not
+        return session.get_manifest_json_data(lambda: load_o3de_manifest_json_data(manifest_path))
+    return load_o3de_manifest_json_data(manifest_path)
+
+
+def is_o3de_manifest_path(manifest_path: pathlib.Path) -> bool:
+    """
+    Returns True if manifest_path is the path of ~/.o3de/o3de_manifest.json, comparing resolved paths
+    :param manifest_path: path of a manifest file
+    """
+    return resolve_path(manifest_path) == resolve_path(get_o3de_manifest())
+
+
+def load_o3de_manifest_json_data(manifest_path: pathlib.Path = None) -> dict:
+    """
+    Loads supplied manifest file or ~/.o3de/o3de_manifest.json if None without using the active manifest session
+    See load_o3de_manifest for details
+
     raises Json.JSONDecodeError if manifest data could not be decoded to JSON
     :param manifest_path: optional path to manifest file to load
     """
@@ -179,16 +436,15 @@ def load_o3de_manifest(manifest_path: pathlib.Path = None) -> dict:
                         ' The default o3de manifest data dictionary will be returned.')
             return get_default_o3de_manifest_json_data()
 
-    with manifest_path.open('r') as f:
-        try:
-            json_data = json.load(f)
-        except json.JSONDecodeError as e:
-            logger.error(f'Manifest json failed to load at path "{manifest_path}": {str(e)}')
-            # Re-raise the exception and let the caller
-            # determine if they can proceed
-            raise
-        else:
-            return json_data
+    try:
+        json_data = load_json_file(manifest_path)
+    except json.JSONDecodeError as e:
+        logger.error(f'Manifest json failed to load at path "{manifest_path}": {str(e)}')
+        # Re-raise the exception and let the caller
+        # determine if they can proceed
+        raise
+    else:
+        return json_data
 
 
 def save_o3de_manifest(json_data: dict, manifest_path: pathlib.Path = None) -> bool:
@@ -200,6 +456,19 @@ def save_o3de_manifest(json_data: dict, manifest_path: pathlib.Path = None) -> b
     """
     if not manifest_path:
         manifest_path = get_o3de_manifest()
+    session = get_manifest_session()
+    if session and session.defer_saves:
+        # files that have been moved away, ex. by utils.backup_file, are written immediately
+        # so that lookups of the file on disk keep finding it
+        if manifest_path.is_file():
+            session.defer_save(manifest_path, json_data, is_o3de_manifest_path(manifest_path))
+            return True
+        session.discard_deferred_save(manifest_path)
+    # the file may be rewritten without changing its size or modification time
+    # so make sure the registry index and active session do not return stale data for it
+    get_registry_index().invalidate(manifest_path)
+    if session:
+        session.invalidate()
     with manifest_path.open('w') as s:
         try:
             s.write(json.dumps(json_data, indent=4) + '\n')
@@ -209,6 +478,27 @@ def save_o3de_manifest(json_data: dict, manifest_path: pathlib.Path = None) -> b
             return False
 
 
+def write_json_file_atomically(json_data: dict, json_path: pathlib.Path) -> bool:
+    """
+    Writes the json dictionary to a temporary file next to json_path and then replaces json_path with it,
+    so readers never see a partially written file
+
+    :param json_data: dictionary to save in json format at the file path
+    :param json_path: path of the json file to save
+    """
+    json_path = pathlib.Path(json_path)
+    temp_json_path = json_path.with_name(f'{json_path.name}.{os.getpid()}.tmp')
+    try:
+        with temp_json_path.open('w') as s:
+            s.write(json.dumps(json_data, indent=4) + '\n')
+        os.replace(temp_json_path, json_path)
+    except OSError as e:
+        logger.error(f'Json file {json_path} failed to save: {str(e)}')
+        temp_json_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
 def get_gems_from_external_subdirectories(external_subdirs: list) -> list:
     '''
     Helper Method for scanning a set of external subdirectories for gem.json files
@@ -217,7 +507,7 @@ def get_gems_from_external_subdirectories(external_subdirs: list) -> list:
 
     if external_subdirs:
         for subdirectory in external_subdirs:
-            gem_json_path = pathlib.Path(subdirectory).resolve() / 'gem.json'
+            gem_json_path = resolve_path(subdirectory) / 'gem.json'
             if gem_json_path.is_file():
                 gem_directories.append(pathlib.PurePath(subdirectory).as_posix())
 
@@ -362,7 +652,7 @@ def get_gem_external_subdirectories(gem_path: pathlib.Path, visited_gem_paths: l
     '''
 
     # Resolve the path before to make sure it is absolute before adding to the visited_gem_paths set
-    gem_path = pathlib.Path(gem_path).resolve()
+    gem_path = resolve_path(gem_path)
     if gem_path in visited_gem_paths:
         logger.warning(f'A cycle has been detected when visiting external subdirectories at gem path "{gem_path}". The visited paths are: {visited_gem_paths}')
         return []
@@ -381,7 +671,7 @@ def get_gem_external_subdirectories(gem_path: pathlib.Path, visited_gem_paths: l
 
     external_subdirectories = []
     if gem_object:
-        external_subdirectories = list(map(lambda rel_path: (pathlib.Path(gem_path) / rel_path).resolve().as_posix(),
+        external_subdirectories = list(map(lambda rel_path: resolve_path(pathlib.Path(gem_path) / rel_path).as_posix(),
             gem_object['external_subdirectories'])) if 'external_subdirectories' in gem_object else []
 
         # recurse into gem subdirectories
@@ -397,6 +687,46 @@ def get_gem_external_subdirectories(gem_path: pathlib.Path, visited_gem_paths: l
     return list(dict.fromkeys(external_subdirectories))
 
 
+def get_gems_json_data_by_path_concurrently(external_subdirectories: list, max_workers: int = None) -> dict:
+    """
+    Loads the gem.json of every gem in the external subdirectories and recursively the gem.json of every gem
+    in their "external_subdirectories" entries.
+    Checking for and loading each gem.json is done on a pool of threads, one level of subdirectories at a time,
+    and each file is parsed once. When called inside a ManifestSession, later queries for these gems are
+    served from the session.
+    :param external_subdirectories: the external subdirectories to search for gems
+    :param max_workers: optional maximum number of threads, the ThreadPoolExecutor default is used if None
+    :return: a dictionary of resolved gem path -> gem.json data, ordered breadth first in the order
+    the subdirectories are listed
+    """
+    def load_gem_json_data(gem_path: pathlib.Path) -> tuple:
+        gem_path = resolve_path(gem_path)
+        if not (gem_path / 'gem.json').is_file():
+            return gem_path, None
+        return gem_path, get_gem_json_data(gem_path=gem_path)
+
+    gems_json_data_by_path = {}
+    visited_gem_paths = set()
+    gem_paths = list(dict.fromkeys(external_subdirectories or []))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while gem_paths:
+            # executor.map yields results in the order of gem_paths regardless of which load finishes first
+            results = executor.map(load_gem_json_data, gem_paths)
+            gem_paths = []
+            for gem_path, gem_json_data in results:
+                if gem_path in visited_gem_paths:
+                    continue
+                visited_gem_paths.add(gem_path)
+                if not gem_json_data:
+                    continue
+
+                gems_json_data_by_path[gem_path] = gem_json_data
+                gem_paths.extend(gem_path / rel_path for rel_path in gem_json_data.get('external_subdirectories', []))
+            gem_paths = [gem_path for gem_path in dict.fromkeys(gem_paths) if gem_path not in visited_gem_paths]
+
+    return gems_json_data_by_path
+
+
 def get_gem_templates(gem_path: pathlib.Path) -> list:
     gem_object = get_gem_json_data(gem_path=gem_path)
     if gem_object:
@@ -424,13 +754,7 @@ def add_dependency_gem_names(gem_name:str, gems_json_data_by_name:dict, all_gem_
     param: gems_json_data_by_name a dict of all gem json data to use
     param: all_gem_names the set that all dependency gem names are added to
     """
-    gem_json_data = gems_json_data_by_name.get(gem_name, None)
-    if gem_json_data:
-        dependencies = gem_json_data.get('dependencies',[])
-        for dependency_gem_name in dependencies:
-            if dependency_gem_name not in all_gem_names:
-                all_gem_names.add(dependency_gem_name)
-                add_dependency_gem_names(dependency_gem_name, gems_json_data_by_name, all_gem_names)
+    all_gem_names.update(compatibility.GemDependencyGraph(gems_json_data_by_name).get_dependency_gem_names([gem_name]))
 
 
 def remove_non_dependency_gem_json_data(gem_names:list, gems_json_data_by_name:dict) -> None:
@@ -441,8 +765,8 @@ def remove_non_dependency_gem_json_data(gem_names:list, gems_json_data_by_name:d
     param: gems_json_data_by_name a dict of all gem json data that will be modified
     """
     gem_names_to_keep = set(gem_names)
-    for gem_name in set(gem_names):
-        add_dependency_gem_names(gem_name, gems_json_data_by_name, gem_names_to_keep)
+    gem_dependency_graph = compatibility.GemDependencyGraph(gems_json_data_by_name)
+    gem_names_to_keep.update(gem_dependency_graph.get_dependency_gem_names(gem_names_to_keep))
 
     gem_names_to_remove = [gem_name for gem_name in gems_json_data_by_name if gem_name not in gem_names_to_keep]
     for gem_name in gem_names_to_remove:
@@ -462,6 +786,7 @@ def get_gems_json_data_by_name(engine_path:pathlib.Path = None,
     It's often more efficient to open all gem.json files instead of 
     looking up each by name, which will load many gem.json files multiple times
     It takes about 150ms to populate this structure with 137 gems, 4696 bytes in total
+    gem.json files that have not changed since they were last loaded are read from the registry index
 
     param: engine_path optional engine path
     param: project_path optional project path
@@ -494,9 +819,13 @@ def get_gems_json_data_by_name(engine_path:pathlib.Path = None,
     # Filter out duplicate external_subdirectories before querying if they contain gem.json files
     external_subdirectories = list(dict.fromkeys(external_subdirectories))
 
-    gem_paths = get_gems_from_external_subdirectories(external_subdirectories)
-    for gem_path in gem_paths:
-        get_gem_external_subdirectories(gem_path, list(), all_gems_json_data)
+    with ManifestSession():
+        # load every reachable gem.json concurrently first, the serial walk below is then served
+        # from the session and keeps the result order deterministic
+        get_gems_json_data_by_path_concurrently(external_subdirectories)
+        gem_paths = get_gems_from_external_subdirectories(external_subdirectories)
+        for gem_path in gem_paths:
+            get_gem_external_subdirectories(gem_path, list(), all_gems_json_data)
 
     # convert from being keyed on gem_path to gem_name and store the paths
     utils.replace_dict_keys_with_value_key(all_gems_json_data, value_key='gem_name', replaced_key_name='path')
@@ -513,9 +842,11 @@ def get_all_external_subdirectories(engine_path:pathlib.Path = None, project_pat
     # Filter out duplicate external_subdirectories before querying if they contain gem.json files
     external_subdirectories_data = list(dict.fromkeys(external_subdirectories_data))
 
-    gem_paths = get_gems_from_external_subdirectories(external_subdirectories_data)
-    for gem_path in gem_paths:
-        external_subdirectories_data.extend(get_gem_external_subdirectories(gem_path, list(), gems_json_data_by_path))
+    with ManifestSession():
+        get_gems_json_data_by_path_concurrently(external_subdirectories_data)
+        gem_paths = get_gems_from_external_subdirectories(external_subdirectories_data)
+        for gem_path in gem_paths:
+            external_subdirectories_data.extend(get_gem_external_subdirectories(gem_path, list(), gems_json_data_by_path))
 
     # Remove duplicates from the list
     return list(dict.fromkeys(external_subdirectories_data))
@@ -586,7 +917,7 @@ def get_json_file_path(object_typename: str,
         logger.error('Must specify an object typename and object path.')
         return None
 
-    object_path = pathlib.Path(object_path).resolve()
+    object_path = resolve_path(object_path)
     return object_path / f'{object_typename}.json'
 
 
@@ -601,19 +932,54 @@ def get_json_data_file(object_json: pathlib.Path,
         logger.error(f'Invalid {object_typename} json {object_json} supplied or file missing.')
         return None
 
-    if not object_validator or not object_validator(object_json):
-        logger.error(f'{object_typename} json {object_json} is not valid or could not be validated.')
-        return None
+    session = get_manifest_session()
+    if session:
+        # json data saved by a session that defers saves hasn't been written to the file yet
+        object_json_data = session.get_deferred_json_data(object_json)
+        if object_json_data is not None:
+            return object_json_data
 
-    with object_json.open('r') as f:
-        try:
-            object_json_data = json.load(f)
-        except json.JSONDecodeError as e:
-            logger.warning(f'{object_json} failed to load: {e}')
-        else:
+    def load_object_json(object_json: pathlib.Path) -> dict or None:
+        # parse the file only once if the loaded json data can be validated instead of the file
+        json_data_validator = validation.get_json_data_validator(object_validator)
+        if json_data_validator:
+            with object_json.open('r') as f:
+                try:
+                    object_json_data = json.load(f)
+                except json.JSONDecodeError:
+                    object_json_data = None
+            if object_json_data is None or not json_data_validator(object_json_data):
+                logger.error(f'{object_typename} json {object_json} is not valid or could not be validated.')
+                return None
             return object_json_data
 
-    return None
+        if not object_validator or not object_validator(object_json):
+            logger.error(f'{object_typename} json {object_json} is not valid or could not be validated.')
+            return None
+
+        with object_json.open('r') as f:
+            try:
+                object_json_data = json.load(f)
+            except json.JSONDecodeError as e:
+                logger.warning(f'{object_json} failed to load: {e}')
+            else:
+                return object_json_data
+
+        return None
+
+    # The validated json data is cached per validator and validators version, validators without
+    # a name can't be identified across runs so they skip the registry index
+    validator_name = getattr(object_validator, '__qualname__', None)
+    if not validator_name:
+        return load_object_json(object_json)
+
+    def load_indexed_object_json(object_json: pathlib.Path) -> dict or None:
+        return get_registry_index().load_json_data(object_json, loader_key, load_object_json)
+
+    loader_key = f'{getattr(object_validator, "__module__", "")}.{validator_name}.v{validation.VALIDATORS_VERSION}'
+    if session:
+        return session.get_json_data(object_json, loader_key, load_indexed_object_json)
+    return load_indexed_object_json(object_json)
 
 
 def get_json_data(object_typename: str,
@@ -765,23 +1131,22 @@ def get_registered(engine_name: str = None,
         matching_engine_paths = []
         for engine in engines:
             if isinstance(engine, dict):
-                engine_path = pathlib.Path(engine['path']).resolve()
+                engine_path = resolve_path(engine['path'])
             else:
-                engine_path = pathlib.Path(engine).resolve()
+                engine_path = resolve_path(engine)
 
             engine_json = engine_path / 'engine.json'
             if not pathlib.Path(engine_json).is_file():
                 logger.warning(f'{engine_json} does not exist')
             else:
-                with engine_json.open('r') as f:
-                    try:
-                        engine_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{engine_json} failed to load: {str(e)}')
-                    else:
-                        this_engines_name = engine_json_data.get('engine_name','')
-                        if this_engines_name == engine_name:
-                            matching_engine_paths.append(engine_path)
+                try:
+                    engine_json_data = load_json_file(engine_json)
+                except json.JSONDecodeError as e:
+                    logger.warning(f'{engine_json} failed to load: {str(e)}')
+                else:
+                    this_engines_name = engine_json_data.get('engine_name','')
+                    if this_engines_name == engine_name:
+                        matching_engine_paths.append(engine_path)
         if matching_engine_paths:
             engine_path = matching_engine_paths[0]
             if len(matching_engine_paths) > 1:
@@ -793,20 +1158,19 @@ def get_registered(engine_name: str = None,
     elif isinstance(project_name, str):
         projects = get_all_projects()
         for project_path in projects:
-            project_path = pathlib.Path(project_path).resolve()
+            project_path = resolve_path(project_path)
             project_json = project_path / 'project.json'
             if not pathlib.Path(project_json).is_file():
                 logger.warning(f'{project_json} does not exist')
             else:
-                with project_json.open('r') as f:
-                    try:
-                        project_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{project_json} failed to load: {str(e)}')
-                    else:
-                        this_projects_name = project_json_data['project_name']
-                        if this_projects_name == project_name:
-                            return project_path
+                try:
+                    project_json_data = load_json_file(project_json)
+                except json.JSONDecodeError as e:
+                    logger.warning(f'{project_json} failed to load: {str(e)}')
+                else:
+                    this_projects_name = project_json_data['project_name']
+                    if this_projects_name == project_name:
+                        return project_path
 
     elif isinstance(gem_name, str):
         gems = []
@@ -825,20 +1189,19 @@ def get_registered(engine_name: str = None,
                 gems = list(dict.fromkeys(gems))
 
         for gem_path in gems:
-            gem_path = pathlib.Path(gem_path).resolve()
+            gem_path = resolve_path(gem_path)
             gem_json = gem_path / 'gem.json'
             if not pathlib.Path(gem_json).is_file():
                 logger.warning(f'{gem_json} does not exist')
             else:
-                with gem_json.open('r') as f:
-                    try:
-                        gem_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{gem_json} failed to load: {str(e)}')
-                    else:
-                        this_gems_name = gem_json_data['gem_name']
-                        if this_gems_name == gem_name:
-                            return gem_path
+                try:
+                    gem_json_data = load_json_file(gem_json)
+                except json.JSONDecodeError as e:
+                    logger.warning(f'{gem_json} failed to load: {str(e)}')
+                else:
+                    this_gems_name = gem_json_data['gem_name']
+                    if this_gems_name == gem_name:
+                        return gem_path
 
     elif isinstance(template_name, str):
         templates = []
@@ -857,38 +1220,36 @@ def get_registered(engine_name: str = None,
                 templates = list(dict.fromkeys(templates))
 
         for template_path in templates:
-            template_path = pathlib.Path(template_path).resolve()
+            template_path = resolve_path(template_path)
             template_json = template_path / 'template.json'
             if not pathlib.Path(template_json).is_file():
                 logger.warning(f'{template_json} does not exist')
             else:
-                with template_json.open('r') as f:
-                    try:
-                        template_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{template_path} failed to load: {str(e)}')
-                    else:
-                        this_templates_name = template_json_data['template_name']
-                        if this_templates_name == template_name:
-                            return template_path
+                try:
+                    template_json_data = load_json_file(template_json)
+                except json.JSONDecodeError as e:
+                    logger.warning(f'{template_path} failed to load: {str(e)}')
+                else:
+                    this_templates_name = template_json_data['template_name']
+                    if this_templates_name == template_name:
+                        return template_path
 
     elif isinstance(restricted_name, str):
         restricted = get_manifest_restricted()
         for restricted_path in restricted:
-            restricted_path = pathlib.Path(restricted_path).resolve()
+            restricted_path = resolve_path(restricted_path)
             restricted_json = restricted_path / 'restricted.json'
             if not pathlib.Path(restricted_json).is_file():
                 logger.warning(f'{restricted_json} does not exist')
             else:
-                with restricted_json.open('r') as f:
-                    try:
-                        restricted_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{restricted_json} failed to load: {str(e)}')
-                    else:
-                        this_restricted_name = restricted_json_data['restricted_name']
-                        if this_restricted_name == restricted_name:
-                            return restricted_path
+                try:
+                    restricted_json_data = load_json_file(restricted_json)
+                except json.JSONDecodeError as e:
+                    logger.warning(f'{restricted_json} failed to load: {str(e)}')
+                else:
+                    this_restricted_name = restricted_json_data['restricted_name']
+                    if this_restricted_name == restricted_name:
+                        return restricted_path
 
     elif isinstance(default_folder, str):
         if default_folder == 'engines':
@@ -933,13 +1294,12 @@ def get_registered(engine_name: str = None,
             cache_file = get_repo_path(repo_uri=repo_uri, cache_folder=cache_folder)
             if cache_file.is_file():
                 repo = pathlib.Path(cache_file).resolve()
-                with repo.open('r') as f:
-                    try:
-                        repo_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{cache_file} failed to load: {str(e)}')
-                    else:
-                        this_repos_name = repo_json_data['repo_name']
-                        if this_repos_name == repo_name:
-                            return repo_uri
+                try:
+                    repo_json_data = load_json_file(repo)
+                except json.JSONDecodeError as e:
+                    logger.warning(f'{cache_file} failed to load: {str(e)}')
+                else:
+                    this_repos_name = repo_json_data['repo_name']
+                    if this_repos_name == repo_name:
+                        return repo_uri
     return None
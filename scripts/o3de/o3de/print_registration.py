@@ -304,20 +304,21 @@ def print_repos(verbose: int) -> int:
 
 
 def register_show(verbose: int, project_path: pathlib.Path = None, project_name: str = None) -> int:
-    json_data = manifest.load_o3de_manifest()
-    print(f"{manifest.get_o3de_manifest()}:")
-    print(json.dumps(json_data, indent=4))
-
-    result = 0
-    if verbose > 0:
-        result = print_engines(verbose) or result
-        result = print_all_projects(verbose) or result
-        result = print_all_gems(verbose, project_path, project_name) or result
-        result = print_all_templates(verbose, project_path, project_name) or result
-        result = print_restricted(verbose) or result
-        result = print_repos(verbose) or result
-
-    return result
+    with manifest.ManifestSession():
+        json_data = manifest.load_o3de_manifest()
+        print(f"{manifest.get_o3de_manifest()}:")
+        print(json.dumps(json_data, indent=4))
+
+        result = 0
+        if verbose > 0:
+            result = print_engines(verbose) or result
+            result = print_all_projects(verbose) or result
+            result = print_all_gems(verbose, project_path, project_name) or result
+            result = print_all_templates(verbose, project_path, project_name) or result
+            result = print_restricted(verbose) or result
+            result = print_repos(verbose) or result
+
+        return result
 
 
 def _run_register_show(args: argparse) -> int:
@@ -7,6 +7,8 @@
 #
 """
 Contains functions for the project manager to call that gather data from o3de scripts and massage it
+The Project Manager runs each of its enumeration queries in a manifest.ManifestSession (see PythonBindings.cpp),
+so the manifest and object json files are loaded once per query
 """
 
 import logging
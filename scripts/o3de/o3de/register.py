@@ -11,6 +11,7 @@ This file contains all the code that has to do with registering engines, project
 """
 
 import argparse
+import concurrent.futures
 import logging
 import json
 import os
@@ -63,7 +64,8 @@ def register_shipped_engine_o3de_objects(force: bool = False) -> int:
 def register_all_in_folder(folder_path: pathlib.Path,
                            remove: bool = False,
                            engine_path: pathlib.Path = None,
-                           exclude: list = None) -> int:
+                           exclude: list = None,
+                           max_workers: int = None) -> int:
     if not folder_path:
         logger.error(f'Folder path cannot be empty.')
         return 1
@@ -80,8 +82,16 @@ def register_all_in_folder(folder_path: pathlib.Path,
     restricted_set = set()
     repo_set = set()
 
-    ret_val = 0
+    exclude = exclude or []
     for root, dirs, files in os.walk(folder_path):
+        # Skip build trees entirely and do not descend into template folders,
+        # the o3de objects inside of templates are not registrable
+        if stop_on_build_folders(dirs, files):
+            dirs[:] = []
+            continue
+        if stop_on_template_folders(dirs, files):
+            dirs[:] = []
+
         if root in exclude:
             continue
 
@@ -99,36 +109,109 @@ def register_all_in_folder(folder_path: pathlib.Path,
             elif name == 'repo.json':
                 repo_set.add(root)
 
-    for engine in sorted(engines_set, reverse=True):
-        error_code = register(engine_path=engine, remove=remove)
+    # register() only accepts o3de object paths as pathlib paths
+    o3de_objects = [('engine_path', pathlib.Path(engine)) for engine in sorted(engines_set, reverse=True)]
+    o3de_objects.extend(('project_path', pathlib.Path(project)) for project in sorted(projects_set, reverse=True))
+    o3de_objects.extend(('gem_path', pathlib.Path(gem)) for gem in sorted(gems_set, reverse=True))
+    o3de_objects.extend(('template_path', pathlib.Path(template))
+                        for template in sorted(templates_set, reverse=True))
+    o3de_objects.extend(('restricted_path', pathlib.Path(restricted))
+                        for restricted in sorted(restricted_set, reverse=True))
+    o3de_objects.extend(('repo_uri', repo) for repo in sorted(repo_set, reverse=True))
+
+    # engines are always registered with the o3de manifest, the other objects with the supplied engine path
+    engine_objects = [o3de_object for o3de_object in o3de_objects if o3de_object[0] == 'engine_path']
+    other_objects = [o3de_object for o3de_object in o3de_objects if o3de_object[0] != 'engine_path']
+    with manifest.ManifestSession(defer_saves=True) as session:
+        ret_val = register_o3de_objects(engine_objects, remove=remove, max_workers=max_workers)
+        error_code = register_o3de_objects(other_objects, remove=remove, max_workers=max_workers,
+                                           engine_path=engine_path)
         if error_code:
             ret_val = error_code
+        if not session.save_deferred_json_data():
+            ret_val = 1
 
-    for project in sorted(projects_set, reverse=True):
-        error_code = register(engine_path=engine_path, project_path=project, remove=remove)
-        if error_code:
-            ret_val = error_code
+    return ret_val
 
-    for gem in sorted(gems_set, reverse=True):
-        error_code = register(engine_path=engine_path, gem_path=gem, remove=remove)
-        if error_code:
-            ret_val = error_code
 
-    for template in sorted(templates_set, reverse=True):
-        error_code = register(engine_path=engine_path, template_path=template, remove=remove)
-        if error_code:
-            ret_val = error_code
+# json file name and validator of the o3de objects that are validated before registering them
+_o3de_object_json_validators = {
+    'engine_path': ('engine.json', 'valid_o3de_engine_json'),
+    'gem_path': ('gem.json', 'valid_o3de_gem_json'),
+    'template_path': ('template.json', 'valid_o3de_template_json'),
+    'restricted_path': ('restricted.json', 'valid_o3de_restricted_json')
+}
 
-    for restricted in sorted(restricted_set, reverse=True):
-        error_code = register(engine_path=engine_path, restricted_path=restricted, remove=remove)
-        if error_code:
-            ret_val = error_code
 
-    for repo in sorted(repo_set, reverse=True):
-        error_code = register(engine_path=engine_path, repo_uri=repo, remove=remove)
-        if error_code:
-            ret_val = error_code
+def validate_o3de_objects(o3de_objects: list, max_workers: int = None) -> list:
+    """
+    Validates the json file of each o3de object concurrently
+    Objects without a validator, such as projects whose validation can update the project.json, are considered
+    valid and are validated when they are registered
+    :param o3de_objects: list of (register() path keyword, path) tuples
+    :param max_workers: optional maximum number of threads used to validate the o3de objects
+    :return: list of booleans in the same order as o3de_objects, True if the o3de object is valid
+    """
+    def validate_o3de_object(o3de_object: tuple) -> bool:
+        register_path_kwarg, o3de_object_path = o3de_object
+        json_filename, validation_func_name = _o3de_object_json_validators.get(register_path_kwarg, (None, None))
+        if not validation_func_name:
+            return True
+        return manifest.get_json_data_file(pathlib.Path(o3de_object_path) / json_filename,
+                                           json_filename.split('.')[0],
+                                           getattr(validation, validation_func_name)) is not None
+
+    if len(o3de_objects) < 2 or max_workers == 1:
+        return list(map(validate_o3de_object, o3de_objects))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(validate_o3de_object, o3de_objects))
+
+
+def register_o3de_objects(o3de_objects: list,
+                          remove: bool = False,
+                          force: bool = False,
+                          max_workers: int = None,
+                          **register_kwargs) -> int:
+    """
+    Registers or removes a batch of o3de objects
+    The o3de objects are validated concurrently and every registration is applied to the in-memory manifests,
+    so the o3de manifest and each changed engine.json, project.json or gem.json are only written once
+    after all the o3de objects have been registered.
+    Failing o3de objects don't stop the registration of the others and are reported once all were processed.
+    If a manifest session is already active the changes are written when that session saves its deferred json data.
+    :param o3de_objects: list of (register() path keyword, path) tuples, ex. ('gem_path', 'C:/Gems/MyGem')
+    :param remove: add/remove the entries
+    :param force: force update of the engine_path for specified "engine_name" from the engine.json file
+    :param max_workers: optional maximum number of threads used to validate the o3de objects
+    :param register_kwargs: additional keyword arguments to pass to register()
+    :return: 0 if all o3de objects were registered, otherwise the error code of the last failure
+    """
+    if not o3de_objects:
+        return 0
 
+    ret_val = 0
+    failed_objects = []
+    owns_session = not manifest.get_manifest_session()
+    with manifest.ManifestSession(defer_saves=True) as session:
+        objects_valid = [True] * len(o3de_objects) if remove or force else \
+            validate_o3de_objects(o3de_objects, max_workers)
+
+        for (register_path_kwarg, o3de_object_path), is_valid in zip(o3de_objects, objects_valid):
+            if not is_valid:
+                error_code = 1
+            else:
+                error_code = register(**{register_path_kwarg: o3de_object_path}, remove=remove, force=force,
+                                      **register_kwargs)
+            if error_code:
+                failed_objects.append(o3de_object_path)
+                ret_val = error_code
+
+        if owns_session and not session.save_deferred_json_data():
+            ret_val = 1
+
+    if failed_objects:
+        logger.error(f'Failed to {"remove" if remove else "register"} {len(failed_objects)} of {len(o3de_objects)}'
+                     ' o3de objects:\n  ' + '\n  '.join(map(str, failed_objects)))
     return ret_val
 
 
@@ -150,7 +233,6 @@ def register_all_o3de_objects_of_type_in_folder(o3de_object_path: pathlib.Path,
     o3de_object_type_set = set()
     register_path_kwarg = f'{o3de_object_type}_path' if o3de_object_type != 'repo' else f'{o3de_object_type}_uri'
 
-    ret_val = 0
     for root, dirs, files in os.walk(o3de_object_path):
         # Skip subdirectories where the stop iteration callback is true
         if stop_iteration_callable and stop_iteration_callable(dirs, files):
@@ -161,19 +243,19 @@ def register_all_o3de_objects_of_type_in_folder(o3de_object_path: pathlib.Path,
             # Nested o3de objects of the same type aren't supported(i.e an engine cannot be inside of a engine).
             dirs[:] = []
 
-    for o3de_object_type_root in sorted(o3de_object_type_set, reverse=True):
-        error_code = register(**{register_path_kwarg: o3de_object_type_root},
-                              remove=remove, force=force, **register_kwargs)
-        if error_code:
-            ret_val = error_code
-
-    return ret_val
+    return register_o3de_objects([(register_path_kwarg, o3de_object_type_root)
+                                  for o3de_object_type_root in sorted(o3de_object_type_set, reverse=True)],
+                                 remove=remove, force=force, **register_kwargs)
 
 
 def stop_on_template_folders(dirs: list, files: list) -> bool:
     return 'template.json' in files
 
 
+def stop_on_build_folders(dirs: list, files: list) -> bool:
+    return 'CMakeCache.txt' in files
+
+
 def register_all_engines_in_folder(engines_path: pathlib.Path,
                                    remove: bool = False,
                                    force: bool = False) -> int:
@@ -749,93 +831,94 @@ def register(engine_path: pathlib.Path = None,
     :return: 0 for success or non 0 failure code
     """
 
-    try:
-        json_data = manifest.load_o3de_manifest()
-    except json.JSONDecodeError:
-        if not force:
-            logger.error('O3DE object registration has halted due to JSON Decode Error in manifest at path:'
-                         f' "{manifest.get_o3de_manifest()}".'
-                         '\n      Registration can be forced using the --force option,'
-                         ' but that will result in the manifest using default data')
-            return 1
-        else:
-            # Use a default manifest data an proceed
-            json_data = manifest.get_default_o3de_manifest_json_data()
+    with manifest.ManifestSession():
+        try:
+            json_data = manifest.load_o3de_manifest()
+        except json.JSONDecodeError:
+            if not force:
+                logger.error('O3DE object registration has halted due to JSON Decode Error in manifest at path:'
+                             f' "{manifest.get_o3de_manifest()}".'
+                             '\n      Registration can be forced using the --force option,'
+                             ' but that will result in the manifest using default data')
+                return 1
+            else:
+                # Use a default manifest data an proceed
+                json_data = manifest.get_default_o3de_manifest_json_data()
 
-    result = 0
+        result = 0
 
-    # do anything that could require a engine context first
-    if isinstance(project_path, pathlib.PurePath):
-        if not project_path:
-            logger.error(f'Project path cannot be empty.')
-            return 1
-        result = result or register_project_path(json_data, project_path, remove, engine_path, force, dry_run)
+        # do anything that could require a engine context first
+        if isinstance(project_path, pathlib.PurePath):
+            if not project_path:
+                logger.error(f'Project path cannot be empty.')
+                return 1
+            result = result or register_project_path(json_data, project_path, remove, engine_path, force, dry_run)
 
-    if isinstance(gem_path, pathlib.PurePath):
-        if not gem_path:
-            logger.error(f'Gem path cannot be empty.')
-            return 1
-        result = result or register_gem_path(json_data, gem_path, remove,
-                                             external_subdir_engine_path, external_subdir_project_path,
-                                             force, dry_run)
+        if isinstance(gem_path, pathlib.PurePath):
+            if not gem_path:
+                logger.error(f'Gem path cannot be empty.')
+                return 1
+            result = result or register_gem_path(json_data, gem_path, remove,
+                                                 external_subdir_engine_path, external_subdir_project_path,
+                                                 force, dry_run)
 
-    if isinstance(external_subdir_path, pathlib.PurePath):
-        if not external_subdir_path:
-            logger.error(f'External Subdirectory path is None.')
-            return 1
-        result = result or register_external_subdirectory(json_data, external_subdir_path, remove,
-                                                          external_subdir_engine_path, external_subdir_project_path, 
-                                                          external_subdir_gem_path)
+        if isinstance(external_subdir_path, pathlib.PurePath):
+            if not external_subdir_path:
+                logger.error(f'External Subdirectory path is None.')
+                return 1
+            result = result or register_external_subdirectory(json_data, external_subdir_path, remove,
+                                                              external_subdir_engine_path, external_subdir_project_path, 
+                                                              external_subdir_gem_path)
 
-    if isinstance(template_path, pathlib.PurePath):
-        if not template_path:
-            logger.error(f'Template path cannot be empty.')
-            return 1
-        result = result or register_template_path(json_data, template_path, remove, project_path, engine_path)
+        if isinstance(template_path, pathlib.PurePath):
+            if not template_path:
+                logger.error(f'Template path cannot be empty.')
+                return 1
+            result = result or register_template_path(json_data, template_path, remove, project_path, engine_path)
 
-    if isinstance(restricted_path, pathlib.PurePath):
-        if not restricted_path:
-            logger.error(f'Restricted path cannot be empty.')
-            return 1
-        result = result or register_restricted_path(json_data, restricted_path, remove, project_path, engine_path)
+        if isinstance(restricted_path, pathlib.PurePath):
+            if not restricted_path:
+                logger.error(f'Restricted path cannot be empty.')
+                return 1
+            result = result or register_restricted_path(json_data, restricted_path, remove, project_path, engine_path)
 
-    if isinstance(repo_uri, str):
-        if not repo_uri:
-            logger.error(f'Repo URI cannot be empty.')
-            return 1
-        result = result or register_repo(json_data, repo_uri, remove)
+        if isinstance(repo_uri, str):
+            if not repo_uri:
+                logger.error(f'Repo URI cannot be empty.')
+                return 1
+            result = result or register_repo(json_data, repo_uri, remove)
 
-    if isinstance(default_engines_folder, pathlib.PurePath):
-        result = result or register_default_engines_folder(json_data, default_engines_folder, remove)
+        if isinstance(default_engines_folder, pathlib.PurePath):
+            result = result or register_default_engines_folder(json_data, default_engines_folder, remove)
 
-    if isinstance(default_projects_folder, pathlib.PurePath):
-        result = result or register_default_projects_folder(json_data, default_projects_folder, remove)
+        if isinstance(default_projects_folder, pathlib.PurePath):
+            result = result or register_default_projects_folder(json_data, default_projects_folder, remove)
 
-    if isinstance(default_gems_folder, pathlib.PurePath):
-        result = result or register_default_gems_folder(json_data, default_gems_folder, remove)
+        if isinstance(default_gems_folder, pathlib.PurePath):
+            result = result or register_default_gems_folder(json_data, default_gems_folder, remove)
 
-    if isinstance(default_templates_folder, pathlib.PurePath):
-        result = result or register_default_templates_folder(json_data, default_templates_folder, remove)
+        if isinstance(default_templates_folder, pathlib.PurePath):
+            result = result or register_default_templates_folder(json_data, default_templates_folder, remove)
 
-    if isinstance(default_restricted_folder, pathlib.PurePath):
-        result = result or register_default_restricted_folder(json_data, default_restricted_folder, remove)
+        if isinstance(default_restricted_folder, pathlib.PurePath):
+            result = result or register_default_restricted_folder(json_data, default_restricted_folder, remove)
 
-    if isinstance(default_third_party_folder, pathlib.PurePath):
-        result = result or register_default_third_party_folder(json_data, default_third_party_folder, remove)
+        if isinstance(default_third_party_folder, pathlib.PurePath):
+            result = result or register_default_third_party_folder(json_data, default_third_party_folder, remove)
 
-    # engine is done LAST
-    # Now that everything that could have an engine context is done, if the engine is supplied that means this is
-    # registering the engine itself
-    if isinstance(engine_path, pathlib.PurePath):
-        if not engine_path:
-            logger.error(f'Engine path cannot be empty.')
-            return 1
-        result = result or register_engine_path(json_data, engine_path, remove, force)
+        # engine is done LAST
+        # Now that everything that could have an engine context is done, if the engine is supplied that means this is
+        # registering the engine itself
+        if isinstance(engine_path, pathlib.PurePath):
+            if not engine_path:
+                logger.error(f'Engine path cannot be empty.')
+                return 1
+            result = result or register_engine_path(json_data, engine_path, remove, force)
 
-    if not result and not dry_run:
-        manifest.save_o3de_manifest(json_data)
+        if not result and not dry_run:
+            manifest.save_o3de_manifest(json_data)
 
-    return result
+        return result
 
 
 def _run_register(args: argparse) -> int:
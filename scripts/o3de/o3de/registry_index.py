@@ -0,0 +1,203 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+"""
+Contains a persistent index of parsed o3de object json files (engine.json, project.json, gem.json, template.json...)
+or of any other json serializable data computed from a file, such as its sha256 digest.
+Entries are keyed by resolved file path and are only considered valid while the modification time and size
+of the file on disk match the values recorded when the file was parsed.
+A file modified shortly before it was parsed could be modified again within the same modification time tick
+with the same size, so data parsed from such a file is not trusted and the file is parsed again until then.
+"""
+
+import copy
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+
+from o3de import utils
+
+logger = logging.getLogger('o3de.registry_index')
+logging.basicConfig(format=utils.LOG_FORMAT)
+
+REGISTRY_INDEX_VERSION = 1
+
+# resolution of file modification times, 2 seconds for FAT file systems
+MTIME_RESOLUTION_NS = 2 * 1000000000
+
+
+class RegistryIndex:
+    """
+    Caches the result of loading json files, so only files whose stat has changed since they were last
+    loaded are opened and parsed again.
+    The index is loaded lazily from index_path and only written back by save() when it has changed.
+    """
+
+    def __init__(self, index_path: pathlib.Path = None):
+        self.index_path = pathlib.Path(index_path) if index_path else None
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def _load_entries(self) -> dict:
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if self.index_path and self.index_path.is_file():
+            try:
+                with self.index_path.open('r') as f:
+                    index_json_data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f'Registry index {self.index_path} failed to load and will be rebuilt: {str(e)}')
+            else:
+                if isinstance(index_json_data, dict) and \
+                        index_json_data.get('version', None) == REGISTRY_INDEX_VERSION:
+                    self._entries = index_json_data.get('entries', {})
+        return self._entries
+
+    @staticmethod
+    def _get_file_stat(json_path: pathlib.Path) -> tuple or None:
+        try:
+            file_stat = os.stat(json_path)
+        except (OSError, ValueError):
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    @staticmethod
+    def _is_entry_racy(entry: dict) -> bool:
+        # the file was modified within the same modification time tick as it was indexed, so it may
+        # have been modified again after it was indexed without changing its modification time
+        return entry.get('mtime_ns') >= entry.get('indexed_ns', 0) - MTIME_RESOLUTION_NS
+
+    def _get_entry_data(self, key: str, file_stat: tuple, trust_racy: bool = True) -> dict or None:
+        entry = self._load_entries().get(key, None)
+        if entry and (entry.get('mtime_ns'), entry.get('size')) == file_stat:
+            if not trust_racy and self._is_entry_racy(entry):
+                return None
+            return entry.setdefault('data', {})
+        return None
+
+    def _set_entry_data(self, key: str, file_stat: tuple, loader_key: str, json_data,
+                        indexed_ns: int = None) -> None:
+        entries = self._load_entries()
+        entry = entries.get(key, None)
+        if not entry or (entry.get('mtime_ns'), entry.get('size')) != file_stat or \
+                (indexed_ns is not None and self._is_entry_racy(entry)):
+            # the data of other loaders is dropped with a racy entry, it was loaded at the same time
+            entry = {'mtime_ns': file_stat[0], 'size': file_stat[1],
+                     'indexed_ns': indexed_ns if indexed_ns is not None else time.time_ns(), 'data': {}}
+            entries[key] = entry
+        entry['data'][loader_key] = copy.deepcopy(json_data)
+        self._dirty = True
+
+    def load_json_data(self, json_path: str or pathlib.Path, loader_key: str, loader: callable) -> dict or None:
+        """
+        Returns the json data of json_path, calling loader(json_path) only if the file has not been loaded
+        with the same loader_key before or if the modification time or size of the file changed since then.
+        Files modified within MTIME_RESOLUTION_NS of being loaded are loaded again on every call until they were
+        last loaded long enough after their modification.
+        The result of the loader is cached even if it is None, so invalid files are not parsed again until modified.
+        Exceptions raised by the loader are propagated and nothing is cached.
+        A deep copy of the data is returned, so callers are free to modify it.
+        :param json_path: path of the json file to load
+        :param loader_key: identifies the loader, different loaders of the same file are cached separately
+        :param loader: callable that validates and loads the json file
+        :return: the json data returned by the loader
+        """
+        json_path = pathlib.Path(json_path)
+        file_stat = self._get_file_stat(json_path)
+        if not file_stat or not loader_key:
+            return loader(json_path)
+
+        key = json_path.resolve().as_posix()
+        with self._lock:
+            entry_data = self._get_entry_data(key, file_stat, trust_racy=False)
+            if entry_data is not None and loader_key in entry_data:
+                return copy.deepcopy(entry_data[loader_key])
+
+        # recorded before loading, so a modification made while the file is loaded makes the entry racy
+        indexed_ns = time.time_ns()
+        json_data = loader(json_path)
+
+        with self._lock:
+            self._set_entry_data(key, file_stat, loader_key, json_data, indexed_ns)
+
+        return json_data
+
+    def get_json_data(self, json_path: str or pathlib.Path, loader_key: str) -> dict or None:
+        """
+        Returns a copy of the data stored for json_path with loader_key or None if there is no data
+        or the modification time or size of the file changed since the data was stored
+        Unlike load_json_data, this trusts data stored right after the file was modified, since the data is
+        stored by the caller which wrote the file rather than parsed from it
+        :param json_path: path of the file the data was stored for
+        :param loader_key: identifies the data stored for the file
+        """
+        file_stat = self._get_file_stat(json_path)
+        if not file_stat:
+            return None
+
+        with self._lock:
+            entry_data = self._get_entry_data(pathlib.Path(json_path).resolve().as_posix(), file_stat)
+            return copy.deepcopy(entry_data.get(loader_key, None)) if entry_data else None
+
+    def set_json_data(self, json_path: str or pathlib.Path, loader_key: str, json_data) -> None:
+        """
+        Stores json_data for the current version of json_path
+        :param json_path: path of the file to store the data for, nothing is stored if the file doesn't exist
+        :param loader_key: identifies the data stored for the file
+        :param json_data: json serializable data to store
+        """
+        file_stat = self._get_file_stat(json_path)
+        if not file_stat:
+            return
+
+        with self._lock:
+            self._set_entry_data(pathlib.Path(json_path).resolve().as_posix(), file_stat, loader_key, json_data)
+
+    def invalidate(self, json_path: str or pathlib.Path = None) -> None:
+        """
+        Removes the entry for json_path from the index or all entries if json_path is None
+        :param json_path: optional path of the json file to remove
+        """
+        with self._lock:
+            entries = self._load_entries()
+            if json_path is None:
+                entries.clear()
+                self._dirty = True
+            elif entries.pop(pathlib.Path(json_path).resolve().as_posix(), None) is not None:
+                self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Atomically writes the index to index_path if it has changed since it was loaded
+        :return: True if the index is up to date on disk, False if it failed to save
+        """
+        with self._lock:
+            if not self._dirty or not self.index_path:
+                return True
+
+            # remove entries for files that no longer exist so the index does not grow unbounded
+            entries = {key: entry for key, entry in self._entries.items() if os.path.isfile(key)}
+            temp_index_path = self.index_path.with_name(f'{self.index_path.name}.{os.getpid()}.tmp')
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                with temp_index_path.open('w') as s:
+                    s.write(json.dumps({'version': REGISTRY_INDEX_VERSION, 'entries': entries}))
+                os.replace(temp_index_path, self.index_path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f'Registry index {self.index_path} failed to save: {str(e)}')
+                temp_index_path.unlink(missing_ok=True)
+                return False
+
+            self._entries = entries
+            self._dirty = False
+            return True
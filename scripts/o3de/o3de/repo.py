@@ -6,18 +6,79 @@
 #
 #
 
+import concurrent.futures
 import json
 import logging
 import pathlib
+import urllib.error
 import urllib.parse
 import urllib.request
 import hashlib
 from datetime import datetime
-from o3de import manifest, utils, validation
+from o3de import manifest, registry_index, utils, validation
 
 logger = logging.getLogger('o3de.repo')
 logging.basicConfig(format=utils.LOG_FORMAT)
 
+# maximum number of object manifests downloaded concurrently, which bounds the number of open connections
+REPO_DOWNLOAD_MAX_WORKERS = 8
+
+_repo_cache_index = None
+
+
+def get_repo_cache_index() -> registry_index.RegistryIndex:
+    """
+    Returns the persistent index of the http headers received when downloading the files in the o3de cache folder
+    """
+    global _repo_cache_index
+    if not _repo_cache_index:
+        _repo_cache_index = registry_index.RegistryIndex(manifest.get_o3de_repo_cache_index_path())
+    return _repo_cache_index
+
+
+def download_repo_file(parsed_uri, cache_file: pathlib.Path) -> int:
+    """
+    Downloads a repo json file to the cache file, overwriting it if it exists
+    Http requests are conditional on the ETag and Last-Modified headers received when the cache file was downloaded,
+    so a file that hasn't changed on the server is not downloaded again
+    :param parsed_uri: uniform resource identifier of the file to download
+    :param cache_file: location path on disk to download the file
+    :return: 0 for success or non 0 failure code
+    """
+    if parsed_uri.scheme not in ['http', 'https']:
+        return utils.download_file(parsed_uri, cache_file, True)
+
+    repo_cache_index = get_repo_cache_index()
+    request = urllib.request.Request(parsed_uri.geturl())
+    # the cached headers are discarded by the index if the cache file changed since it was downloaded
+    cached_headers = repo_cache_index.get_json_data(cache_file, 'http_headers') if cache_file.is_file() else None
+    if cached_headers:
+        if cached_headers.get('etag'):
+            request.add_header('If-None-Match', cached_headers['etag'])
+        if cached_headers.get('last_modified'):
+            request.add_header('If-Modified-Since', cached_headers['last_modified'])
+
+    try:
+        with urllib.request.urlopen(request) as s:
+            with cache_file.open('wb') as f:
+                utils.copyfileobj(s, f, lambda copied_bytes: False)
+            response_headers = {'etag': s.headers.get('ETag'), 'last_modified': s.headers.get('Last-Modified')}
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            # not modified, the cache file is up to date
+            return 0
+        logger.error(f'HTTP Error {e.code} opening {parsed_uri.geturl()}')
+        return 1
+    except urllib.error.URLError as e:
+        logger.error(f'URL Error {e.reason} opening {parsed_uri.geturl()}')
+        return 1
+
+    response_headers = {key: value for key, value in response_headers.items() if isinstance(value, str)}
+    if response_headers:
+        repo_cache_index.set_json_data(cache_file, 'http_headers', response_headers)
+    return 0
+
+
 def get_cache_file_uri(uri: str):
     parsed_uri = urllib.parse.urlparse(uri)
     uri_sha256 = hashlib.sha256(parsed_uri.geturl().encode())
@@ -39,7 +100,8 @@ def download_repo_manifest(manifest_uri: str) -> pathlib.Path or None:
     if git_provider:
         parsed_uri = git_provider.get_specific_file_uri(parsed_uri)
 
-    result = utils.download_file(parsed_uri, cache_file, True)
+    result = download_repo_file(parsed_uri, cache_file)
+    get_repo_cache_index().save()
 
     return cache_file if result == 0 else None
 
@@ -68,19 +130,26 @@ def download_object_manifests(repo_data):
     except KeyError:
         pass
 
-    for o3de_object_uris, manifest_json in manifest_download_list:
-        for o3de_object_uri in o3de_object_uris:
-            manifest_json_uri = f'{o3de_object_uri}/{manifest_json}'
-            cache_file, parsed_uri = get_cache_file_uri(manifest_json_uri)
+    def download_object_manifest(manifest_json_uri: str) -> int:
+        cache_file, parsed_uri = get_cache_file_uri(manifest_json_uri)
 
-            git_provider = utils.get_git_provider(parsed_uri)
-            if git_provider:
-                parsed_uri = git_provider.get_specific_file_uri(parsed_uri)
+        git_provider = utils.get_git_provider(parsed_uri)
+        if git_provider:
+            parsed_uri = git_provider.get_specific_file_uri(parsed_uri)
 
-            download_file_result = utils.download_file(parsed_uri, cache_file, True)
-            if download_file_result != 0:
-                return download_file_result
-    return 0
+        return download_repo_file(parsed_uri, cache_file)
+
+    manifest_json_uris = [f'{o3de_object_uri}/{manifest_json}'
+                          for o3de_object_uris, manifest_json in manifest_download_list
+                          for o3de_object_uri in o3de_object_uris]
+    if not manifest_json_uris:
+        return 0
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=REPO_DOWNLOAD_MAX_WORKERS) as executor:
+        download_file_results = list(executor.map(download_object_manifest, manifest_json_uris))
+    get_repo_cache_index().save()
+
+    return next((result for result in download_file_results if result != 0), 0)
 
 def validate_remote_repo(repo_uri: str, validate_contained_objects: bool = False) -> bool:
     manifest_uri = get_repo_manifest_uri(repo_uri)
@@ -172,7 +241,8 @@ def process_add_o3de_repo(file_name: str or pathlib.Path,
             repo_uri = f'{repo}/repo.json'
             cache_file, parsed_uri = get_cache_file_uri(repo_uri)
             
-            download_file_result = utils.download_file(parsed_uri, cache_file, True)
+            download_file_result = download_repo_file(parsed_uri, cache_file)
+            get_repo_cache_index().save()
             if download_file_result != 0:
                 return download_file_result
 
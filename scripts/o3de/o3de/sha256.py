@@ -13,11 +13,51 @@ import hashlib
 import pathlib
 import sys
 
-from o3de import utils
+from o3de import manifest, registry_index, utils
 
 logger = logging.getLogger('o3de.sha256')
 logging.basicConfig(format=utils.LOG_FORMAT)
 
+# size of the buffer used to hash files, so memory usage doesn't grow with the size of the file
+SHA256_CHUNK_SIZE = 1024 * 1024
+
+_sha256_index = None
+
+
+def get_sha256_index() -> registry_index.RegistryIndex:
+    """
+    Returns the persistent index of file sha256 digests stored in the o3de cache folder
+    """
+    global _sha256_index
+    if not _sha256_index:
+        _sha256_index = registry_index.RegistryIndex(manifest.get_o3de_sha256_index_path())
+    return _sha256_index
+
+
+def compute_file_sha256(file_path: str or pathlib.Path, chunk_size: int = SHA256_CHUNK_SIZE) -> str:
+    """
+    Returns the sha256 hex digest of the file, reading it in chunks of chunk_size bytes
+    :param file_path: path of the file to hash
+    :param chunk_size: number of bytes to read at a time
+    """
+    file_sha256 = hashlib.sha256()
+    with pathlib.Path(file_path).open('rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            file_sha256.update(chunk)
+    return file_sha256.hexdigest()
+
+
+def get_file_sha256(file_path: str or pathlib.Path) -> str:
+    """
+    Returns the sha256 hex digest of the file
+    Digests are cached in the sha256 index, so files are only hashed again if their size or modification time changed
+    :param file_path: path of the file to hash
+    """
+    sha256_index = get_sha256_index()
+    file_sha256 = sha256_index.load_json_data(file_path, 'sha256', compute_file_sha256)
+    sha256_index.save()
+    return file_sha256
+
 
 def sha256(file_path: str or pathlib.Path,
            json_path: str or pathlib.Path = None) -> int:
@@ -35,7 +75,7 @@ def sha256(file_path: str or pathlib.Path,
             logger.error(f'Json path {json_path} does not exist.')
             return 1
 
-    the_sha256 = hashlib.sha256(file_path.open('rb').read()).hexdigest()
+    the_sha256 = get_file_sha256(file_path)
 
     if json_path:
         with json_path.open('r') as s:
@@ -13,6 +13,10 @@ import pathlib
 import uuid
 from o3de import utils
 
+# Version of the validators, validated json data cached in the registry index is only reused by
+# validators of the same version. Increment it when changing which json files a validator accepts.
+VALIDATORS_VERSION = 1
+
 
 def always_valid(json_data: dict) -> bool:
     return True
@@ -22,6 +26,15 @@ def valid_o3de_json_dict(json_data: dict, key: str) -> bool:
     return key in json_data
 
 
+def valid_o3de_repo_json_data(json_data: dict) -> bool:
+    try:
+        _ = json_data['repo_name']
+        _ = json_data['origin']
+    except (KeyError, TypeError):
+        return False
+    return True
+
+
 def valid_o3de_repo_json(file_name: str or pathlib.Path) -> bool:
     file_name = pathlib.Path(file_name).resolve()
     if not file_name.is_file():
@@ -30,10 +43,16 @@ def valid_o3de_repo_json(file_name: str or pathlib.Path) -> bool:
     with file_name.open('r') as f:
         try:
             json_data = json.load(f)
-            _ = json_data['repo_name']
-            _ = json_data['origin']
-        except (json.JSONDecodeError, KeyError):
+        except json.JSONDecodeError:
             return False
+    return valid_o3de_repo_json_data(json_data)
+
+
+def valid_o3de_engine_json_data(json_data: dict) -> bool:
+    try:
+        _ = json_data['engine_name']
+    except (KeyError, TypeError):
+        return False
     return True
 
 
@@ -45,10 +64,9 @@ def valid_o3de_engine_json(file_name: str or pathlib.Path) -> bool:
     with file_name.open('r') as f:
         try:
             json_data = json.load(f)
-            _ = json_data['engine_name']
-        except (json.JSONDecodeError, KeyError):
+        except json.JSONDecodeError:
             return False
-    return True
+    return valid_o3de_engine_json_data(json_data)
 
 
 def valid_o3de_project_json(file_name: str or pathlib.Path, generate_uuid: bool = True) -> bool:
@@ -83,6 +101,19 @@ def valid_o3de_project_json(file_name: str or pathlib.Path, generate_uuid: bool
     return True
 
 
+def valid_o3de_gem_json_data(json_data: dict) -> bool:
+    try:
+        _ = json_data['gem_name']
+
+        if 'compatible_engines' in json_data:
+            if not utils.validate_version_specifier_list(json_data['compatible_engines']):
+                return False
+
+    except (KeyError, TypeError):
+        return False
+    return True
+
+
 def valid_o3de_gem_json(file_name: str or pathlib.Path) -> bool:
     file_name = pathlib.Path(file_name).resolve()
     if not file_name.is_file():
@@ -91,14 +122,16 @@ def valid_o3de_gem_json(file_name: str or pathlib.Path) -> bool:
     with file_name.open('r') as f:
         try:
             json_data = json.load(f)
-            _ = json_data['gem_name']
+        except json.JSONDecodeError:
+            return False
+    return valid_o3de_gem_json_data(json_data)
 
-            if 'compatible_engines' in json_data:
-                if not utils.validate_version_specifier_list(json_data['compatible_engines']):
-                    return False
 
-        except (json.JSONDecodeError, KeyError):
-            return False
+def valid_o3de_template_json_data(json_data: dict) -> bool:
+    try:
+        _ = json_data['template_name']
+    except (KeyError, TypeError):
+        return False
     return True
 
 
@@ -110,9 +143,16 @@ def valid_o3de_template_json(file_name: str or pathlib.Path) -> bool:
     with file_name.open('r') as f:
         try:
             json_data = json.load(f)
-            _ = json_data['template_name']
-        except (json.JSONDecodeError, KeyError):
+        except json.JSONDecodeError:
             return False
+    return valid_o3de_template_json_data(json_data)
+
+
+def valid_o3de_restricted_json_data(json_data: dict) -> bool:
+    try:
+        _ = json_data['restricted_name']
+    except (KeyError, TypeError):
+        return False
     return True
 
 
@@ -124,7 +164,28 @@ def valid_o3de_restricted_json(file_name: str or pathlib.Path) -> bool:
     with file_name.open('r') as f:
         try:
             json_data = json.load(f)
-            _ = json_data['restricted_name']
-        except (json.JSONDecodeError, KeyError):
+        except json.JSONDecodeError:
             return False
-    return True
+    return valid_o3de_restricted_json_data(json_data)
+
+
+# json file validators and the equivalent validators of already loaded json data
+_json_data_validators = {
+    valid_o3de_repo_json: valid_o3de_repo_json_data,
+    valid_o3de_engine_json: valid_o3de_engine_json_data,
+    valid_o3de_gem_json: valid_o3de_gem_json_data,
+    valid_o3de_template_json: valid_o3de_template_json_data,
+    valid_o3de_restricted_json: valid_o3de_restricted_json_data,
+    always_valid: always_valid
+}
+
+
+def get_json_data_validator(file_validator: callable) -> callable or None:
+    """
+    Returns the validator that checks already loaded json data for a json file validator,
+    so callers that need the json data can load and validate a file with a single parse.
+    Returns None if the json file validator has no json data equivalent, for example because it
+    modifies the file as valid_o3de_project_json can.
+    :param file_validator: the json file validator such as valid_o3de_gem_json
+    """
+    return _json_data_validators.get(file_validator, None)
@@ -0,0 +1,26 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import pytest
+from unittest.mock import patch
+
+from o3de import registry_index
+
+
+@pytest.fixture(autouse=True)
+def temp_o3de_cache_indexes(tmp_path_factory):
+    # the persistent indexes are stored in a temporary folder instead of the o3de cache folder of the user,
+    # so the test json files are never added to the indexes of the user
+    cache_folder = tmp_path_factory.mktemp('Cache')
+    with patch('o3de.manifest._registry_index',
+               registry_index.RegistryIndex(cache_folder / 'o3de_registry_index.json')) as _1, \
+            patch('o3de.sha256._sha256_index',
+                  registry_index.RegistryIndex(cache_folder / 'o3de_sha256_index.json')) as _2, \
+            patch('o3de.repo._repo_cache_index',
+                  registry_index.RegistryIndex(cache_folder / 'o3de_repo_cache_index.json')) as _3:
+        yield cache_folder
@@ -0,0 +1,108 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import pathlib
+import pytest
+from unittest.mock import patch
+
+from o3de import compatibility
+
+
+class TestGemDependencyGraph:
+    @pytest.mark.parametrize("gem_json_data, all_gems_json_data, expected_result", [
+            # gems without dependencies are compatible
+            pytest.param({'gem_name':'gem1'}, {}, set()),
+            # when no gems are available all dependencies are incompatible
+            pytest.param({'gem_name':'gem1', 'dependencies':['gem2>=1.0.0']}, {}, {'gem2>=1.0.0'}),
+            # missing dependencies of dependencies are found
+            pytest.param({'gem_name':'gem1', 'dependencies':['gem2']},
+                {'gem2':{'gem_name':'gem2', 'dependencies':['gem3']}},
+                {'gem2 is missing the dependency gem3'}),
+            # incompatible dependency versions are found, but their own dependencies are not checked
+            pytest.param({'gem_name':'gem1', 'dependencies':['gem2>=2.0.0', 'gem3~=1.0']},
+                {'gem2':{'gem_name':'gem2', 'version':'1.0.0', 'dependencies':['gem4']},
+                 'gem3':{'gem_name':'gem3', 'version':'1.2.0', 'dependencies':['gem4']},
+                 'gem4':{'gem_name':'gem4'}},
+                {'gem1 depends on gem2>=2.0.0 but gem2 version 1.0.0 was found'}),
+            # gems which depend on each other are resolved
+            pytest.param({'gem_name':'gem1', 'dependencies':['gem2']},
+                {'gem2':{'gem_name':'gem2', 'dependencies':['gem3']},
+                 'gem3':{'gem_name':'gem3', 'dependencies':['gem2', 'gem4==2.0.0']},
+                 'gem4':{'gem_name':'gem4', 'version':'1.0.0'}},
+                {'gem3 depends on gem4==2.0.0 but gem4 version 1.0.0 was found'}),
+        ]
+    )
+    def test_get_incompatible_dependencies(self, gem_json_data, all_gems_json_data, expected_result):
+        gem_dependency_graph = compatibility.GemDependencyGraph(all_gems_json_data)
+        assert gem_dependency_graph.get_incompatible_dependencies(gem_json_data) == expected_result
+        assert compatibility.get_incompatible_gem_dependencies(gem_json_data, all_gems_json_data) == expected_result
+
+    def test_get_incompatible_dependencies_checks_each_gem_once(self):
+        all_gems_json_data = {f'gem{index}': {'gem_name': f'gem{index}', 'version': '1.0.0',
+                                              'dependencies': [f'gem{index + 1}>=1.0.0', 'common']}
+                              for index in range(2000)}
+        all_gems_json_data['common'] = {'gem_name': 'common'}
+        gem_dependency_graph = compatibility.GemDependencyGraph(all_gems_json_data)
+
+        with patch('o3de.compatibility.has_compatible_version',
+                   side_effect=compatibility.has_compatible_version) as has_compatible_version_patch:
+            for index in range(2000):
+                assert gem_dependency_graph.get_incompatible_dependencies(all_gems_json_data[f'gem{index}']) == \
+                       {'gem1999 is missing the dependency gem2000>=1.0.0'}
+
+            # the dependencies of gem1 to gem1998 are checked once when the graph resolves them, and the
+            # dependencies of gem0 to gem1998 once more when they are passed to get_incompatible_dependencies
+            assert has_compatible_version_patch.call_count == 1998 + 1999
+
+    def test_get_dependency_gem_names(self):
+        gem_dependency_graph = compatibility.GemDependencyGraph({
+            'gem1':{'gem_name':'gem1', 'dependencies':['gem2>=1.0.0']},
+            'gem2':{'gem_name':'gem2', 'dependencies':['gem1', 'gem3']},
+            'gem4':{'gem_name':'gem4'}})
+        assert gem_dependency_graph.get_dependency_gem_names(['gem1']) == {'gem1', 'gem2', 'gem3'}
+
+
+@pytest.mark.parametrize("name_and_version_specifier_list, object_name, object_version, expected_result", [
+        pytest.param(['o3de'], 'o3de', '1.0.0', True),
+        pytest.param(['o3de>=1.0.0'], 'o3de', '1.0.0', True),
+        pytest.param(['o3de>1.0.0', 'o3de-sdk==1.0.0'], 'o3de', '1.0.0', False),
+        pytest.param(['o3de>=1.0.0'], 'o3de', 'invalid', False),
+        pytest.param(['invalid specifier'], 'o3de', '1.0.0', False),
+    ]
+)
+def test_has_compatible_version(name_and_version_specifier_list, object_name, object_version, expected_result):
+    assert compatibility.has_compatible_version(name_and_version_specifier_list, object_name, object_version) == expected_result
+
+
+@pytest.mark.parametrize("project_engine, expected_engine_path", [
+        pytest.param('o3de', 'engine3'),
+        pytest.param('o3de>=1.0.0,<2.0.0', 'engine2'),
+        pytest.param('o3de==0.0.0', 'engine5'),
+        pytest.param('o3de-sdk', None),
+        pytest.param('invalid specifier', None),
+    ]
+)
+def test_get_most_compatible_project_engine_path(tmp_path, project_engine, expected_engine_path):
+    engines_json_data = {
+        'engine1': {'engine_name': 'o3de', 'version': '1.0.0'},
+        'engine2': {'engine_name': 'o3de', 'version': '1.2.0'},
+        'engine3': {'engine_name': 'o3de', 'version': '2.0.0'},
+        'engine4': {'engine_name': 'o3de', 'version': 'invalid'},
+        'engine5': {'engine_name': 'o3de'},
+    }
+
+    # only the engine versions are checked, the gem dependencies are not resolved for each engine
+    with patch('o3de.manifest.get_gems_json_data_by_name') as get_gems_json_data_by_name_patch, \
+            patch('o3de.compatibility.GemDependencyGraph') as gem_dependency_graph_patch:
+        engine_path = compatibility.get_most_compatible_project_engine_path(tmp_path,
+            project_json_data={'project_name': 'TestProject', 'engine': project_engine},
+            user_project_json_data={}, engines_json_data=engines_json_data)
+        get_gems_json_data_by_name_patch.assert_not_called()
+        gem_dependency_graph_patch.assert_not_called()
+
+    assert engine_path == (pathlib.Path(expected_engine_path) if expected_engine_path else None)
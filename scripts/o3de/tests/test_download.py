@@ -6,13 +6,16 @@
 #
 
 import copy
+import hashlib
 import json
+import os
 import pytest
 import pathlib
 import urllib.request
+import zipfile
 from unittest.mock import patch, MagicMock, mock_open
 
-from o3de import manifest, download, utils
+from o3de import manifest, download, registry_index, sha256, utils
 
 TEST_O3DE_MANIFEST_JSON_PAYLOAD = '''
 {
@@ -374,3 +377,52 @@ class TestObjectDownload:
                 patch('pathlib.Path.is_file', return_value=True) as _4:
 
             assert update_function(object_name, existing_time) == update_available
+
+
+class TestValidateDownloadedZipSha256:
+    @pytest.fixture(autouse=True)
+    def setup_zip(self, tmp_path):
+        self.zip_path = tmp_path / 'gem.zip'
+        self.zip_path.write_bytes(TEST_O3DE_INCORRECT_FILE_DATA.encode())
+        # old enough for the sha256 index to trust entries of the file
+        file_stat = self.zip_path.stat()
+        os.utime(self.zip_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns - 2 * registry_index.MTIME_RESOLUTION_NS))
+        self.advertised_sha256 = hashlib.sha256(TEST_O3DE_ZIP_FILE_DATA.encode()).hexdigest()
+
+    def test_validation_ignores_sha256_index_entry(self):
+        # an index entry of a replaced file with the same size and modification time
+        sha256_index = sha256.get_sha256_index()
+        sha256_index.set_json_data(self.zip_path, 'sha256', self.advertised_sha256)
+        assert sha256.get_file_sha256(self.zip_path) == self.advertised_sha256
+
+        with patch('o3de.download.unzip_manifest_json_data') as unzip_manifest_json_data_patch:
+            assert download.validate_downloaded_zip_sha256({'sha256': self.advertised_sha256},
+                                                           self.zip_path, 'gem.json') == 0
+            unzip_manifest_json_data_patch.assert_not_called()
+
+    def test_validation_does_not_add_sha256_index_entry(self):
+        zip_sha256 = hashlib.sha256(TEST_O3DE_INCORRECT_FILE_DATA.encode()).hexdigest()
+        with patch('o3de.download.unzip_manifest_json_data', return_value={'gem_name': 'TestGem'}):
+            assert download.validate_downloaded_zip_sha256({'gem_name': 'TestGem', 'sha256': zip_sha256},
+                                                           self.zip_path, 'gem.json') == 1
+
+        assert sha256.get_sha256_index().get_json_data(self.zip_path, 'sha256') is None
+
+    def test_reused_download_is_hashed_once(self, tmp_path):
+        gem_json_data = {'gem_name': 'TestGem', 'origin_uri': 'http://o3derepo.org/TestGem/gem.zip'}
+        with zipfile.ZipFile(self.zip_path, 'w') as zip_file:
+            zip_file.writestr('gem.json', json.dumps(gem_json_data))
+        zip_sha256 = hashlib.sha256(self.zip_path.read_bytes()).hexdigest()
+        downloadable_object_data = dict(gem_json_data, sha256=zip_sha256)
+
+        with patch('o3de.download.get_downloadable', return_value=downloadable_object_data) as _1, \
+                patch('o3de.download.get_download_zip_path', return_value=self.zip_path) as _2, \
+                patch('o3de.utils.download_zip_file') as download_zip_file_patch, \
+                patch('o3de.sha256.compute_file_sha256',
+                      side_effect=sha256.compute_file_sha256) as compute_file_sha256_patch:
+            assert download.download_o3de_object('TestGem', 'gems', tmp_path / 'TestGem', 'gem', 'gem_name',
+                                                 skip_auto_register=True, force_overwrite=False) == 0
+
+        download_zip_file_patch.assert_not_called()
+        compute_file_sha256_patch.assert_called_once_with(self.zip_path)
+        assert json.loads((tmp_path / 'TestGem' / 'gem.json').read_text()) == gem_json_data
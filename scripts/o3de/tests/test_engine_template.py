@@ -8,6 +8,7 @@ import json
 import pathlib
 import uuid
 import pytest
+import random
 import string
 
 from o3de import engine_template
@@ -133,6 +134,58 @@ TEST_CONCRETE_GEM_TEMPLATE_JSON_CONTENTS = string.Template(
     TEST_TEMPLATE_JSON_CONTENTS).safe_substitute({'Name': 'TestGem'})
 
 
+def transform_each_replacement_in_order(s_data: str, replacements: list) -> str:
+    for replace_this, with_this in replacements:
+        s_data = s_data.replace(replace_this, with_this)
+    return s_data
+
+
+@pytest.mark.parametrize(
+    "s_data, replacements", [
+        pytest.param('${Name}/${NameLower}/${NameUpper}.cpp ${Name}',
+                     [('${Name}', 'TestGem'), ('${NameLower}', 'testgem'), ('${NameUpper}', 'TESTGEM')]),
+        # the first replacement of a repeated string wins
+        pytest.param('${Name} ${Version}', [('${Name}', 'TestGem'), ('${Version}', '1.0.0'), ('${Name}', 'Other')]),
+        # a replacement creating a string replaced by a later pair
+        pytest.param('${Name} ${DisplayName}', [('${DisplayName}', '${Name}'), ('${Name}', 'TestGem')]),
+        # a replacement creating a string replaced by an earlier pair, which is kept
+        pytest.param('${Name} ${DisplayName}', [('${Name}', 'TestGem'), ('${DisplayName}', '${Name}')]),
+        # a replacement creating a string to replace with the text around it
+        pytest.param('${Na${Part}', [('${Part}', 'me}'), ('${Name}', 'TestGem')]),
+        # overlapping strings to replace
+        pytest.param('TestGemLower testgem TestGem', [('TestGem', '${Name}'), ('GemLower', '${Lower}')]),
+        pytest.param('abcabc', [('ab', 'x'), ('bc', 'y'), ('c', 'z')])
+    ]
+)
+def test_transform_matches_replacing_each_pair_in_order(s_data, replacements):
+    assert engine_template._transform(s_data, replacements, keep_license_text=True) == \
+           transform_each_replacement_in_order(s_data, replacements)
+
+
+def test_transform_matches_replacing_each_pair_in_order_for_random_pairs():
+    rng = random.Random(0)
+    for _ in range(2000):
+        replacements = [(''.join(rng.choices('ab', k=rng.randint(1, 3))), ''.join(rng.choices('ab$', k=rng.randint(0, 3))))
+                        for _ in range(rng.randint(1, 4))]
+        s_data = ''.join(rng.choices('ab$', k=rng.randint(0, 12)))
+        assert engine_template._transform(s_data, replacements, keep_license_text=True) == \
+               transform_each_replacement_in_order(s_data, replacements), (s_data, replacements)
+
+
+def test_transform_replaces_random_uuid_created_by_replacement():
+    t_data = engine_template._transform('${Id}', [('${Id}', '${Random_Uuid}')])
+
+    assert uuid.UUID(t_data)
+
+
+def test_transform_replaces_each_random_uuid():
+    t_data = engine_template._transform('${Random_Uuid} ${Random_Uuid} ${Name}', [('${Name}', 'TestGem')])
+
+    first_uuid, second_uuid, name = t_data.split(' ')
+    assert uuid.UUID(first_uuid) != uuid.UUID(second_uuid)
+    assert name == 'TestGem'
+
+
 @pytest.mark.parametrize(
     "concrete_contents,"
     " templated_contents_with_license, templated_contents_without_license,"
@@ -213,6 +266,62 @@ def test_create_template(tmpdir,
             assert s_data == templated_contents_without_license
 
 
+
+def test_create_template_incremental_only_transforms_changed_files(tmp_path):
+    template_source_path = tmp_path / 'TestTemplate'
+    source_include_path = template_source_path / 'Code/Include/TestTemplate'
+    source_include_path.mkdir(parents=True)
+    changed_source_file = source_include_path / 'TestTemplateBus.h'
+    changed_source_file.write_text('namespace TestTemplate {}\n')
+    unchanged_source_file = source_include_path / 'TestTemplateSystem.h'
+    unchanged_source_file.write_text('#include <TestTemplate/TestTemplateBus.h>\n')
+    removed_source_file = template_source_path / 'TestTemplateRemoved.txt'
+    removed_source_file.write_text('TestTemplate\n')
+    template_folder = tmp_path / 'Templates/TestTemplate'
+    cache_folder = tmp_path / 'Cache'
+
+    def create_template_incrementally() -> list:
+        with patch('o3de.manifest.get_o3de_cache_folder', return_value=cache_folder) as _1, \
+                patch('o3de.engine_template.open', side_effect=open, create=True) as open_patch:
+            assert engine_template.create_template(template_source_path, template_folder, source_name='TestTemplate',
+                                                   no_register=True, incremental=True) == 0
+        return [pathlib.Path(call.args[0]) for call in open_patch.call_args_list if call.args[1] == 'r']
+
+    assert len(create_template_incrementally()) == 3
+
+    template_json_path = template_folder / 'template.json'
+    template_json_data = json.loads(template_json_path.read_text())
+    template_json_data['summary'] = 'An edited summary.'
+    template_json_path.write_text(json.dumps(template_json_data))
+
+    changed_source_file.write_text('namespace TestTemplate { class TestTemplateBus; }\n')
+    removed_source_file.unlink()
+
+    # the incremental mode doesn't require force and only transforms the changed file again
+    assert create_template_incrementally() == [changed_source_file]
+
+    template_content_folder = template_folder / 'Template'
+    assert (template_content_folder / 'Code/Include/${Name}/${Name}Bus.h').read_text() == \
+           'namespace ${SanitizedCppName} { class ${SanitizedCppName}Bus; }\n'
+    assert (template_content_folder / 'Code/Include/${Name}/${Name}System.h').read_text() == \
+           '#include <${SanitizedCppName}/${SanitizedCppName}Bus.h>\n'
+    assert not (template_content_folder / '${Name}Removed.txt').exists()
+
+    template_json_data = json.loads(template_json_path.read_text())
+    assert template_json_data['summary'] == 'An edited summary.'
+    assert template_json_data['copyFiles'] == [
+        {'file': 'Code/Include/${Name}/${Name}Bus.h', 'isTemplated': True},
+        {'file': 'Code/Include/${Name}/${Name}System.h', 'isTemplated': True}
+    ]
+
+    # the template cache is kept in the o3de cache folder, so an incremental run leaves the template folder unchanged
+    template_folder_files = {path: path.read_bytes() for path in template_folder.rglob('*') if path.is_file()}
+    assert create_template_incrementally() == []
+    assert {path: path.read_bytes() for path in template_folder.rglob('*') if path.is_file()} == template_folder_files
+    assert not (template_folder / '.template_cache.json').exists()
+    assert len(list((cache_folder / engine_template.template_cache_folder_name).glob('*.json'))) == 1
+
+
 class TestCreateTemplate:
     def instantiate_template_wrapper(self, tmpdir, create_from_template_func, instantiated_name,
                                      concrete_contents, templated_contents,
@@ -13,7 +13,7 @@ import pathlib
 import logging
 from unittest.mock import patch
 
-from o3de import manifest, utils
+from o3de import manifest, registry_index, utils
 
 
 TEST_GEM_JSON_PAYLOAD = '''
@@ -626,9 +626,146 @@ class TestManifestRemoveNonDependencyGemJsonData:
             pytest.param(['gem1'], 
                 {'gem1':{'dependencies':['gem2']}, 'gem2':{'dependencies':['gem3']}, 'gem3':{}, 'gem4':{}}, 
                 {'gem1':{'dependencies':['gem2']}, 'gem2':{'dependencies':['gem3']}, 'gem3':{}}), 
+            # dependencies with version specifiers are kept 
+            pytest.param(['gem1'], 
+                {'gem1':{'dependencies':['gem2>=1.0.0']}, 'gem2':{'dependencies':['gem1']}, 'gem3':{}}, 
+                {'gem1':{'dependencies':['gem2>=1.0.0']}, 'gem2':{'dependencies':['gem1']}}), 
         ]
     )
     def test_remove_non_dependency_gem_json_data(self, top_level_gem_names, gems_json_data_by_name, expected_result):
             manifest.remove_non_dependency_gem_json_data(gem_names=top_level_gem_names, 
                                                         gems_json_data_by_name=gems_json_data_by_name)
             assert gems_json_data_by_name == expected_result
+
+class TestManifestSession:
+    @staticmethod
+    def load_o3de_manifest_json_data(manifest_path: pathlib.Path = None) -> dict:
+        return json.loads(TEST_O3DE_MANIFEST_JSON_PAYLOAD)
+
+    def test_manifest_session_loads_manifest_once(self):
+        with patch('o3de.manifest.load_o3de_manifest_json_data', side_effect=self.load_o3de_manifest_json_data) \
+                as load_o3de_manifest_json_data_patch:
+            with manifest.ManifestSession():
+                assert manifest.get_manifest_projects() == ['D:/MinimalProject']
+                assert manifest.get_manifest_external_subdirectories() == ['D:/GemOutsideEngine']
+                assert manifest.get_manifest_engines() == ['D:/o3de/o3de']
+            load_o3de_manifest_json_data_patch.assert_called_once()
+
+            # without an active session the manifest is loaded each time
+            manifest.get_manifest_projects()
+            manifest.get_manifest_projects()
+            assert load_o3de_manifest_json_data_patch.call_count == 3
+
+    def test_manifest_session_returns_copies(self):
+        with patch('o3de.manifest.load_o3de_manifest_json_data', side_effect=self.load_o3de_manifest_json_data):
+            with manifest.ManifestSession():
+                manifest.get_manifest_projects().append('D:/OtherProject')
+                assert manifest.get_manifest_projects() == ['D:/MinimalProject']
+
+    def test_nested_manifest_sessions_reuse_outer_session(self):
+        with manifest.ManifestSession() as outer_session:
+            with manifest.ManifestSession() as inner_session:
+                assert inner_session is outer_session
+                assert manifest.get_manifest_session() is outer_session
+            assert manifest.get_manifest_session() is outer_session
+        assert manifest.get_manifest_session() is None
+
+    def test_save_o3de_manifest_invalidates_session(self, tmp_path):
+        manifest_path = tmp_path / 'o3de_manifest.json'
+        manifest_path.write_text(TEST_O3DE_MANIFEST_JSON_PAYLOAD)
+        with patch('o3de.manifest.get_o3de_manifest', return_value=manifest_path), \
+                patch('o3de.manifest.get_registry_index',
+                      return_value=registry_index.RegistryIndex(tmp_path / 'o3de_registry_index.json')):
+            with manifest.ManifestSession():
+                json_data = manifest.load_o3de_manifest()
+                json_data['projects'] = []
+                assert manifest.save_o3de_manifest(json_data)
+                assert manifest.get_manifest_projects() == []
+
+    def test_deferred_save_to_explicit_o3de_manifest_path_is_loaded(self, tmp_path):
+        manifest_path = tmp_path / 'o3de_manifest.json'
+        manifest_path.write_text(TEST_O3DE_MANIFEST_JSON_PAYLOAD)
+        with patch('o3de.manifest.get_o3de_manifest', return_value=manifest_path):
+            with manifest.ManifestSession(defer_saves=True):
+                json_data = manifest.load_o3de_manifest()
+                json_data['projects'] = []
+                assert manifest.save_o3de_manifest(json_data, manifest_path)
+
+                assert manifest.get_manifest_projects() == []
+                assert manifest.load_o3de_manifest(manifest_path)['projects'] == []
+                assert json.loads(manifest_path.read_text())['projects'] == ['D:/MinimalProject']
+
+            # the session writes the saved json data when it exits instead of stale manifest json data
+            assert json.loads(manifest_path.read_text())['projects'] == []
+
+    def test_deferred_save_of_project_json_is_loaded(self, tmp_path):
+        project_path = tmp_path / 'TestProject'
+        project_path.mkdir()
+        project_json = project_path / 'project.json'
+        project_json.write_text(TEST_PROJECT_JSON_PAYLOAD)
+        with patch('o3de.manifest.get_all_projects', return_value=[project_path]):
+            with manifest.ManifestSession(defer_saves=True) as session:
+                assert manifest.get_registered(project_name='TestProject') == project_path
+
+                project_json_data = manifest.load_json_file(project_json)
+                project_json_data['project_name'] = 'RenamedProject'
+                assert manifest.save_o3de_manifest(project_json_data, project_json)
+
+                assert manifest.get_registered(project_name='RenamedProject') == project_path
+                assert manifest.get_registered(project_name='TestProject') is None
+
+                assert session.save_deferred_json_data()
+                assert manifest.load_json_file(project_json)['project_name'] == 'RenamedProject'
+                assert json.loads(project_json.read_text())['project_name'] == 'RenamedProject'
+
+    def test_manifest_session_loads_object_json_once(self, tmp_path):
+        gem_path = tmp_path / 'TestGem'
+        gem_path.mkdir()
+        (gem_path / 'gem.json').write_text(TEST_GEM_JSON_PAYLOAD)
+        with patch('o3de.manifest.get_registry_index',
+                   return_value=registry_index.RegistryIndex(tmp_path / 'o3de_registry_index.json')) as _1, \
+                patch('o3de.registry_index.RegistryIndex.load_json_data', autospec=True,
+                      side_effect=registry_index.RegistryIndex.load_json_data) as load_json_data_patch:
+            with manifest.ManifestSession():
+                for _ in range(3):
+                    assert manifest.get_gem_json_data(gem_path=gem_path)['gem_name'] == 'TestGem'
+            load_json_data_patch.assert_called_once()
+
+
+class TestManifestGetGemsJsonDataConcurrently:
+    @pytest.fixture(autouse=True)
+    def setup_gems(self, tmp_path):
+        # Gem1 contains Gem2 which contains Gem3, Gem4 is a sibling of Gem1 and NotAGem has no gem.json
+        self.gems_root = tmp_path / 'Gems'
+        gems = {'Gem1': ['Gem2'], 'Gem1/Gem2': ['Gem3', '../../Gem4'], 'Gem1/Gem2/Gem3': [], 'Gem4': []}
+        for gem_rel_path, gem_external_subdirectories in gems.items():
+            gem_path = self.gems_root / gem_rel_path
+            gem_path.mkdir(parents=True)
+            gem_json_data = json.loads(TEST_GEM_JSON_PAYLOAD)
+            gem_json_data['gem_name'] = gem_path.name
+            gem_json_data['external_subdirectories'] = gem_external_subdirectories
+            (gem_path / 'gem.json').write_text(json.dumps(gem_json_data))
+        (self.gems_root / 'NotAGem').mkdir()
+        self.index = registry_index.RegistryIndex(tmp_path / 'o3de_registry_index.json')
+
+    def test_get_gems_json_data_by_path_concurrently_is_breadth_first(self):
+        with patch('o3de.manifest.get_registry_index', return_value=self.index):
+            gems_json_data_by_path = manifest.get_gems_json_data_by_path_concurrently(
+                [self.gems_root / 'Gem1', self.gems_root / 'NotAGem', self.gems_root / 'Gem1'])
+
+        assert list(gems_json_data_by_path.keys()) == [
+            (self.gems_root / 'Gem1').resolve(),
+            (self.gems_root / 'Gem1/Gem2').resolve(),
+            (self.gems_root / 'Gem1/Gem2/Gem3').resolve(),
+            (self.gems_root / 'Gem4').resolve()]
+
+    def test_get_gems_json_data_by_name_loads_each_gem_json_once(self):
+        with patch('o3de.manifest.get_registry_index', return_value=self.index) as _1, \
+                patch('pathlib.Path.open', side_effect=pathlib.Path.open, autospec=True) as open_patch:
+            gems_json_data = manifest.get_gems_json_data_by_name(
+                external_subdirectories=[self.gems_root / 'Gem1', self.gems_root / 'NotAGem'])
+
+            # the order matches the depth first walk of the external subdirectories
+            assert list(gems_json_data.keys()) == ['Gem1', 'Gem2', 'Gem3', 'Gem4']
+            assert gems_json_data['Gem4']['path'] == (self.gems_root / 'Gem4').resolve()
+            assert open_patch.call_count == 4
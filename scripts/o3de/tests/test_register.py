@@ -13,7 +13,7 @@ import pytest
 import pathlib
 from unittest.mock import patch
 
-from o3de import register
+from o3de import manifest, register
 
 string_manifest_data = '{}'
 
@@ -446,3 +446,59 @@ class TestRegisterProject:
                                         self.o3de_manifest_data.get('external_subdirectories', []))
                  
             assert result == expected_result
+
+
+class TestRegisterAllInFolder:
+    @pytest.fixture(autouse=True)
+    def setup_o3de_objects(self, tmp_path):
+        self.manifest_path = tmp_path / '.o3de' / 'o3de_manifest.json'
+        self.manifest_path.parent.mkdir()
+        self.manifest_path.write_text(TEST_O3DE_MANIFEST_JSON_PAYLOAD)
+
+        self.objects_path = tmp_path / 'O3DE'
+        gem_json_data = json.loads(TEST_GEM_JSON_PAYLOAD)
+        for gem_json_path in [self.objects_path / 'Gems' / 'GemA' / 'gem.json',
+                              self.objects_path / 'Gems' / 'GemB' / 'gem.json',
+                              self.objects_path / 'TestProject' / 'Gems' / 'ProjectGem' / 'gem.json',
+                              # o3de objects inside of templates and build folders are not registered
+                              self.objects_path / 'Templates' / 'TestTemplate' / 'Template' / 'gem.json',
+                              self.objects_path / 'build' / 'GemC' / 'gem.json']:
+            gem_json_path.parent.mkdir(parents=True)
+            gem_json_path.write_text(json.dumps(dict(gem_json_data, gem_name=gem_json_path.parent.name)))
+        (self.objects_path / 'Gems' / 'InvalidGem').mkdir()
+        (self.objects_path / 'Gems' / 'InvalidGem' / 'gem.json').write_text('{}')
+        (self.objects_path / 'Templates' / 'TestTemplate' / 'template.json').write_text(
+            json.dumps({'template_name': 'TestTemplate'}))
+        (self.objects_path / 'build' / 'CMakeCache.txt').write_text('')
+        (self.objects_path / 'TestProject' / 'project.json').write_text(
+            json.dumps({'project_name': 'TestProject', 'external_subdirectories': []}))
+
+    def test_register_all_in_folder_saves_manifests_once(self):
+        with patch('o3de.manifest.get_o3de_manifest', return_value=self.manifest_path) as _1, \
+                patch('o3de.manifest.get_project_engine_path', return_value=None) as _2, \
+                patch('o3de.manifest.write_json_file_atomically',
+                      side_effect=manifest.write_json_file_atomically) as write_json_patch:
+            result = register.register_all_in_folder(self.objects_path)
+
+        # the invalid gem fails to register without preventing the registration of the other objects
+        assert result == 1
+        o3de_manifest_data = json.loads(self.manifest_path.read_text())
+        assert set(o3de_manifest_data['external_subdirectories']) == \
+               {(self.objects_path / 'Gems' / gem_name).resolve().as_posix() for gem_name in ['GemA', 'GemB']}
+        assert o3de_manifest_data['templates'] == \
+               [(self.objects_path / 'Templates' / 'TestTemplate').resolve().as_posix()]
+        assert o3de_manifest_data['projects'] == [(self.objects_path / 'TestProject').resolve().as_posix()]
+        project_json_data = json.loads((self.objects_path / 'TestProject' / 'project.json').read_text())
+        assert project_json_data['external_subdirectories'] == ['Gems/ProjectGem']
+
+        # the deferred changes to the o3de manifest and project.json are each written once
+        assert sorted(call.args[1].name for call in write_json_patch.call_args_list) == \
+               ['o3de_manifest.json', 'project.json']
+
+    def test_register_all_in_folder_discards_changes_on_exception(self):
+        with patch('o3de.manifest.get_o3de_manifest', return_value=self.manifest_path) as _1, \
+                patch('o3de.register.register_template_path', side_effect=RuntimeError) as _2:
+            with pytest.raises(RuntimeError):
+                register.register_all_in_folder(self.objects_path)
+
+        assert json.loads(self.manifest_path.read_text()) == json.loads(TEST_O3DE_MANIFEST_JSON_PAYLOAD)
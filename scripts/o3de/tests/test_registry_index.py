@@ -0,0 +1,152 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import json
+import os
+import pathlib
+import pytest
+from unittest.mock import patch, MagicMock
+
+from o3de import manifest, registry_index, validation
+
+
+TEST_GEM_JSON_PAYLOAD = {
+    "gem_name": "TestGem",
+    "version": "0.0.0",
+    "external_subdirectories": []
+}
+
+
+def load_json(json_path: pathlib.Path) -> dict:
+    with json_path.open('r') as f:
+        return json.load(f)
+
+
+def set_modified_before_indexing(file_path: pathlib.Path) -> None:
+    # files modified within the modification time resolution of being loaded are loaded again
+    file_stat = file_path.stat()
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns - 2 * registry_index.MTIME_RESOLUTION_NS))
+
+
+class TestRegistryIndex:
+    @pytest.fixture(autouse=True)
+    def setup_gem_json(self, tmp_path):
+        self.index_path = tmp_path / 'Cache' / 'o3de_registry_index.json'
+        self.gem_json_path = tmp_path / 'TestGem' / 'gem.json'
+        self.gem_json_path.parent.mkdir()
+        self.gem_json_path.write_text(json.dumps(TEST_GEM_JSON_PAYLOAD))
+        set_modified_before_indexing(self.gem_json_path)
+
+    def test_load_json_data_only_loads_unchanged_file_once(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        loader = MagicMock(side_effect=load_json)
+
+        assert index.load_json_data(self.gem_json_path, 'json', loader) == TEST_GEM_JSON_PAYLOAD
+        assert index.load_json_data(self.gem_json_path, 'json', loader) == TEST_GEM_JSON_PAYLOAD
+        assert loader.call_count == 1
+
+    def test_load_json_data_reloads_file_modified_in_same_mtime_tick(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        loader = MagicMock(side_effect=load_json)
+        self.gem_json_path.write_text(json.dumps(TEST_GEM_JSON_PAYLOAD))
+        index.load_json_data(self.gem_json_path, 'json', loader)
+
+        # rewritten with the same size and modification time, as a write within the same mtime tick would be
+        file_stat = self.gem_json_path.stat()
+        new_gem_json = dict(TEST_GEM_JSON_PAYLOAD, gem_name='TestGen')
+        self.gem_json_path.write_text(json.dumps(new_gem_json))
+        os.utime(self.gem_json_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+
+        assert index.load_json_data(self.gem_json_path, 'json', loader) == new_gem_json
+        assert loader.call_count == 2
+
+    def test_load_json_data_returns_copies(self):
+        index = registry_index.RegistryIndex(self.index_path)
+
+        json_data = index.load_json_data(self.gem_json_path, 'json', load_json)
+        json_data['gem_name'] = 'Modified'
+
+        assert index.load_json_data(self.gem_json_path, 'json', load_json) == TEST_GEM_JSON_PAYLOAD
+
+    def test_load_json_data_reloads_changed_file(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        loader = MagicMock(side_effect=load_json)
+        index.load_json_data(self.gem_json_path, 'json', loader)
+
+        new_gem_json = dict(TEST_GEM_JSON_PAYLOAD, gem_name='RenamedTestGem')
+        self.gem_json_path.write_text(json.dumps(new_gem_json))
+        file_stat = self.gem_json_path.stat()
+        os.utime(self.gem_json_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000000))
+
+        assert index.load_json_data(self.gem_json_path, 'json', loader) == new_gem_json
+        assert loader.call_count == 2
+
+    def test_load_json_data_caches_loaders_separately(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        invalid_loader = MagicMock(return_value=None)
+
+        assert index.load_json_data(self.gem_json_path, 'invalid', invalid_loader) is None
+        assert index.load_json_data(self.gem_json_path, 'invalid', invalid_loader) is None
+        assert index.load_json_data(self.gem_json_path, 'json', load_json) == TEST_GEM_JSON_PAYLOAD
+        invalid_loader.assert_called_once()
+
+    def test_load_json_data_does_not_cache_exceptions(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        self.gem_json_path.write_text('{ invalid json')
+
+        for _ in range(2):
+            with pytest.raises(json.JSONDecodeError):
+                index.load_json_data(self.gem_json_path, 'json', load_json)
+
+    def test_save_persists_index_between_instances(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        index.load_json_data(self.gem_json_path, 'json', load_json)
+        assert index.save()
+        assert self.index_path.is_file()
+
+        loader = MagicMock(side_effect=load_json)
+        new_index = registry_index.RegistryIndex(self.index_path)
+        assert new_index.load_json_data(self.gem_json_path, 'json', loader) == TEST_GEM_JSON_PAYLOAD
+        loader.assert_not_called()
+
+    def test_save_removes_missing_files(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        index.load_json_data(self.gem_json_path, 'json', load_json)
+        self.gem_json_path.unlink()
+        assert index.save()
+
+        index_json_data = json.loads(self.index_path.read_text())
+        assert index_json_data['entries'] == {}
+
+    def test_invalidate_reloads_file(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        loader = MagicMock(side_effect=load_json)
+        index.load_json_data(self.gem_json_path, 'json', loader)
+        index.invalidate(self.gem_json_path)
+        index.load_json_data(self.gem_json_path, 'json', loader)
+        assert loader.call_count == 2
+
+    def test_get_gem_json_data_loads_unchanged_file_once(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        with patch('o3de.manifest.get_registry_index', return_value=index) as _1, \
+                patch('pathlib.Path.open', side_effect=pathlib.Path.open, autospec=True) as open_patch:
+            for _ in range(3):
+                assert manifest.get_gem_json_data(gem_path=self.gem_json_path.parent) == TEST_GEM_JSON_PAYLOAD
+
+            # the gem.json is opened once and validated after it is loaded
+            open_patch.assert_called_once()
+
+    def test_get_gem_json_data_reloads_file_for_new_validators_version(self):
+        index = registry_index.RegistryIndex(self.index_path)
+        with patch('o3de.manifest.get_registry_index', return_value=index) as _1, \
+                patch('pathlib.Path.open', side_effect=pathlib.Path.open, autospec=True) as open_patch:
+            manifest.get_gem_json_data(gem_path=self.gem_json_path.parent)
+            with patch('o3de.validation.VALIDATORS_VERSION', validation.VALIDATORS_VERSION + 1):
+                assert manifest.get_gem_json_data(gem_path=self.gem_json_path.parent) == TEST_GEM_JSON_PAYLOAD
+
+            assert open_patch.call_count == 2
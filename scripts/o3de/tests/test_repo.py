@@ -7,13 +7,17 @@
 #
 
 import copy
+import functools
+import http.server
 import json
+import os
 import pytest
 import pathlib
+import threading
 import urllib.request
 from unittest.mock import patch, MagicMock, mock_open
 
-from o3de import manifest, register, repo
+from o3de import manifest, register, registry_index, repo
 
 TEST_O3DE_MANIFEST_JSON_PAYLOAD = '''
 {
@@ -325,3 +329,72 @@ class TestRepos:
                 patch('pathlib.Path.is_file', mocked_isfile) as _5:
                     valid = repo.validate_remote_repo('http://o3de.org/repoA')
                     assert valid
+
+
+@pytest.fixture
+def repo_http_server(tmp_path):
+    """
+    Serves the files of a local folder over http, recording the status code of every response
+    """
+    served_path = tmp_path / 'served'
+    served_path.mkdir()
+    response_codes = []
+
+    class RecordingRequestHandler(http.server.SimpleHTTPRequestHandler):
+        def log_request(self, code='-', size='-'):
+            response_codes.append(int(code))
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                             functools.partial(RecordingRequestHandler, directory=str(served_path)))
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    yield served_path, f'http://127.0.0.1:{server.server_address[1]}', response_codes
+    server.shutdown()
+    server.server_close()
+
+
+class TestRepoDownloadObjectManifests:
+    gem_names = ['GemA', 'GemB', 'GemC']
+
+    @pytest.fixture(autouse=True)
+    def setup_repo(self, tmp_path, repo_http_server):
+        self.served_path, self.repo_uri, self.response_codes = repo_http_server
+        for gem_name in self.gem_names:
+            gem_json_path = self.served_path / 'Gems' / gem_name / 'gem.json'
+            gem_json_path.parent.mkdir(parents=True)
+            gem_json_path.write_text(json.dumps({'gem_name': gem_name}))
+        self.repo_data = {'gems': [f'{self.repo_uri}/Gems/{gem_name}' for gem_name in self.gem_names]}
+
+        self.cache_path = tmp_path / 'cache'
+        self.cache_path.mkdir()
+        cache_index = registry_index.RegistryIndex(self.cache_path / 'o3de_repo_cache_index.json')
+        with patch('o3de.manifest.get_o3de_cache_folder', return_value=self.cache_path) as _1, \
+                patch('o3de.repo.get_repo_cache_index', return_value=cache_index) as _2:
+            yield
+
+    def test_download_object_manifests_only_downloads_modified_files(self):
+        assert repo.download_object_manifests(self.repo_data) == 0
+        assert self.response_codes == [200] * len(self.gem_names)
+
+        # unchanged files are not downloaded again
+        self.response_codes.clear()
+        assert repo.download_object_manifests(self.repo_data) == 0
+        assert self.response_codes == [304] * len(self.gem_names)
+
+        # Last-Modified has a resolution of a second
+        gem_json_path = self.served_path / 'Gems' / 'GemB' / 'gem.json'
+        gem_json_path.write_text(json.dumps({'gem_name': 'GemB', 'version': '2.0.0'}))
+        file_stat = gem_json_path.stat()
+        os.utime(gem_json_path, (file_stat.st_atime, file_stat.st_mtime + 10))
+
+        self.response_codes.clear()
+        assert repo.download_object_manifests(self.repo_data) == 0
+        assert sorted(self.response_codes) == [200, 304, 304]
+        cache_file, _ = repo.get_cache_file_uri(f'{self.repo_uri}/Gems/GemB/gem.json')
+        assert json.loads(cache_file.read_text()) == {'gem_name': 'GemB', 'version': '2.0.0'}
+
+    def test_download_object_manifests_fails_for_missing_files(self):
+        self.repo_data['gems'].append(f'{self.repo_uri}/Gems/MissingGem')
+
+        assert repo.download_object_manifests(self.repo_data) == 1
+        assert sorted(self.response_codes) == [200] * len(self.gem_names) + [404]
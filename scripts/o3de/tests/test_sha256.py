@@ -0,0 +1,58 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import hashlib
+import json
+import os
+import pytest
+from unittest.mock import patch
+
+from o3de import registry_index, sha256
+
+
+TEST_FILE_DATA = os.urandom(1024 * 3 + 17)
+
+
+class TestSha256:
+    @pytest.fixture(autouse=True)
+    def setup_sha256_index(self, tmp_path):
+        self.file_path = tmp_path / 'gem.zip'
+        self.file_path.write_bytes(TEST_FILE_DATA)
+        # files modified within the modification time resolution of being hashed are hashed again
+        file_stat = self.file_path.stat()
+        os.utime(self.file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns - 2 * registry_index.MTIME_RESOLUTION_NS))
+        self.sha256_index = registry_index.RegistryIndex(tmp_path / 'Cache' / 'o3de_sha256_index.json')
+        with patch('o3de.sha256.get_sha256_index', return_value=self.sha256_index):
+            yield
+
+    @pytest.mark.parametrize("chunk_size", [1, 1024, sha256.SHA256_CHUNK_SIZE])
+    def test_compute_file_sha256_matches_hashlib(self, chunk_size):
+        assert sha256.compute_file_sha256(self.file_path, chunk_size) == hashlib.sha256(TEST_FILE_DATA).hexdigest()
+
+    def test_get_file_sha256_only_hashes_unchanged_file_once(self):
+        with patch('o3de.sha256.compute_file_sha256', side_effect=sha256.compute_file_sha256) as compute_patch:
+            for _ in range(3):
+                assert sha256.get_file_sha256(self.file_path) == hashlib.sha256(TEST_FILE_DATA).hexdigest()
+            compute_patch.assert_called_once()
+
+        # the digest is persisted in the index
+        assert self.sha256_index.index_path.is_file()
+
+    def test_get_file_sha256_hashes_changed_file(self):
+        sha256.get_file_sha256(self.file_path)
+        self.file_path.write_bytes(TEST_FILE_DATA + b'changed')
+
+        assert sha256.get_file_sha256(self.file_path) == hashlib.sha256(TEST_FILE_DATA + b'changed').hexdigest()
+
+    def test_sha256_adds_sha256_to_json(self, tmp_path):
+        json_path = tmp_path / 'repo.json'
+        json_path.write_text(json.dumps({'repo_name': 'TestRepo'}))
+
+        assert sha256.sha256(self.file_path, json_path) == 0
+        assert json.loads(json_path.read_text()) == {'repo_name': 'TestRepo',
+                                                     'sha256': hashlib.sha256(TEST_FILE_DATA).hexdigest()}
@@ -15,7 +15,9 @@ references or code that should not be published. Can be used to scan any directo
 from __future__ import absolute_import
 from __future__ import print_function
 import six
+import concurrent.futures
 import logging
+import mmap
 import os
 import re
 import sys
@@ -30,6 +32,59 @@ else:
 
 import validator_data_LEGAL_REVIEW_REQUIRED # pull in the data we need to configure this tool
 
+# Python3 requires specific encoding but the repo is a mix of UTF-8, UTF-16, and latin-1
+# The first encoding which decodes the whole file is used
+ENCODINGS = ["utf8", "utf-16-le", "utf-16-be", "latin-1"]
+
+# Minimum number of files for the files to be validated by worker processes
+PARALLEL_FILE_COUNT = 256
+
+# Number of files sent to a worker process at once
+WORKER_CHUNK_SIZE = 64
+
+
+def read_text_file(filepath):
+    """Memory map a file and decode it with the first of ENCODINGS that can decode it, translating the line endings
+    to '\n' like a file opened in text mode. Return None if no encoding can decode the file."""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for encoding_format in ENCODINGS:
+                try:
+                    text = str(data, encoding_format)
+                    break
+                except UnicodeDecodeError:
+                    continue
+            else:
+                return None
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+# Validator of the worker processes, created once by each process
+_worker_validator = None
+
+
+def _init_worker(options, args, platform):
+    global _worker_validator
+    _worker_validator = Validator(options, args)
+    _worker_validator.compile_filter_patterns(platform)
+
+
+def _scan_file_in_worker(filepath):
+    """Scan a file in a worker process, capturing the output that validate_line writes directly so that the main
+    process can output it in order."""
+    validator = _worker_validator
+    validator.pattern_used = set([])
+    validator.listed_filepaths = []
+    if validator.options.exception_file:
+        validator.exceptions_output = StringIO()
+    failed, messages = validator.scan_file(filepath)
+    exceptions = validator.exceptions_output.getvalue() if validator.options.exception_file else ''
+    return failed, messages, exceptions, validator.pattern_used, validator.listed_filepaths
+
 class Validator(object):
     """Class to contain the validator program"""
     # Set of all acceptable_use patterns actually used during the run
@@ -131,6 +186,11 @@ class Validator(object):
 
     def output_unique_filepath(self, filepath):
         """Output the name of a file exactly once in a run."""
+        # Worker processes only collect the names, the main process outputs them
+        if self.listed_filepaths is not None:
+            self.listed_filepaths.append(filepath)
+            return
+
         # Dictionary to use to ensure that we know which files we have already talked about
         global printed_filepath
         try:
@@ -147,62 +207,66 @@ class Validator(object):
     def validate_file(self, filepath):
         """Validate the content of a file 'filepath'.
         Return 0 if no issues are found, and 1 if an issue was noted."""
+        failed, messages = self.scan_file(filepath)
+        for level, message in messages:
+            logging.log(level, message)
+        return failed
+
+    def scan_file(self, filepath):
+        """Validate the content of a file 'filepath' without logging the results.
+        Return a tuple of 0 if no issues are found and 1 if an issue was noted, or None if the file was skipped, and of
+        the list of (logging level, message) pairs to log."""
         failed = 0
+        messages = []
 
         # Otherwise read the file off disk.  Check the filename itself to make sure no naughty
         # bits are there.
         errors = []
         info = []
         failed = self.validate_line(filepath, 'filename', 0, failed, errors, info)
-        for e in errors:
-            logging.error(e)
-        for i in info:
-            logging.info(i)
+        messages.extend((logging.ERROR, e) for e in errors)
+        messages.extend((logging.INFO, i) for i in info)
 
         # Check if this file is a binary file, or an extension we always skip
         # These extensions are here because they sometimes look like text files,
         # but are not really text files in practice.
         if validator_data_LEGAL_REVIEW_REQUIRED.skip_file(filepath):
-            logging.debug('Skipping %s', filepath)
-            return
-
-        # Python3 requires specific encoding but the repo is a mix of UTF-8, UTF-16, and latin-1
-        # Just try except the possibilities until it works
-        encodings = ["utf8", "utf-16-le", "utf-16-be", "latin-1"]
-        for encoding_format in encodings:
-            try:
-                with open(filepath, encoding=encoding_format) as f:
-                    logging.debug('Validating %s', filepath)
-
-                    # Take care to deal with files that have unreasonably large lines.
-                    # if we don't do this, then the validator can segfault as it tries
-                    # to read a line that is insanely large. A try/except will not prevent this.
-                    # This can happen, for example, in XML file or obj files (the 3d format, not
-                    # the compiler output kind).
-                    # Quesion: if we encounter such a file, should we call it "binary" and quit?
-                    # TODO: There is a small "leak" here, in that we don't deal with crossing
-                    # a non line boundary clealy. In particular, a validation pattern
-                    # that occurs in the boundary crossing will not be properly searched.
-                    # The easiest thing to do is probably to retain the prior 128 bytes or
-                    # so from the prior portion of the line as a prefix to the tail of the rest of the line.
-                    # This will make the logic below much more complex.
-                    fileline = 0
-                    line = f.readline(10000)
-                    while line != '':
-                        fileline += 1
-                        errors = []
-                        info = []
-                        failed = self.validate_line(line, filepath, fileline, failed, errors, info)
-                        for e in errors:
-                            logging.error(e)
-                        for i in info:
-                            logging.info(i)
-                        line = f.readline(10000)
-                return failed
-            except UnicodeDecodeError:
-                continue
-
-        raise UnicodeError("Could not decode {0} due to an unexpected file encoding".format(filepath))
+            messages.append((logging.DEBUG, 'Skipping {}'.format(filepath)))
+            return None, messages
+
+        # The file is decoded once, as a whole, so the patterns also find text in lines of any length
+        text = read_text_file(filepath)
+        if text is None:
+            raise UnicodeError("Could not decode {0} due to an unexpected file encoding".format(filepath))
+        messages.append((logging.DEBUG, 'Validating {}'.format(filepath)))
+
+        # The prefilter and the bad patterns are searched in the whole file first, which is much faster than searching
+        # each line. Only the lines where a bad pattern match starts can fail validation, so only those lines are
+        # validated. Patterns are searched line by line in validate_line, so the whole file search is only a filter.
+        lower = text.lower()
+        if not any(ext in lower for ext in self.prefilter):
+            return failed, messages
+
+        fileline = 1
+        counted_position = 0
+        position = 0
+        while position < len(text):
+            m = self.compiled_multiline_bad_pattern.search(text, position)
+            if not m:
+                break
+            line_start = text.rfind('\n', 0, m.start()) + 1
+            line_end = text.find('\n', m.start())
+            line_end = len(text) if line_end == -1 else line_end + 1
+            fileline += text.count('\n', counted_position, line_start)
+            counted_position = line_start
+
+            errors = []
+            info = []
+            failed = self.validate_line(text[line_start:line_end], filepath, fileline, failed, errors, info)
+            messages.extend((logging.ERROR, e) for e in errors)
+            messages.extend((logging.INFO, i) for i in info)
+            position = line_end
+        return failed, messages
 
     # Walk directory tree and find all file paths, and run the search for bad code on each file.
     # We explicitly skip "SDKs" directories, "BinTemp" and "Python" directories and various others.
@@ -218,21 +282,24 @@ class Validator(object):
         validations = 0
         bypassed_directories = validator_data_LEGAL_REVIEW_REQUIRED.get_bypassed_directories(self.options.all)
 
+        filepaths = []
         for dirname, dirnames, filenames in os.walk(os.path.normpath(root)):
             # First deal with the files in the current directory
             for filename in filenames:
                 filepath = os.path.join(dirname, filename)
-                scanned += 1
-                file_failed = self.validate_file(os.path.normpath(filepath))
-                if file_failed:
-                    platform_failed = file_failed
-                else:
-                    validations += 1
+                filepaths.append(os.path.normpath(filepath))
 
             # Trim out allowlisted subdirectories in the current directory if allowed
             for name in bypassed_directories:
                 if name in dirnames:
                     dirnames.remove(name)
+
+        for file_failed in self.validate_files(filepaths, platform):
+            scanned += 1
+            if file_failed:
+                platform_failed = file_failed
+            else:
+                validations += 1
         if scanned == 0:
             logging.error('No files scanned at target search directory: %s', root)
             platform_failed = 1
@@ -241,6 +308,29 @@ class Validator(object):
         return platform_failed
 
 
+    def validate_files(self, filepaths, platform):
+        """Validate files, distributing them across worker processes when there are many of them.
+        The results are output in the order of the files, as if they were validated one after the other.
+        Yield the result of validate_file for each file."""
+        jobs = getattr(self.options, 'jobs', None) or os.cpu_count() or 1
+        if jobs <= 1 or len(filepaths) < PARALLEL_FILE_COUNT:
+            for filepath in filepaths:
+                yield self.validate_file(filepath)
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                                    initargs=(self.options, self.args, platform)) as executor:
+            results = executor.map(_scan_file_in_worker, filepaths, chunksize=WORKER_CHUNK_SIZE)
+            for failed, messages, exceptions, pattern_used, listed_filepaths in results:
+                for level, message in messages:
+                    logging.log(level, message)
+                if exceptions:
+                    self.exceptions_output.write(exceptions)
+                self.pattern_used.update(pattern_used)
+                for filepath in listed_filepaths:
+                    self.output_unique_filepath(filepath)
+                yield failed
+
     def compile_filter_patterns(self, platform):
         """Join together patterns listed in data file into single patterns and compile for speed."""
         if not platform in validator_data_LEGAL_REVIEW_REQUIRED.restricted_platforms:
@@ -272,6 +362,8 @@ class Validator(object):
             bad_pattern = '|'.join(self.bad_patterns)
             acceptable_pattern = '|'.join([p for p,compiledp,fileset in self.acceptable_use_patterns])
             self.compiled_bad_pattern = re.compile(bad_pattern)
+            # Searched in whole files, where '^' and '$' must match at the start and end of each line
+            self.compiled_multiline_bad_pattern = re.compile(bad_pattern, re.MULTILINE)
             self.compiled_acceptable_pattern = re.compile(acceptable_pattern)
         except:
             logging.error('Could not compile patterns for validation. Check patterns in validator_data_LEGAL_REVIEW_REQUIRED.py for correctness.')
@@ -362,7 +454,9 @@ class Validator(object):
         self.args = args
         self.prefilter = None
         self.compiled_bad_pattern = None
+        self.compiled_multiline_bad_pattern = None
         self.compiled_acceptable_pattern = None
+        self.listed_filepaths = None
         self.bad_patterns = None
         self.acceptable_use_patterns = None
 
@@ -393,6 +487,9 @@ def parse_options():
     parser.add_option('-a', '--all', action='store_true',
                       dest='all',
                       help='Do not skip any files or subdirectories when processing. Should be used on final clean code only. If you use this on your build tree in place lots of temp files will match.')
+    parser.add_option('-j', '--jobs', action='store', type='int', default=None,
+                      dest='jobs',
+                      help='Number of processes validating files, defaults to the number of CPUs. Use 1 to validate in a single process.')
     parser.add_option('-i', '--ignore-file-paths', action='store_true',
                       dest='ignore_file_paths',
                       help='disable the filepath check for accepted_use patterns. Should only be when targeting a directory other than /dev/.')